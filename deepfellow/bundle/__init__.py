@@ -0,0 +1,21 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collect bundle commands."""
+
+import typer
+
+from deepfellow.common.lazy import LazyCommand, lazy_group
+
+COMMANDS = (
+    LazyCommand("export", "deepfellow.bundle.export:app", "Save the DeepFellow docker images into an archive."),
+    LazyCommand("import", "deepfellow.bundle.load:app", "Load the DeepFellow docker images from an archive."),
+)
+
+app = typer.Typer(cls=lazy_group(COMMANDS))
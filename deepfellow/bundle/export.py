@@ -0,0 +1,72 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Export bundle typer command."""
+
+import time
+from pathlib import Path
+
+import typer
+
+from deepfellow.common.bundle import (
+    BUNDLE_COMPRESSION_LEVEL,
+    assert_zstd,
+    export_bundle,
+    get_save_reference,
+    get_template_images,
+)
+from deepfellow.common.defaults import DF_INFRA_IMAGE, DF_INFRA_IMAGE_HUB, DF_SERVER_IMAGE, DF_SERVER_IMAGE_HUB
+from deepfellow.common.docker import DockerError
+from deepfellow.common.docker_api import format_decimal_size
+from deepfellow.common.echo import echo
+from deepfellow.common.install import assert_docker
+from deepfellow.common.pull import pull_missing_images
+from deepfellow.common.registry import get_newest_image_tag
+
+app = typer.Typer()
+
+
+@app.command()
+def export(
+    archive: Path = typer.Argument(..., dir_okay=False, help="Path of the bundle, e.g. deepfellow-bundle.tar.zst"),
+    infra_image: str = typer.Option(DF_INFRA_IMAGE, envvar="DF_INFRA_IMAGE", help="DeepFellow Infra docker image."),
+    server_image: str = typer.Option(DF_SERVER_IMAGE, envvar="DF_SERVER_IMAGE", help="DeepFellow Server docker image."),
+    image: list[str] = typer.Option([], "--image", help="Additional docker image to bundle, can be repeated"),
+    level: int = typer.Option(BUNDLE_COMPRESSION_LEVEL, min=1, max=19, help="zstd compression level."),
+) -> None:
+    """Save the DeepFellow docker images into a single zstd-compressed archive.
+
+    The bundle holds the Infra and Server images with the images of their compose services.
+
+    Load it on an air-gapped host with `deepfellow bundle import`, the install then skips the registry.
+    """
+    assert_docker()
+    assert_zstd()
+
+    if infra_image == DF_INFRA_IMAGE:
+        infra_image = get_newest_image_tag(DF_INFRA_IMAGE_HUB)
+
+    if server_image == DF_SERVER_IMAGE:
+        server_image = get_newest_image_tag(DF_SERVER_IMAGE_HUB)
+
+    images = list(dict.fromkeys([infra_image, server_image, *get_template_images(), *image]))
+    if not pull_missing_images(images):
+        echo.error("Unable to pull all docker images, the bundle is not exported.")
+        raise typer.Exit(1)
+
+    echo.info(f"Exporting {len(images)} docker image(s) to {archive} ...")
+    started_at = time.monotonic()
+    try:
+        size = export_bundle([get_save_reference(reference) for reference in images], archive, level)
+    except DockerError as exc:
+        echo.error(f"Unable to export the bundle. {str(exc).strip()}")
+        raise typer.Exit(1) from exc
+
+    elapsed = time.monotonic() - started_at
+    echo.success(f"Exported {len(images)} docker images to {archive}, {format_decimal_size(size)} in {elapsed:.1f}s.")
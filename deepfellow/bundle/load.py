@@ -0,0 +1,49 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import bundle typer command."""
+
+from pathlib import Path
+
+import typer
+
+from deepfellow.common.bundle import assert_zstd, import_bundle, save_bundle_images
+from deepfellow.common.docker import DockerError
+from deepfellow.common.echo import echo
+from deepfellow.common.install import assert_docker
+from deepfellow.common.state import state
+
+app = typer.Typer()
+
+
+@app.command("import")
+def load(
+    archive: Path = typer.Argument(..., exists=True, dir_okay=False, help="Bundle created with `bundle export`"),
+) -> None:
+    """Load the docker images of a bundle.
+
+    The loaded images are recorded, the install commands use them when the registry is unreachable.
+    """
+    assert_docker()
+    assert_zstd()
+
+    echo.info(f"Importing the docker images from {archive} ...")
+    try:
+        images = import_bundle(archive)
+    except DockerError as exc:
+        echo.error(f"Unable to import the bundle. {str(exc).strip()}")
+        raise typer.Exit(1) from exc
+
+    try:
+        save_bundle_images(images)
+    except OSError as exc:
+        echo.error(f"Unable to record the imported images in {state.cli_bundle_file}. {exc}")
+        raise typer.Exit(1) from exc
+
+    echo.success("\n".join([f"Imported {len(images)} docker image(s).", *images]))
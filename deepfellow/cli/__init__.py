@@ -11,10 +11,11 @@
 
 import typer
 
-from .uninstall import app as uninstall_app
-from .update import app as update_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("uninstall", "deepfellow.cli.uninstall:app", "Uninstall DeepFellow CLI."),
+    LazyCommand("update", "deepfellow.cli.update:app", "Update DeepFellow CLI."),
+)
 
-app.add_typer(uninstall_app)
-app.add_typer(update_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
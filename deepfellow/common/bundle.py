@@ -0,0 +1,188 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Image bundle for air-gapped hosts.
+
+A bundle is the ``docker save`` tarball of the images referenced by the generated compose files
+(Infra, Server, MongoDB, Qdrant, Milvus, OpenTelemetry Collector and the zero-downtime proxy),
+compressed with ``zstd``. Both ways the tarball is streamed through a pipe
+(``docker save | zstd`` and ``zstd -d | docker load``), so it is never kept uncompressed on disk
+or in memory.
+
+The import records the loaded images in ``~/.deepfellow/bundle.json``. Only these images are used
+by the install commands in place of the registry: the newest bundled DeepFellow image is installed
+when the registry is unreachable, the bundled images are not pulled, and the digest-pinned compose
+images point to their bundled tags, as ``docker save`` keeps no digest.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from deepfellow.common.cache import read_json
+from deepfellow.common.config import write_file_atomic
+from deepfellow.common.defaults import (
+    DOCKER_COMPOSE_INFRA,
+    DOCKER_COMPOSE_MILVUS,
+    DOCKER_COMPOSE_MONGO_DB,
+    DOCKER_COMPOSE_OTEL_COLLECTOR,
+    DOCKER_COMPOSE_PROXY_IMAGE,
+    DOCKER_COMPOSE_QDRANT,
+    DOCKER_COMPOSE_SERVER,
+)
+from deepfellow.common.docker import DockerError, is_image_present
+from deepfellow.common.echo import echo
+from deepfellow.common.state import state
+from deepfellow.common.system import is_command_available, pipe, run
+
+ZSTD_COMMAND = "zstd"
+BUNDLE_COMPRESSION_LEVEL = 3
+
+# Compose templates whose images are bundled
+BUNDLE_TEMPLATES: tuple[dict[str, Any], ...] = (
+    DOCKER_COMPOSE_INFRA,
+    DOCKER_COMPOSE_SERVER,
+    DOCKER_COMPOSE_MONGO_DB,
+    DOCKER_COMPOSE_QDRANT,
+    DOCKER_COMPOSE_MILVUS,
+    DOCKER_COMPOSE_OTEL_COLLECTOR,
+)
+
+LOADED_IMAGE_PATTERN = re.compile(r"^Loaded image(?: ID)?: (\S+)$", re.MULTILINE)
+
+
+def assert_zstd() -> None:
+    """Raise typer.Exit(1) if zstd is not installed, otherwise pass."""
+    if not is_command_available(ZSTD_COMMAND):
+        echo.error("Missing zstd. Install zstd.")
+        raise typer.Exit(1)
+
+
+def get_template_images() -> list[str]:
+    """Return the fixed images of the compose templates, the ``${...}`` ones are configured on install."""
+    images = [
+        service["image"]
+        for template in BUNDLE_TEMPLATES
+        for service in template.values()
+        if "$" not in service.get("image", "$")
+    ]
+    return list(dict.fromkeys([*images, DOCKER_COMPOSE_PROXY_IMAGE]))
+
+
+def get_save_reference(image: str) -> str:
+    """Return the reference ``docker save`` stores the image under.
+
+    ``docker save`` drops the digest of a ``name:tag@sha256:...`` reference, the image is tagged
+    with its ``name:tag`` so ``docker load`` restores at least the tag.
+
+    Raises:
+        DockerError: When the image cannot be tagged
+    """
+    name, _, digest = image.partition("@")
+    if not digest or ":" not in name.rsplit("/", 1)[-1]:
+        return image
+
+    run(["docker", "image", "tag", image, name], capture_output=True, raises=DockerError)
+    return name
+
+
+def export_bundle(images: list[str], archive: Path, level: int = BUNDLE_COMPRESSION_LEVEL) -> int:
+    """Stream ``docker save`` of the images through ``zstd`` into the archive.
+
+    The archive is written next to its target and renamed when complete, an interrupted export
+    never leaves a truncated bundle behind.
+
+    Args:
+        images: References of the local images
+        archive: Path of the bundle
+        level: zstd compression level
+
+    Returns:
+        Size of the archive in bytes
+
+    Raises:
+        DockerError: When saving or compressing the images failed
+    """
+    partial = archive.with_name(f"{archive.name}.part")
+    try:
+        pipe(
+            ["docker", "image", "save", *images],
+            [ZSTD_COMMAND, "--quiet", "--force", f"-{level}", "-T0", "-o", partial.as_posix()],
+            raises=DockerError,
+        )
+    except DockerError:
+        partial.unlink(missing_ok=True)
+        raise
+
+    partial.replace(archive)
+    return archive.stat().st_size
+
+
+def import_bundle(archive: Path) -> list[str]:
+    """Stream the decompressed archive into ``docker load``.
+
+    Returns:
+        References of the loaded images
+
+    Raises:
+        DockerError: When decompressing or loading the images failed
+    """
+    output = pipe(
+        [ZSTD_COMMAND, "--quiet", "--decompress", "--stdout", archive.as_posix()],
+        ["docker", "image", "load"],
+        raises=DockerError,
+    )
+    return LOADED_IMAGE_PATTERN.findall(output)
+
+
+def load_bundle_images() -> list[str]:
+    """Return the references of the images loaded with ``bundle import``."""
+    images = read_json(state.cli_bundle_file).get("images")
+    return [image for image in images if isinstance(image, str)] if isinstance(images, list) else []
+
+
+def save_bundle_images(images: list[str]) -> None:
+    """Record the loaded images next to the ones of the previous imports.
+
+    Raises:
+        OSError: When the record cannot be written
+    """
+    images = list(dict.fromkeys([*load_bundle_images(), *images]))
+    write_file_atomic(state.cli_bundle_file, json.dumps({"images": images}))
+
+
+def get_bundle_reference(image: str, bundle_images: list[str]) -> str | None:
+    """Return the reference the image was loaded under, None if it is not bundled.
+
+    A ``name:tag@sha256:...`` image is loaded as ``name:tag`` (see ``get_save_reference``).
+    """
+    if image in bundle_images:
+        return image
+
+    name, _, digest = image.partition("@")
+    return name if digest and name in bundle_images else None
+
+
+def use_bundle_images(services: dict[str, Any]) -> None:
+    """Point the digest-pinned images of the compose services to their bundled tags.
+
+    The loaded images have no digest, compose would pull a ``name:tag@sha256:...`` image again.
+    """
+    if not (bundle_images := load_bundle_images()):
+        return
+
+    for service in services.values():
+        image = service.get("image")
+        reference = get_bundle_reference(image, bundle_images) if image else None
+        if reference is not None and reference != image and is_image_present(reference):
+            echo.debug(f"Using the bundled image {reference} in place of {image}")
+            service["image"] = reference
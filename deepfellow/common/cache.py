@@ -0,0 +1,216 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""On-disk cache of the CLI, kept in ``~/.deepfellow/cache``.
+
+- ``health.json`` - time of the last successful health check of every server
+- ``registry.json`` - tags of the image hubs, kept for ``DF_REGISTRY_CACHE_TTL`` seconds
+- ``http/`` - conditional GET cache: one entry per URL, caller identity and ``VARY_HEADERS`` with the response
+  ``ETag``/``Last-Modified``, revalidated with ``If-None-Match``/``If-Modified-Since``.
+  Entries are evicted least recently used first above ``DF_HTTP_CACHE_SIZE`` MiB.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from deepfellow.common.config import write_file_atomic
+from deepfellow.common.echo import echo
+from deepfellow.common.state import state
+from deepfellow.common.token import get_token_identity
+
+HEALTH_CACHE_FILENAME = "health.json"
+DF_HEALTH_CACHE_TTL = 30.0
+REGISTRY_CACHE_FILENAME = "registry.json"
+DF_REGISTRY_CACHE_TTL = 600.0
+HTTP_CACHE_DIRNAME = "http"
+DF_HTTP_CACHE_SIZE = 32  # MiB
+# Request headers selecting what the server responds with, a part of the HTTP cache key
+VARY_HEADERS = ("OpenAI-Organization",)
+
+
+def read_json(path: Path) -> dict[str, Any]:
+    """Read the JSON cache file, an unreadable file is treated as empty."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(path: Path, data: dict[str, Any]) -> None:
+    """Write the JSON cache file with ``write_file_atomic``, so concurrent CLI runs never read a partial file."""
+    try:
+        write_file_atomic(path, json.dumps(data))
+    except OSError as exc:
+        echo.debug(f"Unable to write cache {path}: {exc}")
+
+
+def get_health_cache_ttl() -> float:
+    """Return the number of seconds a successful health check is trusted (``DF_HEALTH_CACHE_TTL``)."""
+    return float(state.cli_config.get("df_health_cache_ttl", DF_HEALTH_CACHE_TTL))
+
+
+def is_health_cached(url: str) -> bool:
+    """Check if the server passed the health check recently."""
+    checked_at = read_json(state.cli_cache_directory / HEALTH_CACHE_FILENAME).get(url)
+    return isinstance(checked_at, int | float) and 0 <= time.time() - checked_at < get_health_cache_ttl()
+
+
+def save_health(url: str) -> None:
+    """Remember the successful health check of the server."""
+    path = state.cli_cache_directory / HEALTH_CACHE_FILENAME
+    now = time.time()
+    ttl = get_health_cache_ttl()
+    entries = {
+        key: value for key, value in read_json(path).items() if isinstance(value, int | float) and now - value < ttl
+    }
+    write_json(path, entries | {url: now})
+
+
+def forget_health(url: str) -> None:
+    """Drop the cached health of every server the URL belongs to, e.g. after a connection error."""
+    path = state.cli_cache_directory / HEALTH_CACHE_FILENAME
+    entries = read_json(path)
+    remaining = {key: value for key, value in entries.items() if not url.startswith(key)}
+    if remaining != entries:
+        write_json(path, remaining)
+
+
+def get_registry_cache_ttl() -> float:
+    """Return the number of seconds the tags of an image hub are reused (``DF_REGISTRY_CACHE_TTL``)."""
+    return float(state.cli_config.get("df_registry_cache_ttl", DF_REGISTRY_CACHE_TTL))
+
+
+def load_registry_tags(hub: str) -> list[str] | None:
+    """Return the cached tags of the image hub or ``None`` if they are not cached or expired."""
+    if not is_http_cache_enabled():
+        return None
+
+    entry = read_json(state.cli_cache_directory / REGISTRY_CACHE_FILENAME).get(hub)
+    if not isinstance(entry, dict) or not isinstance(entry.get("tags"), list):
+        return None
+
+    fetched_at = entry.get("fetched_at")
+    if not isinstance(fetched_at, int | float) or not 0 <= time.time() - fetched_at < get_registry_cache_ttl():
+        return None
+
+    return [str(tag) for tag in entry["tags"]]
+
+
+def save_registry_tags(hub: str, tags: list[str]) -> None:
+    """Remember the tags of the image hub, dropping the expired entries of the other hubs."""
+    path = state.cli_cache_directory / REGISTRY_CACHE_FILENAME
+    now = time.time()
+    ttl = get_registry_cache_ttl()
+    entries = {
+        key: entry
+        for key, entry in read_json(path).items()
+        if isinstance(entry, dict)
+        and isinstance(fetched_at := entry.get("fetched_at"), int | float)
+        and now - fetched_at < ttl
+    }
+    write_json(path, entries | {hub: {"fetched_at": now, "tags": tags}})
+
+
+@dataclass
+class CachedResponse:
+    """Response body stored with its validators."""
+
+    url: str
+    content: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Return the headers asking the server to respond with 304 if the body did not change."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+
+def is_http_cache_enabled() -> bool:
+    """Check if the HTTP cache is not disabled with ``--no-cache``."""
+    return not state.no_cache
+
+
+def get_http_cache_path(url: str, token: str, headers: dict[str, str] | None = None) -> Path:
+    """Return the cache entry path of the URL fetched with the token and headers.
+
+    Responses depend on the caller and on the ``VARY_HEADERS`` (e.g. the organization of the listed projects),
+    so they are a part of the key. The caller is the identity of the token (``get_token_identity``), not the
+    token itself, so the entries survive the token refresh. Only the hash of the key is stored.
+    """
+    lowered = {name.lower(): value for name, value in (headers or {}).items()}
+    varying = [f"{name}: {lowered.get(name.lower(), '')}" for name in VARY_HEADERS]
+    key = hashlib.sha256("\n".join([get_token_identity(token), url, *varying]).encode()).hexdigest()
+    return state.cli_cache_directory / HTTP_CACHE_DIRNAME / f"{key}.json"
+
+
+def load_response(url: str, token: str, headers: dict[str, str] | None = None) -> CachedResponse | None:
+    """Return the cached response of the URL or ``None`` if it is not cached."""
+    path = get_http_cache_path(url, token, headers)
+    data = read_json(path)
+    try:
+        cached = CachedResponse(**data)
+    except TypeError:
+        return None
+
+    # mtime is the last use time for the LRU eviction
+    with contextlib.suppress(OSError):
+        os.utime(path)
+
+    return cached if cached.url == url else None
+
+
+def save_response(
+    url: str,
+    token: str,
+    content: str,
+    etag: str | None,
+    last_modified: str | None,
+    headers: dict[str, str] | None = None,
+) -> None:
+    """Store the response if it has a validator, otherwise it could never be revalidated."""
+    if not etag and not last_modified:
+        return
+
+    write_json(get_http_cache_path(url, token, headers), asdict(CachedResponse(url, content, etag, last_modified)))
+    evict_responses()
+
+
+def evict_responses() -> None:
+    """Remove the least recently used entries above the ``DF_HTTP_CACHE_SIZE`` limit."""
+    max_size = float(state.cli_config.get("df_http_cache_size", DF_HTTP_CACHE_SIZE)) * 1024 * 1024
+    entries = []
+    for path in (state.cli_cache_directory / HTTP_CACHE_DIRNAME).glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+        if total_size <= max_size:
+            break
+
+        echo.debug(f"Evicting cached response {path.name}")
+        path.unlink(missing_ok=True)
+        total_size -= size
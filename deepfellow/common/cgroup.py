@@ -0,0 +1,213 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Container resource usage read straight from the cgroup v2 files.
+
+``docker stats --no-stream`` samples the containers for a full interval. On Linux hosts with cgroup v2
+the same numbers are available in the container's cgroup directory and its network namespace:
+https://docs.kernel.org/admin-guide/cgroup-v2.html
+
+The PID reported by the daemon is a host PID only if the daemon runs on this host. With a remote
+``DOCKER_HOST`` or the VM of Docker Desktop it is some unrelated local process (or none), so the
+cgroup of the process must contain the container ID before its files are read.
+"""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from deepfellow.common.docker_api import format_binary_size, format_decimal_size
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+PROC_ROOT = Path("/proc")
+# Time between the two ``cpu.stat`` reads used to compute the CPU usage
+CPU_SAMPLE_INTERVAL = 0.1
+
+
+class CgroupError(Exception):
+    """Raised if the cgroup files are not available."""
+
+
+@dataclass(frozen=True)
+class ContainerProcess:
+    """Main process of a container as reported by the daemon."""
+
+    container_id: str
+    pid: int
+
+
+@dataclass
+class CgroupSample:
+    """Counters read from the cgroup of a single container."""
+
+    cpu_usage_usec: int
+    memory_usage: int
+    memory_limit: int
+    block_read: int
+    block_write: int
+    net_rx: int
+    net_tx: int
+    pids: int
+
+
+def is_cgroup_v2() -> bool:
+    """Check if the host uses the unified cgroup v2 hierarchy."""
+    return (CGROUP_ROOT / "cgroup.controllers").exists()
+
+
+def get_cgroup_path(process: ContainerProcess) -> Path:
+    """Return the cgroup directory of the container's main process.
+
+    Raises:
+        CgroupError: When the process is not readable or its cgroup does not belong to the container
+    """
+    try:
+        content = (PROC_ROOT / str(process.pid) / "cgroup").read_text()
+    except OSError as exc:
+        raise CgroupError(f"Unable to read cgroup of process {process.pid}") from exc
+
+    for line in content.splitlines():
+        # cgroup v2 entry: "0::/system.slice/docker-<id>.scope"
+        if line.startswith("0::"):
+            cgroup = line[3:].lstrip("/")
+            if process.container_id not in cgroup:
+                raise CgroupError(
+                    f"Process {process.pid} is not in the cgroup of container {process.container_id[:12]}, "
+                    "the Docker daemon is not local"
+                )
+
+            return CGROUP_ROOT / cgroup
+
+    raise CgroupError(f"Process {process.pid} is not in a cgroup v2 hierarchy")
+
+
+def parse_key_values(content: str) -> dict[str, int]:
+    """Parse the flat keyed files like ``cpu.stat`` or ``memory.stat``."""
+    values = {}
+    for line in content.splitlines():
+        key, _, value = line.partition(" ")
+        if value.isdigit():
+            values[key] = int(value)
+
+    return values
+
+
+def parse_io_stat(content: str) -> tuple[int, int]:
+    """Return the total read and written bytes from ``io.stat``.
+
+    Line format: ``8:0 rbytes=1459200 wbytes=314773504 rios=192 wios=353 dbytes=0 dios=0``
+    """
+    read = write = 0
+    for line in content.splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition("=")
+            if key == "rbytes":
+                read += int(value)
+            elif key == "wbytes":
+                write += int(value)
+
+    return read, write
+
+
+def parse_net_dev(content: str) -> tuple[int, int]:
+    """Return the received and transmitted bytes of all interfaces except loopback from ``/proc/<pid>/net/dev``."""
+    rx = tx = 0
+    # The first two lines are headers
+    for line in content.splitlines()[2:]:
+        interface, _, counters = line.partition(":")
+        if interface.strip() == "lo":
+            continue
+
+        fields = counters.split()
+        rx += int(fields[0])
+        tx += int(fields[8])
+
+    return rx, tx
+
+
+def get_host_memory() -> int:
+    """Return the total memory of the host, used when the container has no memory limit."""
+    try:
+        content = (PROC_ROOT / "meminfo").read_text()
+    except OSError as exc:
+        raise CgroupError("Unable to read the host memory") from exc
+
+    for line in content.splitlines():
+        if line.startswith("MemTotal:"):
+            return int(line.split()[1]) * 1024
+
+    return 0
+
+
+def read_sample(process: ContainerProcess) -> CgroupSample:
+    """Read the counters of the container with the main ``process``."""
+    pid = process.pid
+    cgroup_path = get_cgroup_path(process)
+    try:
+        cpu_stat = parse_key_values((cgroup_path / "cpu.stat").read_text())
+        memory_current = int((cgroup_path / "memory.current").read_text())
+        memory_max = (cgroup_path / "memory.max").read_text().strip()
+        memory_stat = parse_key_values((cgroup_path / "memory.stat").read_text())
+        io_stat = (cgroup_path / "io.stat").read_text() if (cgroup_path / "io.stat").exists() else ""
+        pids_current = (cgroup_path / "pids.current").read_text() if (cgroup_path / "pids.current").exists() else "0"
+        net_dev = (PROC_ROOT / str(pid) / "net" / "dev").read_text()
+    except (OSError, ValueError) as exc:
+        raise CgroupError(f"Unable to read cgroup files from {cgroup_path}") from exc
+
+    block_read, block_write = parse_io_stat(io_stat)
+    net_rx, net_tx = parse_net_dev(net_dev)
+    return CgroupSample(
+        cpu_usage_usec=cpu_stat.get("usage_usec", 0),
+        # Same as docker stats: page cache is not counted as used memory
+        memory_usage=max(memory_current - memory_stat.get("inactive_file", 0), 0),
+        memory_limit=get_host_memory() if memory_max == "max" else int(memory_max),
+        block_read=block_read,
+        block_write=block_write,
+        net_rx=net_rx,
+        net_tx=net_tx,
+        pids=int(pids_current),
+    )
+
+
+def cgroup_stats(
+    processes: dict[str, ContainerProcess], interval: float = CPU_SAMPLE_INTERVAL
+) -> dict[str, dict[str, str]]:
+    """Return usage of the containers, the same as ``docker stats --no-stream --format json``.
+
+    Args:
+        processes: Main process of the container keyed by the container name
+        interval: Time between the two reads used to compute the CPU usage
+
+    Returns:
+        Usage entries keyed by the container name
+
+    Raises:
+        CgroupError: When the cgroup files are not available or the daemon is not local
+    """
+    first = {name: read_sample(process) for name, process in processes.items()}
+    started = time.monotonic()
+    time.sleep(interval)
+    second = {name: read_sample(process) for name, process in processes.items()}
+    elapsed_usec = (time.monotonic() - started) * 1_000_000
+
+    usage = {}
+    for name, sample in second.items():
+        cpu_percent = (sample.cpu_usage_usec - first[name].cpu_usage_usec) / elapsed_usec * 100
+        memory_percent = sample.memory_usage / sample.memory_limit * 100 if sample.memory_limit else 0.0
+        usage[name] = {
+            "Name": name,
+            "CPUPerc": f"{max(cpu_percent, 0.0):.2f}%",
+            "MemUsage": f"{format_binary_size(sample.memory_usage)} / {format_binary_size(sample.memory_limit)}",
+            "MemPerc": f"{memory_percent:.2f}%",
+            "NetIO": f"{format_decimal_size(sample.net_rx)} / {format_decimal_size(sample.net_tx)}",
+            "BlockIO": f"{format_decimal_size(sample.block_read)} / {format_decimal_size(sample.block_write)}",
+            "PIDs": str(sample.pids),
+        }
+
+    return usage
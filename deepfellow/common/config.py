@@ -9,13 +9,18 @@
 
 """Config for CLI."""
 
+import os
 import re
-from collections.abc import Mapping
+import stat
+from collections.abc import Iterable, Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from uuid import uuid4
 
 from deepfellow.common.echo import echo
+from deepfellow.common.state import state
+
+NumberT = TypeVar("NumberT", int, float)
 
 
 def dict_to_env(data: dict[str, Any], prefix: str = "DF_", parent_key: str = "") -> dict[str, str]:
@@ -96,6 +101,42 @@ def env_to_dict(env_vars: dict[str, str], prefix: str = "") -> EnvDict:
     return result
 
 
+ENV_LINE_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$")
+ENV_FILE_HEADER = "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
+
+
+def parse_env_line(line: str) -> tuple[str, str] | None:
+    """Parse the KEY=VALUE line of a .env file.
+
+    Args:
+        line: Line of the .env file
+
+    Returns:
+        Tuple (env_name, env_value) or None for comments, blank and malformed lines
+    """
+    line = line.strip()
+
+    if not line or line.startswith("#"):
+        return None
+
+    # Match KEY=VALUE pattern (with optional quotes)
+    match = ENV_LINE_PATTERN.match(line)
+    if not match:
+        return None  # Skip malformed lines
+
+    key, value = match.groups()
+
+    # Remove surrounding quotes if present
+    if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
+        value = value[1:-1]
+
+    # Handle escape sequences in double quotes
+    if '"' in line and not value.startswith("'"):
+        value = value.replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"').replace("\\\\", "\\")
+
+    return key, value
+
+
 def read_env_file(file_path: str | Path) -> dict[str, str]:
     """Read environment variables from a .env file.
 
@@ -105,73 +146,202 @@ def read_env_file(file_path: str | Path) -> dict[str, str]:
     Returns:
         Dictionary of environment variables {env_name: env_value}
     """
-    env_vars = {}
     file_path = Path(file_path)
 
     if not file_path.exists():
         raise FileNotFoundError(f"Environment file not found: {file_path}")
 
     lines = file_path.read_text(encoding="utf-8").splitlines()
+    return dict(parsed for line in lines if (parsed := parse_env_line(line)) is not None)
 
-    for line in lines:
-        line = line.strip()
 
-        if not line or line.startswith("#"):
-            continue
+def read_env_file_to_dict(env_file: Path) -> EnvDict:
+    """Read envs and return as deep dict."""
+    if env_file.exists():
+        original_env_vars = read_env_file(env_file)
+        return env_to_dict(original_env_vars)
 
-        # Match KEY=VALUE pattern (with optional quotes)
-        match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)$", line)
-        if not match:
-            continue  # Skip malformed lines
+    return {}
 
-        key, value = match.groups()
 
-        # Remove surrounding quotes if present
-        if (value.startswith('"') and value.endswith('"')) or (value.startswith("'") and value.endswith("'")):
-            value = value[1:-1]
+def get_config_number(name: str, default: NumberT) -> NumberT:
+    """Return the number set in the CLI config, the default (with a warning) if it is not a valid number.
 
-        # Handle escape sequences in double quotes
-        if '"' in line and not value.startswith("'"):
-            value = value.replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"').replace("\\\\", "\\")
+    Args:
+        name: Variable name, e.g. ``DF_PULL_RETRIES``
+        default: Value used when the variable is not set, its type is the type of the result
+    """
+    value = state.cli_config.get(name.lower(), default)
+    try:
+        return type(default)(value)
+    except (TypeError, ValueError):
+        echo.warning(f"Invalid {name} value {value!r} in the CLI config, using the default {default}.")
+        return default
 
-        env_vars[key] = value
 
-    return env_vars
+def write_file_atomic(path: Path, content: str | Iterable[str], mode: int | None = None) -> None:
+    """Write the file atomically: to a temporary file in the same directory, fsync-ed and renamed over the path.
 
+    The content is written as is or chunk by chunk, so large files are not built in memory. The temporary
+    file is removed when the write fails, the path is left untouched.
 
-def read_env_file_to_dict(env_file: Path) -> EnvDict:
-    """Read envs and return as deep dict."""
-    if env_file.exists():
-        original_env_vars = read_env_file(env_file)
-        return env_to_dict(original_env_vars)
+    Args:
+        path: File to write
+        content: Text or the chunks of text
+        mode: Permissions of the file; by default an existing file keeps its permissions and a new one
+            gets the default ones (umask applies)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if mode is None and path.exists():
+        mode = stat.S_IMODE(path.stat().st_mode)
+
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if mode is None else 0o600)
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.writelines([content] if isinstance(content, str) else content)
+            file.flush()
+            os.fsync(file.fileno())
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    temp_path.replace(path)
+
+
+class EnvFile:
+    """Transaction over a .env file.
+
+    The file is parsed once, any number of changes is applied in memory and ``save`` writes them
+    with a single atomic write. Comments, blank lines and the order of the variables are kept:
+    changed variables are rewritten in place and new ones are appended at the end.
+
+    Sample usage:
+    ```
+    env = EnvFile.read(directory / ".env")
+    previous_url = env.get("DF_CONNECT_TO_MESH_URL")
+    env.update({"DF_CONNECT_TO_MESH_URL": url, "DF_CONNECT_TO_MESH_KEY": key})
+    env.save()
+    ```
+    """
 
-    return {}
+    def __init__(self, path: Path, lines: Iterable[str] = (), exists: bool = False) -> None:
+        self.path = path
+        self.exists = exists
+        self.load(lines)
+
+    def load(self, lines: Iterable[str]) -> None:
+        """Parse the lines of the file, dropping the unsaved changes."""
+        self.lines = list(lines)
+        self.values: dict[str, str] = {}
+        # Line of the last definition of every variable, that is the one rewritten on change
+        self.line_numbers: dict[str, int] = {}
+        # Changed variables, None marks the removed ones
+        self.changes: dict[str, str | None] = {}
+        for line_number, line in enumerate(self.lines):
+            if (parsed := parse_env_line(line)) is not None:
+                key, value = parsed
+                self.values[key] = value
+                self.line_numbers[key] = line_number
+
+    @classmethod
+    def read(cls, path: Path) -> "EnvFile":
+        """Parse the file, a missing file is read as empty and created on save."""
+        if not path.is_file():
+            return cls(path)
+
+        return cls(path, path.read_text(encoding="utf-8").splitlines(), exists=True)
+
+    @property
+    def changed(self) -> bool:
+        """Check if there are unsaved changes."""
+        return bool(self.changes)
+
+    def get(self, key: str, default: str | None = None) -> str | None:
+        """Return the value of the variable."""
+        return self.values.get(key, default)
+
+    def as_dict(self) -> dict[str, str]:
+        """Return all variables {env_name: env_value}."""
+        return dict(self.values)
+
+    def set(self, key: str, value: str | int) -> None:
+        """Set the variable, setting the current value is not a change."""
+        value = str(value)
+        if self.values.get(key) == value:
+            return
+
+        self.values[key] = value
+        self.changes[key] = value
+
+    def update(self, values: Mapping[str, str | int]) -> None:
+        """Set all the variables."""
+        for key, value in values.items():
+            self.set(key, value)
+
+    def unset(self, key: str) -> None:
+        """Remove the variable from the file."""
+        if self.values.pop(key, None) is not None:
+            self.changes[key] = None
+
+    def render(self, docker_note: bool = True) -> str:
+        """Return the file content with the changes applied."""
+        lines = [ENV_FILE_HEADER] if docker_note and not self.exists else []
+        for line_number, line in enumerate(self.lines):
+            parsed = parse_env_line(line)
+            if parsed is None or parsed[0] not in self.changes:
+                lines.append(f"{line}\n")
+                continue
+
+            key = parsed[0]
+            value = self.changes[key]
+            # Earlier definitions of the changed variable are dropped, they were overridden anyway
+            if value is not None and self.line_numbers[key] == line_number:
+                lines.append(f"{key}={value}\n")
+
+        lines.extend(
+            f"{key}={value}\n"
+            for key, value in self.changes.items()
+            if value is not None and key not in self.line_numbers
+        )
+        return "".join(lines)
+
+    def save(self, docker_note: bool = True, quiet: bool = False) -> bool:
+        """Write the changes at once, a missing file is created even without changes.
+
+        Args:
+            docker_note: Start a new file with the Docker Compose header comment
+            quiet: Report the write on the debug level only
+
+        Returns:
+            True if the file was written
+        """
+        if self.exists and not self.changed:
+            echo.debug(f"No changes in {self.path.as_posix()}.")
+            return False
+
+        content = self.render(docker_note)
+        write_file_atomic(self.path, content)
+
+        action = "Updated" if self.exists else "Generated"
+        msg = echo.debug if quiet else echo.info
+        msg(f"{action} {self.path.as_posix()}.")
+
+        self.exists = True
+        self.load(content.splitlines())
+        return True
 
 
 def save_env_file(
     env_file: Path, values: Mapping[str, str | int], docker_note: bool = True, quiet: bool = False
 ) -> None:
     """Creates or updates .env file with provided values."""
-    # Load existing values if file exists
-    existing_vars = {}
-    file_existed = env_file.exists()
-    if file_existed:
-        existing_vars = read_env_file(env_file)
-
-    env_file.parent.mkdir(exist_ok=True)
-
-    # Merge existing with new values (new values take precedence)
-    final_vars = {**existing_vars, **values}
-
-    content = "# Docker Compose Environment Variables\n# Edit these values as needed\n\n" if docker_note else ""
-    for key, value in final_vars.items():
-        content += f"{key}={value}\n"
-
-    env_file.write_text(content)
-
-    action = "Updated" if file_existed else "Generated"
-    msg = echo.debug if quiet else echo.info
-    msg(f"{action} {env_file.as_posix()}.")
+    env = EnvFile.read(env_file)
+    env.update(values)
+    env.save(docker_note=docker_note, quiet=quiet)
 
 
 def configure_uuid_key(name: str, existing: Any) -> str:
@@ -15,8 +15,11 @@ from typing import Any
 
 DF_DEEPFELLOW_DIRECTORY = Path.home() / ".deepfellow"
 
+
 DF_CLI_CONFIG_PATH = DF_DEEPFELLOW_DIRECTORY / "config"  # env style config file
 DF_CLI_SECRETS_PATH = DF_DEEPFELLOW_DIRECTORY / "secrets"  # env style secrets file
+DF_CLI_CACHE_DIRECTORY = DF_DEEPFELLOW_DIRECTORY / "cache"
+DF_CLI_BUNDLE_PATH = DF_DEEPFELLOW_DIRECTORY / "bundle.json"  # images loaded with `bundle import`
 
 DF_INFRA_DIRECTORY = DF_DEEPFELLOW_DIRECTORY / "infra"
 DF_INFRA_IMAGE_HUB = "hub.simplito.com/deepfellow/deepfellow-infra"
@@ -40,6 +43,13 @@ DF_MONGO_DB = "deepfellow"
 
 DOCKER_COMPOSE_CONFIG_FILENAME = "compose.yaml"
 
+
+class OutputFormatChoice(str, Enum):
+    table = "table"
+    json = "json"
+    jsonl = "jsonl"
+
+
 # ================
 # Vector databases
 # ================
@@ -443,3 +453,23 @@ OTEL_COLLECTOR_CONFIG_DEBUG_ONLY = {
         },
     },
 }
+
+# TCP proxy publishing the port of a service updated with `update --zero-downtime`,
+# the stream proxy passes TLS through, so it works with `ssl-on` as well
+DOCKER_COMPOSE_PROXY_IMAGE = "nginx:1.27-alpine"
+PROXY_NGINX_CONF = """
+events {{}}
+
+stream {{
+    upstream backend {{
+        server {service}:{port};
+    }}
+
+    server {{
+        listen {port};
+        proxy_pass backend;
+        proxy_connect_timeout 2s;
+        proxy_next_upstream on;
+    }}
+}}
+"""
@@ -9,15 +9,29 @@
 
 """Docker helper methods."""
 
+import json
 import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import typer
 import yaml
 
+from deepfellow.common.cgroup import CgroupError, ContainerProcess, cgroup_stats, is_cgroup_v2
 from deepfellow.common.config import env_to_dict, read_env_file
 from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME
+from deepfellow.common.docker_api import (
+    COMPOSE_PROJECT_LABEL,
+    DockerApiError,
+    DockerApiNotFoundError,
+    compose_labels,
+    compose_project_name,
+    container_to_compose_ps,
+    get_docker_api,
+    stats_to_usage,
+)
 from deepfellow.common.echo import echo
 from deepfellow.common.exceptions import DockerNetworkError, DockerSocketNotFoundError
 from deepfellow.common.system import run
@@ -29,6 +43,9 @@ class DockerError(Exception):
 
 def is_docker_installed() -> bool:
     """Checks if docker is installed."""
+    if shutil.which("docker") is not None and get_docker_api() is not None:
+        return True
+
     try:
         run(["docker", "--version"], capture_output=True, raises=DockerError)
     except (DockerError, FileNotFoundError):
@@ -39,6 +56,9 @@ def is_docker_installed() -> bool:
 
 def is_user_allowed_to_use_docker() -> bool:
     """Check is user is allowed to use docker."""
+    if get_docker_api() is not None:
+        return True
+
     try:
         run(["docker", "ps"], capture_output=True, raises=DockerError)
     except DockerError:
@@ -108,6 +128,19 @@ def load_compose_file(compose_file: Path = Path(DOCKER_COMPOSE_CONFIG_FILENAME))
     return yaml.safe_load(compose_file.read_text())
 
 
+def set_pull_policy(service: dict[str, Any], local_image: bool) -> bool:
+    """Set ``pull_policy: never`` for a locally built image, return True if the service changed."""
+    if local_image:
+        if "pull_policy" not in service:
+            service["pull_policy"] = "never"
+            return True
+    elif "pull_policy" in service:
+        del service["pull_policy"]
+        return True
+
+    return False
+
+
 def get_socket(allow_rootful: bool = False) -> str:
     """Get the Docker socket.
 
@@ -174,6 +207,12 @@ def list_networks() -> list[str]:
     Raises:
         DockerNetworkError: When unable to fetch network list
     """
+    if (api := get_docker_api()) is not None:
+        try:
+            return api.list_networks()
+        except DockerApiError as exc:
+            echo.debug(exc)
+
     result = run(["docker", "network", "ls", "--format", "{{.Name}}"], capture_output=True)
     if result is None:
         raise DockerNetworkError("Failed to fetch Docker network list")
@@ -198,6 +237,15 @@ def create_network(network_name: str, driver: str = "bridge") -> None:
     Raises:
         DockerNetworkError: When unable to create network
     """
+    if (api := get_docker_api()) is not None:
+        try:
+            api.create_network(network_name, driver)
+        except DockerApiError as exc:
+            echo.debug(exc)
+        else:
+            echo.debug(f"Created docker network {network_name}.")
+            return
+
     try:
         run(["docker", "network", "create", "--driver", driver, network_name], raises=DockerError, quiet=True)
         echo.debug(f"Created docker network {network_name}.")
@@ -240,6 +288,12 @@ def add_network_to_service(service: dict, network_name: str) -> None:
 
 def is_service_running(service: str, cwd: Path) -> bool:
     """Check if service is running."""
+    if (api := get_docker_api()) is not None:
+        try:
+            return bool(api.list_containers(compose_labels(cwd, service), status="running"))
+        except DockerApiError as exc:
+            echo.debug(exc)
+
     result: str | None = None
     try:
         result = run(
@@ -269,188 +323,168 @@ def get_docker_network(directory: Path) -> str:
     return str(env_content.get("df_infra_docker_subnet", ""))
 
 
-def parse_docker_compose_ps(data: str) -> dict[str, str]:
-    """Parse the output of docker compose ps command.
+def parse_json_output(data: str) -> list[dict[str, Any]]:
+    """Parse the ``--format json`` output of docker commands.
+
+    Depending on the version, docker prints either a JSON array or one JSON object per line.
 
     Args:
-        data: The output string from docker compose ps
+        data: The output string from docker command
 
     Returns:
-        Dictionary with container information keyed by column names
+        List of the parsed entries
     """
-    lines = data.splitlines()
-
-    if len(lines) < 2:
-        return {}
+    data = data.strip()
+    if not data:
+        return []
 
-    header = lines[0]
-    info = lines[1]
+    if data.startswith("["):
+        return list(json.loads(data))
 
-    # Find the start positions of each column header
-    indexes = {}
-    last_end = 0
-    headers = header.split()
+    return [json.loads(line) for line in data.splitlines() if line.strip()]
 
-    for i, header_name in enumerate(headers):
-        start = header.find(header_name, last_end)
-        if i < len(headers) - 1:
-            next_header = headers[i + 1]
-            end = header.find(next_header, start)
-        else:
-            end = len(info)
-
-        indexes[header_name] = (start, end)
-        last_end = start + 1
-
-    # Extract data for each column
-    result = {}
-    for header_name, (start, end) in indexes.items():
-        value = info[start:end].strip()
-        result[header_name] = value
 
-    return result
+def docker_ps(directory: Path) -> list[dict[str, Any]]:
+    """Return all containers of the compose project, the same as ``docker compose ps --all --format json``."""
+    if (api := get_docker_api()) is not None:
+        try:
+            containers = api.list_containers(
+                {COMPOSE_PROJECT_LABEL: compose_project_name(directory)}, all_containers=True
+            )
+            return [container_to_compose_ps(container) for container in containers]
+        except DockerApiError as exc:
+            echo.debug(exc)
 
+    result = run(["docker", "compose", "ps", "--all", "--format", "json"], cwd=directory, capture_output=True)
+    if result is None:
+        echo.error(f"Failed to get docker status from {directory}")
+        raise typer.Exit(1)
 
-def parse_docker_compose_usage(data: str) -> dict[str, str]:
-    """Parse the output of docker stats command.
+    return parse_json_output(result)
 
-    Args:
-        data: The output string from docker stats command
 
-    Returns:
-        Dictionary with container usage information
-    """
-    lines = data.splitlines()
+def get_container_processes(directory: Path) -> dict[str, ContainerProcess]:
+    """Return the ID and main process of the running containers of the compose project keyed by the container name."""
+    if (api := get_docker_api()) is not None:
+        try:
+            containers = api.list_containers({COMPOSE_PROJECT_LABEL: compose_project_name(directory)}, status="running")
+            inspected = [api.inspect_container(container["Id"]) for container in containers]
+            return {
+                container["Name"].lstrip("/"): ContainerProcess(container["Id"], container["State"]["Pid"])
+                for container in inspected
+            }
+        except DockerApiError as exc:
+            echo.debug(exc)
 
-    if len(lines) < 2:
+    container_ids = run(["docker", "compose", "ps", "-q"], cwd=directory, capture_output=True)
+    if not container_ids or not container_ids.split():
         return {}
 
-    header_line = lines[0]
-
-    # Define the expected column headers in order (as they appear in docker stats)
-    column_headers = ["CONTAINER ID", "NAME", "CPU %", "MEM USAGE / LIMIT", "MEM %", "NET I/O", "BLOCK I/O", "PIDS"]
-
-    # Find the start position of each column header
-    indexes = {}
-    for i, header_name in enumerate(column_headers):
-        start = header_line.find(header_name)
-        if start == -1:
+    result = run(
+        ["docker", "inspect", "--format", "{{.Name}} {{.Id}} {{.State.Pid}}", *container_ids.split()],
+        capture_output=True,
+    )
+    processes = {}
+    for line in (result or "").splitlines():
+        fields = line.split()
+        if len(fields) != 3:
             continue
 
-        # Determine end position (start of next column or end of line)
-        if i < len(column_headers) - 1:
-            # Find where the next column starts
-            next_start = len(header_line)
-            for next_header in column_headers[i + 1 :]:
-                next_pos = header_line.find(next_header)
-                if next_pos != -1:
-                    next_start = next_pos
-                    break
-            end = next_start
-        else:
-            end = len(header_line)
-
-        indexes[header_name] = (start, end)
+        name, container_id, pid = fields
+        if pid.isdigit() and int(pid) > 0:
+            processes[name.lstrip("/")] = ContainerProcess(container_id, int(pid))
 
-    # Process the first data line (skip header)
-    data_line = lines[1]
+    return processes
 
-    container_info = {}
-    for header_name, (start, end) in indexes.items():
-        # Extract substring respecting column bounds
-        value = data_line[start:end].strip() if end <= len(data_line) else data_line[start:].strip()
 
-        # Split MEM USAGE / LIMIT into two separate fields
-        if header_name == "MEM USAGE / LIMIT":
-            parts = value.split(" / ")
-            if len(parts) == 2:
-                container_info["MEM USAGE"] = parts[0].strip()
-                container_info["MEM LIMIT"] = parts[1].strip()
-        else:
-            container_info[header_name] = value
+def docker_stats(directory: Path) -> dict[str, dict[str, str]]:
+    """Return usage of the running containers, the same as ``docker stats --no-stream --format json``.
 
-    return container_info
+    On cgroup v2 hosts the usage is read straight from the cgroup files, which takes a fraction
+    of the ``docker stats`` sampling interval. Docker is asked for the stats if the files are not readable.
 
+    Returns:
+        Usage entries keyed by the container name. The CLI fallback samples all running containers,
+        so the result may contain containers from outside of the compose project.
+    """
+    if is_cgroup_v2():
+        try:
+            return cgroup_stats(get_container_processes(directory))
+        except CgroupError as exc:
+            echo.debug(exc)
+
+    if (api := get_docker_api()) is not None:
+        try:
+            containers = api.list_containers({COMPOSE_PROJECT_LABEL: compose_project_name(directory)}, status="running")
+            with ThreadPoolExecutor(max_workers=max(len(containers), 1)) as executor:
+                stats = list(executor.map(api.container_stats, [container["Id"] for container in containers]))
+            usage = [stats_to_usage(container_stats) for container_stats in stats]
+            return {container_usage["Name"]: container_usage for container_usage in usage}
+        except DockerApiError as exc:
+            echo.debug(exc)
+
+    result = run(["docker", "stats", "--no-stream", "--format", "{{json .}}"], cwd=directory, capture_output=True)
+    if result is None:
+        echo.debug("Failed to get docker stats")
+        return {}
 
-def docker_ps(directory: Path, context: str) -> dict[str, str] | None:
-    """Run docker compose ps command and display results."""
-    # Execute docker compose ps command in the specified directory
-    try:
-        result = run(["docker", "compose", "ps", context], cwd=directory, capture_output=True)
-    except Exception as e:
-        echo.debug(e)
-        echo.error(f"Failed to get docker status from {context}")
-        return None
-
-    # Check if the command returned any containers (header line + at least one data line)
-    if not result or len(result.splitlines()) <= 1:
-        echo.info(f"No {context} container is currently running.")
-        return None
-
-    # Parse the docker ps output into a structured dictionary
-    parsed = parse_docker_compose_ps(result)
-
-    # Validate parsing was successful
-    if not parsed:
-        echo.error("Error parsing docker ps")
-        raise typer.Exit(1)
+    return {container_usage["Name"]: container_usage for container_usage in parse_json_output(result)}
 
-    return parsed
 
+def get_image_repo_digests(image: str) -> list[str]:
+    """Return the ``RepoDigests`` (``repository@sha256:...``) of the local image, empty if it is not present."""
+    if (api := get_docker_api()) is not None:
+        try:
+            return list(api.inspect_image(image).get("RepoDigests") or [])
+        except DockerApiNotFoundError:
+            return []
+        except DockerApiError as exc:
+            echo.debug(exc)
 
-def get_container_id(directory: Path, context: str) -> str:
-    """Run docker ps context -q."""
     try:
-        result = run(["docker", "compose", "ps", context, "-q"], cwd=directory, capture_output=True)
-    except Exception as e:
-        echo.debug(e)
-        echo.error(f"Failed to check container ID for {context}")
-        raise typer.Exit(1) from e
+        result = run(
+            ["docker", "image", "inspect", "--format", "{{json .RepoDigests}}", image],
+            capture_output=True,
+            raises=DockerError,
+        )
+    except DockerError:
+        return []
 
-    return str(result)
+    return list(json.loads(result or "null") or [])
 
 
-def docker_stats(directory: Path, context: str) -> dict[str, str] | None:
-    """Run docker stats command and display results."""
-    container_id = get_container_id(directory, context)
+def is_image_present(image: str) -> bool:
+    """Check if the image is present locally, the registry is not contacted."""
+    if (api := get_docker_api()) is not None:
+        try:
+            api.inspect_image(image)
+        except DockerApiNotFoundError:
+            return False
+        except DockerApiError as exc:
+            echo.debug(exc)
+        else:
+            return True
+
     try:
-        result = run(["docker", "stats", container_id, "--no-stream"], cwd=directory, capture_output=True)
-    except Exception as e:
-        echo.debug(e)
-        echo.error(f"Failed to get docker stats for {context}")
-        return None
+        run(["docker", "image", "inspect", "--format", "{{.Id}}", image], capture_output=True, raises=DockerError)
+    except DockerError:
+        return False
 
-    if not result or len(result.splitlines()) <= 1:
-        echo.info(f"No {context} container is currently running.")
-        return None
+    return True
 
-    parsed = parse_docker_compose_usage(result)
 
-    if not parsed:
-        echo.error("Error parsing docker response")
-        raise typer.Exit(1)
+def list_image_tags(repository: str) -> list[str]:
+    """Return the tags of the local images of the repository, e.g. ``registry.example.com/org/image``."""
+    if (api := get_docker_api()) is not None:
+        try:
+            images = api.list_images(repository)
+        except DockerApiNotFoundError:
+            return []
+        except DockerApiError as exc:
+            echo.debug(exc)
+        else:
+            repo_tags = [repo_tag.rpartition(":") for image in images for repo_tag in image.get("RepoTags") or []]
+            return [tag for name, _, tag in repo_tags if name == repository]
 
-    return parsed
-
-
-def print_docker_status(directory: Path, context: str) -> None:
-    """Collect stats about docker and print them out."""
-    ps_response = docker_ps(directory, context) or {}
-    stat_response = docker_stats(directory, context) or {}
-    response = ps_response | stat_response
-    if not response:
-        echo.error("Failed to get data from docker.")
-        return
-
-    # Display container information in a formatted output
-    echo.info(
-        f"image: {response.get('IMAGE', 'N/A')}"
-        f"\ncreated: {response.get('CREATED', 'N/A')}"
-        f"\nstatus: {response.get('STATUS', 'N/A')}"
-        f"\nports: {response.get('PORTS', 'N/A')}"
-        f"\nCPU: {response.get('CPU %', 'N/A')}"
-        f"\nUsed memory: {response.get('MEM USAGE', 'N/A')}"
-        f"\nMemory limit: {response.get('MEM LIMIT', 'N/A')}"
-        f"\nNET I/O: {response.get('NET I/O', 'N/A')}"
-        f"\nDisk I/O: {response.get('BLOCK I/O', 'N/A')}"
-    )
+    result = run(["docker", "image", "ls", "--format", "{{.Tag}}", repository], capture_output=True)
+    return [tag for tag in (result or "").split() if tag != "<none>"]
@@ -0,0 +1,317 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Docker Engine API client.
+
+Talks to the Docker daemon directly over its unix socket, so the read-only probes and network calls
+do not spawn a ``docker`` subprocess. Callers fall back to the CLI when ``get_docker_api`` returns ``None``
+or a call raises ``DockerApiError``.
+
+https://docs.docker.com/reference/api/engine/
+"""
+
+import atexit
+import json
+import os
+import re
+import time
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from deepfellow.common.echo import echo
+
+DOCKER_API_TIMEOUT = 5.0
+# ``GET /containers/{id}/stats?stream=false`` waits for two samples to compute the CPU usage
+DOCKER_API_STATS_TIMEOUT = 10.0
+
+COMPOSE_PROJECT_LABEL = "com.docker.compose.project"
+COMPOSE_SERVICE_LABEL = "com.docker.compose.service"
+
+
+class DockerApiError(Exception):
+    """Raised if the Docker Engine API call fails."""
+
+
+class DockerApiNotFoundError(DockerApiError):
+    """Raised if the daemon responds with 404, e.g. the image is not present - the CLI would report the same."""
+
+
+class DockerApi:
+    """Minimal Docker Engine API client."""
+
+    def __init__(self, transport: httpx.BaseTransport, timeout: float = DOCKER_API_TIMEOUT) -> None:
+        self.client = httpx.Client(transport=transport, base_url="http://docker", timeout=timeout)
+
+    @classmethod
+    def from_socket(cls, socket: str) -> "DockerApi":
+        """Create the client connected to the unix socket."""
+        return cls(httpx.HTTPTransport(uds=socket))
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self.client.close()
+
+    def request(self, method: str, path: str, **kwargs: Any) -> Any:
+        """Perform the request and return the decoded JSON response.
+
+        Raises:
+            DockerApiNotFoundError: When the daemon responds with 404.
+            DockerApiError: When the daemon is unreachable or responds with another error.
+        """
+        echo.debug(f"Docker API {method} {path}")
+        try:
+            response = self.client.request(method, path, **kwargs)
+            response.raise_for_status()
+        except httpx.HTTPStatusError as exc:
+            error = DockerApiNotFoundError if exc.response.status_code == httpx.codes.NOT_FOUND else DockerApiError
+            raise error(f"Docker API {method} {path} failed: {exc}") from exc
+        except httpx.HTTPError as exc:
+            raise DockerApiError(f"Docker API {method} {path} failed: {exc}") from exc
+
+        if not response.content:
+            return None
+
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    def ping(self) -> bool:
+        """Check if the daemon responds."""
+        try:
+            return self.request("GET", "/_ping") == "OK"
+        except DockerApiError:
+            return False
+
+    def list_networks(self) -> list[str]:
+        """Return the names of all networks."""
+        return [network["Name"] for network in self.request("GET", "/networks")]
+
+    def create_network(self, network_name: str, driver: str = "bridge") -> None:
+        """Create the network."""
+        self.request("POST", "/networks/create", json={"Name": network_name, "Driver": driver})
+
+    def list_containers(
+        self, labels: dict[str, str] | None = None, status: str | None = None, all_containers: bool = False
+    ) -> list[dict[str, Any]]:
+        """Return containers matching the labels and status."""
+        filters: dict[str, list[str]] = {}
+        if labels:
+            filters["label"] = [f"{key}={value}" for key, value in labels.items()]
+
+        if status:
+            filters["status"] = [status]
+
+        params = {"all": str(all_containers).lower(), "filters": json.dumps(filters)}
+        return list(self.request("GET", "/containers/json", params=params))
+
+    def inspect_container(self, container_id: str) -> dict[str, Any]:
+        """Return the low-level information about the container."""
+        return dict(self.request("GET", f"/containers/{container_id}/json"))
+
+    def inspect_image(self, image: str) -> dict[str, Any]:
+        """Return the low-level information about the local image."""
+        return dict(self.request("GET", f"/images/{image}/json"))
+
+    def list_images(self, reference: str) -> list[dict[str, Any]]:
+        """Return the local images matching the reference, e.g. ``registry.example.com/org/image``."""
+        params = {"filters": json.dumps({"reference": [reference]})}
+        return list(self.request("GET", "/images/json", params=params))
+
+    def pull_image(self, image: str) -> Iterator[dict[str, Any]]:
+        """Pull the image, yielding the progress events streamed by the daemon.
+
+        Raises:
+            DockerApiError: When the daemon is unreachable or reports an error.
+        """
+        echo.debug(f"Docker API POST /images/create {image}")
+        try:
+            with self.client.stream(
+                "POST",
+                "/images/create",
+                params={"fromImage": image},
+                timeout=httpx.Timeout(DOCKER_API_TIMEOUT, read=None),
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line.strip():
+                        continue
+
+                    event = json.loads(line)
+                    if "error" in event:
+                        raise DockerApiError(f"Pull of {image} failed: {event['error']}")
+
+                    yield event
+        except (httpx.HTTPError, ValueError) as exc:
+            raise DockerApiError(f"Pull of {image} failed: {exc}") from exc
+
+    def container_stats(self, container_id: str) -> dict[str, Any]:
+        """Return a single stats sample of the container."""
+        return dict(
+            self.request(
+                "GET",
+                f"/containers/{container_id}/stats",
+                params={"stream": "false"},
+                timeout=DOCKER_API_STATS_TIMEOUT,
+            )
+        )
+
+
+def find_socket() -> str | None:
+    """Find the Docker socket without spawning any process.
+
+    Unlike ``get_socket`` it never asks the user - a missing socket means the caller uses the CLI.
+    """
+    if docker_host := os.getenv("DOCKER_HOST"):
+        return docker_host.removeprefix("unix://") if docker_host.startswith("unix://") else None
+
+    candidates = [f"/run/user/{os.getuid()}/docker.sock", "/var/run/docker.sock", "/run/docker.sock"]
+    if xdg_runtime_dir := os.getenv("XDG_RUNTIME_DIR"):
+        candidates.insert(0, f"{xdg_runtime_dir}/docker.sock")
+
+    return next((candidate for candidate in candidates if Path(candidate).is_socket()), None)
+
+
+@cache
+def get_docker_api() -> DockerApi | None:
+    """Return the Docker Engine API client or ``None`` if the daemon is not reachable over the socket."""
+    socket = find_socket()
+    if socket is None:
+        echo.debug("Docker socket not found, using the docker CLI.")
+        return None
+
+    api = DockerApi.from_socket(socket)
+    if not api.ping():
+        echo.debug(f"Docker socket {socket} not reachable, using the docker CLI.")
+        api.close()
+        return None
+
+    atexit.register(api.close)
+    return api
+
+
+def compose_project_name(directory: Path) -> str:
+    """Return the Docker Compose project name used for the directory.
+
+    Mirrors the compose defaults: ``COMPOSE_PROJECT_NAME`` or the normalized directory name.
+    """
+    if project_name := os.getenv("COMPOSE_PROJECT_NAME"):
+        return project_name
+
+    return re.sub(r"[^a-z0-9_-]", "", directory.resolve().name.lower())
+
+
+def compose_labels(directory: Path, service: str) -> dict[str, str]:
+    """Return the labels identifying the compose service containers."""
+    return {COMPOSE_PROJECT_LABEL: compose_project_name(directory), COMPOSE_SERVICE_LABEL: service}
+
+
+def format_ports(ports: list[dict[str, Any]]) -> str:
+    """Format container ports like ``docker compose ps`` does."""
+    formatted = []
+    for port in ports:
+        private = f"{port['PrivatePort']}/{port['Type']}"
+        if "PublicPort" in port:
+            ip = port.get("IP", "")
+            host = f"[{ip}]" if ":" in ip else ip
+            formatted.append(f"{host}:{port['PublicPort']}->{private}")
+        else:
+            formatted.append(private)
+
+    return ", ".join(dict.fromkeys(formatted))
+
+
+def format_binary_size(size: float) -> str:
+    """Format the size with binary units, e.g. ``1.5GiB``."""
+    for unit in ("B", "KiB", "MiB", "GiB", "TiB"):
+        if size < 1024 or unit == "TiB":
+            break
+        size /= 1024
+
+    return f"{size:.4g}{unit}"
+
+
+def format_decimal_size(size: float) -> str:
+    """Format the size with decimal units, e.g. ``1.5GB``."""
+    for unit in ("B", "kB", "MB", "GB", "TB"):
+        if size < 1000 or unit == "TB":
+            break
+        size /= 1000
+
+    return f"{size:.3g}{unit}"
+
+
+def format_created(timestamp: int, now: float | None = None) -> str:
+    """Format the creation timestamp as the relative time, e.g. ``2 hours ago``."""
+    seconds = max(int((now if now is not None else time.time()) - timestamp), 0)
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if seconds >= size:
+            count = seconds // size
+            return f"{count} {unit}{'s' if count > 1 else ''} ago"
+
+    return f"{seconds} seconds ago"
+
+
+def container_to_compose_ps(container: dict[str, Any]) -> dict[str, Any]:
+    """Convert the container from ``GET /containers/json`` to the ``docker compose ps --format json`` entry."""
+    names = container.get("Names") or [""]
+    return {
+        "ID": container.get("Id", ""),
+        "Name": names[0].lstrip("/"),
+        "Image": container.get("Image", ""),
+        "Command": container.get("Command", ""),
+        "Service": container.get("Labels", {}).get(COMPOSE_SERVICE_LABEL, ""),
+        "State": container.get("State", ""),
+        "Status": container.get("Status", ""),
+        "RunningFor": format_created(container["Created"]) if "Created" in container else "",
+        "Ports": format_ports(container.get("Ports") or []),
+    }
+
+
+def stats_to_usage(stats: dict[str, Any]) -> dict[str, str]:
+    """Convert the container stats to the ``docker stats --format json`` entry."""
+    cpu_stats = stats.get("cpu_stats", {})
+    precpu_stats = stats.get("precpu_stats", {})
+    cpu_delta = cpu_stats.get("cpu_usage", {}).get("total_usage", 0) - precpu_stats.get("cpu_usage", {}).get(
+        "total_usage", 0
+    )
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+    online_cpus = cpu_stats.get("online_cpus") or len(cpu_stats.get("cpu_usage", {}).get("percpu_usage") or [1])
+    cpu_percent = cpu_delta / system_delta * online_cpus * 100 if system_delta > 0 and cpu_delta > 0 else 0.0
+
+    memory_stats = stats.get("memory_stats", {})
+    # Same as the CLI: page cache is not counted as used memory (``inactive_file`` on cgroup v2)
+    memory_details = memory_stats.get("stats", {})
+    memory_cache = memory_details.get("inactive_file", memory_details.get("total_inactive_file", 0))
+    memory_usage = max(memory_stats.get("usage", 0) - memory_cache, 0)
+    memory_limit = memory_stats.get("limit", 0)
+    memory_percent = memory_usage / memory_limit * 100 if memory_limit else 0.0
+
+    networks = (stats.get("networks") or {}).values()
+    net_rx = sum(network.get("rx_bytes", 0) for network in networks)
+    net_tx = sum(network.get("tx_bytes", 0) for network in networks)
+
+    block_entries = (stats.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []
+    block_read = sum(entry["value"] for entry in block_entries if entry.get("op", "").lower() == "read")
+    block_write = sum(entry["value"] for entry in block_entries if entry.get("op", "").lower() == "write")
+
+    return {
+        "ID": stats.get("id", "")[:12],
+        "Name": stats.get("name", "").lstrip("/"),
+        "CPUPerc": f"{cpu_percent:.2f}%",
+        "MemUsage": f"{format_binary_size(memory_usage)} / {format_binary_size(memory_limit)}",
+        "MemPerc": f"{memory_percent:.2f}%",
+        "NetIO": f"{format_decimal_size(net_rx)} / {format_decimal_size(net_tx)}",
+        "BlockIO": f"{format_decimal_size(block_read)} / {format_decimal_size(block_write)}",
+        "PIDs": str(stats.get("pids_stats", {}).get("current", 0)),
+    }
@@ -12,24 +12,21 @@
 from collections.abc import Callable
 from typing import Any
 
-import questionary
 import typer
-from questionary import Style
 from rich.console import Console
 from rich.prompt import Confirm, Prompt
 
 from deepfellow.common.colors import COLORS, RESET
+from deepfellow.common.defaults import OutputFormatChoice
 from deepfellow.common.state import state
 
 ValidationCallback = Callable[[Any], Any] | None
 
-questionary_style = Style(
-    [
-        ("qmark", ""),  # style for the question mark
-        ("question", "fg:#2f6cff nobold"),  # style for the question text
-        ("answer", "fg:ansicyan bold"),  # chosen answer
-    ]
-)
+QUESTIONARY_STYLE = [
+    ("qmark", ""),  # style for the question mark
+    ("question", "fg:#2f6cff nobold"),  # style for the question text
+    ("answer", "fg:ansicyan bold"),  # chosen answer
+]
 
 
 def add_tabs(msg: str) -> str:
@@ -77,32 +74,37 @@ def get_return_value(
 
 
 class Echo(Console):
+    def message(self, message: str, **kwargs: Any) -> None:
+        """Print a human readable message, to stderr when stdout carries the ``--output json/jsonl`` records."""
+        self.stderr = state.output != OutputFormatChoice.table
+        self.print(message, **kwargs)
+
     def debug(self, message_source: Any) -> None:
         """Print a debug message to the console."""
         if state.debug:
             message = str(message_source)
             final_msg = f"🔍\t[grey]{add_tabs(message)}[/]" if is_interactive() else message
-            self.print(final_msg, style="dim white")
+            self.message(final_msg, style="dim white")
 
     def info(self, message: str) -> None:
         """Print a success message to the console."""
         final_msg = f"💡\t{add_tabs(message)}" if is_interactive() else message
-        self.print(final_msg)
+        self.message(final_msg)
 
     def success(self, message: str) -> None:
         """Print a success message to the console."""
         final_msg = f"✅\t[green]{add_tabs(message)}[/]" if is_interactive() else message
-        self.print(final_msg)
+        self.message(final_msg)
 
     def warning(self, message: str) -> None:
         """Print a warning message to the console."""
         final_msg = f"⚠️\t[yellow]{add_tabs(message)}[/]" if is_interactive() else message
-        self.print(final_msg)
+        self.message(final_msg)
 
     def error(self, message: str) -> None:
         """Print an error message to the console."""
         final_msg = f"💀\t[bold red]{add_tabs(message)}[/]" if is_interactive() else message
-        self.print(final_msg)
+        self.message(final_msg)
 
     def confirm(self, message: str, **kwargs: Any) -> bool:
         """Prompt the user for confirmation."""
@@ -257,6 +259,9 @@ class Echo(Console):
             echo.info(f"{message} (chosen automatically: {return_value})")
             return return_value
 
+        # questionary pulls in prompt_toolkit, which is too heavy to import on every CLI start
+        import questionary
+
         final_msg = f"{add_tabs(message)}" if is_interactive() else message
         return questionary.select(
             final_msg,
@@ -264,7 +269,7 @@ class Echo(Console):
             default=default,
             qmark="❓     ",  # match typer prefix
             pointer="       »",  # move pointer to align with question
-            style=questionary_style,
+            style=questionary.Style(QUESTIONARY_STYLE),
             **kwargs,
         ).ask()
 
@@ -9,6 +9,7 @@
 
 """Helper do komend env."""
 
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,8 +17,9 @@ from typing import Any
 import typer
 from rich.markup import escape
 
-from deepfellow.common.config import read_env_file, save_env_file
+from deepfellow.common.config import EnvFile, read_env_file
 from deepfellow.common.echo import echo
+from deepfellow.common.restart import get_services_using, recreate_services
 
 
 @dataclass(frozen=True)
@@ -49,6 +51,33 @@ class EnvMetadata:
         return f"{styled_key}: {display}"
 
 
+def get_env_name(env_name: str, df_prefix: bool = True) -> str:
+    """Return the upper-cased variable name, with the DF_ prefix if required."""
+    env_name = env_name.upper()
+    if df_prefix and not env_name.startswith("DF_"):
+        echo.debug("Added the DF_ prefix to the variable name")
+        env_name = f"DF_{env_name}"
+
+    return env_name
+
+
+def open_env_file(env_file: Path, should_raise: bool = True) -> EnvFile:
+    """Parse the env file once for a series of reads and changes saved together.
+
+    Args:
+        env_file: Path to the .env file
+        should_raise: Exit if the file does not exist, otherwise it is created on save
+
+    Returns:
+        EnvFile transaction
+    """
+    if not env_file.is_file() and should_raise:
+        echo.error(f"Environment file not found: {env_file}")
+        raise typer.Exit(1)
+
+    return EnvFile.read(env_file)
+
+
 def env_set(
     env_file: Path,
     env_name: str,
@@ -59,43 +88,81 @@ def env_set(
     **kwargs: Any,
 ) -> None:
     """Set env value in the directpry/.env file."""
-    if not env_file.is_file() and should_raise:
-        echo.error(f"Environment file not found: {env_file}")
-        raise typer.Exit(1)
-
-    envs: dict[str, str] = {}
-
-    if env_file.is_file():
-        envs = read_env_file(env_file)
-
-    env_name = env_name.upper()
-    if df_prefix and not env_name.startswith("DF_"):
-        echo.debug("Added the DF_ prefix to the variable name")
-        env_name = f"DF_{env_name}"
-
-    envs[env_name] = env_value
-    save_env_file(env_file, envs, quiet=quiet, **kwargs)
+    env = open_env_file(env_file, should_raise)
+    env.set(get_env_name(env_name, df_prefix), env_value)
+    env.save(quiet=quiet, **kwargs)
 
 
 def env_get(
     env_file: Path, env_name: str, df_prefix: bool = True, should_raise: bool = True, default: str | None = None
 ) -> str | None:
     """Set env value in the directpry/.env file."""
-    if not env_file.is_file() and should_raise:
-        echo.error(f"Environment file not found: {env_file}")
-        raise typer.Exit(1)
+    env = open_env_file(env_file, should_raise)
+    return env.get(get_env_name(env_name, df_prefix), default)
 
-    envs: dict[str, str] = {}
 
-    if env_file.is_file():
-        envs = read_env_file(env_file)
+ENV_NAME_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
-    env_name = env_name.upper()
-    if df_prefix and not env_name.startswith("DF_"):
-        echo.debug("Added the DF_ prefix to the variable name")
-        env_name = f"DF_{env_name}"
 
-    return envs.get(env_name, default)
+def parse_env_assignments(
+    assignments: list[str], from_file: Path | None = None, df_prefix: bool = True
+) -> dict[str, str]:
+    """Return the variables to set from the ``KEY=VALUE`` arguments and the overrides file.
+
+    The arguments take precedence over the file. A single ``NAME [VALUE]`` pair without ``=``
+    is accepted as well, as the command took it before.
+
+    Args:
+        assignments: ``KEY=VALUE`` arguments
+        from_file: .env file with the overrides
+        df_prefix: Add the DF_ prefix to the names without it
+
+    Returns:
+        Dictionary {env_name: env_value}
+
+    Raises:
+        ValueError: When an argument is not a valid assignment
+    """
+    values = read_env_file(from_file) if from_file is not None else {}
+    if assignments and "=" not in assignments[0] and len(assignments) <= 2:
+        values[assignments[0]] = assignments[1] if len(assignments) == 2 else ""
+    else:
+        for assignment in assignments:
+            name, separator, value = assignment.partition("=")
+            if not separator or not ENV_NAME_PATTERN.match(name):
+                raise ValueError(f"Invalid assignment {assignment!r}, expected KEY=VALUE")
+
+            values[name] = value
+
+    for name in values:
+        if not ENV_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid variable name {name!r}")
+
+    return {get_env_name(name, df_prefix): value for name, value in values.items()}
+
+
+def apply_env_changes(directory: Path, values: dict[str, str]) -> None:
+    """Save the variables with a single write and recreate only the services using the changed ones.
+
+    Args:
+        directory: Installation directory with the .env and compose files
+        values: Variables to set {env_name: env_value}
+    """
+    env = open_env_file(directory / ".env")
+    env.update(values)
+    changed = list(env.changes)
+    if not changed:
+        echo.info("All variables already have these values, nothing to apply.")
+        return
+
+    env.save()
+    services = get_services_using(directory, changed)
+    if not services:
+        echo.info(f"No service uses {', '.join(changed)}, nothing to restart.")
+        return
+
+    if echo.confirm(f"Restart {', '.join(services)} now to apply the changes?", default=True):
+        recreate_services(directory, services)
 
 
 def print_env_info(
@@ -0,0 +1,84 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared HTTP client.
+
+All REST helpers use one ``httpx.Client`` per process, so the connections (and TLS sessions)
+are kept alive between the requests of a single command instead of being opened for every call.
+
+Timeouts and HTTP/2 can be configured in the CLI config file:
+- ``DF_HTTP_CONNECT_TIMEOUT`` - seconds to establish a connection (default 10)
+- ``DF_HTTP_READ_TIMEOUT`` - seconds to wait for the response data (default 60)
+- ``DF_HTTP2`` - ``true`` to negotiate HTTP/2, requires the optional ``h2`` package
+"""
+
+import atexit
+from importlib.util import find_spec
+
+import httpx
+
+from deepfellow.common.config import get_config_number
+from deepfellow.common.echo import echo
+from deepfellow.common.state import state
+
+DF_HTTP_CONNECT_TIMEOUT = 10.0
+DF_HTTP_READ_TIMEOUT = 60.0
+
+_client: httpx.Client | None = None
+
+
+def get_timeout() -> httpx.Timeout:
+    """Return the request timeout from the CLI config, an invalid value falls back to the default."""
+    connect = get_config_number("DF_HTTP_CONNECT_TIMEOUT", DF_HTTP_CONNECT_TIMEOUT)
+    read = get_config_number("DF_HTTP_READ_TIMEOUT", DF_HTTP_READ_TIMEOUT)
+    return httpx.Timeout(read, connect=connect)
+
+
+def is_http2_enabled() -> bool:
+    """Check if HTTP/2 is enabled in the CLI config and available."""
+    if str(state.cli_config.get("df_http2", "")).lower() not in ("1", "true", "yes"):
+        return False
+
+    if find_spec("h2") is None:
+        echo.debug("HTTP/2 requires the h2 package (pip install 'httpx[http2]'), using HTTP/1.1.")
+        return False
+
+    return True
+
+
+def get_client() -> httpx.Client:
+    """Return the shared HTTP client, creating it on first use.
+
+    httpx negotiates the response compression on its own: gzip and deflate always,
+    brotli and zstd when their optional packages are installed.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.Client(timeout=get_timeout(), http2=is_http2_enabled())
+
+    return _client
+
+
+def create_async_client() -> httpx.AsyncClient:
+    """Return a new async HTTP client configured like the shared one.
+
+    Async clients are bound to the event loop they are used in, so they are not shared.
+    """
+    return httpx.AsyncClient(timeout=get_timeout(), http2=is_http2_enabled())
+
+
+def close_client() -> None:
+    """Close the shared HTTP client and its connections."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+
+
+atexit.register(close_client)
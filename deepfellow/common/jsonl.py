@@ -0,0 +1,70 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""JSON Lines files used for the results and snapshots of the bulk commands.
+
+Files may hold secrets (e.g. created API keys), so they are readable by the owner only.
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from deepfellow.common.config import write_file_atomic
+
+JSONL_FILE_MODE = 0o600
+
+
+def read_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the records of the file one by one.
+
+    Blank lines and a truncated last line (left by an interrupted run) are skipped.
+    """
+    with path.open() as file:
+        for line in file:
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+            if isinstance(record, dict):
+                yield record
+
+
+def append_jsonl(path: Path, record: dict[str, Any]) -> None:
+    """Append the record with a single write, so concurrent appends never interleave."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, JSONL_FILE_MODE)
+    try:
+        os.write(fd, (json.dumps(record, default=str) + "\n").encode())
+    finally:
+        os.close(fd)
+
+
+def write_jsonl(path: Path, records: Iterable[dict[str, Any]]) -> int:
+    """Write the records atomically with ``write_file_atomic``, the file is readable by the owner only.
+
+    Returns:
+        Number of written records
+    """
+    count = 0
+
+    def lines() -> Iterator[str]:
+        nonlocal count
+        for record in records:
+            yield json.dumps(record, default=str) + "\n"
+            count += 1
+
+    write_file_atomic(path, lines(), mode=JSONL_FILE_MODE)
+    return count
@@ -0,0 +1,110 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy loading of the command modules.
+
+Every command group registers its subcommands from a static table of ``LazyCommand`` entries.
+The names and help texts are known upfront, so ``--help`` and shell completion work without
+importing anything. The command module is imported only when its command is actually invoked.
+"""
+
+import importlib
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from typer.core import TyperCommand, TyperGroup
+from typer.main import get_command_from_info, get_group
+
+if TYPE_CHECKING:
+    import typer
+
+    # Typer vendors click, the classes are needed for annotations only
+    from typer._click import Command, Context
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """Static description of a subcommand.
+
+    Attributes:
+        name: Name of the subcommand, e.g. ``install``.
+        import_path: Location of the ``typer.Typer`` app, e.g. ``deepfellow.infra.install:app``.
+        help: Short help displayed in the commands list.
+    """
+
+    name: str
+    import_path: str
+    help: str
+
+
+def load_command(lazy_command: LazyCommand) -> "Command":
+    """Import the module of the lazy command and return its click command."""
+    module_name, _, attribute = lazy_command.import_path.partition(":")
+    typer_app: typer.Typer = getattr(importlib.import_module(module_name), attribute or "app")
+
+    command: Command
+    if (
+        len(typer_app.registered_commands) == 1
+        and not typer_app.registered_groups
+        and not typer_app.registered_callback
+    ):
+        command = get_command_from_info(
+            typer_app.registered_commands[0],
+            pretty_exceptions_short=typer_app.pretty_exceptions_short,
+            rich_markup_mode=typer_app.rich_markup_mode,
+        )
+    else:
+        command = get_group(typer_app)
+
+    command.name = lazy_command.name
+    command.help = command.help or lazy_command.help
+    return command
+
+
+class PlaceholderCommand(TyperCommand):
+    """Stand-in for a lazy command, replaced with the real one when the command is resolved."""
+
+    def __init__(self, lazy_command: LazyCommand) -> None:
+        super().__init__(name=lazy_command.name, help=lazy_command.help)
+        self.lazy_command = lazy_command
+
+    def load(self) -> "Command":
+        """Return the real command."""
+        return load_command(self.lazy_command)
+
+
+class LazyGroup(TyperGroup):
+    """Typer group resolving its ``lazy_commands`` only on invocation."""
+
+    lazy_commands: tuple[LazyCommand, ...] = ()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        for lazy_command in self.lazy_commands:
+            self.commands.setdefault(lazy_command.name, PlaceholderCommand(lazy_command))
+
+    def resolve_command(self, ctx: "Context", args: list[str]) -> tuple[str | None, "Command | None", list[str]]:
+        """Resolve the command and import it if it is still a placeholder."""
+        cmd_name, cmd, args = super().resolve_command(ctx, args)
+        if cmd_name is not None and isinstance(cmd, PlaceholderCommand):
+            cmd = self.commands[cmd_name] = cmd.load()
+
+        return cmd_name, cmd, args
+
+
+def lazy_group(commands: Sequence[LazyCommand]) -> type[LazyGroup]:
+    """Return a ``LazyGroup`` class for the ``typer.Typer(cls=...)`` argument.
+
+    Sample usage:
+    ```
+    app = typer.Typer(cls=lazy_group([LazyCommand("start", "deepfellow.infra.start:app", "Start DeepFellow Infra.")]))
+    ```
+    """
+    return type("LazyGroup", (LazyGroup,), {"lazy_commands": tuple(commands)})
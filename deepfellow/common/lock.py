@@ -0,0 +1,56 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Advisory file locks serializing the CLI processes."""
+
+import os
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+if sys.platform != "win32":
+    import fcntl
+
+
+def get_lock_path(path: Path) -> Path:
+    """Return the lock file guarding the file.
+
+    A separate file is locked, because the guarded file itself may be replaced while the lock is held.
+    """
+    return path.with_name(f".{path.name}.lock")
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive ``fcntl`` lock of the file while the block runs, waiting for the other holders.
+
+    The lock is released when the process exits, even if it is killed. Without ``fcntl`` (Windows)
+    the block runs without the lock.
+
+    Sample usage:
+    ```
+    with file_lock(get_lock_path(secrets_file)):
+        secrets = EnvFile.read(secrets_file)
+        ...
+        secrets.save()
+    ```
+    """
+    if sys.platform == "win32":
+        yield
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        # Closing the descriptor releases the lock
+        os.close(fd)
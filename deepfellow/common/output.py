@@ -0,0 +1,94 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Records printed by the list and get commands in the format selected with the global ``--output`` option.
+
+- ``table`` - ``key: value`` blocks rendered by rich
+- ``json`` - a single JSON array (an object for a single record)
+- ``jsonl`` - one JSON object per line
+
+JSON records are written straight to stdout, bypassing rich, as soon as they are available.
+"""
+
+import json
+import sys
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from deepfellow.common.defaults import OutputFormatChoice
+from deepfellow.common.echo import echo
+from deepfellow.common.state import state
+
+
+def as_dict(record: Any) -> dict[str, Any]:
+    """Return the dictionary representation of the record (``Organization``, ``Project``, ``ApiKey``...)."""
+    return dict(record.as_dict())
+
+
+def write(text: str) -> None:
+    """Write the text to stdout immediately."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+def print_record(
+    record: Any,
+    to_dict: Callable[[Any], dict[str, Any]] = as_dict,
+    to_text: Callable[[Any], str] = str,
+    output: OutputFormatChoice | None = None,
+) -> None:
+    """Print a single record.
+
+    Args:
+        record: Printed record
+        to_dict: Returns the JSON representation of the record
+        to_text: Returns the human readable representation of the record
+        output: Output format, the global ``--output`` by default
+    """
+    output = output or state.output
+    if output == OutputFormatChoice.table:
+        echo.info(to_text(record))
+    elif output == OutputFormatChoice.json:
+        write(json.dumps(to_dict(record), indent=2, default=str) + "\n")
+    else:
+        write(json.dumps(to_dict(record), default=str) + "\n")
+
+
+def print_records(
+    records: Iterable[Any],
+    to_dict: Callable[[Any], dict[str, Any]] = as_dict,
+    to_text: Callable[[Any], str] = str,
+    empty_message: str | None = None,
+    output: OutputFormatChoice | None = None,
+) -> None:
+    """Print the records one by one as the iterable yields them.
+
+    Args:
+        records: Printed records, e.g. a generator fetching them page by page
+        to_dict: Returns the JSON representation of the record
+        to_text: Returns the human readable representation of the record
+        empty_message: Message displayed in the table output when there are no records
+        output: Output format, the global ``--output`` by default
+    """
+    output = output or state.output
+    count = 0
+    for record in records:
+        if output == OutputFormatChoice.table:
+            echo.info(f"\n{to_text(record)}" if count else to_text(record))
+        elif output == OutputFormatChoice.json:
+            # The array is streamed element by element, it is valid JSON once closed
+            write(("," if count else "[") + "\n  " + json.dumps(to_dict(record), default=str))
+        else:
+            write(json.dumps(to_dict(record), default=str) + "\n")
+        count += 1
+
+    if output == OutputFormatChoice.json:
+        write("\n]\n" if count else "[]\n")
+    elif output == OutputFormatChoice.table and not count and empty_message:
+        echo.info(empty_message)
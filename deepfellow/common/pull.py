@@ -0,0 +1,263 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Concurrent pull of the images of a compose project.
+
+Images are pulled through the Docker Engine API (``POST /images/create``), a few at a time, and the
+per-layer progress events of every image are summed into one rich progress display. A failed pull
+is retried with a backoff - the daemon keeps the layers which completed, so only the failed ones are
+downloaded again. ``docker pull`` is used when the API is not reachable or rejects the pull
+(e.g. a private registry with the credentials of ``docker login``). Images already present locally are not
+pulled if their reference always names the same image - pinned by digest or tagged with an exact version
+(``mongo:8.2.7``) - or loaded with ``bundle import``. Moving tags (``latest``, ``qdrant/qdrant:v1.15``)
+are pulled to refresh them.
+
+The CLI config file accepts:
+- ``DF_PULL_CONCURRENCY`` - number of images pulled at once (default 4)
+- ``DF_PULL_RETRIES`` - retries of a failed pull (default 2)
+"""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from rich.progress import BarColumn, Progress, TaskID, TextColumn, TimeElapsedColumn
+
+from deepfellow.common.bundle import load_bundle_images
+from deepfellow.common.config import get_config_number
+from deepfellow.common.docker import DockerError, is_image_present
+from deepfellow.common.docker_api import DockerApiError, format_decimal_size, get_docker_api
+from deepfellow.common.echo import echo, is_interactive
+from deepfellow.common.restart import get_compose_config
+from deepfellow.common.system import run
+
+DF_PULL_CONCURRENCY = 4
+DF_PULL_RETRIES = 2
+PULL_RETRY_DELAY = 2.0
+
+# Tags naming a single release, e.g. ``8.2.7`` or ``v1.15.5-unprivileged``
+EXACT_VERSION_TAG_PATTERN = re.compile(r"^v?\d+\.\d+\.\d+")
+# Statuses after which the whole layer is downloaded
+LAYER_DOWNLOADED_STATUSES = ("Verifying Checksum", "Download complete", "Extracting", "Pull complete")
+
+
+@dataclass
+class LayerProgress:
+    """Download progress of the layers of an image, fed with the pull events of the daemon."""
+
+    layers: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def update(self, event: dict[str, Any]) -> None:
+        """Record the pull event, layers which already exist locally are not counted."""
+        layer = event.get("id")
+        status = event.get("status", "")
+        if not layer:
+            return
+
+        if status == "Downloading":
+            detail = event.get("progressDetail") or {}
+            self.layers[layer] = (int(detail.get("current") or 0), int(detail.get("total") or 0))
+        elif status in LAYER_DOWNLOADED_STATUSES and layer in self.layers:
+            _, total = self.layers[layer]
+            self.layers[layer] = (total, total)
+
+    @property
+    def completed(self) -> int:
+        """Bytes downloaded so far."""
+        return sum(current for current, _ in self.layers.values())
+
+    @property
+    def total(self) -> int:
+        """Bytes of the layers being downloaded."""
+        return sum(total for _, total in self.layers.values())
+
+
+@dataclass
+class PullResult:
+    """Outcome of the pull of an image."""
+
+    image: str
+    # None when the size is unknown (pulled with ``docker pull``)
+    downloaded: int | None = 0
+    error: str | None = None
+
+
+def get_pull_concurrency() -> int:
+    """Return the number of images pulled at once (``DF_PULL_CONCURRENCY``)."""
+    return max(get_config_number("DF_PULL_CONCURRENCY", DF_PULL_CONCURRENCY), 1)
+
+
+def get_pull_retries() -> int:
+    """Return the number of retries of a failed pull (``DF_PULL_RETRIES``)."""
+    return max(get_config_number("DF_PULL_RETRIES", DF_PULL_RETRIES), 0)
+
+
+def get_pull_images(directory: Path) -> list[str] | None:
+    """Return the images of the compose project to pull, None if the compose config is not available.
+
+    Services with ``pull_policy: never`` (locally built images) are skipped.
+    """
+    config = get_compose_config(directory)
+    if config is None:
+        return None
+
+    images = [
+        service["image"]
+        for service in (config.get("services") or {}).values()
+        if service.get("image") and service.get("pull_policy") not in ("never", "build")
+    ]
+    return list(dict.fromkeys(images))
+
+
+def with_tag(image: str) -> str:
+    """Return the image reference with the ``latest`` tag if it has no tag, the API would pull all tags."""
+    if "@" in image or ":" in image.rsplit("/", 1)[-1]:
+        return image
+
+    return f"{image}:latest"
+
+
+def is_pinned(image: str) -> bool:
+    """Check if the reference always names the same image - pinned by digest or tagged with an exact version."""
+    if "@" in image:
+        return True
+
+    _, _, tag = image.rsplit("/", 1)[-1].partition(":")
+    return EXACT_VERSION_TAG_PATTERN.match(tag) is not None
+
+
+def _pull_once(image: str, progress: Progress, task: TaskID) -> int | None:
+    """Pull the image once, return the number of downloaded bytes, None if unknown (``docker pull`` fallback).
+
+    Raises:
+        DockerError: When the pull failed
+    """
+    if (api := get_docker_api()) is not None:
+        layers = LayerProgress()
+        try:
+            for event in api.pull_image(with_tag(image)):
+                layers.update(event)
+                progress.update(
+                    task,
+                    completed=layers.completed,
+                    total=layers.total or None,
+                    size=f"{format_decimal_size(layers.completed)} / {format_decimal_size(layers.total)}",
+                )
+        except DockerApiError as exc:
+            echo.debug(exc)
+        else:
+            return layers.completed
+
+    run(["docker", "pull", "--quiet", image], capture_output=True, raises=DockerError)
+    return None
+
+
+def pull_image(image: str, progress: Progress, retries: int = DF_PULL_RETRIES) -> PullResult:
+    """Pull the image, retrying a failed pull."""
+    task = progress.add_task(image, total=None, size="")
+    result = PullResult(image)
+    for attempt in range(retries + 1):
+        try:
+            result.downloaded = _pull_once(image, progress, task)
+        except DockerError as exc:
+            result.error = str(exc).strip() or "docker pull failed"
+            if attempt < retries:
+                echo.debug(f"Pull of {image} failed, retrying: {result.error}")
+                time.sleep(PULL_RETRY_DELAY * 2**attempt)
+        else:
+            result.error = None
+            break
+
+    if result.error:
+        progress.update(task, size="failed")
+    elif result.downloaded is None:
+        progress.update(task, total=1, completed=1, size="pulled")
+    elif result.downloaded:
+        progress.update(task, total=result.downloaded, completed=result.downloaded)
+    else:
+        progress.update(task, total=1, completed=1, size="up to date")
+
+    return result
+
+
+def pull_images(directory: Path) -> bool:
+    """Pull the images of the compose project, see ``pull_missing_images``.
+
+    Sample usage:
+    ```
+    save_compose_file(compose, directory / DOCKER_COMPOSE_CONFIG_FILENAME)
+    pull_images(directory)
+    ```
+
+    Returns:
+        True if all images are present now
+    """
+    images = get_pull_images(directory)
+    if images is None:
+        try:
+            run(["docker", "compose", "pull"], cwd=directory, raises=DockerError)
+        except DockerError:
+            return False
+
+        return True
+
+    return pull_missing_images(images)
+
+
+def pull_missing_images(images: list[str]) -> bool:
+    """Pull the images concurrently and print the downloaded size and time.
+
+    Images present locally are skipped if they are pinned (``is_pinned``) or bundled (``bundle import``),
+    the moving tags are pulled to refresh them - the pull of an up-to-date image downloads nothing.
+
+    Returns:
+        True if all images are present now
+    """
+    bundle_images = set(load_bundle_images())
+    missing = [
+        image
+        for image in images
+        if not (is_pinned(image) or with_tag(image) in bundle_images) or not is_image_present(image)
+    ]
+    if present := len(images) - len(missing):
+        echo.info(f"{present} docker image(s) already present.")
+
+    if not missing:
+        return True
+
+    echo.info(f"Pulling {len(missing)} docker image(s).")
+    started_at = time.monotonic()
+    with (
+        Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TextColumn("{task.fields[size]}"),
+            TimeElapsedColumn(),
+            console=echo,
+            disable=not is_interactive(),
+        ) as progress,
+        ThreadPoolExecutor(max_workers=min(get_pull_concurrency(), len(missing))) as executor,
+    ):
+        retries = get_pull_retries()
+        results = list(executor.map(lambda image: pull_image(image, progress, retries), missing))
+
+    elapsed = time.monotonic() - started_at
+    failed = [result for result in results if result.error]
+    for result in failed:
+        echo.error(f"Unable to pull {result.image}: {result.error}")
+
+    downloaded = format_decimal_size(sum(result.downloaded or 0 for result in results))
+    if unknown := sum(1 for result in results if result.downloaded is None and not result.error):
+        downloaded += f" (+ {unknown} image(s) of unknown size)"
+
+    echo.info(f"Pulled {len(missing) - len(failed)} of {len(missing)} images, {downloaded} in {elapsed:.1f}s.")
+    return not failed
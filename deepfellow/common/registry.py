@@ -10,10 +10,29 @@
 """Shared Docker image registry utilities."""
 
 import re
+import time
+from collections.abc import Iterable, Iterator
+from urllib.parse import urljoin
 
 import httpx
 
+from deepfellow.common.bundle import load_bundle_images
+from deepfellow.common.cache import load_registry_tags, save_registry_tags
+from deepfellow.common.docker import get_image_repo_digests, list_image_tags
 from deepfellow.common.echo import echo
+from deepfellow.common.http import get_client
+
+DOCKER_HUB_REGISTRY = "registry-1.docker.io"
+TAGS_PAGE_SIZE = 1000
+TOKEN_EXPIRY_MARGIN = 10.0
+
+# Manifest lists first - ``RepoDigests`` of a multi-platform image hold the digest of the list
+MANIFEST_MEDIA_TYPES = (
+    "application/vnd.oci.image.index.v1+json",
+    "application/vnd.docker.distribution.manifest.list.v2+json",
+    "application/vnd.oci.image.manifest.v1+json",
+    "application/vnd.docker.distribution.manifest.v2+json",
+)
 
 
 def _parse_tag(tag: str) -> tuple[int, ...] | None:
@@ -22,10 +41,53 @@ def _parse_tag(tag: str) -> tuple[int, ...] | None:
     return tuple(int(x) for x in match.groups()) if match else None
 
 
+def split_image(image: str) -> tuple[str, str, str]:
+    """Split the image reference into the registry, repository path and tag (or digest).
+
+    Images without a registry host are Docker Hub images, e.g. ``nginx`` is ``library/nginx:latest``.
+    """
+    name, _, digest = image.partition("@")
+    tag = "latest"
+    if ":" in name.rsplit("/", 1)[-1]:
+        name, tag = name.rsplit(":", 1)
+
+    registry, _, image_path = name.partition("/")
+    if not image_path or ("." not in registry and ":" not in registry and registry != "localhost"):
+        registry, image_path = DOCKER_HUB_REGISTRY, name if "/" in name else f"library/{name}"
+
+    return registry, image_path, digest or tag
+
+
+class RegistryTokens:
+    """Anonymous bearer tokens of the registries, reused until they expire."""
+
+    def __init__(self) -> None:
+        self.tokens: dict[tuple[str, str], tuple[str, float]] = {}
+
+    def get(self, registry: str, image_path: str) -> str | None:
+        """Return the token of the repository if it is still valid."""
+        token, expires_at = self.tokens.get((registry, image_path), ("", 0.0))
+        return token if time.monotonic() < expires_at else None
+
+    def save(self, registry: str, image_path: str, token: str, expires_in: float) -> None:
+        """Remember the token, it is dropped a bit before the registry considers it expired."""
+        self.tokens[(registry, image_path)] = (token, time.monotonic() + expires_in - TOKEN_EXPIRY_MARGIN)
+
+    def reset(self) -> None:
+        """Forget all tokens."""
+        self.tokens.clear()
+
+
+registry_tokens = RegistryTokens()
+
+
 def _get_registry_token(registry: str, image_path: str) -> str | None:
     """Obtain an anonymous bearer token via the registry's WWW-Authenticate realm."""
+    if token := registry_tokens.get(registry, image_path):
+        return token
+
     try:
-        probe = httpx.get(f"https://{registry}/v2/", timeout=10)
+        probe = get_client().get(f"https://{registry}/v2/", timeout=10)
         www_auth = probe.headers.get("www-authenticate", "")
         # parse: Bearer realm="...",service="...",scope="..."
         realm_match = re.search(r'realm="([^"]+)"', www_auth)
@@ -38,44 +100,190 @@ def _get_registry_token(registry: str, image_path: str) -> str | None:
         params = {"scope": f"repository:{image_path}:pull"}
         if service:
             params["service"] = service
-        token_resp = httpx.get(realm, params=params, timeout=10)
+        token_resp = get_client().get(realm, params=params, timeout=10)
         token_resp.raise_for_status()
         data = token_resp.json()
-        return data.get("token") or data.get("access_token")
+        token = data.get("token") or data.get("access_token")
     except Exception as exc:
         echo.debug(f"registry auth failed for {registry}: {exc}")
         return None
 
+    if token:
+        # Tokens without expires_in are valid for 60 seconds (Docker Registry token spec)
+        registry_tokens.save(registry, image_path, token, float(data.get("expires_in") or 60))
+
+    return str(token) if token else None
+
+
+def iter_tags(registry: str, image_path: str, token: str) -> Iterator[list[str]]:
+    """Yield the tags of the repository page by page.
+
+    The ``Link: <...>; rel="next"`` header is followed; registries not sending it are asked for
+    the next page (``last``) as long as they return full pages. The listing ends on an empty page
+    or when the next page was already requested (e.g. a registry ignoring ``n``/``last`` or linking
+    back to the same page), the order of the tags is not relied on.
+
+    Raises:
+        httpx.HTTPError: When a page cannot be fetched
+    """
+    url: str | None = f"https://{registry}/v2/{image_path}/tags/list"
+    params: dict[str, str | int] | None = {"n": TAGS_PAGE_SIZE}
+    requested: set[tuple[str, str | None]] = set()
+    while url is not None:
+        page = (url, str(params["last"]) if params and "last" in params else None)
+        if page in requested:
+            echo.debug(f"{url} was already listed, stopping the listing")
+            return
+
+        requested.add(page)
+        resp = get_client().get(url, params=params, headers={"Authorization": f"Bearer {token}"}, timeout=10)
+        resp.raise_for_status()
+        tags: list[str] = resp.json().get("tags") or []
+        if not tags:
+            return
+
+        yield tags
+
+        if next_link := resp.links.get("next", {}).get("url"):
+            url, params = urljoin(url, next_link), None
+        elif len(tags) >= TAGS_PAGE_SIZE:
+            params = {"n": TAGS_PAGE_SIZE, "last": tags[-1]}
+        else:
+            url = None
+
 
 def get_newest_image_tag(hub: str) -> str:
     """Return the full image reference with the newest semver tag from the registry.
 
+    The newest tag of every hub is cached for ``DF_REGISTRY_CACHE_TTL`` seconds (see ``common/cache.py``).
+
     Args:
         hub: Image hub without tag, e.g. ``registry.example.com/org/image``.
 
     Falls back to :latest if the registry is unreachable or has no semver tags.
     """
+    return get_registry_image(hub) or f"{hub}:latest"
+
+
+def get_registry_image(hub: str) -> str | None:
+    """Return the image of the hub with the newest semver tag from the registry, None if the registry is unreachable.
+
+    A registry without semver tags gives the :latest image.
+    """
+    if (tags := load_registry_tags(hub)) is not None:
+        newest = max_semver_tag(tags)
+    else:
+        fetched = _fetch_tags(hub)
+        if fetched is None:
+            return None
+
+        tags, newest = fetched
+        save_registry_tags(hub, tags)
+
+    return f"{hub}:{newest}" if newest else f"{hub}:latest"
+
+
+def get_bundle_image(hub: str) -> str | None:
+    """Return the image of the hub with the newest semver tag loaded with ``bundle import``, None if there is none.
+
+    Only the bundled images still present locally are considered.
+    """
+    bundled_tags = [image.removeprefix(f"{hub}:") for image in load_bundle_images() if image.startswith(f"{hub}:")]
+    if not bundled_tags:
+        return None
+
+    present = set(list_image_tags(hub))
+    newest = max_semver_tag(tag for tag in bundled_tags if tag in present)
+    return f"{hub}:{newest}" if newest else None
+
+
+def get_install_image(hub: str) -> str:
+    """Return the image to install: the newest one from the registry or, offline, the newest bundled one.
+
+    A reachable registry wins, so the images of an old ``bundle import`` do not pin later online installs.
+    Without the registry the image loaded with ``bundle import`` is used, so an air-gapped install works.
+    Other images present locally are not preferred.
+
+    Args:
+        hub: Image hub without tag, e.g. ``registry.example.com/org/image``.
+    """
+    if (image := get_registry_image(hub)) is not None:
+        return image
+
+    if (image := get_bundle_image(hub)) is not None:
+        echo.info(f"The registry is unreachable, using the image {image} imported from the bundle.")
+        return image
+
+    return f"{hub}:latest"
+
+
+def max_semver_tag(tags: Iterable[str], newest: str | None = None) -> str | None:
+    """Return the highest semver tag, starting from the ``newest`` one known so far."""
+    newest_version = _parse_tag(newest) if newest else None
+    for tag in tags:
+        version = _parse_tag(tag)
+        if version is not None and (newest_version is None or version > newest_version):
+            newest, newest_version = tag, version
+
+    return newest
+
+
+def _fetch_tags(hub: str) -> tuple[list[str], str | None] | None:
+    """Return all tags of the hub with the newest semver one or None if the registry is unreachable."""
     registry, image_path = hub.split("/", 1)
 
     token = _get_registry_token(registry, image_path)
     if not token:
-        return f"{hub}:latest"
+        return None
+
+    tags: list[str] = []
+    newest = None
+    try:
+        for page in iter_tags(registry, image_path, token):
+            tags.extend(page)
+            newest = max_semver_tag(page, newest)
+            echo.debug(f"registry {hub}: {len(tags)} tags, newest so far {newest}")
+    except Exception:
+        return None
+
+    return tags, newest
+
+
+def get_remote_digest(image: str) -> str | None:
+    """Return the digest the registry serves for the image tag, without downloading the manifest.
+
+    Args:
+        image: Image reference, e.g. ``registry.example.com/org/image:1.2.3``
+
+    Returns:
+        ``sha256:...`` digest or None if the registry is unreachable
+    """
+    registry, image_path, reference = split_image(image)
+    if reference.startswith("sha256:"):
+        return reference
+
+    headers = {"Accept": ", ".join(MANIFEST_MEDIA_TYPES)}
+    if token := _get_registry_token(registry, image_path):
+        headers["Authorization"] = f"Bearer {token}"
 
     try:
-        headers = {"Authorization": f"Bearer {token}"}
-        resp = httpx.get(
-            f"https://{registry}/v2/{image_path}/tags/list",
+        resp = get_client().head(
+            f"https://{registry}/v2/{image_path}/manifests/{reference}",
             headers=headers,
             timeout=10,
         )
         resp.raise_for_status()
-        raw_tags: list[str] = resp.json().get("tags") or []
-    except Exception:
-        return f"{hub}:latest"
+    except httpx.HTTPError as exc:
+        echo.debug(f"registry manifest lookup failed for {image}: {exc}")
+        return None
+
+    return resp.headers.get("docker-content-digest")
+
 
-    semver_tags = [t for t in raw_tags if _parse_tag(t)]
-    if not semver_tags:
-        return f"{hub}:latest"
+def is_image_up_to_date(image: str) -> bool:
+    """Check if the local image has the digest the registry serves for its tag, i.e. a pull would be a no-op."""
+    remote_digest = get_remote_digest(image)
+    if remote_digest is None:
+        return False
 
-    newest = max(semver_tags, key=lambda v: _parse_tag(v) or (0, 0, 0))
-    return f"{hub}:{newest}"
+    return any(repo_digest.endswith(f"@{remote_digest}") for repo_digest in get_image_repo_digests(image))
@@ -9,17 +9,279 @@
 
 """REST utils."""
 
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
 from json import JSONDecodeError
 from typing import Any
+from urllib.parse import urlencode
 
 import httpx
 import typer
 
+from deepfellow.common.cache import (
+    forget_health,
+    is_health_cached,
+    is_http_cache_enabled,
+    load_response,
+    save_health,
+    save_response,
+)
 from deepfellow.common.echo import echo
 from deepfellow.common.env import env_set
+from deepfellow.common.http import create_async_client, get_client
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
 
+# Requests which can be safely repeated after the server may have already processed them
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+DF_HTTP_RETRIES = 3
+DF_HTTP_BACKOFF = 0.5
+DF_HTTP_MAX_BACKOFF = 30.0
+CIRCUIT_BREAKER_THRESHOLD = 5
+CIRCUIT_BREAKER_COOLDOWN = 30.0
+# Seconds the health check waits, a live server responds at once - the long DF_HTTP_READ_TIMEOUT is for the API calls
+HEALTH_CHECK_TIMEOUT = 5.0
+# Items requested per page of the paginated lists
+PAGE_SIZE = 100
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised if the host failed too many times in a row and is not called for a while."""
+
+
+@dataclass
+class RetryPolicy:
+    """How many times and how long to wait before repeating a failed request.
+
+    Attributes:
+        retries: Number of repeats after the first attempt.
+        backoff: Base of the exponential backoff in seconds.
+        max_backoff: Upper bound of a single wait in seconds.
+    """
+
+    retries: int = DF_HTTP_RETRIES
+    backoff: float = DF_HTTP_BACKOFF
+    max_backoff: float = DF_HTTP_MAX_BACKOFF
+
+    @classmethod
+    def from_config(cls) -> "RetryPolicy":
+        """Create the policy from ``DF_HTTP_RETRIES`` and ``DF_HTTP_BACKOFF`` in the CLI config."""
+        return cls(
+            retries=int(state.cli_config.get("df_http_retries", DF_HTTP_RETRIES)),
+            backoff=float(state.cli_config.get("df_http_backoff", DF_HTTP_BACKOFF)),
+        )
+
+    def should_retry(
+        self, method: str, attempt: int, response: httpx.Response | None = None, exc: Exception | None = None
+    ) -> bool:
+        """Check if the outcome of the attempt is worth another try.
+
+        Connection failures and 429 mean the request was not processed, so they are retried for every method.
+        Other transport errors and gateway errors are retried only for the idempotent methods.
+        """
+        if attempt >= self.retries:
+            return False
+
+        if isinstance(exc, httpx.ConnectError | httpx.ConnectTimeout):
+            return True
+
+        if isinstance(exc, httpx.TransportError):
+            return method.upper() in IDEMPOTENT_METHODS
+
+        if response is None or response.status_code not in RETRY_STATUS_CODES:
+            return False
+
+        return response.status_code == 429 or method.upper() in IDEMPOTENT_METHODS
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Return seconds to wait before the next attempt: ``Retry-After`` or exponential backoff with full jitter."""
+        if response is not None and (retry_after := parse_retry_after(response.headers.get("Retry-After"))) is not None:
+            return min(retry_after, self.max_backoff)
+
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """Fail fast for a host which keeps failing.
+
+    After ``threshold`` consecutive failed requests the host is skipped for ``cooldown`` seconds.
+    The first request after the cool-down is let through and closes the circuit if it succeeds.
+    """
+
+    def __init__(self, threshold: int = CIRCUIT_BREAKER_THRESHOLD, cooldown: float = CIRCUIT_BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures: dict[str, int] = {}
+        self.opened_at: dict[str, float] = {}
+
+    def check(self, host: str) -> None:
+        """Raise ``CircuitOpenError`` if the host should not be called now."""
+        opened_at = self.opened_at.get(host)
+        if opened_at is not None and time.monotonic() - opened_at < self.cooldown:
+            raise CircuitOpenError(f"{host} failed {self.failures[host]} times in a row, not calling it for a while")
+
+    def record(self, host: str, success: bool) -> None:
+        """Record the outcome of the request."""
+        if success:
+            self.failures.pop(host, None)
+            self.opened_at.pop(host, None)
+            return
+
+        self.failures[host] = self.failures.get(host, 0) + 1
+        if self.failures[host] >= self.threshold:
+            self.opened_at[host] = time.monotonic()
+
+    def reset(self) -> None:
+        """Close all circuits."""
+        self.failures.clear()
+        self.opened_at.clear()
+
+
+circuit_breaker = CircuitBreaker()
+
+
+class TokenRefresher:
+    """Refresh a bearer token rejected by the server although it looked valid locally.
+
+    The token validity is decided locally from its expiration, a revoked token or a clock skew
+    is found out only by a 401. ``get_token`` registers how to refresh the token it returned,
+    the first 401 refreshes it once and the rejected token is replaced in the following requests.
+    """
+
+    def __init__(self) -> None:
+        self.callbacks: dict[str, Callable[[], str | None]] = {}
+        self.replaced: dict[str, str] = {}
+        self.lock = threading.Lock()
+
+    def register(self, token: str, refresh: Callable[[], str | None]) -> None:
+        """Register the callback returning a new token in place of the ``token``, None if it failed."""
+        self.callbacks[token] = refresh
+
+    def refresh(self, token: str) -> str | None:
+        """Return the new token in place of the rejected one, the callback is called at most once."""
+        with self.lock:
+            if token in self.replaced:
+                return self.replaced[token]
+
+            if (refresh := self.callbacks.pop(token, None)) is None:
+                return None
+
+            if (new_token := refresh()) is not None and new_token != token:
+                self.replaced[token] = new_token
+                return new_token
+
+            return None
+
+    def replace(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """Return the headers with the already refreshed token in the ``Authorization`` header."""
+        token = get_bearer_token(headers)
+        if token is None or token not in self.replaced:
+            return headers
+
+        return (headers or {}) | {"Authorization": f"Bearer {self.replaced[token]}"}
+
+    def refresh_headers(self, headers: dict[str, str] | None) -> dict[str, str] | None:
+        """Return the headers with the refreshed token or None if the token cannot be refreshed."""
+        token = get_bearer_token(headers)
+        if token is None or (new_token := self.refresh(token)) is None:
+            return None
+
+        return (headers or {}) | {"Authorization": f"Bearer {new_token}"}
+
+    def reset(self) -> None:
+        """Forget all tokens."""
+        self.callbacks.clear()
+        self.replaced.clear()
+
+
+token_refresher = TokenRefresher()
+
+
+def get_bearer_token(headers: dict[str, str] | None) -> str | None:
+    """Return the token from the ``Authorization: Bearer ...`` header."""
+    scheme, _, token = (headers or {}).get("Authorization", "").partition(" ")
+    return token if scheme == "Bearer" and token else None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Return seconds from the ``Retry-After`` header given as seconds or as HTTP date."""
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_failure(response: httpx.Response) -> bool:
+    """Check if the response means the host is not healthy."""
+    return response.status_code >= 500 or response.status_code == 429
+
+
+def send_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send the request with the shared client, retrying transient failures.
+
+    A 401 for a token registered in ``token_refresher`` refreshes the token once and repeats the request.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        kwargs: Passed to ``httpx.Client.request``
+
+    Returns:
+        The last response, also if it is an error one
+
+    Raises:
+        httpx.HTTPError: When the request failed on every attempt or the circuit is open
+    """
+    if "headers" in kwargs:
+        kwargs["headers"] = token_refresher.replace(kwargs["headers"])
+
+    response = _send_request(method, url, **kwargs)
+    if response.status_code == 401 and (headers := token_refresher.refresh_headers(kwargs.get("headers"))) is not None:
+        echo.debug(f"Token rejected, repeating {method} {url} with the refreshed one")
+        response = _send_request(method, url, **(kwargs | {"headers": headers}))
+
+    return response
+
+
+def _send_request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    """Send the request retrying transient failures, see ``send_request``."""
+    host = httpx.URL(url).host
+    circuit_breaker.check(host)
+    policy = RetryPolicy.from_config()
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = get_client().request(method, url, **kwargs)
+        except httpx.TransportError as exc:
+            if not policy.should_retry(method, attempt, exc=exc):
+                circuit_breaker.record(host, success=False)
+                forget_health(url)
+                raise
+        else:
+            if not policy.should_retry(method, attempt, response=response):
+                circuit_breaker.record(host, success=not is_failure(response))
+                return response
+
+        delay = policy.delay(attempt, response)
+        echo.debug(f"Retrying {method} {url} in {delay:.1f}s")
+        time.sleep(delay)
+        attempt += 1
+
 
 def get_server_url(server: str | None) -> str:
     """Return server URL. Repeat until a valid URL is provided."""
@@ -41,17 +303,57 @@ def get_server_url(server: str | None) -> str:
         env_set(config_file, "SERVER_URL", server, should_raise=False, docker_note=False)
         config_server = server
 
-    check_health(server)
+    # A recent successful health check is trusted, a connection error drops it (see ``send_request``)
+    if not is_health_cached(server):
+        check_health(server)
+        save_health(server)
+
     return server
 
 
-def get(url: str, token: str, headers: dict[str, str] | None = None, item_name: str | None = None) -> dict[str, Any]:
-    """Perform GET on url."""
+def send_cached_get(url: str, token: str, headers: dict[str, str]) -> httpx.Response:
+    """Perform GET revalidating the cached response.
+
+    The server responds with 304 when the cached body is still valid, the body is then served from the cache
+    as a 200 response. Disabled with ``--no-cache``.
+    """
+    if not is_http_cache_enabled():
+        return send_request("GET", url, headers=headers)
+
+    cached = load_response(url, token, headers)
+    response = send_request("GET", url, headers=headers | (cached.conditional_headers() if cached else {}))
+    if cached and response.status_code == 304:
+        echo.debug(f"Not modified, using cached response of {url}")
+        return httpx.Response(
+            200, text=cached.content, headers={"Content-Type": "application/json"}, request=response.request
+        )
+
+    if response.status_code == 200:
+        save_response(
+            url, token, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"), headers
+        )
+
+    return response
+
+
+def get(
+    url: str, token: str, headers: dict[str, str] | None = None, item_name: str | None = None, cache: bool = False
+) -> dict[str, Any]:
+    """Perform GET on url.
+
+    Args:
+        url: Requested URL
+        token: Bearer token
+        headers: Additional headers
+        item_name: Name of the item used in the error messages
+        cache: Revalidate and reuse the response cached on disk (see ``send_cached_get``)
+    """
     echo.debug(f"GET {url}")
     headers = headers or {}
     item_name = item_name or "Item"
     try:
-        response = httpx.get(url, headers=headers | {"Authorization": f"Bearer {token}"})
+        headers = headers | {"Authorization": f"Bearer {token}"}
+        response = send_cached_get(url, token, headers) if cache else send_request("GET", url, headers=headers)
         if response.status_code in (404, 422):  # 422 might happen if user provides non UUID id
             echo.error(f"{item_name} not found.")
             raise typer.Exit(1)
@@ -75,13 +377,63 @@ def get(url: str, token: str, headers: dict[str, str] | None = None, item_name:
     return response.json()
 
 
+def paginate(
+    url: str,
+    token: str,
+    headers: dict[str, str] | None = None,
+    item_name: str | None = None,
+    limit: int | None = None,
+    page_size: int = PAGE_SIZE,
+    cache: bool = True,
+) -> Iterator[dict[str, Any]]:
+    """Yield the items of the OpenAI-style paginated list, fetching the next page only when it is needed.
+
+    Pages are requested with ``limit`` and ``after`` (ID of the last received item) until the response has
+    ``has_more`` false or repeats a cursor. Servers without pagination return everything in the first page.
+
+    Args:
+        url: URL of the list endpoint
+        token: Bearer token
+        headers: Additional headers
+        item_name: Name of the items used in the error messages
+        limit: Stop after that many items
+        page_size: Number of items requested per page
+        cache: Revalidate the pages with the HTTP cache, disable it for one-off crawls of many pages
+    """
+    after = None
+    seen_cursors: set[str] = set()
+    count = 0
+    while limit is None or count < limit:
+        params = {"limit": min(page_size, limit - count) if limit is not None else page_size}
+        if after is not None:
+            params["after"] = after
+
+        page = get(f"{url}?{urlencode(params)}", token, headers=headers, item_name=item_name, cache=cache)
+        items = page.get("data", [])
+        next_after = page.get("last_id") or (items[-1].get("id") if items else None)
+        # A page ending at an earlier cursor repeats the items, the server would be asked for it forever
+        if next_after is not None and next_after in seen_cursors:
+            echo.warning(f"{url} returned the page ending at {next_after} again, stopping the listing.")
+            return
+
+        for item in items[: limit - count if limit is not None else None]:
+            yield item
+            count += 1
+
+        if not page.get("has_more") or next_after is None:
+            return
+
+        seen_cursors.add(next_after)
+        after = next_after
+
+
 def delete(url: str, token: str, headers: dict[str, str] | None = None, item_name: str | None = None) -> None:
     """Perform DELETE on url."""
     echo.debug(f"DELETE {url}")
     headers = headers or {}
     item_name = item_name or "Item"
     try:
-        response = httpx.delete(url, headers=headers | {"Authorization": f"Bearer {token}"})
+        response = send_request("DELETE", url, headers=headers | {"Authorization": f"Bearer {token}"})
 
         if response.status_code in (404, 422):  # 422 might happen if user provides non UUID id
             echo.error(f"{item_name} not found.")
@@ -119,7 +471,8 @@ def post(
     data = data or {}
     echo.debug(f"POST {url} {headers=} {data=}")
     try:
-        response = httpx.post(
+        response = send_request(
+            "POST",
             url,
             headers=headers | {"Authorization": f"Bearer {token}"},
             json=data,
@@ -156,19 +509,26 @@ def make_request(
     data: dict[str, Any] | None = None,
     reraise: bool = False,
     timeout: float = 60 * 60 * 24,
+    cache: bool = False,
 ) -> dict[str, Any]:
-    """POST request on url using data."""
+    """POST request on url using data.
+
+    ``cache`` applies to GET requests only, see ``send_cached_get``.
+    """
     headers = headers or {}
     data = data or {}
     echo.debug(f"{method} {url} {headers=} {data=}")
     try:
-        response = httpx.request(
-            method=method,
-            url=url,
-            headers=headers | {"Authorization": f"Bearer {token}"},
-            json=data,
-            timeout=timeout,
-        )
+        if cache and method == "GET":
+            response = send_cached_get(url, token, headers | {"Authorization": f"Bearer {token}"})
+        else:
+            response = send_request(
+                method,
+                url,
+                headers=headers | {"Authorization": f"Bearer {token}"},
+                json=data,
+                timeout=timeout,
+            )
 
         if response.status_code in (400, 401, 403):
             try:
@@ -196,7 +556,7 @@ def check_health(url: str) -> None:
     url = f"{url}/health"
     echo.debug(f"GET {url}")
     try:
-        response = httpx.get(url)
+        response = send_request("GET", url, timeout=HEALTH_CHECK_TIMEOUT)
         if response.status_code == 200:
             return
 
@@ -211,3 +571,191 @@ def check_health(url: str) -> None:
     except Exception as exc:
         echo.error(f"Unknown error when requesting {url}/health")
         raise typer.Exit(1) from exc
+
+
+@dataclass
+class BulkRequest:
+    """Single request of the bulk operation."""
+
+    method: str
+    url: str
+    data: dict[str, Any] | None = None
+    label: str | None = None
+    headers: dict[str, str] | None = None
+
+    def __str__(self) -> str:
+        """Return the label or the method and URL."""
+        return self.label or f"{self.method} {self.url}"
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a single bulk request."""
+
+    request: BulkRequest
+    status_code: int | None = None
+    data: Any = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Check if the request succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BulkReport:
+    """Aggregated outcome of the bulk operation."""
+
+    results: list[BulkResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def succeeded(self) -> list[BulkResult]:
+        """Return the successful results."""
+        return [result for result in self.results if result.ok]
+
+    @property
+    def failed(self) -> list[BulkResult]:
+        """Return the failed results."""
+        return [result for result in self.results if not result.ok]
+
+    def print(self) -> None:
+        """Print the summary and the errors."""
+        for result in self.failed:
+            echo.error(f"{result.request}: {result.error}")
+
+        summary = f"{len(self.succeeded)} of {len(self.results)} requests succeeded in {self.elapsed:.1f}s."
+        if self.failed:
+            echo.warning(summary)
+        else:
+            echo.success(summary)
+
+
+def get_error_message(response: httpx.Response) -> str:
+    """Return the error message from the response ``detail`` or its text."""
+    try:
+        return str(response.json()["detail"])
+    except (JSONDecodeError, KeyError, TypeError):
+        return response.text or response.reason_phrase
+
+
+async def _send_with_retry(client: httpx.AsyncClient, request: BulkRequest, headers: dict[str, str]) -> httpx.Response:
+    """Async counterpart of ``send_request``."""
+    host = httpx.URL(request.url).host
+    circuit_breaker.check(host)
+    policy = RetryPolicy.from_config()
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = await client.request(
+                request.method, request.url, headers=(request.headers or {}) | headers, json=request.data
+            )
+        except httpx.TransportError as exc:
+            if not policy.should_retry(request.method, attempt, exc=exc):
+                circuit_breaker.record(host, success=False)
+                forget_health(request.url)
+                raise
+        else:
+            if not policy.should_retry(request.method, attempt, response=response):
+                circuit_breaker.record(host, success=not is_failure(response))
+                return response
+
+        delay = policy.delay(attempt, response)
+        echo.debug(f"Retrying {request} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _send(
+    client: httpx.AsyncClient, semaphore: asyncio.Semaphore, request: BulkRequest, headers: dict[str, str]
+) -> BulkResult:
+    """Send the request once a semaphore slot is free, collecting the error instead of raising it."""
+    async with semaphore:
+        echo.debug(f"{request.method} {request.url}")
+        headers = token_refresher.replace(headers) or {}
+        try:
+            response = await _send_with_retry(client, request, headers)
+            if response.status_code == 401 and (
+                refreshed := await asyncio.to_thread(token_refresher.refresh_headers, headers)
+            ):
+                echo.debug(f"Token rejected, repeating {request} with the refreshed one")
+                response = await _send_with_retry(client, request, refreshed)
+        except httpx.HTTPError as exc:
+            return BulkResult(request, error=str(exc) or type(exc).__name__)
+
+    if response.is_error:
+        return BulkResult(request, status_code=response.status_code, error=get_error_message(response))
+
+    try:
+        data = response.json() if response.content else None
+    except JSONDecodeError:
+        data = response.text
+
+    return BulkResult(request, status_code=response.status_code, data=data)
+
+
+async def _send_and_report(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    request: BulkRequest,
+    headers: dict[str, str],
+    on_result: Callable[[BulkResult], None] | None,
+) -> BulkResult:
+    """Send the request and pass its result to ``on_result`` as soon as it is known."""
+    result = await _send(client, semaphore, request, headers)
+    if on_result is not None:
+        on_result(result)
+
+    return result
+
+
+async def _bulk_request(
+    requests: list[BulkRequest],
+    headers: dict[str, str],
+    concurrency: int,
+    on_result: Callable[[BulkResult], None] | None = None,
+) -> list[BulkResult]:
+    """Send all requests with at most ``concurrency`` of them in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    async with create_async_client() as client:
+        return await asyncio.gather(
+            *(_send_and_report(client, semaphore, request, headers, on_result) for request in requests)
+        )
+
+
+def bulk_request(
+    requests: Iterable[BulkRequest],
+    token: str,
+    concurrency: int = 8,
+    headers: dict[str, str] | None = None,
+    on_result: Callable[[BulkResult], None] | None = None,
+) -> BulkReport:
+    """Send many requests concurrently and report the outcome of each.
+
+    Unlike the other helpers it never exits on a failed request - the errors are collected
+    in the report, so one bad item does not abort the whole batch.
+
+    Sample usage:
+    ```
+    report = bulk_request([BulkRequest("DELETE", f"{server_url}/organizations/{org_id}") for org_id in ids], token)
+    report.print()
+    if report.failed:
+        raise typer.Exit(1)
+    ```
+
+    Args:
+        requests: Requests to send
+        token: Bearer token
+        concurrency: Maximum number of requests in flight
+        headers: Additional headers sent with every request, ``BulkRequest.headers`` are sent with a single one
+        on_result: Called with every result as soon as its request completes, e.g. to save the progress
+
+    Returns:
+        Report with results in the order of the requests
+    """
+    headers = (headers or {}) | {"Authorization": f"Bearer {token}"}
+    started = time.monotonic()
+    results = asyncio.run(_bulk_request(list(requests), headers, max(concurrency, 1), on_result))
+    return BulkReport(results=results, elapsed=time.monotonic() - started)
@@ -0,0 +1,133 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Restart of the Docker Compose services affected by a configuration change.
+
+Instead of restarting the whole stack, only the affected services are recreated:
+- ``env set`` recreates the services whose definition references a changed ``.env`` variable
+  (``${VAR}``, ``${VAR:-default}`` or ``$VAR``),
+- the commands changing the compose file or several variables compare the effective compose
+  configuration (``docker compose config``) from before and after the change.
+"""
+
+import json
+import re
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME
+from deepfellow.common.docker import ensure_network, get_docker_network, load_compose_file
+from deepfellow.common.echo import echo
+from deepfellow.common.system import run
+
+# ``$$`` is the escaped dollar sign, it is matched first so it is never read as a reference
+COMPOSE_VARIABLE_PATTERN = re.compile(r"\$(?:\$|\{([A-Za-z_][A-Za-z0-9_]*)|([A-Za-z_][A-Za-z0-9_]*))")
+
+
+def find_variables(value: Any) -> set[str]:
+    """Return the names of the variables referenced anywhere in the compose value."""
+    if isinstance(value, str):
+        return {braced or plain for braced, plain in COMPOSE_VARIABLE_PATTERN.findall(value) if braced or plain}
+
+    if isinstance(value, dict):
+        return set().union(*(find_variables(key) | find_variables(item) for key, item in value.items()))
+
+    if isinstance(value, list):
+        return set().union(*(find_variables(item) for item in value))
+
+    return set()
+
+
+def get_affected_services(compose: dict[str, Any], variables: Iterable[str]) -> list[str]:
+    """Return the services referencing any of the variables, in the compose file order.
+
+    Args:
+        compose: Docker Compose configuration
+        variables: Names of the changed variables
+
+    Returns:
+        Names of the services to recreate
+    """
+    changed = set(variables)
+    return [name for name, service in (compose.get("services") or {}).items() if find_variables(service) & changed]
+
+
+def get_services_using(directory: Path, variables: Iterable[str]) -> list[str]:
+    """Return the services of the compose project in the directory referencing any of the variables."""
+    return get_affected_services(load_compose_file(directory / DOCKER_COMPOSE_CONFIG_FILENAME), variables)
+
+
+def recreate_services(directory: Path, services: list[str]) -> float:
+    """Recreate the services, leaving the rest of the stack running.
+
+    ``--no-deps`` keeps the dependencies (e.g. the databases) untouched and ``--force-recreate``
+    replaces the containers even if compose sees no difference in their configuration.
+
+    Returns:
+        Seconds from stopping the old containers until the new ones are healthy
+    """
+    ensure_network(get_docker_network(directory))
+    started_at = time.monotonic()
+    run(["docker", "compose", "up", "-d", "--wait", "--no-deps", "--force-recreate", *services], cwd=directory)
+    return time.monotonic() - started_at
+
+
+def get_compose_config(directory: Path) -> dict[str, Any] | None:
+    """Return the effective compose configuration, with the variables interpolated.
+
+    Returns:
+        ``docker compose config`` as a dict or None if it is not available
+    """
+    output = run(["docker", "compose", "config", "--format", "json"], cwd=directory, capture_output=True)
+    if output is None:
+        return None
+
+    try:
+        return dict(json.loads(output))
+    except ValueError as exc:
+        echo.debug(f"Unable to parse the compose config: {exc}")
+        return None
+
+
+def plan_restart(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    """Return the services whose effective configuration changed or which were added."""
+    before_services = before.get("services") or {}
+    return [name for name, service in (after.get("services") or {}).items() if before_services.get(name) != service]
+
+
+def restart_changed_services(directory: Path, before: dict[str, Any] | None) -> None:
+    """Recreate the services changed since the ``before`` configuration and report the downtime.
+
+    Sample usage:
+    ```
+    before = get_compose_config(directory)
+    env.save()
+    restart_changed_services(directory, before)
+    ```
+
+    Args:
+        directory: Directory of the compose project
+        before: Effective compose configuration from before the change, all services are recreated
+            if it is not known
+    """
+    after = get_compose_config(directory)
+    if before is None or after is None:
+        services = list(load_compose_file(directory / DOCKER_COMPOSE_CONFIG_FILENAME).get("services") or {})
+    else:
+        services = plan_restart(before, after)
+
+    if not services:
+        echo.info("No service configuration changed, nothing to restart.")
+        return
+
+    echo.info(f"Recreating {', '.join(services)} ...")
+    downtime = recreate_services(directory, services)
+    echo.info(f"Recreated {', '.join(services)}, downtime {downtime:.1f}s.")
@@ -13,7 +13,13 @@ from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
 from typing import Any, ClassVar
 
-from deepfellow.common.defaults import DF_CLI_CONFIG_PATH, DF_CLI_SECRETS_PATH
+from deepfellow.common.defaults import (
+    DF_CLI_BUNDLE_PATH,
+    DF_CLI_CACHE_DIRECTORY,
+    DF_CLI_CONFIG_PATH,
+    DF_CLI_SECRETS_PATH,
+    OutputFormatChoice,
+)
 
 
 class SingletonMeta(type):
@@ -45,9 +51,13 @@ class AppState(metaclass=SingletonMeta):
     debug: bool = False
     yes: bool = False
     non_interactive: bool = False
+    no_cache: bool = False
+    output: OutputFormatChoice = OutputFormatChoice.table
     cli_config: dict[str, Any] = field(default_factory=dict)
     cli_config_file: Path = DF_CLI_CONFIG_PATH
     cli_secrets_file: Path = DF_CLI_SECRETS_PATH
+    cli_cache_directory: Path = DF_CLI_CACHE_DIRECTORY
+    cli_bundle_file: Path = DF_CLI_BUNDLE_PATH
 
     def reset(self) -> None:
         """Restore every field to its default. Intended for test isolation."""
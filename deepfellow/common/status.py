@@ -0,0 +1,233 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Status of the Docker Compose project containers."""
+
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from rich.live import Live
+from rich.table import Table
+
+from deepfellow.common.defaults import OutputFormatChoice
+from deepfellow.common.docker import docker_ps, docker_stats
+from deepfellow.common.echo import echo
+from deepfellow.common.output import print_records
+from deepfellow.common.system import stream
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+@dataclass
+class ContainerStatus:
+    """Status and resource usage of a single container."""
+
+    service: str
+    name: str
+    image: str
+    state: str
+    status: str
+    created: str
+    ports: str
+    cpu: str | None = None
+    memory_usage: str | None = None
+    memory_limit: str | None = None
+    memory_percent: str | None = None
+    net_io: str | None = None
+    block_io: str | None = None
+    pids: str | None = None
+
+    @classmethod
+    def from_docker(cls, container: dict[str, Any], usage: dict[str, str] | None = None) -> "ContainerStatus":
+        """Create the status from ``docker compose ps`` and ``docker stats`` JSON entries."""
+        container_status = cls(
+            service=container.get("Service", ""),
+            name=container.get("Name", ""),
+            image=container.get("Image", ""),
+            state=container.get("State", ""),
+            status=container.get("Status", ""),
+            created=container.get("RunningFor", ""),
+            ports=container.get("Ports", ""),
+        )
+        if usage:
+            container_status.update_usage(usage)
+
+        return container_status
+
+    def update_usage(self, usage: dict[str, str]) -> None:
+        """Set the resource usage from the ``docker stats`` JSON entry."""
+        memory_usage, _, memory_limit = usage.get("MemUsage", "").partition(" / ")
+        self.cpu = usage.get("CPUPerc")
+        self.memory_usage = memory_usage or None
+        self.memory_limit = memory_limit or None
+        self.memory_percent = usage.get("MemPerc")
+        self.net_io = usage.get("NetIO")
+        self.block_io = usage.get("BlockIO")
+        self.pids = usage.get("PIDs")
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the status as dict."""
+        return asdict(self)
+
+
+def get_status(directory: Path) -> list[ContainerStatus]:
+    """Collect the status of all containers of the compose project.
+
+    The container list and the usage stats are fetched concurrently - sampling the stats is the slow part.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        containers_future = executor.submit(docker_ps, directory)
+        usage_future = executor.submit(docker_stats, directory)
+        containers = containers_future.result()
+        usage = usage_future.result()
+
+    statuses = [
+        ContainerStatus.from_docker(container, usage.get(container.get("Name", ""))) for container in containers
+    ]
+    return sorted(statuses, key=lambda container_status: container_status.service)
+
+
+def status_table(statuses: list[ContainerStatus], history: dict[str, deque[float]] | None = None) -> Table:
+    """Render the statuses as a table.
+
+    Args:
+        statuses: Statuses of the containers
+        history: Recent CPU usage samples keyed by the container name, rendered as sparklines if provided
+
+    Returns:
+        Table with one row per container
+    """
+    table = Table(box=None, header_style="bold")
+    for column in ("SERVICE", "IMAGE", "STATUS", "PORTS", "CPU", "MEMORY", "NET I/O", "BLOCK I/O"):
+        table.add_column(column)
+
+    if history is not None:
+        table.add_column("CPU HISTORY")
+
+    for container_status in statuses:
+        memory = (
+            f"{container_status.memory_usage} / {container_status.memory_limit}"
+            if container_status.memory_usage
+            else None
+        )
+        row = [
+            container_status.service,
+            container_status.image,
+            container_status.status,
+            container_status.ports,
+            container_status.cpu or "N/A",
+            memory or "N/A",
+            container_status.net_io or "N/A",
+            container_status.block_io or "N/A",
+        ]
+        if history is not None:
+            row.append(sparkline(history.get(container_status.name, [])))
+
+        table.add_row(*row)
+
+    return table
+
+
+def print_status(statuses: list[ContainerStatus], context: str, output: OutputFormatChoice) -> None:
+    """Print the statuses in the requested format."""
+    if output == OutputFormatChoice.json:
+        echo.print_json(data=[container_status.as_dict() for container_status in statuses])
+        return
+
+    if output == OutputFormatChoice.jsonl:
+        print_records(statuses, to_dict=ContainerStatus.as_dict, output=output)
+        return
+
+    if not statuses:
+        echo.info(f"No {context} container is currently running.")
+        return
+
+    echo.print(status_table(statuses))
+
+
+def parse_percent(value: str | None) -> float:
+    """Convert the ``docker stats`` percent, e.g. ``1.50%``, to float."""
+    try:
+        return float((value or "").rstrip("%"))
+    except ValueError:
+        return 0.0
+
+
+def sparkline(values: Iterable[float]) -> str:
+    """Render the values as a sparkline scaled to the highest value."""
+    values = list(values)
+    top = max(values, default=0.0)
+    if top <= 0:
+        return SPARKLINE_BLOCKS[0] * len(values)
+
+    last_block = len(SPARKLINE_BLOCKS) - 1
+    return "".join(SPARKLINE_BLOCKS[round(value / top * last_block)] for value in values)
+
+
+def watch_status(directory: Path, context: str, interval: float = 2.0, history_size: int | None = None) -> None:
+    """Display a live table of the compose project containers until interrupted.
+
+    Usage comes from a single long-running ``docker stats`` stream. Only the latest sample of every
+    container is kept, plus the last ``history_size`` CPU samples when the sparklines are enabled.
+
+    Args:
+        directory: Directory of the compose project
+        context: Name of the installation used in messages, e.g. ``infra``
+        interval: Minimum number of seconds between the table refreshes
+        history_size: Number of CPU samples in the sparklines, disabled if None
+    """
+    containers = sorted(docker_ps(directory), key=lambda container: container.get("Service", ""))
+    statuses = {container.get("Name", ""): ContainerStatus.from_docker(container) for container in containers}
+    running = [name for name, container_status in statuses.items() if container_status.state == "running"]
+    if not running:
+        echo.info(f"No {context} container is currently running.")
+        return
+
+    history: dict[str, deque[float]] | None = (
+        {name: deque(maxlen=history_size) for name in running} if history_size else None
+    )
+    command = ["docker", "stats", "--format", "{{json .}}", *running]
+    last_refresh = 0.0
+    try:
+        with Live(status_table(list(statuses.values()), history), console=echo, auto_refresh=False) as live:
+            for line in stream(command, cwd=directory):
+                # docker stats clears the screen before each batch of samples
+                line = ANSI_ESCAPE.sub("", line).strip()
+                if not line:
+                    continue
+
+                try:
+                    usage = json.loads(line)
+                except json.JSONDecodeError:
+                    echo.debug(f"Skipping docker stats line: {line}")
+                    continue
+
+                if not isinstance(usage, dict):
+                    continue
+
+                if (container_status := statuses.get(usage.get("Name", ""))) is None:
+                    continue
+
+                container_status.update_usage(usage)
+                if history is not None:
+                    history[container_status.name].append(parse_percent(usage.get("CPUPerc")))
+
+                if time.monotonic() - last_refresh >= interval:
+                    live.update(status_table(list(statuses.values()), history), refresh=True)
+                    last_refresh = time.monotonic()
+    except KeyboardInterrupt:
+        pass
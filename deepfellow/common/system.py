@@ -12,6 +12,8 @@
 import os
 import shutil
 import subprocess
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -108,6 +110,78 @@ def run(
     return None
 
 
+def stream(command: list[str], cwd: Path | str | None = None) -> Iterator[str]:
+    """Run subprocess command and yield its stdout line by line.
+
+    Meant for long-running commands like ``docker stats``. The process is terminated
+    when the generator is closed.
+
+    Args:
+        command: command to run
+        cwd: directory to run from
+
+    Yields:
+        Lines of the process's `stdout` without the trailing newline.
+    """
+    clean_env = os.environ.copy()
+    clean_env.pop("VIRTUAL_ENV", None)
+
+    process = subprocess.Popen(
+        command, cwd=cwd, text=True, env=clean_env, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    )
+    try:
+        for line in process.stdout or []:
+            yield line.rstrip("\n")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def pipe(source: list[str], sink: list[str], raises: type[Exception] = subprocess.SubprocessError) -> str:
+    """Run the ``source | sink`` pipeline, streaming the stdout of the source into the sink.
+
+    Nothing is buffered in memory, so it fits multi-GB streams like ``docker save | zstd``.
+
+    Args:
+        source: command producing the stream
+        sink: command consuming the stream
+        raises: exception raised if any of the commands failed
+
+    Returns:
+        The sink's `stdout`.
+
+    Raises:
+        The `raises` exception with the `stderr` of the failed command, the sink is checked first
+        as its failure breaks the pipe of the source too.
+    """
+    clean_env = os.environ.copy()
+    clean_env.pop("VIRTUAL_ENV", None)
+
+    # The stderr of the source goes to a file, a full pipe would block it while the sink is read
+    with tempfile.TemporaryFile() as source_errors:
+        source_process = subprocess.Popen(source, env=clean_env, stdout=subprocess.PIPE, stderr=source_errors)
+        sink_process = subprocess.Popen(
+            sink, env=clean_env, text=True, stdin=source_process.stdout, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        # Only the sink reads the stream now, the source gets SIGPIPE if the sink exits early
+        if source_process.stdout is not None:
+            source_process.stdout.close()
+
+        output, sink_errors = sink_process.communicate()
+        source_process.wait()
+
+        if sink_process.returncode != 0:
+            echo.debug(f"Failed to run command {sink}")
+            raise raises(sink_errors)
+
+        if source_process.returncode != 0:
+            echo.debug(f"Failed to run command {source}")
+            source_errors.seek(0)
+            raise raises(source_errors.read().decode(errors="replace"))
+
+    return output
+
+
 def rmtree(path: Path) -> None:
     """Remove a directory tree, falling back to ``sudo rm -rf`` on PermissionError.
 
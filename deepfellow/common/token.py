@@ -0,0 +1,45 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bearer tokens of DeepFellow Server."""
+
+import base64
+import json
+from typing import Any
+
+
+def get_token_claims(token: str) -> dict[str, Any]:
+    """Return the payload of the JWT token.
+
+    The signature is not verified - the server does it on every request, the CLI only reads the claims
+    describing the token.
+
+    Returns:
+        Claims of the token, empty if the token is not a JWT (e.g. an API Key)
+    """
+    parts = token.split(".")
+    if len(parts) != 3:
+        return {}
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+    except ValueError:
+        return {}
+
+    return payload if isinstance(payload, dict) else {}
+
+
+def get_token_identity(token: str) -> str:
+    """Return what the token authenticates: the ``sub`` claim of a JWT, the token itself otherwise.
+
+    The access token changes on every refresh while its ``sub`` stays, so data kept per identity
+    (e.g. the HTTP cache) outlives the refresh.
+    """
+    subject = get_token_claims(token).get("sub")
+    return f"sub:{subject}" if isinstance(subject, str | int) and subject != "" else f"token:{token}"
@@ -14,8 +14,6 @@ from typing import Any, cast
 from urllib.parse import urlparse
 
 import typer
-from email_validator import EmailNotValidError
-from email_validator import validate_email as validate_email_lib
 
 from .echo import echo
 from .system import is_command_available
@@ -50,6 +48,10 @@ def validate_email(value: str | None) -> str | None:
         # We allow email collected via option to be None
         return None
 
+    # email_validator is slow to import, load it only when an email is validated
+    from email_validator import EmailNotValidError
+    from email_validator import validate_email as validate_email_lib
+
     try:
         validated = validate_email_lib(value)
 
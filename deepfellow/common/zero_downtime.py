@@ -0,0 +1,243 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Blue/green update of a service published through a small TCP proxy.
+
+The first ``update --zero-downtime`` moves the published port of the service to an nginx stream proxy
+(``<service>-proxy``) forwarding to the service name on the compose network. Every such update then:
+1. starts a second replica from the new image next to the running container
+   (``docker compose up --scale <service>=2 --no-recreate --wait``) and waits for its health check,
+2. reloads the proxy, so the upstream resolves to both replicas,
+3. drains the old container (``docker stop`` lets the in-flight requests finish, the proxy retries
+   the refused connections on the new replica) and removes it,
+4. reloads the proxy again, leaving the new replica as the only upstream.
+
+While switching, a probe requests the health endpoint of the service through the published port and reports
+the longest gap. The proxy itself always accepts the connections, so only a response of the service counts.
+"""
+
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import httpx
+import typer
+
+from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME, DOCKER_COMPOSE_PROXY_IMAGE, PROXY_NGINX_CONF
+from deepfellow.common.docker import (
+    DockerError,
+    ensure_network,
+    get_docker_network,
+    is_service_running,
+    load_compose_file,
+    save_compose_file,
+)
+from deepfellow.common.echo import echo
+from deepfellow.common.system import run
+
+# Seconds the old container gets to finish the in-flight requests before it is killed
+DRAIN_TIMEOUT = 30
+# Endpoint requested by the probe while switching
+HEALTH_PATH = "/health"
+
+
+def get_proxy_name(service: str) -> str:
+    """Return the name of the proxy service publishing the port of the service."""
+    return f"{service}-proxy"
+
+
+def get_container_port(port_mapping: str) -> int:
+    """Return the container port of a ``HOST:CONTAINER[/PROTOCOL]`` port mapping."""
+    return int(str(port_mapping).rsplit(":", 1)[-1].split("/")[0])
+
+
+def enable_proxy(directory: Path, compose: dict[str, Any], service: str) -> bool:
+    """Move the published port of the service to its proxy.
+
+    The ``container_name`` of the service is dropped as well, so compose can run two replicas.
+
+    Args:
+        directory: Directory of the compose project, the proxy config is written there
+        compose: Docker Compose configuration, changed in place
+        service: Name of the service
+
+    Returns:
+        True if the compose configuration changed, False if the proxy was already there
+
+    Raises:
+        ValueError: When the service does not publish a port
+    """
+    services = compose["services"]
+    proxy = get_proxy_name(service)
+    if proxy in services:
+        return False
+
+    app = services[service]
+    ports = app.get("ports")
+    if not ports:
+        raise ValueError(f"Service {service} does not publish a port")
+
+    del app["ports"]
+    app.pop("container_name", None)
+
+    config_file = directory / f"{proxy}.conf"
+    config_file.write_text(PROXY_NGINX_CONF.format(service=service, port=get_container_port(ports[0])))
+
+    services[proxy] = {
+        "image": DOCKER_COMPOSE_PROXY_IMAGE,
+        "ports": ports,
+        "volumes": [f"./{config_file.name}:/etc/nginx/nginx.conf:ro"],
+        "restart": "unless-stopped",
+        "depends_on": [service],
+    }
+    if "networks" in app:
+        services[proxy]["networks"] = list(app["networks"])
+
+    return True
+
+
+class GapProbe:
+    """Requests the health endpoint in the background and measures the longest time it did not respond.
+
+    A 5xx response counts as a gap - the proxy responds with 502 when no upstream accepts the request.
+
+    Sample usage:
+    ```
+    with GapProbe(8086) as probe:
+        switch()
+    echo.info(f"Longest gap {probe.longest_gap:.1f}s")
+    ```
+    """
+
+    def __init__(
+        self, port: int, host: str = "127.0.0.1", path: str = HEALTH_PATH, tls: bool = False, interval: float = 0.1
+    ) -> None:
+        self.port = port
+        self.host = host
+        self.url = f"{'https' if tls else 'http'}://{host}:{port}{path}"
+        self.interval = interval
+        self.longest_gap = 0.0
+        self.reached = False
+        self._failed_since: float | None = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._probe, daemon=True)
+
+    def __enter__(self) -> "GapProbe":
+        """Start probing."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop probing, a gap lasting until now is counted too."""
+        self._stopped.set()
+        self._thread.join()
+        self._end_gap(time.monotonic())
+
+    def is_healthy(self) -> bool:
+        """Check if the service responds to the health request, every request opens a new connection."""
+        try:
+            # The certificate is not verified, it is issued for the public name of the service, often self-signed
+            return httpx.get(self.url, timeout=1, verify=False).status_code < 500
+        except httpx.HTTPError:
+            return False
+
+    def _end_gap(self, now: float) -> None:
+        if self._failed_since is not None:
+            self.longest_gap = max(self.longest_gap, now - self._failed_since)
+            self._failed_since = None
+
+    def _probe(self) -> None:
+        while not self._stopped.is_set():
+            reachable = self.is_healthy()
+            now = time.monotonic()
+            if reachable:
+                self.reached = True
+                self._end_gap(now)
+            elif self._failed_since is None:
+                self._failed_since = now
+
+            self._stopped.wait(self.interval)
+
+
+def list_containers(directory: Path, service: str) -> list[str]:
+    """Return the IDs of the containers of the service."""
+    output = run(["docker", "compose", "ps", "--quiet", service], cwd=directory, capture_output=True)
+    return output.split() if output else []
+
+
+def reload_proxy(directory: Path, proxy: str) -> None:
+    """Reload the proxy config, the upstream name is resolved again and open connections are kept."""
+    run(["docker", "compose", "exec", proxy, "nginx", "-s", "reload"], cwd=directory, quiet=True)
+
+
+def zero_downtime_update(directory: Path, service: str, port: int, tls: bool = False) -> None:
+    """Replace the containers of the service with the ones of the current image without refusing requests.
+
+    Args:
+        directory: Directory of the compose project
+        service: Name of the service
+        port: Published (host) port of the service, probed while switching
+        tls: The service serves HTTPS (``server ssl-on``)
+    """
+    compose_file = directory / DOCKER_COMPOSE_CONFIG_FILENAME
+    compose = load_compose_file(compose_file)
+    proxy = get_proxy_name(service)
+    try:
+        proxy_added = enable_proxy(directory, compose, service)
+    except ValueError as exc:
+        echo.error(str(exc))
+        raise typer.Exit(1) from exc
+
+    if proxy_added:
+        save_compose_file(compose, compose_file, quiet=True)
+        echo.info(f"The port of {service} is published by the {proxy} service from now on.")
+
+    old_containers = list_containers(directory, service)
+    ensure_network(get_docker_network(directory))
+    echo.info(f"Starting the new {service} container next to the running one ...")
+    command = ["docker", "compose", "up", "-d", "--wait", "--no-deps", "--no-recreate"]
+    try:
+        run([*command, "--scale", f"{service}={len(old_containers) + 1}", service], cwd=directory, raises=DockerError)
+    except DockerError:
+        if new_containers := [
+            container for container in list_containers(directory, service) if container not in old_containers
+        ]:
+            run(["docker", "rm", "--force", *new_containers], cwd=directory, quiet=True)
+
+        echo.error(f"The new {service} container did not become healthy, the current one keeps running.")
+        raise typer.Exit(1) from None
+
+    proxy_running = is_service_running(proxy, cwd=directory)
+    with GapProbe(port, tls=tls) as probe:
+        if proxy_running:
+            reload_proxy(directory, proxy)
+
+        if old_containers:
+            echo.info(f"Draining the old {service} container ...")
+            run(["docker", "stop", "--time", str(DRAIN_TIMEOUT), *old_containers], cwd=directory, quiet=True)
+
+        if not proxy_running:
+            run(["docker", "compose", "up", "-d", "--no-deps", proxy], cwd=directory)
+
+        if old_containers:
+            run(["docker", "rm", *old_containers], cwd=directory, quiet=True)
+
+        reload_proxy(directory, proxy)
+
+    if probe.reached:
+        echo.success(f"Switched {service} to the new container, longest gap {probe.longest_gap:.1f}s.")
+    else:
+        echo.warning(f"Switched {service} to the new container, {probe.url} did not respond to measure the gap.")
@@ -11,39 +11,25 @@
 
 import typer
 
-from .connect import app as connect_app
-from .disconnect import app as disconnect_app
-from .env_command import app as env_app
-from .env_command.info import app as info_app
-from .install import app as install_app
-from .logs import app as logs_app
-from .model import app as model_app
-from .prune import app as prune_app
-from .restart import app as restart_app
-from .service import app as service_app
-from .ssl_on import app as ssl_on_app
-from .start import app as start_app
-from .status import app as status_app
-from .stop import app as stop_app
-from .uninstall import app as uninstall_app
-from .update import app as update_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("info", "deepfellow.infra.env_command.info:app", "Display environment configuration."),
+    LazyCommand("install", "deepfellow.infra.install:app", "Install infra with docker."),
+    LazyCommand("uninstall", "deepfellow.infra.uninstall:app", "Uninstall Deepfellow Infra."),
+    LazyCommand("start", "deepfellow.infra.start:app", "Start DeepFellow Infra."),
+    LazyCommand("status", "deepfellow.infra.status:app", "Show DeepFellow Infra status."),
+    LazyCommand("stop", "deepfellow.infra.stop:app", "Stop DeepFellow Infra."),
+    LazyCommand("restart", "deepfellow.infra.restart:app", "Restart DeepFellow Infra."),
+    LazyCommand("update", "deepfellow.infra.update:app", "Update DeepFellow Infra."),
+    LazyCommand("ssl-on", "deepfellow.infra.ssl_on:app", "Switch on the SSL."),
+    LazyCommand("connect", "deepfellow.infra.connect:app", "Connect two Infras together."),
+    LazyCommand("disconnect", "deepfellow.infra.disconnect:app", "Disconnect infra."),
+    LazyCommand("env", "deepfellow.infra.env_command:app", "Manage Infra environment variables."),
+    LazyCommand("service", "deepfellow.infra.service:app", "Manage DeepFellow Infra services."),
+    LazyCommand("model", "deepfellow.infra.model:app", "Manage DeepFellow Infra models."),
+    LazyCommand("logs", "deepfellow.infra.logs:app", "Show DeepFellow Infra logs."),
+    LazyCommand("prune", "deepfellow.infra.prune:app", "Remove all DeepFellow Infra containers, volumes, and files."),
+)
 
-
-app.add_typer(info_app)
-app.add_typer(install_app)
-app.add_typer(uninstall_app)
-app.add_typer(start_app)
-app.add_typer(status_app)
-app.add_typer(stop_app)
-app.add_typer(restart_app)
-app.add_typer(update_app)
-app.add_typer(ssl_on_app)
-app.add_typer(connect_app)
-app.add_typer(disconnect_app)
-app.add_typer(env_app, name="env", help="Manage Infra environment variables.")
-app.add_typer(service_app, name="service", help="Manage DeepFellow Infra services.")
-app.add_typer(model_app, name="model", help="Manage DeepFellow Infra models.")
-app.add_typer(logs_app)
-app.add_typer(prune_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
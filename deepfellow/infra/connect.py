@@ -19,7 +19,9 @@ import typer
 
 from deepfellow.common.docker import is_service_running
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_get, env_set
+from deepfellow.common.env import open_env_file
+from deepfellow.common.http import get_client
+from deepfellow.common.restart import get_compose_config, restart_changed_services
 from deepfellow.common.system import run
 from deepfellow.common.validation import validate_url
 from deepfellow.infra.utils.options import directory_option
@@ -72,7 +74,7 @@ def _verify_parent_connection(local_infra_url: str, admin_api_key: str) -> str:
 
     while time.monotonic() < deadline:
         try:
-            response = httpx.get(topology_url, headers=headers, timeout=5)
+            response = get_client().get(topology_url, headers=headers, timeout=5)
             if response.status_code == 200:
                 topology = response.json()
                 got_valid_json = True
@@ -144,21 +146,19 @@ def connect(
         )
         raise typer.Exit(1)
 
-    env_file = directory / ".env"
-    original_parent_infra_url = env_get(env_file, "DF_CONNECT_TO_MESH_URL")
+    env = open_env_file(directory / ".env")
+    original_parent_infra_url = env.get("DF_CONNECT_TO_MESH_URL")
 
     if original_parent_infra_url:
         echo.info(f"Disconnecting from {original_parent_infra_url} ...")
 
-    env_set(env_file, "DF_CONNECT_TO_MESH_URL", parent_infra_url)
-    env_set(env_file, "DF_CONNECT_TO_MESH_KEY", mesh_key)
+    before = get_compose_config(directory)
+    env.update({"DF_CONNECT_TO_MESH_URL": parent_infra_url, "DF_CONNECT_TO_MESH_KEY": mesh_key})
+    env.save()
+    restart_changed_services(directory, before)
 
-    echo.info("Restarting this instance DeepFellow Infra ...")
-    run(["docker", "compose", "down"], cwd=directory, quiet=True)
-    run(["docker", "compose", "up", "-d", "--remove-orphans"], cwd=directory, quiet=True)
-
-    infra_port = env_get(env_file, "DF_INFRA_PORT", should_raise=False)
-    admin_api_key = env_get(env_file, "DF_INFRA_ADMIN_API_KEY", should_raise=False)
+    infra_port = env.get("DF_INFRA_PORT")
+    admin_api_key = env.get("DF_INFRA_ADMIN_API_KEY")
 
     if infra_port and admin_api_key:
         echo.info("Verifying connection to parent Infra ...")
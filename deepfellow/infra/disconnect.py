@@ -15,8 +15,8 @@ import typer
 
 from deepfellow.common.docker import is_service_running
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_get, env_set
-from deepfellow.common.system import run
+from deepfellow.common.env import open_env_file
+from deepfellow.common.restart import get_compose_config, restart_changed_services
 from deepfellow.infra.utils.options import directory_option
 from deepfellow.infra.utils.validation import check_infra_directory
 
@@ -35,18 +35,16 @@ def disconnect(
         echo.info("Call `deepfellow infra start`")
         raise typer.Exit(1)
 
-    env_file = directory / ".env"
-    parent_infra_url = env_get(env_file, "DF_CONNECT_TO_MESH_URL")
+    env = open_env_file(directory / ".env")
+    parent_infra_url = env.get("DF_CONNECT_TO_MESH_URL")
 
     if parent_infra_url:
         if echo.confirm(f"Are you sure you want to disconnect from {parent_infra_url}", default=False):
             echo.info(f"Disconnecting from {parent_infra_url} ...")
-            env_set(env_file, "DF_CONNECT_TO_MESH_URL", "")
-            env_set(env_file, "DF_CONNECT_TO_MESH_KEY", "")
-
-            echo.info("Restarting this instance DeepFellow Infra ...")
-            run(["docker", "compose", "down"], cwd=directory, quiet=True)
-            run(["docker", "compose", "up", "-d", "--remove-orphans"], cwd=directory, quiet=True)
+            before = get_compose_config(directory)
+            env.update({"DF_CONNECT_TO_MESH_URL": "", "DF_CONNECT_TO_MESH_KEY": ""})
+            env.save()
+            restart_changed_services(directory, before)
 
             echo.success(f"DeepFellow Infra is disconnected from another Deepfellow Infra at {parent_infra_url}")
         else:
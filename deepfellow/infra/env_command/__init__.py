@@ -11,11 +11,11 @@
 
 import typer
 
-from .info import app as info_app
-from .set import app as set_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("set", "deepfellow.infra.env_command.set:app", "Set environment configuration."),
+    LazyCommand("info", "deepfellow.infra.env_command.info:app", "Display environment configuration."),
+)
 
-
-app.add_typer(set_app)
-app.add_typer(info_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
@@ -14,8 +14,7 @@ from pathlib import Path
 import typer
 
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_set
-from deepfellow.infra.utils.docker import start_infra, stop_infra
+from deepfellow.common.env import apply_env_changes, parse_env_assignments
 from deepfellow.infra.utils.options import directory_option
 from deepfellow.infra.utils.validation import check_infra_directory
 
@@ -25,13 +24,28 @@ app = typer.Typer()
 @app.command()
 def set(
     directory: Path = directory_option(),
-    env_name: str = typer.Argument(..., help="Name of the environment variable", callback=lambda x: x.upper()),
-    env_value: str = typer.Argument("", help="Value of the environment variable"),
+    assignments: list[str] | None = typer.Argument(
+        None, help="KEY=VALUE assignments, a single NAME VALUE pair is accepted as well", show_default=False
+    ),
+    from_file: Path | None = typer.Option(
+        None, "--from-file", exists=True, dir_okay=False, help="Env file with the variables to set"
+    ),
     df_prefix: bool = typer.Option(True, help="Add DF_ prefix if not provided?"),
 ) -> None:
-    """Set environment configuration."""
+    """Set environment configuration.
+
+    All variables are saved with a single write and only the services using the changed ones
+    are recreated, once.
+    """
     check_infra_directory(directory)
-    env_set(directory / ".env", env_name, env_value, df_prefix)
-    if echo.confirm("Restart the infra now to apply the change?", default=True):
-        stop_infra(directory)
-        start_infra(directory)
+    try:
+        values = parse_env_assignments(assignments or [], from_file, df_prefix)
+    except ValueError as exc:
+        echo.error(str(exc))
+        raise typer.Exit(1) from exc
+
+    if not values:
+        echo.error("Provide KEY=VALUE assignments or --from-file.")
+        raise typer.Exit(1)
+
+    apply_env_changes(directory, values)
@@ -17,6 +17,7 @@ from typing import Any, cast
 
 import typer
 
+from deepfellow.common.bundle import use_bundle_images
 from deepfellow.common.config import (
     configure_uuid_key,
     read_env_file_to_dict,
@@ -38,14 +39,15 @@ from deepfellow.common.docker import (
     ensure_network,
     get_socket,
     save_compose_file,
+    set_pull_policy,
 )
 from deepfellow.common.echo import echo
 from deepfellow.common.env import env_set
 from deepfellow.common.generate import generate_password
 from deepfellow.common.install import assert_docker, ensure_directory
-from deepfellow.common.registry import get_newest_image_tag
+from deepfellow.common.pull import pull_images
+from deepfellow.common.registry import get_install_image
 from deepfellow.common.state import state
-from deepfellow.common.system import run
 from deepfellow.common.validation import validate_df_name, validate_url
 from deepfellow.infra.utils.options import directory_option
 
@@ -86,7 +88,7 @@ def install(  # noqa: C901
     secrets_file = state.cli_secrets_file
 
     if not local_image and image == DF_INFRA_IMAGE:
-        image = get_newest_image_tag(DF_INFRA_IMAGE_HUB)
+        image = get_install_image(DF_INFRA_IMAGE_HUB)
 
     # Check if overriding existing installation
     ensure_directory(
@@ -248,16 +250,18 @@ def install(  # noqa: C901
     volumes.append(f"{docker_socket}:/var/run/docker.sock")
     volumes.append("${DF_INFRA_STORAGE_DIR}:${DF_INFRA_STORAGE_DIR}")
 
-    if local_image:
-        infra_service["pull_policy"] = "never"
+    set_pull_policy(infra_service, local_image)
 
+    use_bundle_images(compose)
     save_compose_file(
         {"services": compose, "networks": {docker_network: {"external": True}}},
         directory / DOCKER_COMPOSE_CONFIG_FILENAME,
     )
 
-    echo.info("Pulling docker image(s).")
-    run(["docker", "compose", "pull"], directory, quiet=True)
+    if not pull_images(directory):
+        echo.error("Unable to pull the docker images of DeepFellow Infra.")
+        raise typer.Exit(1)
+
     echo.success(
         "DeepFellow Infra installed.\n"
         "To start the docker image - `deepfellow infra start`.\n"
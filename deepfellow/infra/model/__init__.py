@@ -11,11 +11,11 @@
 
 import typer
 
-from .install import app as install_app
-from .uninstall import app as uninstall_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("install", "deepfellow.infra.model.install:app", "Install model."),
+    LazyCommand("uninstall", "deepfellow.infra.model.uninstall:app", "Uninstall model."),
+)
 
-
-app.add_typer(install_app)
-app.add_typer(uninstall_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
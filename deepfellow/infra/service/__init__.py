@@ -11,13 +11,12 @@
 
 import typer
 
-from .install import app as install_app
-from .list import app as list_app
-from .uninstall import app as uninstall_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("install", "deepfellow.infra.service.install:app", "Install service."),
+    LazyCommand("list", "deepfellow.infra.service.list:app", "Display list of installed services."),
+    LazyCommand("uninstall", "deepfellow.infra.service.uninstall:app", "Uninstall service."),
+)
 
-
-app.add_typer(install_app)
-app.add_typer(list_app)
-app.add_typer(uninstall_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
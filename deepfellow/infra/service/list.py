@@ -17,6 +17,7 @@ import typer
 from deepfellow.common.config import read_env_file
 from deepfellow.common.echo import echo
 from deepfellow.common.env import env_set
+from deepfellow.common.output import print_records
 from deepfellow.common.rest import make_request
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -83,6 +84,7 @@ def list(
             token=api_key,
             err_msg="Unable to list services.",
             reraise=True,
+            cache=True,
         )
     except httpx.ConnectError as exc:
         echo.error("No connection with DeepFellow Infra. Is it up? (deepfellow infra start)")
@@ -95,10 +97,5 @@ def list(
         echo.error(msg)
         raise typer.Exit(1) from exc
 
-    services = [service for service in data.get("list", []) if _is_installed(service)]
-
-    if not services:
-        echo.info("No services installed.")
-        return
-
-    echo.info("\n\n".join(_format_service(service) for service in services))
+    services = (service for service in data.get("list", []) if _is_installed(service))
+    print_records(services, to_dict=dict, to_text=_format_service, empty_message="No services installed.")
@@ -13,9 +13,11 @@ from pathlib import Path
 
 import typer
 
-from deepfellow.common.docker import print_docker_status
+from deepfellow.common.defaults import OutputFormatChoice
 from deepfellow.common.echo import echo
 from deepfellow.common.install import assert_docker
+from deepfellow.common.state import state
+from deepfellow.common.status import get_status, print_status, watch_status
 from deepfellow.infra.utils.options import directory_option
 
 app = typer.Typer()
@@ -24,8 +26,25 @@ app = typer.Typer()
 @app.command()
 def status(
     directory: Path = directory_option(exists=True),
+    output: OutputFormatChoice | None = typer.Option(
+        None, "--output", "-o", help="Output format, the global --output by default."
+    ),
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep refreshing the status until interrupted."),
+    interval: float = typer.Option(2.0, "--interval", min=0.5, help="Seconds between refreshes in watch mode."),
+    sparkline: int = typer.Option(
+        0, "--sparkline", min=0, help="Show a CPU sparkline of the last N samples in watch mode."
+    ),
 ) -> None:
     """Show DeepFellow Infra status."""
     assert_docker()
     echo.debug("Showing DeepFellow Infra status")
-    print_docker_status(directory, "infra")
+    output = output or state.output
+    if watch:
+        if output != OutputFormatChoice.table:
+            echo.error("--watch works only with the table output.")
+            raise typer.Exit(1)
+
+        watch_status(directory, "infra", interval, sparkline or None)
+        return
+
+    print_status(get_status(directory), "infra", output)
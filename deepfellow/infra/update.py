@@ -16,12 +16,18 @@ import typer
 from deepfellow.common.config import (
     read_env_file_to_dict,
 )
-from deepfellow.common.defaults import DF_INFRA_IMAGE, DF_INFRA_IMAGE_HUB, DOCKER_COMPOSE_CONFIG_FILENAME
-from deepfellow.common.docker import load_compose_file, save_compose_file
+from deepfellow.common.defaults import (
+    DF_INFRA_IMAGE,
+    DF_INFRA_IMAGE_HUB,
+    DF_INFRA_PORT,
+    DOCKER_COMPOSE_CONFIG_FILENAME,
+)
+from deepfellow.common.docker import load_compose_file, save_compose_file, set_pull_policy
 from deepfellow.common.echo import echo
 from deepfellow.common.env import env_set
-from deepfellow.common.registry import get_newest_image_tag
+from deepfellow.common.registry import get_newest_image_tag, is_image_up_to_date
 from deepfellow.common.system import run
+from deepfellow.common.zero_downtime import zero_downtime_update
 from deepfellow.infra.utils.docker import start_infra, stop_infra
 from deepfellow.infra.utils.options import directory_option
 from deepfellow.infra.utils.validation import check_infra_directory
@@ -47,6 +53,11 @@ def update(
     image: str = typer.Option(DF_INFRA_IMAGE, envvar="DF_INFRA_IMAGE", help="DeepFellow Infra docker image."),
     local_image: bool = typer.Option(False, help="Use locally build DeepFellow Infra docker image."),
     tag: str | None = typer.Option(None, help="Deepfellow Infra docker image tag (e.g. 0.15.0)"),
+    zero_downtime: bool = typer.Option(
+        False,
+        "--zero-downtime",
+        help="Start the new container next to the running one and switch to it once it is healthy.",
+    ),
 ) -> None:
     """Update DeepFellow Infra."""
     check_infra_directory(directory)
@@ -63,17 +74,7 @@ def update(
     compose = load_compose_file(compose_file=compose_file)
     infra_service = compose["services"]["infra"]
 
-    update_compose = False
-    if local_image:
-        if "pull_policy" not in infra_service:
-            infra_service["pull_policy"] = "never"
-            update_compose = True
-    else:
-        if "pull_policy" in infra_service:
-            del infra_service["pull_policy"]
-            update_compose = True
-
-    if update_compose:
+    if set_pull_policy(infra_service, local_image):
         save_compose_file(
             compose,
             directory / DOCKER_COMPOSE_CONFIG_FILENAME,
@@ -81,11 +82,28 @@ def update(
 
     image = _resolve_image(image, tag)
 
-    if infra_values["df_infra_image"] != image:
+    image_changed = infra_values["df_infra_image"] != image
+    if image_changed:
         env_set(env_file, "INFRA_IMAGE", image, quiet=False, docker_note=False)
 
-    run(["docker", "compose", "pull", "infra"], cwd=directory)
+    # The registry digest of the tag is compared with the local image, so an unchanged image is not pulled
+    if not local_image and is_image_up_to_date(image):
+        if not image_changed:
+            echo.success(f"Deepfellow Infra is up to date ({image}).")
+            return
+
+        echo.info(f"{image} is already pulled.")
+    else:
+        run(["docker", "compose", "pull", "infra"], cwd=directory)
+
     echo.success("Deepfellow Infra updated.")
-    if echo.confirm("Do you want to restart?", default=True):
+    if zero_downtime:
+        zero_downtime_update(
+            directory,
+            "infra",
+            int(str(infra_values.get("df_infra_port", DF_INFRA_PORT))),
+            tls=str(infra_values.get("df_infra_url", "")).startswith("https:"),
+        )
+    elif echo.confirm("Do you want to restart?", default=True):
         stop_infra(directory)
         start_infra(directory)
@@ -16,18 +16,24 @@ from pathlib import Path
 import typer
 
 from deepfellow.common.config import EnvDict, env_to_dict, read_env_file, save_env_file
-from deepfellow.common.defaults import DF_CLI_CONFIG_PATH, DF_CLI_SECRETS_PATH
+from deepfellow.common.defaults import DF_CLI_CONFIG_PATH, DF_CLI_SECRETS_PATH, OutputFormatChoice
+from deepfellow.common.lazy import LazyCommand, lazy_group
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_system
 
-from .cli import app as cli_app
 from .common.colors import COLORS, RESET
 from .common.echo import echo
-from .infra import app as infra_app
-from .otel import app as otel_app
-from .server import app as server_app
 
-app = typer.Typer(invoke_without_command=True)
+# Object-based command groups, imported only when invoked
+COMMANDS = (
+    LazyCommand("bundle", "deepfellow.bundle:app", "Move DeepFellow docker images to air-gapped hosts."),
+    LazyCommand("cli", "deepfellow.cli:app", "Manage DeepFellow CLI."),
+    LazyCommand("infra", "deepfellow.infra:app", "Manage DeepFellow Infra."),
+    LazyCommand("otel", "deepfellow.otel:app", "Manage local OpenTelemetry collector."),
+    LazyCommand("server", "deepfellow.server:app", "Manage DeepFellow Server."),
+)
+
+app = typer.Typer(invoke_without_command=True, cls=lazy_group(COMMANDS))
 
 
 def print_name() -> None:
@@ -64,6 +70,10 @@ def main(
     debug: bool = typer.Option(False, "-v", "-vv", "--verbose", "--debug", help="Display debug information"),
     yes: bool = typer.Option(False, "-y", "--yes", help="Automatically answer to all questions"),
     non_interactive: bool = typer.Option(False, help="Run in non-interactive mode"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Always download the lists instead of using the cache"),
+    output: OutputFormatChoice = typer.Option(
+        OutputFormatChoice.table, "--output", "-o", envvar="DF_CLI_OUTPUT", help="Output format of list/get commands."
+    ),
 ) -> None:
     """DeepFellow Command Line Interface."""
     if ctx.invoked_subcommand is None:
@@ -80,6 +90,8 @@ def main(
     state.debug = debug
     state.yes = yes
     state.non_interactive = non_interactive
+    state.no_cache = no_cache
+    state.output = output
     state.cli_config_file = config
     state.cli_config = cli_config
     state.cli_secrets_file = secrets
@@ -100,11 +112,5 @@ def version() -> None:
         echo.error("No version information available. Have you installed the command?")
 
 
-# Add object-based command groups
-app.add_typer(cli_app, name="cli", help="Manage DeepFellow CLI.")
-app.add_typer(infra_app, name="infra")
-app.add_typer(otel_app, name="otel", help="Manage local OpenTelemetry collector.")
-app.add_typer(server_app, name="server")
-
 if __name__ == "__main__":
     app()
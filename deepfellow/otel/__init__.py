@@ -11,8 +11,8 @@
 
 import typer
 
-from .logs import app as logs_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (LazyCommand("logs", "deepfellow.otel.logs:app", "Show local OpenTelemetry collector logs."),)
 
-app.add_typer(logs_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
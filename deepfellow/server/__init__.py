@@ -9,44 +9,30 @@
 
 import typer
 
-from .create_admin import app as create_admin_app
-from .env_command import app as env_app
-from .info import app as info_app
-from .install import app as install_app
-from .login import app as login_app
-from .logout import app as logout_app
-from .logs import app as logs_app
-from .opentelemetry import app as opentelemetry_app
-from .organization import app as organization_app
-from .password_reset import app as reset_password_app
-from .project import app as project_app
-from .prune import app as prune_app
-from .restart import app as restart_app
-from .ssl_on import app as ssl_on_app
-from .start import app as start_app
-from .status import app as status_app
-from .stop import app as stop_app
-from .uninstall import app as uninstall_app
-from .update import app as update_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("info", "deepfellow.server.info:app", "Display runtime configuration values."),
+    LazyCommand("install", "deepfellow.server.install:app", "Install DeepFellow Server with docker."),
+    LazyCommand("uninstall", "deepfellow.server.uninstall:app", "Uninstall DeepFellow Server."),
+    LazyCommand("create-admin", "deepfellow.server.create_admin:app", "Create admin."),
+    LazyCommand("opentelemetry", "deepfellow.server.opentelemetry:app", "Connect to Open Telemetry."),
+    LazyCommand("password-reset", "deepfellow.server.password_reset:app", "Password reset."),
+    LazyCommand("start", "deepfellow.server.start:app", "Start DeepFellow Server."),
+    LazyCommand("status", "deepfellow.server.status:app", "Show DeepFellow Server status."),
+    LazyCommand("stop", "deepfellow.server.stop:app", "Stop DeepFellow Server."),
+    LazyCommand("restart", "deepfellow.server.restart:app", "Restart DeepFellow Server."),
+    LazyCommand("update", "deepfellow.server.update:app", "Update DeepFellow Server."),
+    LazyCommand("ssl-on", "deepfellow.server.ssl_on:app", "Switch on the SSL."),
+    LazyCommand("logs", "deepfellow.server.logs:app", "Show DeepFellow Server logs."),
+    LazyCommand("env", "deepfellow.server.env_command:app", "Manage DeepFellow Server environment variables."),
+    LazyCommand("login", "deepfellow.server.login:app", "Login user and store the token in the secrets file."),
+    LazyCommand("logout", "deepfellow.server.logout:app", "Logout user and invalidate token on the server."),
+    LazyCommand("organization", "deepfellow.server.organization:app", "Manage Organizations."),
+    LazyCommand("project", "deepfellow.server.project:app", "Manage Projects."),
+    LazyCommand("api-key", "deepfellow.server.api_key:app", "Manage API Keys of all organizations and projects."),
+    LazyCommand("inventory", "deepfellow.server.inventory:app", "Snapshot and compare organizations and projects."),
+    LazyCommand("prune", "deepfellow.server.prune:app", "Remove all DeepFellow Server containers, volumes, and files."),
+)
 
-app.add_typer(info_app)
-app.add_typer(install_app)
-app.add_typer(uninstall_app)
-app.add_typer(create_admin_app)
-app.add_typer(opentelemetry_app)
-app.add_typer(reset_password_app)
-app.add_typer(start_app)
-app.add_typer(status_app)
-app.add_typer(stop_app)
-app.add_typer(restart_app)
-app.add_typer(update_app)
-app.add_typer(ssl_on_app)
-app.add_typer(logs_app)
-app.add_typer(env_app, name="env", help="Manage DeepFellow Server environment variables.")
-app.add_typer(login_app)
-app.add_typer(logout_app)
-app.add_typer(organization_app, name="organization", help="Manage Organizations.")
-app.add_typer(project_app, name="project", help="Manage Projects.")
-app.add_typer(prune_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
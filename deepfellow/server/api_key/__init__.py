@@ -0,0 +1,18 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collect server api-key commands working across all organizations and projects."""
+
+import typer
+
+from deepfellow.common.lazy import LazyCommand, lazy_group
+
+COMMANDS = (LazyCommand("sweep", "deepfellow.server.api_key.sweep:app", "Find and revoke unused API Keys."),)
+
+app = typer.Typer(cls=lazy_group(COMMANDS))
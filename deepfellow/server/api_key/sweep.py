@@ -0,0 +1,127 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""server api-key sweep command."""
+
+import time
+from dataclasses import dataclass
+from typing import Literal
+
+import typer
+
+from deepfellow.common.echo import echo
+from deepfellow.common.output import print_records
+from deepfellow.common.rest import BulkRequest, bulk_request, get_server_url
+from deepfellow.common.state import state
+from deepfellow.common.validation import validate_server
+from deepfellow.server.organization.admin_api_key.utils import ApiKey as AdminApiKey
+from deepfellow.server.project.api_key.utils import ApiKey as ProjectApiKey
+from deepfellow.server.utils.inventory import crawl_inventory
+from deepfellow.server.utils.login import get_token
+from deepfellow.server.utils.time import parse_duration
+
+app = typer.Typer()
+
+
+@dataclass
+class SweptApiKey:
+    """API Key not used for longer than the sweep threshold."""
+
+    kind: Literal["organization", "project"]
+    organization_id: str
+    project_id: str | None
+    api_key: AdminApiKey | ProjectApiKey
+    unused_days: float
+
+    def revoke_request(self, server: str) -> BulkRequest:
+        """Return the request of the revoke endpoint of the key."""
+        if self.project_id is None:
+            url = f"{server}/v1/organization/admin_api_keys/{self.api_key.id}"
+        else:
+            url = f"{server}/v1/organization/projects/{self.project_id}/api_keys/{self.api_key.id}"
+
+        return BulkRequest(
+            "DELETE",
+            url,
+            label=f"{self.kind} API Key {self.api_key.name}",
+            headers={"OpenAI-Organization": self.organization_id},
+        )
+
+    def as_dict(self) -> dict[str, str | None]:
+        """Dictionary representation of the swept key."""
+        return {
+            "kind": self.kind,
+            "organization_id": self.organization_id,
+            "project_id": self.project_id,
+            "id": self.api_key.id,
+            "name": self.api_key.name,
+            "redacted_value": self.api_key.redacted_value,
+            "last_used_at": self.api_key.last_used_at_to_str(),
+            "unused_days": f"{self.unused_days:.0f}",
+        }
+
+    def __str__(self) -> str:
+        """String represantation of the swept key."""
+        return "\n".join(f"{key}: {value}" for key, value in self.as_dict().items() if value is not None)
+
+
+def get_unused_seconds(api_key: AdminApiKey | ProjectApiKey, now: float) -> float:
+    """Return the time since the key was used, or created if it was never used."""
+    return now - (api_key.last_used_at or api_key.created_at)
+
+
+def sweep_api_keys(server: str, token: str, unused_for: float, concurrency: int) -> list[SweptApiKey]:
+    """Return the organization and API Keys of the active projects not used for ``unused_for`` seconds."""
+    now = time.time()
+    swept = []
+    for entry in crawl_inventory(server, token, concurrency, include_archived=False):
+        if not isinstance(entry.item, AdminApiKey | ProjectApiKey):
+            continue
+
+        unused_seconds = get_unused_seconds(entry.item, now)
+        if unused_seconds >= unused_for:
+            kind: Literal["organization", "project"] = "project" if entry.project_id else "organization"
+            swept.append(SweptApiKey(kind, entry.organization_id, entry.project_id, entry.item, unused_seconds / 86400))
+
+    return swept
+
+
+@app.command()
+def sweep(
+    server: str | None = typer.Option(None, callback=validate_server, help="DeepFellow Server address"),
+    unused_for: str = typer.Option(..., "--unused-for", help="Minimal time since the last use, e.g. 90d, 12h, 2w"),
+    revoke: bool = typer.Option(False, "--revoke", help="Revoke the found API Keys"),
+    concurrency: int = typer.Option(8, min=1, max=64, help="Maximum number of requests in flight"),
+) -> None:
+    """Find and revoke unused API Keys.
+
+    Walks the organization and project API Keys of all organizations and reports the ones
+    not used for the given time (or never used and created before it).
+    """
+    try:
+        unused_seconds = parse_duration(unused_for)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc), param_hint="--unused-for") from exc
+
+    secrets_file = state.cli_secrets_file
+    server_url = get_server_url(server)
+    token = get_token(secrets_file, server_url)
+
+    swept = sweep_api_keys(server_url, token, unused_seconds, concurrency)
+    print_records(swept, empty_message=f"No API Key unused for {unused_for}.")
+    if not swept or not revoke:
+        return
+
+    if not state.yes and not echo.confirm(f"Are you sure you want to revoke {len(swept)} API Keys?", default=False):
+        raise typer.Exit(1)
+
+    report = bulk_request([api_key.revoke_request(server_url) for api_key in swept], token, concurrency=concurrency)
+    report.print()
+    if report.failed:
+        raise typer.Exit(1)
@@ -11,11 +11,13 @@
 
 import typer
 
-from .info import app as info_app
-from .set import app as set_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("set", "deepfellow.server.env_command.set:app", "Set environment configuration."),
+    LazyCommand(
+        "info", "deepfellow.server.env_command.info:app", "Display environment variables with their DF_ prefix."
+    ),
+)
 
-
-app.add_typer(set_app)
-app.add_typer(info_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
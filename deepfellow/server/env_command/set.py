@@ -7,15 +7,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""infra env set command."""
+"""server env set command."""
 
 from pathlib import Path
 
 import typer
 
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_set
-from deepfellow.server.utils.docker import start_server, stop_server
+from deepfellow.common.env import apply_env_changes, parse_env_assignments
 from deepfellow.server.utils.options import directory_option
 from deepfellow.server.utils.validation import check_server_directory
 
@@ -25,13 +24,28 @@ app = typer.Typer()
 @app.command()
 def set(
     directory: Path = directory_option(),
-    env_name: str = typer.Argument(..., help="Name of the environment variable", callback=lambda x: x.upper()),
-    env_value: str = typer.Argument("", help="Value of the environment variable"),
+    assignments: list[str] | None = typer.Argument(
+        None, help="KEY=VALUE assignments, a single NAME VALUE pair is accepted as well", show_default=False
+    ),
+    from_file: Path | None = typer.Option(
+        None, "--from-file", exists=True, dir_okay=False, help="Env file with the variables to set"
+    ),
     df_prefix: bool = typer.Option(True, help="Add DF_ prefix if not provided?"),
 ) -> None:
-    """Set environment configuration."""
+    """Set environment configuration.
+
+    All variables are saved with a single write and only the services using the changed ones
+    are recreated, once.
+    """
     check_server_directory(directory)
-    env_set(directory / ".env", env_name, env_value, df_prefix)
-    if echo.confirm("Restart the server now to apply the change?", default=True):
-        stop_server(directory)
-        start_server(directory)
+    try:
+        values = parse_env_assignments(assignments or [], from_file, df_prefix)
+    except ValueError as exc:
+        echo.error(str(exc))
+        raise typer.Exit(1) from exc
+
+    if not values:
+        echo.error("Provide KEY=VALUE assignments or --from-file.")
+        raise typer.Exit(1)
+
+    apply_env_changes(directory, values)
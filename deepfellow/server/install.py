@@ -16,6 +16,7 @@ from typing import Any, cast
 
 import typer
 
+from deepfellow.common.bundle import use_bundle_images
 from deepfellow.common.config import read_env_file_to_dict, save_env_file
 from deepfellow.common.defaults import (
     DEFAULT_VECTOR_DATABASE,
@@ -43,12 +44,13 @@ from deepfellow.common.docker import (
     add_network_to_service,
     ensure_network,
     save_compose_file,
+    set_pull_policy,
 )
 from deepfellow.common.echo import echo
 from deepfellow.common.generate import generate_password
 from deepfellow.common.install import assert_docker, ensure_directory
-from deepfellow.common.registry import get_newest_image_tag
-from deepfellow.common.system import run
+from deepfellow.common.pull import pull_images
+from deepfellow.common.registry import get_install_image
 from deepfellow.common.validation import validate_url
 from deepfellow.server.utils.configure import configure_infra, configure_mongo, configure_otel, configure_vector_db
 from deepfellow.server.utils.options import directory_option, set_default_server_directory
@@ -144,7 +146,7 @@ def install(  # noqa: C901
     assert_docker()
 
     if not local_image and image == DF_SERVER_IMAGE:
-        image = get_newest_image_tag(DF_SERVER_IMAGE_HUB)
+        image = get_install_image(DF_SERVER_IMAGE_HUB)
 
     ensure_directory(
         directory, error_message="Unable to create DeepFellow Server directory.", force_install=force_install
@@ -300,8 +302,7 @@ def install(  # noqa: C901
     if depends_on:
         compose_server["server"]["depends_on"] = depends_on
 
-    if local_image:
-        compose_server["server"]["pull_policy"] = "never"
+    set_pull_policy(compose_server["server"], local_image)
 
     services.update(compose_server)
 
@@ -323,9 +324,13 @@ def install(  # noqa: C901
         expose_ports_to_host(services)
         echo.warning("Dev mode: internal service ports are exposed to the host. Do not use in production.")
 
+    use_bundle_images(services)
     save_compose_file(
         {"services": services, "volumes": volumes, "networks": {docker_network: {"external": True}}},
         directory / DOCKER_COMPOSE_CONFIG_FILENAME,
     )
-    run(["docker", "compose", "pull"], directory)
+    if not pull_images(directory):
+        echo.error("Unable to pull the docker images of DeepFellow Server.")
+        raise typer.Exit(1)
+
     echo.success("DeepFellow Server Installed.\nCall `deepfellow server start`.")
@@ -0,0 +1,21 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collect server inventory commands."""
+
+import typer
+
+from deepfellow.common.lazy import LazyCommand, lazy_group
+
+COMMANDS = (
+    LazyCommand("dump", "deepfellow.server.inventory.dump:app", "Save organizations, projects and API Keys."),
+    LazyCommand("diff", "deepfellow.server.inventory.diff:app", "Compare two inventory snapshots."),
+)
+
+app = typer.Typer(cls=lazy_group(COMMANDS))
@@ -0,0 +1,53 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""server inventory diff command."""
+
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from deepfellow.common.echo import echo
+from deepfellow.common.jsonl import read_jsonl
+from deepfellow.common.output import print_records
+from deepfellow.server.utils.inventory import diff_snapshots
+
+app = typer.Typer()
+
+CHANGE_SYMBOLS = {"added": "+", "removed": "-", "changed": "~"}
+
+
+def format_change(change: dict[str, Any]) -> str:
+    """Format the change as ``+ project org/project`` followed by the changed fields."""
+    lines = [f"{CHANGE_SYMBOLS[change['change']]} {change['type']} {'/'.join(change['key'])}"]
+    lines.extend(f"  {field}: {old} -> {new}" for field, (old, new) in change.get("fields", {}).items())
+    return "\n".join(lines)
+
+
+@app.command()
+def diff(
+    old: Path = typer.Argument(..., exists=True, dir_okay=False, help="Older snapshot"),
+    new: Path = typer.Argument(..., exists=True, dir_okay=False, help="Newer snapshot"),
+    ignore: list[str] = typer.Option(["last_used_at"], "--ignore", help="Field not compared, can be repeated"),
+) -> None:
+    """Compare two inventory snapshots.
+
+    Both snapshots are read once, side by side, so the comparison uses the same memory for any snapshot size.
+    """
+    try:
+        print_records(
+            diff_snapshots(read_jsonl(old), read_jsonl(new), ignore),
+            to_dict=dict,
+            to_text=format_change,
+            empty_message="No differences.",
+        )
+    except (KeyError, ValueError) as exc:
+        echo.error(f"Invalid snapshot. {exc}")
+        raise typer.Exit(1) from exc
@@ -0,0 +1,46 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""server inventory dump command."""
+
+import time
+from pathlib import Path
+
+import typer
+
+from deepfellow.common.echo import echo
+from deepfellow.common.jsonl import write_jsonl
+from deepfellow.common.rest import get_server_url
+from deepfellow.common.state import state
+from deepfellow.common.validation import validate_server
+from deepfellow.server.utils.inventory import crawl_inventory
+from deepfellow.server.utils.login import get_token
+
+app = typer.Typer()
+
+
+@app.command()
+def dump(
+    server: str | None = typer.Option(None, callback=validate_server, help="DeepFellow Server address"),
+    snapshot: Path = typer.Argument(..., dir_okay=False, help="JSONL file to save the snapshot to"),
+    concurrency: int = typer.Option(8, min=1, max=64, help="Maximum number of requests in flight"),
+) -> None:
+    """Save organizations, projects and API Keys.
+
+    Crawls all organizations with their API Keys, projects and project API Keys and writes
+    one JSON record per item, sorted, to the snapshot file (replaced atomically).
+    """
+    secrets_file = state.cli_secrets_file
+    server_url = get_server_url(server)
+    token = get_token(secrets_file, server_url)
+
+    started = time.monotonic()
+    records = (item.to_record() for item in crawl_inventory(server_url, token, concurrency))
+    count = write_jsonl(snapshot, records)
+    echo.success(f"Saved {count} items to {snapshot} in {time.monotonic() - started:.1f}s.")
@@ -12,8 +12,10 @@
 import httpx
 import typer
 
-from deepfellow.common.config import read_env_file, save_env_file
+from deepfellow.common.config import EnvFile
 from deepfellow.common.echo import echo
+from deepfellow.common.http import get_client
+from deepfellow.common.lock import file_lock, get_lock_path
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.server.utils.login import get_token
@@ -31,7 +33,7 @@ def logout() -> None:
     url = f"{server_url}/auth/logout"
     echo.debug(f"POST {url}")
     try:
-        response = httpx.post(
+        response = get_client().post(
             url,
             headers={"Authorization": f"Bearer {token}"},
             timeout=10.0,
@@ -41,9 +43,10 @@ def logout() -> None:
         echo.warning("Could not invalidate token on the server. Clearing locally.")
         echo.debug(exc)
 
-    secrets = read_env_file(secrets_file) if secrets_file.is_file() else {}
-    secrets.pop("DF_USER_TOKEN", None)
-    secrets.pop("DF_USER_REFRESH_TOKEN", None)
-
-    save_env_file(secrets_file, secrets, docker_note=False, quiet=True)
+    with file_lock(get_lock_path(secrets_file)):
+        secrets = EnvFile.read(secrets_file)
+        secrets.unset("DF_USER_TOKEN")
+        secrets.unset("DF_USER_REFRESH_TOKEN")
+        secrets.unset("DF_USER_TOKEN_EXPIRES_AT")
+        secrets.save(docker_note=False, quiet=True)
     echo.success("Logged out successfully.")
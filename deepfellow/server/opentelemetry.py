@@ -13,11 +13,10 @@ from pathlib import Path
 
 import typer
 
-from deepfellow.common.config import read_env_file_to_dict
 from deepfellow.common.defaults import DEFAULT_OTEL_URL
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_get, env_set
-from deepfellow.common.system import run
+from deepfellow.common.env import open_env_file
+from deepfellow.common.restart import get_compose_config, restart_changed_services
 from deepfellow.common.validation import validate_url
 from deepfellow.server.utils.options import directory_option
 from deepfellow.server.utils.validation import check_server_directory
@@ -37,30 +36,24 @@ def opentelemetry(
 ) -> None:
     """Connect to Open Telemetry."""
     check_server_directory(directory)
-    env_file = directory / ".env"
-    original_otel_url = env_get(env_file, "DF_OTEL_EXPORTER_OTLP_ENDPOINT")
+    env = open_env_file(directory / ".env")
+    original_otel_url = env.get("DF_OTEL_EXPORTER_OTLP_ENDPOINT")
 
     if original_otel_url:
         echo.info(f"Disconnecting from {original_otel_url} ...")
 
-    # Prepare the starting point for .env
-    env_file = directory / ".env"
-    original_env_content = read_env_file_to_dict(env_file)
-
     if not otel_url:
         otel_url = echo.prompt_until_valid(
             "Provide OTL url",
-            default=original_env_content.get("df_otel_exporter_orlp_endpoint", DEFAULT_OTEL_URL),
+            default=original_otel_url or DEFAULT_OTEL_URL,
             validation=validate_url,
         )
 
     if otel_url:
-        env_set(env_file, "DF_OTEL_EXPORTER_OTLP_ENDPOINT", otel_url, quiet=True)
-        env_set(env_file, "DF_OTEL_TRACING_ENABLED", "true")
-
-        echo.info("Restarting this instance DeepFellow Server ...")
-        run(["docker", "compose", "down"], cwd=directory, quiet=True)
-        run(["docker", "compose", "up", "-d", "--remove-orphans"], cwd=directory, quiet=True)
+        before = get_compose_config(directory)
+        env.update({"DF_OTEL_EXPORTER_OTLP_ENDPOINT": otel_url, "DF_OTEL_TRACING_ENABLED": "true"})
+        env.save()
+        restart_changed_services(directory, before)
 
         echo.success(f"DeepFellow Server is connected to Open Telemetry {otel_url}")
     else:
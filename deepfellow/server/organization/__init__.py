@@ -11,18 +11,15 @@
 
 import typer
 
-from .admin_api_key import app as admin_api_key_app
-from .create import app as create_app
-from .get import app as get_app
-from .list import app as list_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("create", "deepfellow.server.organization.create:app", "Create organization."),
+    LazyCommand("list", "deepfellow.server.organization.list:app", "Display list of organizations."),
+    LazyCommand("get", "deepfellow.server.organization.get:app", "Display organization info."),
+    LazyCommand("api-key", "deepfellow.server.organization.admin_api_key:app", "Manage Organization API Keys."),
+    # Temporarily disabling the delete organization.
+    # LazyCommand("delete", "deepfellow.server.organization.delete:app", "Delete organization after confirmation."),
+)
 
-
-app.add_typer(create_app)
-app.add_typer(list_app)
-app.add_typer(get_app)
-app.add_typer(admin_api_key_app, name="api-key", help="Manage Organization API Keys.")
-# Temporarily disabling the delete organization.
-# from .delete import app as delete_app
-# app.add_typer(delete_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
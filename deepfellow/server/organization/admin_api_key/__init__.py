@@ -11,11 +11,11 @@
 
 import typer
 
-from .create import app as create_app
-from .revoke import app as revoke_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("create", "deepfellow.server.organization.admin_api_key.create:app", "Create organization."),
+    LazyCommand("revoke", "deepfellow.server.organization.admin_api_key.revoke:app", "Revoke organization API Key."),
+)
 
-
-app.add_typer(create_app)
-app.add_typer(revoke_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
@@ -11,7 +11,7 @@
 
 import typer
 
-from deepfellow.common.echo import echo
+from deepfellow.common.output import print_record
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -34,4 +34,4 @@ def create(
 
     api_key = create_admin_api_key(server_url, token, organization_id, name)
 
-    echo.info(str(api_key))
+    print_record(api_key)
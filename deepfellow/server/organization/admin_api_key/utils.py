@@ -9,10 +9,11 @@
 
 """Utils for the organization api-key requests."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from deepfellow.common.rest import delete, get, post
+from deepfellow.common.rest import delete, get, paginate, post
 from deepfellow.server.utils.time import datetime_to_str
 
 
@@ -34,7 +35,7 @@ class ApiKey:
     redacted_value: str
     owner: Owner
     created_at: float
-    last_used_at: float
+    last_used_at: float | None
     value: str | None
 
     @classmethod
@@ -51,8 +52,8 @@ class ApiKey:
         return datetime_to_str(self.created_at)
 
     def last_used_at_to_str(self) -> str:
-        """Convert created_at to a localized date string."""
-        return datetime_to_str(self.last_used_at)
+        """Convert last_used_at to a localized date string, ``never`` if the key was not used."""
+        return datetime_to_str(self.last_used_at) if self.last_used_at is not None else "never"
 
     def as_dict(self) -> dict[str, str]:
         """Dictionary representation of ApiKey."""
@@ -106,3 +107,15 @@ def create_admin_api_key(server: str | None, token: str, organization_id: str, n
         headers={"OpenAI-Organization": organization_id},
     )
     return ApiKey.from_data(data)
+
+
+def list_admin_api_keys(server: str | None, token: str, organization_id: str, cache: bool = True) -> Iterator[ApiKey]:
+    """Yield organization API Keys page by page."""
+    for data in paginate(
+        f"{server}/v1/organization/admin_api_keys",
+        token,
+        item_name="Organization API Key",
+        headers={"OpenAI-Organization": organization_id},
+        cache=cache,
+    ):
+        yield ApiKey.from_data(data)
@@ -11,7 +11,7 @@
 
 import typer
 
-from deepfellow.common.echo import echo
+from deepfellow.common.output import print_record
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -36,4 +36,4 @@ def get(
 
     # Response
 
-    echo.info(str(organization))
+    print_record(organization)
@@ -9,9 +9,10 @@
 
 """Utils for the organization requests."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 
-from deepfellow.common.rest import get, post
+from deepfellow.common.rest import get, paginate, post
 from deepfellow.server.utils.time import datetime_to_str
 
 
@@ -53,10 +54,12 @@ def delete_organization(server: str | None, organization_id: str, _token: str) -
     # echo.debug(f"DELETE {url}")
 
 
-def list_organizations(server: str | None, token: str) -> list[Organization]:
-    """List organizations."""
-    data = get(f"{server}/admin/organization/", token, item_name="Organizations")
-    return [Organization(**org) for org in data["data"]]
+def list_organizations(
+    server: str | None, token: str, limit: int | None = None, cache: bool = True
+) -> Iterator[Organization]:
+    """Yield organizations page by page, at most ``limit`` of them."""
+    for data in paginate(f"{server}/admin/organization/", token, item_name="Organizations", limit=limit, cache=cache):
+        yield Organization(**data)
 
 
 def create_organization(server: str | None, token: str, name: str) -> Organization:
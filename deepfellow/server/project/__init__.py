@@ -11,17 +11,14 @@
 
 import typer
 
-from .api_key import app as api_key_app
-from .archive import app as archive_app
-from .create import app as create_app
-from .get import app as get_app
-from .list import app as list_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("get", "deepfellow.server.project.get:app", "Display Project info."),
+    LazyCommand("list", "deepfellow.server.project.list:app", "Display list of Projects."),
+    LazyCommand("create", "deepfellow.server.project.create:app", "Create organization."),
+    LazyCommand("archive", "deepfellow.server.project.archive:app", "Archive a Project."),
+    LazyCommand("api-key", "deepfellow.server.project.api_key:app", "Manage Project API Keys."),
+)
 
-
-app.add_typer(get_app)
-app.add_typer(list_app)
-app.add_typer(create_app)
-app.add_typer(archive_app)
-app.add_typer(api_key_app, name="api-key", help="Manage Project API Keys.")
+app = typer.Typer(cls=lazy_group(COMMANDS))
@@ -11,11 +11,16 @@
 
 import typer
 
-from .create import app as create_app
-from .revoke import app as revoke_app
+from deepfellow.common.lazy import LazyCommand, lazy_group
 
-app = typer.Typer()
+COMMANDS = (
+    LazyCommand("create", "deepfellow.server.project.api_key.create:app", "Create Poject API Key."),
+    LazyCommand(
+        "create-bulk",
+        "deepfellow.server.project.api_key.create_bulk:app",
+        "Create Project API Keys listed in the manifest.",
+    ),
+    LazyCommand("revoke", "deepfellow.server.project.api_key.revoke:app", "Revoke project API Key."),
+)
 
-
-app.add_typer(create_app)
-app.add_typer(revoke_app)
+app = typer.Typer(cls=lazy_group(COMMANDS))
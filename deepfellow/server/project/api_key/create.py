@@ -11,7 +11,7 @@
 
 import typer
 
-from deepfellow.common.echo import echo
+from deepfellow.common.output import print_record
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -35,4 +35,4 @@ def create(
 
     api_key = create_api_key(server_url, token, organization_id, project_id, name)
 
-    echo.info(str(api_key))
+    print_record(api_key)
@@ -0,0 +1,154 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""server project api-key create-bulk command."""
+
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import typer
+
+from deepfellow.common.echo import echo
+from deepfellow.common.jsonl import append_jsonl, read_jsonl, write_jsonl
+from deepfellow.common.rest import BulkRequest, BulkResult, bulk_request, get_server_url
+from deepfellow.common.state import state
+from deepfellow.common.validation import validate_server
+from deepfellow.server.utils.login import get_token
+
+app = typer.Typer()
+
+MANIFEST_FIELDS = ("organization_id", "project_id", "name")
+
+
+@dataclass(frozen=True)
+class ManifestRow:
+    """API Key to create."""
+
+    organization_id: str
+    project_id: str
+    name: str
+
+    @classmethod
+    def from_data(cls, data: dict[str, Any]) -> "ManifestRow":
+        """Instantiate from the manifest or result record, ``ValueError`` if a field is missing."""
+        values = {field: str(data.get(field) or "").strip() for field in MANIFEST_FIELDS}
+        if missing := [field for field, value in values.items() if not value]:
+            raise ValueError(f"missing {', '.join(missing)}")
+
+        return cls(**values)
+
+    def as_dict(self) -> dict[str, str]:
+        """Dictionary representation of the row."""
+        return {"organization_id": self.organization_id, "project_id": self.project_id, "name": self.name}
+
+
+def read_manifest(manifest: Path) -> list[ManifestRow]:
+    """Read the rows from the CSV (with a header) or JSONL manifest, duplicates are dropped."""
+    try:
+        if manifest.suffix.lower() in (".jsonl", ".ndjson"):
+            with manifest.open() as file:
+                records = [json.loads(line) for line in file if line.strip()]
+        else:
+            with manifest.open(newline="") as file:
+                records = list(csv.DictReader(file))
+    except (OSError, ValueError, csv.Error) as exc:
+        echo.error(f"Unable to read the manifest {manifest}. {exc}")
+        raise typer.Exit(1) from exc
+
+    rows = []
+    for number, record in enumerate(records, start=1):
+        try:
+            rows.append(ManifestRow.from_data(record if isinstance(record, dict) else {}))
+        except ValueError as exc:
+            echo.error(f"Invalid row {number} in the manifest {manifest}: {exc}.")
+            raise typer.Exit(1) from exc
+
+    return list(dict.fromkeys(rows))
+
+
+def read_results(results_file: Path) -> dict[ManifestRow, dict[str, Any]]:
+    """Return the last result of every row saved by the previous runs."""
+    if not results_file.is_file():
+        return {}
+
+    results = {}
+    for record in read_jsonl(results_file):
+        try:
+            results[ManifestRow.from_data(record)] = record
+        except ValueError:
+            continue
+
+    return results
+
+
+def to_result_record(row: ManifestRow, result: BulkResult) -> dict[str, Any]:
+    """Convert the result of the request to the results file record."""
+    if result.ok:
+        return row.as_dict() | {"status": "created", "api_key": result.data}
+
+    return row.as_dict() | {"status": "failed", "status_code": result.status_code, "error": result.error}
+
+
+@app.command("create-bulk")
+def create_bulk(
+    server: str | None = typer.Option(None, callback=validate_server, help="DeepFellow server address"),
+    manifest: Path = typer.Argument(
+        ..., exists=True, dir_okay=False, help="CSV or JSONL file with organization_id, project_id and name"
+    ),
+    results_file: Path | None = typer.Option(
+        None, "--results", help="JSONL file with the created API Keys, <manifest>.results.jsonl by default"
+    ),
+    concurrency: int = typer.Option(8, min=1, max=64, help="Maximum number of API Keys created at once"),
+) -> None:
+    """Create Project API Keys listed in the manifest.
+
+    Rows created by a previous run (found in the results file) are skipped, so an interrupted
+    or partially failed run can be simply repeated.
+    """
+    results_file = results_file or manifest.with_name(f"{manifest.stem}.results.jsonl")
+    rows = read_manifest(manifest)
+    results = read_results(results_file)
+    pending = [row for row in rows if results.get(row, {}).get("status") != "created"]
+    echo.info(f"{len(rows) - len(pending)} of {len(rows)} API Keys already created, creating {len(pending)}.")
+    if not pending:
+        return
+
+    secrets_file = state.cli_secrets_file
+    server_url = get_server_url(server)
+    token = get_token(secrets_file, server_url)
+
+    requests = {
+        row: BulkRequest(
+            "POST",
+            f"{server_url}/v1/organization/projects/{row.project_id}/api_keys",
+            data={"name": row.name},
+            label=f"{row.organization_id}/{row.project_id}/{row.name}",
+            headers={"OpenAI-Organization": row.organization_id},
+        )
+        for row in pending
+    }
+    rows_by_request = {id(request): row for row, request in requests.items()}
+
+    def save_result(result: BulkResult) -> None:
+        # Saved right away, so the keys created before an interruption are not created again
+        row = rows_by_request[id(result.request)]
+        results[row] = to_result_record(row, result)
+        append_jsonl(results_file, results[row])
+
+    report = bulk_request(requests.values(), token, concurrency=concurrency, on_result=save_result)
+
+    # Compact the appended progress to the last result of each row, in the manifest order
+    write_jsonl(results_file, (results[row] for row in rows if row in results))
+    report.print()
+    echo.info(f"Results saved to {results_file}.")
+    if report.failed:
+        raise typer.Exit(1)
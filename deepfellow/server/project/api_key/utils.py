@@ -9,10 +9,11 @@
 
 """Utils for the project api-key requests."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from deepfellow.common.rest import delete, get, post
+from deepfellow.common.rest import delete, get, paginate, post
 from deepfellow.server.utils.time import datetime_to_str
 
 
@@ -23,7 +24,7 @@ class ApiKey:
     name: str
     redacted_value: str
     created_at: float
-    last_used_at: float
+    last_used_at: float | None
     value: str | None
 
     @classmethod
@@ -39,8 +40,8 @@ class ApiKey:
         return datetime_to_str(self.created_at)
 
     def last_used_at_to_str(self) -> str:
-        """Convert created_at to a localized date string."""
-        return datetime_to_str(self.last_used_at)
+        """Convert last_used_at to a localized date string, ``never`` if the key was not used."""
+        return datetime_to_str(self.last_used_at) if self.last_used_at is not None else "never"
 
     def as_dict(self) -> dict[str, str]:
         """Dictionary representation of ApiKey."""
@@ -92,3 +93,17 @@ def create_api_key(server: str | None, token: str, organization_id: str, project
         headers={"OpenAI-Organization": organization_id},
     )
     return ApiKey(**data)
+
+
+def list_api_keys(
+    server: str | None, token: str, organization_id: str, project_id: str, cache: bool = True
+) -> Iterator[ApiKey]:
+    """Yield project API keys page by page."""
+    for data in paginate(
+        f"{server}/v1/organization/projects/{project_id}/api_keys",
+        token,
+        item_name="Project API Key",
+        headers={"OpenAI-Organization": organization_id},
+        cache=cache,
+    ):
+        yield ApiKey.from_data(data)
@@ -11,7 +11,7 @@
 
 import typer
 
-from deepfellow.common.echo import echo
+from deepfellow.common.output import print_record
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -34,4 +34,4 @@ def get(
 
     project = get_project(server_url, token, organization_id, project_id)
 
-    echo.info(str(project))
+    print_record(project)
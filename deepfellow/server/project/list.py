@@ -11,7 +11,7 @@
 
 import typer
 
-from deepfellow.common.echo import echo
+from deepfellow.common.output import print_records
 from deepfellow.common.rest import get_server_url
 from deepfellow.common.state import state
 from deepfellow.common.validation import validate_server
@@ -24,6 +24,7 @@ app = typer.Typer()
 @app.command()
 def list(
     server: str | None = typer.Option(None, callback=validate_server, help="DeepFellow Server address"),
+    limit: int | None = typer.Option(None, min=1, help="Display at most that many items"),
     organization_id: str = typer.Argument(...),
 ) -> None:
     """Display list of Projects."""
@@ -32,5 +33,5 @@ def list(
     server_url = get_server_url(server)
     token = get_token(secrets_file, server_url)
 
-    projects = list_projects(server_url, token, organization_id)
-    echo.info("\n\n".join([str(org) for org in projects]))
+    # Items are printed as the pages arrive
+    print_records(list_projects(server_url, token, organization_id, limit=limit))
@@ -9,10 +9,11 @@
 
 """Utils for the project commands."""
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any, Literal
 
-from deepfellow.common.rest import get, post
+from deepfellow.common.rest import get, paginate, post
 from deepfellow.server.utils.time import datetime_to_str
 
 
@@ -58,15 +59,19 @@ def get_project(server: str | None, token: str, organization_id: str, project_id
     return Project(**data)
 
 
-def list_projects(server: str | None, token: str, organization_id: str) -> list[Project]:
-    """List projects."""
-    data = get(
+def list_projects(
+    server: str | None, token: str, organization_id: str, limit: int | None = None, cache: bool = True
+) -> Iterator[Project]:
+    """Yield projects page by page, at most ``limit`` of them."""
+    for data in paginate(
         f"{server}/v1/organization/projects",
         token,
         item_name="Project",
         headers={"OpenAI-Organization": organization_id},
-    )
-    return [Project(**org) for org in data["data"]]
+        limit=limit,
+        cache=cache,
+    ):
+        yield Project(**data)
 
 
 def create_project(server: str | None, token: str, organization_id: str, data: dict[str, Any]) -> Project:
@@ -17,7 +17,8 @@ import typer
 from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME
 from deepfellow.common.docker import is_service_running, load_compose_file, save_compose_file
 from deepfellow.common.echo import echo
-from deepfellow.common.env import env_get, env_set
+from deepfellow.common.env import open_env_file
+from deepfellow.common.restart import get_compose_config, restart_changed_services
 from deepfellow.common.system import run
 from deepfellow.common.validation import validate_server
 from deepfellow.server.utils.options import directory_option
@@ -47,6 +48,9 @@ def ssl_on(
         echo.info("Call `deepfellow server start`")
         raise typer.Exit(1)
 
+    # Effective configuration to compare with after the changes
+    before = get_compose_config(directory)
+
     # Add ssl-volume to docker compose if not there
     docker_config = load_compose_file(directory / DOCKER_COMPOSE_CONFIG_FILENAME)
     env_file = directory / ".env"
@@ -102,14 +106,15 @@ def ssl_on(
         run(["docker", "compose", "cp", "server:/ssl/.", ssl_dir.as_posix()], cwd=directory, quiet=True)
 
     # Update .env with the port
-    port_config = env_get(env_file, "server_port")
+    env = open_env_file(env_file)
+    port_config = env.get("DF_SERVER_PORT")
 
     if port is not None and port != port_config:
         echo.info(f"Storing DF_server_PORT as {port}")
-        env_set(env_file, "server_port", str(port), quiet=True)
+        env.set("DF_SERVER_PORT", str(port))
 
     # Update the server URL
-    host = host_config = env_get(env_file, "server_url")
+    host = host_config = env.get("DF_SERVER_URL")
     if server is None:
         if host and not host.startswith("https"):
             host = host.replace("http:", "https:")
@@ -118,7 +123,9 @@ def ssl_on(
 
     if server is not None and server != host_config:
         echo.info(f"Storing DF_server_URL as {server}")
-        env_set(env_file, "server_url", server, quiet=True)
+        env.set("DF_SERVER_URL", server)
+
+    env.save(quiet=True)
 
     # Update docker compose with the command
     docker_server["entrypoint"] = []
@@ -129,9 +136,6 @@ def ssl_on(
     )
     save_compose_file(docker_config, compose_file=directory / DOCKER_COMPOSE_CONFIG_FILENAME, quiet=True)
 
-    echo.info("Restarting docker.")
-    # Restart docker with rebuild
-    run(["docker", "compose", "down"], cwd=directory, quiet=True)
-    run(["docker", "compose", "up", "--build", "-d", "--remove-orphans"], cwd=directory, quiet=True)
+    restart_changed_services(directory, before)
 
     echo.success(f"DeepFellow Server is running with SSL on {server}.")
@@ -14,12 +14,18 @@ from pathlib import Path
 import typer
 
 from deepfellow.common.config import read_env_file_to_dict
-from deepfellow.common.defaults import DF_SERVER_IMAGE, DF_SERVER_IMAGE_HUB, DOCKER_COMPOSE_CONFIG_FILENAME
-from deepfellow.common.docker import load_compose_file, save_compose_file
+from deepfellow.common.defaults import (
+    DF_SERVER_IMAGE,
+    DF_SERVER_IMAGE_HUB,
+    DF_SERVER_PORT,
+    DOCKER_COMPOSE_CONFIG_FILENAME,
+)
+from deepfellow.common.docker import load_compose_file, save_compose_file, set_pull_policy
 from deepfellow.common.echo import echo
 from deepfellow.common.env import env_set
-from deepfellow.common.registry import get_newest_image_tag
+from deepfellow.common.registry import get_newest_image_tag, is_image_up_to_date
 from deepfellow.common.system import run
+from deepfellow.common.zero_downtime import zero_downtime_update
 from deepfellow.server.utils.docker import start_server, stop_server
 from deepfellow.server.utils.options import directory_option
 from deepfellow.server.utils.validation import check_server_directory
@@ -45,6 +51,11 @@ def update(
     image: str = typer.Option(DF_SERVER_IMAGE, envvar="DF_SERVER_IMAGE", help="DeepFellow Server docker image."),
     local_image: bool = typer.Option(False, help="Use locally build DeepFellow Server docker image."),
     tag: str | None = typer.Option(None, help="Deepfellow Server docker image tag (e.g. 0.15.0)"),
+    zero_downtime: bool = typer.Option(
+        False,
+        "--zero-downtime",
+        help="Start the new container next to the running one and switch to it once it is healthy.",
+    ),
 ) -> None:
     """Update DeepFellow Server."""
     check_server_directory(directory)
@@ -61,17 +72,7 @@ def update(
     compose = load_compose_file(compose_file=compose_file)
     service = compose["services"]["server"]
 
-    update_compose = False
-    if local_image:
-        if "pull_policy" not in service:
-            service["pull_policy"] = "never"
-            update_compose = True
-    else:
-        if "pull_policy" in service:
-            del service["pull_policy"]
-            update_compose = True
-
-    if update_compose:
+    if set_pull_policy(service, local_image):
         save_compose_file(
             compose,
             directory / DOCKER_COMPOSE_CONFIG_FILENAME,
@@ -79,11 +80,28 @@ def update(
 
     image = _resolve_image(image, tag)
 
-    if values["df_server_image"] != image:
+    image_changed = values["df_server_image"] != image
+    if image_changed:
         env_set(env_file, "SERVER_IMAGE", image, quiet=False, docker_note=False)
 
-    run(["docker", "compose", "pull", "server"], cwd=directory)
+    # The registry digest of the tag is compared with the local image, so an unchanged image is not pulled
+    if not local_image and is_image_up_to_date(image):
+        if not image_changed:
+            echo.success(f"DeepFellow Server is up to date ({image}).")
+            return
+
+        echo.info(f"{image} is already pulled.")
+    else:
+        run(["docker", "compose", "pull", "server"], cwd=directory)
+
     echo.success("DeepFellow Server updated.")
-    if echo.confirm("Do you want to restart the server?", default=True):
+    if zero_downtime:
+        zero_downtime_update(
+            directory,
+            "server",
+            int(str(values.get("df_server_port", DF_SERVER_PORT))),
+            tls=str(values.get("df_server_url", "")).startswith("https:"),
+        )
+    elif echo.confirm("Do you want to restart the server?", default=True):
         stop_server(directory)
         start_server(directory)
@@ -0,0 +1,193 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Crawl of all organizations, projects and API Keys of the server and the snapshots of it.
+
+The crawl lists the organizations first and then fans out: the projects and organization API Keys
+of every organization and the API Keys of every project are fetched concurrently.
+
+Items are yielded ordered by their key (``record_key``), so two snapshots can be compared
+with a single pass over both files.
+"""
+
+import heapq
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from typing import Any, Literal, TypeVar
+
+from deepfellow.server.organization.admin_api_key.utils import ApiKey as AdminApiKey
+from deepfellow.server.organization.admin_api_key.utils import list_admin_api_keys
+from deepfellow.server.organization.utils import Organization, list_organizations
+from deepfellow.server.project.api_key.utils import ApiKey as ProjectApiKey
+from deepfellow.server.project.api_key.utils import list_api_keys
+from deepfellow.server.project.utils import Project, list_projects
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+InventoryType = Literal["organization", "organization_api_key", "project", "project_api_key"]
+
+
+@dataclass
+class InventoryItem:
+    """Organization, project or API Key found by the crawl."""
+
+    type: InventoryType
+    organization_id: str
+    project_id: str | None
+    item: Organization | Project | AdminApiKey | ProjectApiKey
+
+    def to_record(self) -> dict[str, Any]:
+        """Return the snapshot record, without the secrets."""
+        data = asdict(self.item)
+        data.pop("value", None)
+        data.pop("object", None)
+        if owner := data.pop("owner", None):
+            data["owner_id"] = owner["id"]
+
+        record: dict[str, Any] = {"type": self.type, "organization_id": self.organization_id}
+        if self.project_id is not None:
+            record["project_id"] = self.project_id
+
+        return record | {key: value for key, value in data.items() if key not in record}
+
+
+def record_key(record: dict[str, Any]) -> tuple[str, ...]:
+    """Return the key identifying the snapshot record, snapshots are sorted by it.
+
+    Organization API Keys sort before the projects of the organization ("api_key" < "project")
+    and the project API Keys right after their project.
+    """
+    organization_id = str(record["organization_id"])
+    record_type = record["type"]
+    if record_type == "organization":
+        return (organization_id,)
+    if record_type == "organization_api_key":
+        return (organization_id, "api_key", str(record["id"]))
+    if record_type == "project":
+        return (organization_id, "project", str(record["id"]))
+    if record_type == "project_api_key":
+        return (organization_id, "project", str(record["project_id"]), "api_key", str(record["id"]))
+
+    raise ValueError(f"Unknown record type {record_type!r}")
+
+
+def _sorted_by_id(items: Iterable[Any]) -> list[Any]:
+    """Return the items sorted by their ``id``."""
+    return sorted(items, key=lambda item: item.id)
+
+
+def _map_ahead(
+    executor: ThreadPoolExecutor, function: Callable[[T], R], items: Iterable[T], ahead: int
+) -> Iterator[tuple[T, R]]:
+    """Yield ``(item, function(item))`` in the order of the items, with at most ``ahead`` results computed in advance.
+
+    A result is yielded as soon as it and the results before it are done, and it is not referenced afterwards,
+    so the memory is bounded by ``ahead`` results, not by all of them.
+    """
+    pending: deque[tuple[T, Future[R]]] = deque()
+    for item in items:
+        pending.append((item, executor.submit(function, item)))
+        if len(pending) > ahead:
+            first, future = pending.popleft()
+            yield first, future.result()
+
+    while pending:
+        first, future = pending.popleft()
+        yield first, future.result()
+
+
+def crawl_inventory(
+    server: str, token: str, concurrency: int = 8, include_archived: bool = True
+) -> Iterator[InventoryItem]:
+    """Yield all organizations with their API Keys, projects and project API Keys.
+
+    Organizations and projects are crawled at most ``concurrency`` ahead of the yielded item, so the items
+    are yielded while the crawl goes on. The pages skip the HTTP cache - a crawl reads every page once.
+
+    Args:
+        server: DeepFellow Server URL
+        token: Admin token
+        concurrency: Maximum number of requests in flight
+        include_archived: Include the archived projects and their keys
+    """
+
+    def list_organization(organization: Organization) -> tuple[list[AdminApiKey], list[Project]]:
+        admin_api_keys = _sorted_by_id(list_admin_api_keys(server, token, organization.id, cache=False))
+        projects = _sorted_by_id(list_projects(server, token, organization.id, cache=False))
+        return admin_api_keys, [project for project in projects if include_archived or project.status == "active"]
+
+    def list_project_api_keys(organization_id: str, project: Project) -> list[ProjectApiKey]:
+        return _sorted_by_id(list_api_keys(server, token, organization_id, project.id, cache=False))
+
+    organizations = _sorted_by_id(list_organizations(server, token, cache=False))
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for organization, (admin_api_keys, projects) in _map_ahead(
+            executor, list_organization, organizations, concurrency
+        ):
+            yield InventoryItem("organization", organization.id, None, organization)
+            for admin_api_key in admin_api_keys:
+                yield InventoryItem("organization_api_key", organization.id, None, admin_api_key)
+
+            list_project = partial(list_project_api_keys, organization.id)
+            for project, api_keys in _map_ahead(executor, list_project, projects, concurrency):
+                yield InventoryItem("project", organization.id, project.id, project)
+                for project_api_key in api_keys:
+                    yield InventoryItem("project_api_key", organization.id, project.id, project_api_key)
+
+
+def _keyed(records: Iterable[dict[str, Any]], side: int) -> Iterator[tuple[tuple[str, ...], int, dict[str, Any]]]:
+    """Yield ``(key, side, record)`` tuples, checking the snapshot is sorted."""
+    previous = None
+    for record in records:
+        key = record_key(record)
+        if previous is not None and key <= previous:
+            raise ValueError(f"Snapshot is not sorted at {'/'.join(key)}")
+
+        previous = key
+        yield key, side, record
+
+
+def diff_snapshots(
+    old: Iterable[dict[str, Any]], new: Iterable[dict[str, Any]], ignore: Iterable[str] = ()
+) -> Iterator[dict[str, Any]]:
+    """Yield the differences of two sorted snapshots, reading each of them once.
+
+    Args:
+        old: Records of the older snapshot
+        new: Records of the newer snapshot
+        ignore: Fields not compared, e.g. ``last_used_at``
+
+    Yields:
+        ``{"change": "added" | "removed" | "changed", "type": ..., "key": [...], ...}`` - the added and removed
+        entries have the ``record``, the changed ones the ``fields`` dict of ``[old, new]`` values.
+
+    Raises:
+        ValueError: When a snapshot is not sorted or has an unknown record
+    """
+    ignored = set(ignore)
+    merged = heapq.merge(_keyed(old, 0), _keyed(new, 1))
+    for key, group in groupby(merged, key=itemgetter(0)):
+        records = {side: record for _, side, record in group}
+        old_record, new_record = records.get(0), records.get(1)
+        if new_record is None:
+            yield {"change": "removed", "type": records[0]["type"], "key": list(key), "record": old_record}
+        elif old_record is None:
+            yield {"change": "added", "type": new_record["type"], "key": list(key), "record": new_record}
+        elif fields := {
+            field: [old_record.get(field), new_record.get(field)]
+            for field in sorted(old_record.keys() | new_record.keys())
+            if field not in ignored and old_record.get(field) != new_record.get(field)
+        }:
+            yield {"change": "changed", "type": new_record["type"], "key": list(key), "fields": fields}
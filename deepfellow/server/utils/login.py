@@ -9,20 +9,62 @@
 
 """Login util."""
 
+import time
 from pathlib import Path
+from typing import Any
 
 import httpx
 import typer
 
-from deepfellow.common.config import read_env_file, save_env_file
+from deepfellow.common.config import EnvFile, read_env_file
 from deepfellow.common.echo import echo
+from deepfellow.common.http import get_client
+from deepfellow.common.lock import file_lock, get_lock_path
+from deepfellow.common.rest import token_refresher
+from deepfellow.common.token import get_token_claims
 from deepfellow.common.validation import validate_email, validate_password
 
+# Refresh the token if it expires in less than this number of seconds
+TOKEN_EXPIRY_MARGIN = 60
+
+
+def get_token_expiry(token: str) -> float | None:
+    """Return the ``exp`` claim of the JWT token.
+
+    The signature is not verified - the server does it on every request, the CLI only needs to know
+    whether the token is worth sending.
+
+    Returns:
+        Expiration as Unix timestamp or None if the token is not a JWT or has no ``exp`` claim
+    """
+    expires_at = get_token_claims(token).get("exp")
+    return float(expires_at) if isinstance(expires_at, int | float) else None
+
+
+def get_saved_token_expiry(secrets: dict[str, str]) -> float | None:
+    """Return the access token expiration saved in the secrets by the login or refresh."""
+    try:
+        return float(secrets["DF_USER_TOKEN_EXPIRES_AT"])
+    except (KeyError, ValueError):
+        return None
+
+
+def save_token_expiry(secrets: EnvFile, data: dict[str, Any]) -> None:
+    """Store the ``access_expires_at`` from the login or refresh response in the secrets."""
+    if (expires_at := data.get("access_expires_at")) is not None:
+        secrets.set("DF_USER_TOKEN_EXPIRES_AT", str(expires_at))
+    else:
+        secrets.unset("DF_USER_TOKEN_EXPIRES_AT")
+
 
 def get_token(secrets_file: Path, server: str) -> str:
     """Load token from the secrets file.
 
     Fallback to refresh_token if access token is expired, then to get_token_from_login.
+    The expiration is checked locally - from the JWT ``exp`` claim or the ``access_expires_at`` saved
+    at login - so no request is needed while the token is valid. ``GET /auth/me`` is used only
+    if the expiration is unknown. A 401 for the returned token refreshes it once and repeats the request
+    (see ``token_refresher``).
 
     Args:
         secrets_file (Path): DeepFellow Server secrets
@@ -34,23 +76,35 @@ def get_token(secrets_file: Path, server: str) -> str:
     Raises:
         typer.Exit for HTTPError other than 401
     """
+    token = load_token(secrets_file, server)
+    # The server may still reject the token, e.g. revoked or with a skewed clock - refresh it once then
+    token_refresher.register(token, lambda: try_refresh_token(secrets_file, server, stale_token=token))
+    return token
+
+
+def load_token(secrets_file: Path, server: str) -> str:
+    """Return the token valid according to its expiration, see ``get_token``."""
     secrets = read_env_file(secrets_file) if secrets_file.is_file() else {}
     token = secrets.get("DF_USER_TOKEN")
     if token is None:
         echo.debug("Token not found in secrets file or it does not exist. Falling back to login.")
         return get_token_from_login(secrets_file, server)
 
+    expires_at = get_token_expiry(token) or get_saved_token_expiry(secrets)
+    if expires_at is not None:
+        return get_unexpired_token(secrets_file, server, token, expires_at)
+
     # Authenticate to check if user is able to log in.
     url = f"{server}/auth/me"
     echo.debug(f"GET {url}")
     try:
-        response = httpx.get(
+        response = get_client().get(
             url,
             headers={"Authorization": f"Bearer {token}"},
         )
         if response.status_code == 401:
             echo.debug("Retrieved token is not valid. Attempting token refresh.")
-            new_token = try_refresh_token(secrets_file, server)
+            new_token = try_refresh_token(secrets_file, server, stale_token=token)
             if new_token is not None:
                 echo.debug("Token refreshed successfully.")
                 return new_token
@@ -67,17 +121,67 @@ def get_token(secrets_file: Path, server: str) -> str:
     return token
 
 
-def try_refresh_token(secrets_file: Path, server: str) -> str | None:
+def get_unexpired_token(secrets_file: Path, server: str, token: str, expires_at: float) -> str:
+    """Return the JWT token if it is valid long enough, otherwise refresh it or log in again."""
+    remaining = expires_at - time.time()
+    if remaining > TOKEN_EXPIRY_MARGIN:
+        echo.debug(f"Token valid for {remaining:.0f}s.")
+        return token
+
+    echo.debug("Token is about to expire. Attempting token refresh.")
+    new_token = try_refresh_token(secrets_file, server, stale_token=token)
+    if new_token is not None:
+        echo.debug("Token refreshed successfully.")
+        return new_token
+
+    if remaining > 0:
+        echo.debug("Token refresh failed. Using the current token until it expires.")
+        return token
+
+    echo.error("Token refresh failed. Falling back to login.")
+    return get_token_from_login(secrets_file, server)
+
+
+def try_refresh_token(secrets_file: Path, server: str, stale_token: str | None = None) -> str | None:
     """Attempt to obtain a new access token using the stored refresh token against /auth/refresh.
 
+    The refresh holds the lock of the secrets file, so concurrent CLI processes refresh the token once:
+    the first one refreshes, the others wait for the lock and reuse the token it saved. Otherwise they
+    would use the already rotated refresh token and overwrite each other's secrets.
+
     Args:
         secrets_file (Path): DeepFellow Server secrets
         server (str): DeepFellow Server URL
+        stale_token (str | None): Token that needs the refresh, a different valid token in the secrets
+            file means another process has already refreshed it
 
     Returns:
         New access token string on success, None if refresh is not possible or fails
     """
-    secrets = read_env_file(secrets_file) if secrets_file.is_file() else {}
+    with file_lock(get_lock_path(secrets_file)):
+        secrets = EnvFile.read(secrets_file)
+        if (token := get_refreshed_token(secrets.as_dict(), stale_token)) is not None:
+            echo.debug("Token already refreshed by another process.")
+            return token
+
+        return request_token_refresh(server, secrets)
+
+
+def get_refreshed_token(secrets: dict[str, str], stale_token: str | None) -> str | None:
+    """Return the token from the secrets if it replaced the stale token and is valid long enough."""
+    token = secrets.get("DF_USER_TOKEN")
+    if stale_token is None or token is None or token == stale_token:
+        return None
+
+    expires_at = get_token_expiry(token) or get_saved_token_expiry(secrets)
+    if expires_at is not None and expires_at - time.time() <= TOKEN_EXPIRY_MARGIN:
+        return None
+
+    return token
+
+
+def request_token_refresh(server: str, secrets: EnvFile) -> str | None:
+    """Call /auth/refresh and save the new tokens, the caller holds the secrets file lock."""
     refresh_token = secrets.get("DF_USER_REFRESH_TOKEN")
     if refresh_token is None:
         return None
@@ -85,7 +189,7 @@ def try_refresh_token(secrets_file: Path, server: str) -> str | None:
     url = f"{server}/auth/refresh"
     echo.debug(f"POST {url}")
     try:
-        response = httpx.post(url, headers={"Authorization": f"Bearer {refresh_token}"}, timeout=10.0)
+        response = get_client().post(url, headers={"Authorization": f"Bearer {refresh_token}"}, timeout=10.0)
         if response.status_code == 401:
             return None
 
@@ -96,9 +200,9 @@ def try_refresh_token(secrets_file: Path, server: str) -> str | None:
 
     data = response.json()
     new_token = data["access_token"]
-    secrets["DF_USER_TOKEN"] = new_token
-    secrets["DF_USER_REFRESH_TOKEN"] = data["refresh_token"]
-    save_env_file(secrets_file, secrets, docker_note=False, quiet=True)
+    secrets.update({"DF_USER_TOKEN": new_token, "DF_USER_REFRESH_TOKEN": data["refresh_token"]})
+    save_token_expiry(secrets, data)
+    secrets.save(docker_note=False, quiet=True)
     return new_token
 
 
@@ -125,7 +229,7 @@ def get_token_from_login(secrets_file: Path, server: str, email: str | None = No
     url = f"{server}/auth/login"
     echo.debug(f"POST {url}")
     try:
-        response = httpx.post(url, json={"email": email, "password": password}, timeout=10.0)
+        response = get_client().post(url, json={"email": email, "password": password}, timeout=10.0)
         if response.status_code == 401:
             echo.error("Not authorized. Invalid credentials.")
             raise typer.Exit(1)
@@ -143,11 +247,13 @@ def get_token_from_login(secrets_file: Path, server: str, email: str | None = No
     data = response.json()
     token = data["access_token"]
 
-    secrets = read_env_file(secrets_file) if secrets_file.is_file() else {}
-    secrets["DF_USER_TOKEN"] = token
-    if refresh_token := data.get("refresh_token"):
-        secrets["DF_USER_REFRESH_TOKEN"] = refresh_token
+    with file_lock(get_lock_path(secrets_file)):
+        secrets = EnvFile.read(secrets_file)
+        secrets.set("DF_USER_TOKEN", token)
+        if refresh_token := data.get("refresh_token"):
+            secrets.set("DF_USER_REFRESH_TOKEN", refresh_token)
+        save_token_expiry(secrets, data)
 
-    save_env_file(secrets_file, secrets, docker_note=False)
+        secrets.save(docker_note=False)
 
     return token
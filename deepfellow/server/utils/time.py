@@ -9,11 +9,27 @@
 
 """Time related utils."""
 
+import re
 from datetime import datetime
 
 from tzlocal.unix import get_localzone
 
+DURATION_UNITS = {"s": 1, "m": 60, "h": 60 * 60, "d": 24 * 60 * 60, "w": 7 * 24 * 60 * 60}
+
 
 def datetime_to_str(value: float) -> str:
     """Convert float representing datetime to a localized date string."""
     return str(datetime.fromtimestamp(value, tz=get_localzone()))
+
+
+def parse_duration(value: str) -> float:
+    """Convert the duration like ``90d``, ``12h`` or ``2w`` to seconds.
+
+    Raises:
+        ValueError: When the duration is not a number followed by one of s, m, h, d, w
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhdw])\s*", value.lower())
+    if match is None:
+        raise ValueError(f"Invalid duration {value!r}, expected a number followed by s, m, h, d or w, e.g. 90d")
+
+    return float(match[1]) * DURATION_UNITS[match[2]]
@@ -0,0 +1,79 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+import typer
+
+from deepfellow.bundle.export import export
+from deepfellow.common.bundle import BUNDLE_COMPRESSION_LEVEL
+from deepfellow.common.defaults import DF_INFRA_IMAGE, DF_INFRA_IMAGE_HUB, DF_SERVER_IMAGE, DF_SERVER_IMAGE_HUB
+from deepfellow.common.docker import DockerError
+
+
+@pytest.fixture
+def mocks() -> Any:
+    manager = Mock()
+    with (
+        mock.patch("deepfellow.bundle.export.assert_docker"),
+        mock.patch("deepfellow.bundle.export.assert_zstd"),
+        mock.patch("deepfellow.bundle.export.get_newest_image_tag", side_effect=lambda hub: f"{hub}:1.0.0"),
+        mock.patch("deepfellow.bundle.export.get_template_images", return_value=["mongo:8@sha256:abc", "qdrant:1"]),
+        mock.patch("deepfellow.bundle.export.get_save_reference", side_effect=lambda image: image.split("@")[0]),
+        mock.patch("deepfellow.bundle.export.pull_missing_images", manager.pull_missing_images),
+        mock.patch("deepfellow.bundle.export.export_bundle", manager.export_bundle),
+        mock.patch("deepfellow.bundle.export.echo", manager.echo),
+    ):
+        manager.pull_missing_images.return_value = True
+        manager.export_bundle.return_value = 2_000_000
+        yield manager
+
+
+def test_export_bundles_newest_images(mocks: Mock, tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.tar.zst"
+
+    export(archive, DF_INFRA_IMAGE, DF_SERVER_IMAGE, ["org/service:2", "qdrant:1"], BUNDLE_COMPRESSION_LEVEL)
+
+    images = [f"{DF_INFRA_IMAGE_HUB}:1.0.0", f"{DF_SERVER_IMAGE_HUB}:1.0.0", "mongo:8@sha256:abc", "qdrant:1"]
+    assert mocks.pull_missing_images.call_args == mock.call([*images, "org/service:2"])
+    assert mocks.export_bundle.call_args == mock.call(
+        [f"{DF_INFRA_IMAGE_HUB}:1.0.0", f"{DF_SERVER_IMAGE_HUB}:1.0.0", "mongo:8", "qdrant:1", "org/service:2"],
+        archive,
+        BUNDLE_COMPRESSION_LEVEL,
+    )
+    assert mocks.echo.success.call_args.args[0].startswith(f"Exported 5 docker images to {archive}, 2MB in ")
+
+
+def test_export_keeps_configured_images(mocks: Mock, tmp_path: Path) -> None:
+    export(tmp_path / "bundle.tar.zst", "infra:dev", "server:dev", [], 19)
+
+    assert mocks.pull_missing_images.call_args.args[0][:2] == ["infra:dev", "server:dev"]
+    assert mocks.export_bundle.call_args.args[2] == 19
+
+
+def test_export_exits_when_pull_failed(mocks: Mock, tmp_path: Path) -> None:
+    mocks.pull_missing_images.return_value = False
+
+    with pytest.raises(typer.Exit):
+        export(tmp_path / "bundle.tar.zst", DF_INFRA_IMAGE, DF_SERVER_IMAGE, [], BUNDLE_COMPRESSION_LEVEL)
+
+    mocks.export_bundle.assert_not_called()
+
+
+def test_export_exits_when_save_failed(mocks: Mock, tmp_path: Path) -> None:
+    mocks.export_bundle.side_effect = DockerError("no space left on device\n")
+
+    with pytest.raises(typer.Exit):
+        export(tmp_path / "bundle.tar.zst", DF_INFRA_IMAGE, DF_SERVER_IMAGE, [], BUNDLE_COMPRESSION_LEVEL)
+
+    assert mocks.echo.error.call_args == mock.call("Unable to export the bundle. no space left on device")
@@ -0,0 +1,68 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from pathlib import Path
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+import typer
+
+from deepfellow.bundle.load import load
+from deepfellow.common.bundle import load_bundle_images
+from deepfellow.common.docker import DockerError
+from deepfellow.common.state import state
+
+
+@mock.patch("deepfellow.bundle.load.import_bundle", return_value=["mongo:8.2.7", "qdrant/qdrant:v1.15"])
+@mock.patch("deepfellow.bundle.load.assert_zstd")
+@mock.patch("deepfellow.bundle.load.assert_docker")
+@mock.patch("deepfellow.bundle.load.echo")
+def test_load_imports_bundle(
+    mock_echo: Mock, mock_assert_docker: Mock, mock_assert_zstd: Mock, mock_import: Mock, tmp_path: Path
+) -> None:
+    load(tmp_path / "bundle.tar.zst")
+
+    assert mock_import.call_args == mock.call(tmp_path / "bundle.tar.zst")
+    assert mock_echo.success.call_args == mock.call("Imported 2 docker image(s).\nmongo:8.2.7\nqdrant/qdrant:v1.15")
+    assert load_bundle_images() == ["mongo:8.2.7", "qdrant/qdrant:v1.15"]
+
+
+@mock.patch("deepfellow.bundle.load.import_bundle", side_effect=DockerError("zstd: bundle.tar.zst: unsupported format"))
+@mock.patch("deepfellow.bundle.load.assert_zstd")
+@mock.patch("deepfellow.bundle.load.assert_docker")
+@mock.patch("deepfellow.bundle.load.echo")
+def test_load_exits_on_invalid_bundle(
+    mock_echo: Mock, mock_assert_docker: Mock, mock_assert_zstd: Mock, mock_import: Mock, tmp_path: Path
+) -> None:
+    with pytest.raises(typer.Exit):
+        load(tmp_path / "bundle.tar.zst")
+
+    assert mock_echo.error.call_args == mock.call(
+        "Unable to import the bundle. zstd: bundle.tar.zst: unsupported format"
+    )
+    assert load_bundle_images() == []
+
+
+@mock.patch("deepfellow.bundle.load.import_bundle", return_value=["mongo:8.2.7"])
+@mock.patch("deepfellow.bundle.load.assert_zstd")
+@mock.patch("deepfellow.bundle.load.assert_docker")
+@mock.patch("deepfellow.bundle.load.echo")
+def test_load_exits_when_images_cannot_be_recorded(
+    mock_echo: Mock, mock_assert_docker: Mock, mock_assert_zstd: Mock, mock_import: Mock, tmp_path: Path
+) -> None:
+    state.cli_bundle_file.mkdir(parents=True)
+
+    with pytest.raises(typer.Exit):
+        load(tmp_path / "bundle.tar.zst")
+
+    assert mock_echo.error.call_args[0][0].startswith(
+        f"Unable to record the imported images in {state.cli_bundle_file}."
+    )
+    assert mock_echo.success.call_count == 0
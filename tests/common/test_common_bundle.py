@@ -0,0 +1,189 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the air-gapped image bundle."""
+
+from pathlib import Path
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+import typer
+
+from deepfellow.common.bundle import (
+    assert_zstd,
+    export_bundle,
+    get_bundle_reference,
+    get_save_reference,
+    get_template_images,
+    import_bundle,
+    load_bundle_images,
+    save_bundle_images,
+    use_bundle_images,
+)
+from deepfellow.common.defaults import DOCKER_COMPOSE_PROXY_IMAGE
+from deepfellow.common.docker import DockerError
+from deepfellow.common.pull import pull_missing_images
+from deepfellow.common.state import state
+
+MONGO = f"mongo:8.2.7@sha256:{'a' * 64}"
+
+
+def test_get_template_images_skips_configured_images() -> None:
+    images = get_template_images()
+
+    assert "milvusdb/milvus:v2.6.2" in images
+    assert DOCKER_COMPOSE_PROXY_IMAGE in images
+    assert not [image for image in images if "$" in image]
+    assert len(images) == len(set(images))
+
+
+@mock.patch("deepfellow.common.bundle.is_command_available", return_value=False)
+@mock.patch("deepfellow.common.bundle.echo")
+def test_assert_zstd_exits_without_zstd(mock_echo: Mock, mock_available: Mock) -> None:
+    with pytest.raises(typer.Exit):
+        assert_zstd()
+
+    assert mock_echo.error.call_args == mock.call("Missing zstd. Install zstd.")
+
+
+@mock.patch("deepfellow.common.bundle.run")
+def test_get_save_reference_keeps_tagged_image(mock_run: Mock) -> None:
+    assert get_save_reference("localhost:5000/org/image:1.0.0") == "localhost:5000/org/image:1.0.0"
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.bundle.run")
+def test_get_save_reference_tags_pinned_image(mock_run: Mock) -> None:
+    assert get_save_reference("mongo:8.2.7@sha256:abc") == "mongo:8.2.7"
+    assert mock_run.call_args.args[0] == ["docker", "image", "tag", "mongo:8.2.7@sha256:abc", "mongo:8.2.7"]
+
+
+@mock.patch("deepfellow.common.bundle.pipe")
+def test_export_bundle_renames_complete_archive(mock_pipe: Mock, tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.tar.zst"
+    mock_pipe.side_effect = lambda *args, **kwargs: (tmp_path / "bundle.tar.zst.part").write_bytes(b"zstd")
+
+    assert export_bundle(["mongo:8", "qdrant:1"], archive, level=5) == 4
+
+    assert archive.read_bytes() == b"zstd"
+    assert mock_pipe.call_args == mock.call(
+        ["docker", "image", "save", "mongo:8", "qdrant:1"],
+        ["zstd", "--quiet", "--force", "-5", "-T0", "-o", (tmp_path / "bundle.tar.zst.part").as_posix()],
+        raises=DockerError,
+    )
+
+
+@mock.patch("deepfellow.common.bundle.pipe")
+def test_export_bundle_removes_partial_archive_on_error(mock_pipe: Mock, tmp_path: Path) -> None:
+    archive = tmp_path / "bundle.tar.zst"
+
+    def fail(*args: object, **kwargs: object) -> None:
+        (tmp_path / "bundle.tar.zst.part").write_bytes(b"trunc")
+        raise DockerError("No such image: mongo:8")
+
+    mock_pipe.side_effect = fail
+
+    with pytest.raises(DockerError):
+        export_bundle(["mongo:8"], archive)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@mock.patch("deepfellow.common.bundle.pipe")
+def test_import_bundle_returns_loaded_images(mock_pipe: Mock, tmp_path: Path) -> None:
+    mock_pipe.return_value = (
+        "Loaded image: mongo:8.2.7\nLoaded image: qdrant/qdrant:v1.15\nLoaded image ID: sha256:abc\n"
+    )
+
+    assert import_bundle(tmp_path / "bundle.tar.zst") == ["mongo:8.2.7", "qdrant/qdrant:v1.15", "sha256:abc"]
+    assert mock_pipe.call_args.args[1] == ["docker", "image", "load"]
+
+
+def test_save_bundle_images_adds_to_previous_import() -> None:
+    assert load_bundle_images() == []
+
+    save_bundle_images(["mongo:8.2.7", "qdrant/qdrant:v1.15"])
+    save_bundle_images(["qdrant/qdrant:v1.15", "nginx:1.27-alpine"])
+
+    assert load_bundle_images() == ["mongo:8.2.7", "qdrant/qdrant:v1.15", "nginx:1.27-alpine"]
+
+
+def test_load_bundle_images_ignores_invalid_file() -> None:
+    state.cli_bundle_file.write_text('{"images": "mongo"}')
+
+    assert load_bundle_images() == []
+
+
+@pytest.mark.parametrize(
+    ("image", "expected"),
+    [
+        ("qdrant/qdrant:v1.15", "qdrant/qdrant:v1.15"),
+        (MONGO, "mongo:8.2.7"),
+        ("mongo:8.2.8@sha256:abc", None),
+        ("milvusdb/milvus:v2.6.2", None),
+    ],
+)
+def test_get_bundle_reference(image: str, expected: str | None) -> None:
+    assert get_bundle_reference(image, ["mongo:8.2.7", "qdrant/qdrant:v1.15"]) == expected
+
+
+@mock.patch("deepfellow.common.bundle.is_image_present", return_value=True)
+def test_use_bundle_images_without_import_keeps_digest(mock_present: Mock) -> None:
+    services = {"mongo": {"image": MONGO}}
+
+    use_bundle_images(services)
+
+    assert services == {"mongo": {"image": MONGO}}
+
+
+@mock.patch("deepfellow.common.bundle.is_image_present", return_value=False)
+def test_use_bundle_images_keeps_digest_of_removed_image(mock_present: Mock) -> None:
+    save_bundle_images(["mongo:8.2.7"])
+    services = {"mongo": {"image": MONGO}}
+
+    use_bundle_images(services)
+
+    assert services == {"mongo": {"image": MONGO}}
+
+
+def test_export_import_install_of_digest_pinned_image(tmp_path: Path) -> None:
+    """The digest-pinned image of the compose file is installed from the bundle without a pull."""
+    local_images = {MONGO}
+
+    def fake_pipe(source: list[str], sink: list[str], raises: type[Exception]) -> str:
+        if source[:3] == ["docker", "image", "save"]:
+            assert set(source[3:]) <= local_images
+            Path(sink[-1]).write_text("\n".join(source[3:]))
+            return ""
+
+        return "".join(f"Loaded image: {image}\n" for image in Path(source[-1]).read_text().splitlines())
+
+    with (
+        mock.patch("deepfellow.common.bundle.pipe", side_effect=fake_pipe),
+        mock.patch("deepfellow.common.bundle.run", side_effect=lambda command, **kwargs: local_images.add(command[-1])),
+        mock.patch("deepfellow.common.bundle.is_image_present", side_effect=lambda image: image in local_images),
+        mock.patch("deepfellow.common.pull.is_image_present", side_effect=lambda image: image in local_images),
+        mock.patch("deepfellow.common.pull.run") as mock_pull_run,
+    ):
+        archive = tmp_path / "bundle.tar.zst"
+        export_bundle([get_save_reference(MONGO)], archive)
+
+        # The air-gapped host
+        local_images.clear()
+        loaded = import_bundle(archive)
+        local_images.update(loaded)
+        save_bundle_images(loaded)
+
+        services = {"mongo": {"image": MONGO}}
+        use_bundle_images(services)
+
+        assert services == {"mongo": {"image": "mongo:8.2.7"}}
+        assert pull_missing_images([services["mongo"]["image"]]) is True
+        mock_pull_run.assert_not_called()
@@ -0,0 +1,175 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cache module."""
+
+import base64
+import json
+import os
+from pathlib import Path
+from unittest import mock
+
+from deepfellow.common.cache import (
+    HEALTH_CACHE_FILENAME,
+    REGISTRY_CACHE_FILENAME,
+    CachedResponse,
+    forget_health,
+    get_http_cache_path,
+    is_health_cached,
+    load_registry_tags,
+    load_response,
+    read_json,
+    save_health,
+    save_registry_tags,
+    save_response,
+    write_json,
+)
+from deepfellow.common.state import state
+
+SERVER = "http://server.example"
+
+
+def test_health_is_not_cached_by_default():
+    assert not is_health_cached(SERVER)
+
+
+def test_save_health_caches_the_server():
+    save_health(SERVER)
+
+    assert is_health_cached(SERVER)
+    assert not is_health_cached("http://other.example")
+
+
+def test_save_health_drops_corrupted_entries():
+    path = state.cli_cache_directory / HEALTH_CACHE_FILENAME
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"http://x": "oops", "http://y": None, "http://z": [1]}))
+
+    save_health(SERVER)
+
+    assert is_health_cached(SERVER)
+    assert set(json.loads(path.read_text())) == {SERVER}
+
+
+def test_health_cache_expires_after_ttl():
+    with mock.patch("deepfellow.common.cache.time.time", return_value=1000.0):
+        save_health(SERVER)
+
+    with mock.patch("deepfellow.common.cache.time.time", return_value=1029.0):
+        assert is_health_cached(SERVER)
+
+    with mock.patch("deepfellow.common.cache.time.time", return_value=1031.0):
+        assert not is_health_cached(SERVER)
+
+
+def test_health_cache_ttl_is_configurable():
+    state.cli_config = {"df_health_cache_ttl": "0"}
+    save_health(SERVER)
+
+    assert not is_health_cached(SERVER)
+
+
+def test_forget_health_drops_the_server_of_the_url():
+    save_health(SERVER)
+    save_health("http://other.example")
+
+    forget_health(f"{SERVER}/projects")
+
+    assert not is_health_cached(SERVER)
+    assert is_health_cached("http://other.example")
+
+
+def test_corrupted_cache_file_is_ignored():
+    path = state.cli_cache_directory / HEALTH_CACHE_FILENAME
+    path.parent.mkdir(parents=True)
+    path.write_text("{not json")
+
+    assert read_json(path) == {}
+    assert not is_health_cached(SERVER)
+
+    save_health(SERVER)
+    assert is_health_cached(SERVER)
+
+
+def test_save_response_without_validators_is_skipped():
+    save_response(SERVER, "token", "{}", etag=None, last_modified=None)
+
+    assert load_response(SERVER, "token") is None
+
+
+def test_load_response_is_keyed_by_url_and_token():
+    save_response(SERVER, "token", '{"data": []}', etag='"v1"', last_modified=None)
+
+    cached = load_response(SERVER, "token")
+    assert cached == CachedResponse(SERVER, '{"data": []}', '"v1"', None)
+    assert cached.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert load_response(SERVER, "other-token") is None
+    assert load_response(f"{SERVER}/other", "token") is None
+
+
+def test_load_response_survives_token_refresh():
+    token, refreshed, other_user = (
+        f"header.{base64.urlsafe_b64encode(json.dumps(claims).encode()).decode().rstrip('=')}.signature"
+        for claims in ({"sub": "user", "exp": 1}, {"sub": "user", "exp": 2}, {"sub": "other", "exp": 2})
+    )
+    save_response(SERVER, token, '{"data": []}', etag='"v1"', last_modified=None)
+
+    assert load_response(SERVER, refreshed) == CachedResponse(SERVER, '{"data": []}', '"v1"', None)
+    assert load_response(SERVER, other_user) is None
+
+
+def test_load_response_is_keyed_by_organization_header():
+    save_response(
+        SERVER, "token", '{"data": ["a"]}', etag='"a"', last_modified=None, headers={"OpenAI-Organization": "a"}
+    )
+    save_response(
+        SERVER, "token", '{"data": ["b"]}', etag='"b"', last_modified=None, headers={"OpenAI-Organization": "b"}
+    )
+
+    assert load_response(SERVER, "token", {"openai-organization": "a"}).content == '{"data": ["a"]}'
+    assert load_response(SERVER, "token", {"OpenAI-Organization": "b"}).content == '{"data": ["b"]}'
+    assert load_response(SERVER, "token") is None
+    assert load_response(SERVER, "token", {"Accept": "application/json"}) is None
+
+
+def test_evict_responses_removes_least_recently_used():
+    state.cli_config = {"df_http_cache_size": str(250 / 1024 / 1024)}
+    for index, url in enumerate(("http://a", "http://b")):
+        save_response(url, "token", "x" * 50, etag='"v1"', last_modified=None)
+        os.utime(get_http_cache_path(url, "token"), (index, index))
+
+    # Using "http://a" makes "http://b" the least recently used entry
+    load_response("http://a", "token")
+    save_response("http://c", "token", "x" * 50, etag='"v1"', last_modified=None)
+
+    assert load_response("http://a", "token") is not None
+    assert load_response("http://b", "token") is None
+    assert load_response("http://c", "token") is not None
+
+
+def test_save_registry_tags_drops_corrupted_entries():
+    path = state.cli_cache_directory / REGISTRY_CACHE_FILENAME
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps({"hub/a": {"fetched_at": "oops", "tags": []}, "hub/b": "oops"}))
+
+    save_registry_tags("hub/c", ["1.0.0"])
+
+    assert load_registry_tags("hub/c") == ["1.0.0"]
+    assert set(json.loads(path.read_text())) == {"hub/c"}
+
+
+def test_write_json_leaves_no_temporary_file_on_error(tmp_path: Path) -> None:
+    path = tmp_path / "health.json"
+    path.write_text('{"url": 1.0}')
+
+    with mock.patch("deepfellow.common.config.os.fsync", side_effect=OSError("disk full")):
+        write_json(path, {"url": 2.0})
+
+    assert read_json(path) == {"url": 1.0}
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,137 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cgroup module."""
+
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from deepfellow.common.cgroup import (
+    CgroupError,
+    ContainerProcess,
+    cgroup_stats,
+    get_cgroup_path,
+    get_host_memory,
+    is_cgroup_v2,
+    parse_io_stat,
+    parse_net_dev,
+    read_sample,
+)
+
+NET_DEV = """Inter-|   Receive                                          |  Transmit
+ face |bytes packets errs drop fifo frame compressed multicast|bytes packets errs drop fifo colls carrier compressed
+    lo:  9999       1    0    0    0     0          0         0  9999       1    0    0    0     0       0          0
+  eth0:  1500      10    0    0    0     0          0         0   500       5    0    0    0     0       0          0
+"""
+
+
+@pytest.fixture
+def fake_host(tmp_path: Path):
+    cgroup_root = tmp_path / "cgroup"
+    proc_root = tmp_path / "proc"
+    container_cgroup = cgroup_root / "system.slice" / "docker-abc.scope"
+    container_cgroup.mkdir(parents=True)
+    (cgroup_root / "cgroup.controllers").write_text("cpu io memory pids\n")
+    (container_cgroup / "cpu.stat").write_text("usage_usec 1000\nuser_usec 800\nsystem_usec 200\n")
+    (container_cgroup / "memory.current").write_text(f"{110 * 1024 * 1024}\n")
+    (container_cgroup / "memory.max").write_text("max\n")
+    (container_cgroup / "memory.stat").write_text(f"anon 1000\ninactive_file {10 * 1024 * 1024}\n")
+    (container_cgroup / "io.stat").write_text("8:0 rbytes=2000000 wbytes=1000 rios=1 wios=1 dbytes=0 dios=0\n")
+    (container_cgroup / "pids.current").write_text("7\n")
+    (proc_root / "42" / "net").mkdir(parents=True)
+    (proc_root / "42" / "cgroup").write_text("0::/system.slice/docker-abc.scope\n")
+    (proc_root / "42" / "net" / "dev").write_text(NET_DEV)
+    (proc_root / "meminfo").write_text("MemTotal:        1048576 kB\nMemFree:          524288 kB\n")
+
+    with (
+        mock.patch("deepfellow.common.cgroup.CGROUP_ROOT", cgroup_root),
+        mock.patch("deepfellow.common.cgroup.PROC_ROOT", proc_root),
+    ):
+        yield container_cgroup
+
+
+def test_is_cgroup_v2(fake_host: Path):
+    assert is_cgroup_v2()
+
+
+CONTAINER = ContainerProcess("abc", 42)
+
+
+def test_get_cgroup_path(fake_host: Path):
+    assert get_cgroup_path(CONTAINER) == fake_host
+
+
+def test_get_cgroup_path_missing_process(fake_host: Path):
+    with pytest.raises(CgroupError):
+        get_cgroup_path(ContainerProcess("abc", 7))
+
+
+def test_get_cgroup_path_of_remote_daemon_container(fake_host: Path):
+    # The PID belongs to a local process, not to the container of a remote daemon
+    with pytest.raises(CgroupError, match="not local"):
+        get_cgroup_path(ContainerProcess("def", 42))
+
+
+def test_get_host_memory_unreadable(fake_host: Path, tmp_path: Path):
+    (tmp_path / "proc" / "meminfo").unlink()
+
+    with pytest.raises(CgroupError):
+        get_host_memory()
+
+
+def test_parse_io_stat():
+    content = "8:0 rbytes=100 wbytes=10 rios=1 wios=1\n8:16 rbytes=50 wbytes=5 rios=1 wios=1\n"
+
+    assert parse_io_stat(content) == (150, 15)
+
+
+def test_parse_net_dev():
+    assert parse_net_dev(NET_DEV) == (1500, 500)
+
+
+def test_read_sample(fake_host: Path):
+    sample = read_sample(CONTAINER)
+
+    assert sample.cpu_usage_usec == 1000
+    assert sample.memory_usage == 100 * 1024 * 1024
+    assert sample.memory_limit == 1024 * 1024 * 1024
+    assert (sample.block_read, sample.block_write) == (2_000_000, 1000)
+    assert (sample.net_rx, sample.net_tx) == (1500, 500)
+    assert sample.pids == 7
+
+
+def test_read_sample_missing_files(fake_host: Path):
+    (fake_host / "cpu.stat").unlink()
+
+    with pytest.raises(CgroupError):
+        read_sample(CONTAINER)
+
+
+@mock.patch("deepfellow.common.cgroup.time")
+def test_cgroup_stats(mock_time: mock.Mock, fake_host: Path):
+    mock_time.monotonic.side_effect = [10.0, 10.1]
+
+    def sleep(interval: float) -> None:
+        (fake_host / "cpu.stat").write_text("usage_usec 51000\n")
+
+    mock_time.sleep.side_effect = sleep
+
+    assert cgroup_stats({"infra-infra-1": CONTAINER}) == {
+        "infra-infra-1": {
+            "Name": "infra-infra-1",
+            "CPUPerc": "50.00%",
+            "MemUsage": "100MiB / 1GiB",
+            "MemPerc": "9.77%",
+            "NetIO": "1.5kB / 500B",
+            "BlockIO": "2MB / 1kB",
+            "PIDs": "7",
+        }
+    }
@@ -7,6 +7,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import stat
 from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
@@ -15,11 +16,13 @@ from unittest import mock
 import pytest
 
 from deepfellow.common.config import (
+    EnvFile,
     configure_uuid_key,
     dict_to_env,
     env_to_dict,
     read_env_file,
     save_env_file,
+    write_file_atomic,
 )
 
 
@@ -635,211 +638,156 @@ KEY5='mixed "quotes" inside'
     assert result == expected
 
 
+HEADER = "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
+
+
 @pytest.mark.parametrize(
     ("values", "expected_content"),
     [
-        ({"KEY": "value"}, "# Docker Compose Environment Variables\n# Edit these values as needed\n\nKEY=value\n"),
-        (
-            {"KEY1": "value1", "KEY2": "value2"},
-            "# Docker Compose Environment Variables\n# Edit these values as needed\n\nKEY1=value1\nKEY2=value2\n",
-        ),
-        (
-            {"INT_VAL": 42, "STR_VAL": "text"},
-            "# Docker Compose Environment Variables\n# Edit these values as needed\n\nINT_VAL=42\nSTR_VAL=text\n",
-        ),
-        ({}, "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"),
+        ({"KEY": "value"}, f"{HEADER}KEY=value\n"),
+        ({"KEY1": "value1", "KEY2": "value2"}, f"{HEADER}KEY1=value1\nKEY2=value2\n"),
+        ({"INT_VAL": 42, "STR_VAL": "text"}, f"{HEADER}INT_VAL=42\nSTR_VAL=text\n"),
+        ({}, HEADER),
     ],
 )
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
 def test_save_env_file_new_file(
-    mock_read_env_file: mock.Mock, mock_echo: mock.Mock, values: Mapping[str, str | int], expected_content: str
+    mock_echo: mock.Mock, values: Mapping[str, str | int], expected_content: str, tmp_path: Path
 ) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = False
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
+    env_file = tmp_path / ".env"
 
-    save_env_file(mock_env_file, values)
+    save_env_file(env_file, values)
 
-    assert mock_env_file.exists.call_count == 1
-    assert mock_read_env_file.call_count == 0
-    assert mock_env_file.write_text.call_count == 1
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
+    assert env_file.read_text() == expected_content
     assert mock_echo.info.call_count == 1
-    assert mock_echo.info.call_args == mock.call("Generated /fake/path/.env.")
+    assert mock_echo.info.call_args == mock.call(f"Generated {env_file.as_posix()}.")
 
 
 @pytest.mark.parametrize(
-    ("existing_vars", "new_values", "expected_content"),
+    ("existing_content", "new_values", "expected_content"),
     [
+        ("OLD_KEY=old_value\n", {"NEW_KEY": "new_value"}, "OLD_KEY=old_value\nNEW_KEY=new_value\n"),
+        ("KEY=old_value\n", {"KEY": "new_value"}, "KEY=new_value\n"),
         (
-            {"OLD_KEY": "old_value"},
-            {"NEW_KEY": "new_value"},
-            "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
-            "OLD_KEY=old_value\nNEW_KEY=new_value\n",
-        ),
-        (
-            {"KEY": "old_value"},
-            {"KEY": "new_value"},
-            "# Docker Compose Environment Variables\n# Edit these values as needed\n\nKEY=new_value\n",
-        ),
-        (
-            {"KEY1": "value1", "KEY2": "value2"},
+            "KEY1=value1\nKEY2=value2\n",
             {"KEY2": "updated", "KEY3": "new"},
-            (
-                "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
-                "KEY1=value1\nKEY2=updated\nKEY3=new\n"
-            ),
+            "KEY1=value1\nKEY2=updated\nKEY3=new\n",
         ),
+        ("", {"KEY": "value"}, "KEY=value\n"),
         (
-            {"EXISTING": "value"},
-            {},
-            "# Docker Compose Environment Variables\n# Edit these values as needed\n\nEXISTING=value\n",
+            "B_KEY=b_value\nA_KEY=a_value\n",
+            {"D_KEY": "d_value", "C_KEY": "c_value"},
+            "B_KEY=b_value\nA_KEY=a_value\nD_KEY=d_value\nC_KEY=c_value\n",
         ),
     ],
 )
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
 def test_save_env_file_existing_file_merge(
-    mock_read_env_file: mock.Mock,
     mock_echo: mock.Mock,
-    existing_vars: dict[str, str],
+    existing_content: str,
     new_values: Mapping[str, str | int],
     expected_content: str,
+    tmp_path: Path,
 ) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = True
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    mock_read_env_file.return_value = existing_vars
-
-    save_env_file(mock_env_file, new_values)
-
-    assert mock_env_file.exists.call_count == 1
-    assert mock_read_env_file.call_count == 1
-    assert mock_read_env_file.call_args == mock.call(mock_env_file)
-    assert mock_env_file.write_text.call_count == 1
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
+    env_file = tmp_path / ".env"
+    env_file.write_text(existing_content)
+
+    save_env_file(env_file, new_values)
+
+    assert env_file.read_text() == expected_content
     assert mock_echo.info.call_count == 1
-    assert mock_echo.info.call_args == mock.call("Updated /fake/path/.env.")
+    assert mock_echo.info.call_args == mock.call(f"Updated {env_file.as_posix()}.")
 
 
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_new_values_take_precedence(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = True
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    mock_read_env_file.return_value = {"SAME_KEY": "old_value", "OTHER_KEY": "keep_this"}
-    new_values = {"SAME_KEY": "new_value", "ANOTHER_KEY": "add_this"}
-
-    save_env_file(mock_env_file, new_values)
-
-    expected_content = (
-        "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
-        "SAME_KEY=new_value\nOTHER_KEY=keep_this\nANOTHER_KEY=add_this\n"
+def test_save_env_file_keeps_comments_and_quoting(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text(f'{HEADER}# Server\nDF_SERVER_PORT=8000\n\n# Mesh\nDF_NAME="quoted value"\nMALFORMED\n')
+
+    save_env_file(env_file, {"DF_SERVER_PORT": 8080, "DF_NAME": "quoted value", "DF_NEW": "new"})
+
+    assert env_file.read_text() == (
+        f'{HEADER}# Server\nDF_SERVER_PORT=8080\n\n# Mesh\nDF_NAME="quoted value"\nMALFORMED\nDF_NEW=new\n'
     )
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
 
 
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_empty_existing_file(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = True
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    mock_read_env_file.return_value = {}
-    new_values = {"KEY": "value"}
+def test_save_env_file_without_changes_does_not_write(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("KEY=value\n")
+    mtime = env_file.stat().st_mtime_ns
 
-    save_env_file(mock_env_file, new_values)
+    save_env_file(env_file, {"KEY": "value"})
 
-    expected_content = "# Docker Compose Environment Variables\n# Edit these values as needed\n\nKEY=value\n"
-    assert mock_read_env_file.call_count == 1
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
-    assert mock_echo.info.call_args == mock.call("Updated /fake/path/.env.")
+    assert env_file.stat().st_mtime_ns == mtime
+    assert mock_echo.info.call_count == 0
 
 
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_mixed_value_types(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = False
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    values: dict[str, str | int] = {"STRING_VAL": "text", "INT_VAL": 42, "ZERO_VAL": 0, "NEGATIVE_VAL": -123}
-
-    save_env_file(mock_env_file, values)
-
-    expected_content = (
-        "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
-        "STRING_VAL=text\nINT_VAL=42\nZERO_VAL=0\nNEGATIVE_VAL=-123\n"
-    )
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
+def test_save_env_file_no_docker_note(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    env_file = tmp_path / "config" / "config"
 
+    save_env_file(env_file, {"KEY": "value"}, docker_note=False, quiet=True)
 
-@mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_preserves_order(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = True
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    mock_read_env_file.return_value = {"B_KEY": "b_value", "A_KEY": "a_value"}
-    new_values = {"D_KEY": "d_value", "C_KEY": "c_value"}
-
-    save_env_file(mock_env_file, new_values)
-
-    expected_content = (
-        "# Docker Compose Environment Variables\n# Edit these values as needed\n\n"
-        "B_KEY=b_value\nA_KEY=a_value\nD_KEY=d_value\nC_KEY=c_value\n"
-    )
-    assert mock_env_file.write_text.call_args == mock.call(expected_content)
+    assert env_file.read_text() == "KEY=value\n"
+    assert mock_echo.info.call_count == 0
+    assert mock_echo.debug.call_args == mock.call(f"Generated {env_file.as_posix()}.")
 
 
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_path_methods_called_correctly(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = True
-    mock_env_file.as_posix.return_value = "/test/path/.env"
-    mock_read_env_file.return_value = {}
-    values = {"KEY": "value"}
+def test_env_file_applies_changes_with_single_write(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("# comment\nA=1\nB=2\nA=3\nC=4\n")
 
-    save_env_file(mock_env_file, values)
+    env = EnvFile.read(env_file)
+    env.set("A", "5")
+    env.unset("B")
+    env.update({"D": "6", "C": 4})
 
-    assert mock_env_file.exists.call_count == 1
-    assert mock_env_file.as_posix.call_count == 1
-    assert mock_env_file.write_text.call_count == 1
+    assert env.changed
+    assert env.as_dict() == {"A": "5", "C": "4", "D": "6"}
+    with mock.patch("deepfellow.common.config.write_file_atomic", wraps=write_file_atomic) as mock_write:
+        assert env.save() is True
 
+    assert mock_write.call_count == 1
+    assert env_file.read_text() == "# comment\nA=5\nC=4\nD=6\n"
+    assert not env.changed
+    assert env.save() is False
 
-@mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_echo_messages(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.as_posix.return_value = "/test/path/.env"
-    values = {"KEY": "value"}
 
-    mock_env_file.exists.return_value = False
-    save_env_file(mock_env_file, values)
-    assert mock_echo.info.call_args == mock.call("Generated /test/path/.env.")
+def test_env_file_read_missing_file(tmp_path: Path) -> None:
+    env = EnvFile.read(tmp_path / ".env")
 
-    mock_echo.reset_mock()
-    mock_env_file.exists.return_value = True
-    mock_read_env_file.return_value = {}
-    save_env_file(mock_env_file, values)
-    assert mock_echo.info.call_args == mock.call("Updated /test/path/.env.")
+    assert env.exists is False
+    assert env.as_dict() == {}
+    assert env.get("KEY", "default") == "default"
 
 
 @mock.patch("deepfellow.common.config.echo")
-@mock.patch("deepfellow.common.config.read_env_file")
-def test_save_env_file_header_always_included(mock_read_env_file: mock.Mock, mock_echo: mock.Mock) -> None:
-    mock_env_file = mock.Mock(spec=Path)
-    mock_env_file.exists.return_value = False
-    mock_env_file.as_posix.return_value = "/fake/path/.env"
-    values = {"KEY": "value"}
-
-    save_env_file(mock_env_file, values)
-
-    written_content = mock_env_file.write_text.call_args[0][0]
-    assert written_content.startswith("# Docker Compose Environment Variables\n# Edit these values as needed\n\n")
-    assert "KEY=value\n" in written_content
+def test_write_file_atomic_keeps_permissions(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text("DF_USER_TOKEN=old\n")
+    secrets_file.chmod(0o600)
+
+    write_file_atomic(secrets_file, "DF_USER_TOKEN=new\n")
+
+    assert secrets_file.read_text() == "DF_USER_TOKEN=new\n"
+    assert stat.S_IMODE(secrets_file.stat().st_mode) == 0o600
+    assert list(tmp_path.iterdir()) == [secrets_file]
+
+
+def test_write_file_atomic_removes_temporary_file_on_error(tmp_path: Path) -> None:
+    env_file = tmp_path / ".env"
+    env_file.write_text("KEY=value\n")
+
+    with (
+        mock.patch("deepfellow.common.config.os.fsync", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        write_file_atomic(env_file, "KEY=other\n")
+
+    assert env_file.read_text() == "KEY=value\n"
+    assert list(tmp_path.iterdir()) == [env_file]
 
 
 @pytest.mark.parametrize(
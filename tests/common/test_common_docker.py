@@ -12,17 +12,29 @@ from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+import typer
 import yaml
 
+from deepfellow.common.cgroup import CgroupError, ContainerProcess
 from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME
 from deepfellow.common.docker import (
     DockerError,
+    docker_ps,
+    docker_stats,
+    get_container_processes,
+    get_image_repo_digests,
     is_docker_installed,
+    is_image_present,
+    is_service_running,
+    list_image_tags,
+    list_networks,
     load_compose_file,
-    parse_docker_compose_ps,
-    parse_docker_compose_usage,
     save_compose_file,
+    set_pull_policy,
 )
+from deepfellow.common.docker_api import DockerApiError, DockerApiNotFoundError
+
+PROCESS = ContainerProcess("abc", 42)
 
 
 @pytest.fixture
@@ -60,6 +72,165 @@ def test_is_docker_installed_error(mock_run: Mock, error: Exception) -> None:
     assert not is_docker_installed()  # Should also be False, not True
 
 
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.shutil.which", return_value="/usr/bin/docker")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_is_docker_installed_uses_api(mock_get_docker_api: Mock, mock_which: Mock, mock_run: Mock) -> None:
+    assert is_docker_installed()
+
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_list_networks_uses_api(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.list_networks.return_value = ["bridge", "deepfellow-infra-net"]
+
+    assert list_networks() == ["bridge", "deepfellow-infra-net"]
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run", return_value="bridge\ndeepfellow-infra-net\n")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_list_networks_falls_back_to_cli(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.list_networks.side_effect = DockerApiError("refused")
+
+    assert list_networks() == ["bridge", "deepfellow-infra-net"]
+    mock_run.assert_called_once()
+
+
+@pytest.mark.parametrize(("containers", "expected"), [([{"Id": "abc"}], True), ([], False)])
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_is_service_running_uses_api(
+    mock_get_docker_api: Mock, mock_run: Mock, containers: list, expected: bool, tmp_path: Path
+) -> None:
+    mock_get_docker_api.return_value.list_containers.return_value = containers
+
+    assert is_service_running("infra", tmp_path / "infra") is expected
+    mock_get_docker_api.return_value.list_containers.assert_called_once_with(
+        {"com.docker.compose.project": "infra", "com.docker.compose.service": "infra"}, status="running"
+    )
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_docker_ps_uses_api(mock_get_docker_api: Mock, mock_run: Mock, tmp_path: Path) -> None:
+    mock_get_docker_api.return_value.list_containers.return_value = [
+        {"Id": "abc", "Names": ["/infra-infra-1"], "Image": "infra:dev", "State": "running", "Status": "Up 2 hours"}
+    ]
+
+    result = docker_ps(tmp_path / "infra")
+
+    assert [container["Name"] for container in result] == ["infra-infra-1"]
+    assert result[0]["Status"] == "Up 2 hours"
+    mock_get_docker_api.return_value.list_containers.assert_called_once_with(
+        {"com.docker.compose.project": "infra"}, all_containers=True
+    )
+    mock_run.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        '[{"Name": "infra-infra-1", "Service": "infra"}, {"Name": "infra-mongo-1", "Service": "mongo"}]',
+        '{"Name": "infra-infra-1", "Service": "infra"}\n{"Name": "infra-mongo-1", "Service": "mongo"}\n',
+    ],
+)
+@mock.patch("deepfellow.common.docker.run")
+def test_docker_ps_cli(mock_run: Mock, output: str, tmp_path: Path) -> None:
+    mock_run.return_value = output
+
+    result = docker_ps(tmp_path)
+
+    assert [container["Service"] for container in result] == ["infra", "mongo"]
+    mock_run.assert_called_once_with(
+        ["docker", "compose", "ps", "--all", "--format", "json"], cwd=tmp_path, capture_output=True
+    )
+
+
+@mock.patch("deepfellow.common.docker.echo")
+@mock.patch("deepfellow.common.docker.run", return_value=None)
+def test_docker_ps_cli_error(mock_run: Mock, mock_echo: Mock, tmp_path: Path) -> None:
+    with pytest.raises(typer.Exit):
+        docker_ps(tmp_path)
+
+    mock_echo.error.assert_called_once()
+
+
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_docker_stats_uses_api(mock_get_docker_api: Mock, mock_run: Mock, tmp_path: Path) -> None:
+    api = mock_get_docker_api.return_value
+    api.list_containers.return_value = [{"Id": "abc"}, {"Id": "def"}]
+    api.container_stats.side_effect = lambda container_id: {"id": container_id, "name": f"/infra-{container_id}-1"}
+
+    result = docker_stats(tmp_path / "infra")
+
+    assert set(result) == {"infra-abc-1", "infra-def-1"}
+    assert result["infra-abc-1"]["CPUPerc"] == "0.00%"
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run")
+def test_docker_stats_cli(mock_run: Mock, tmp_path: Path) -> None:
+    mock_run.return_value = '{"Name": "infra-infra-1", "CPUPerc": "1.50%"}\n{"Name": "other-1", "CPUPerc": "0.00%"}\n'
+
+    result = docker_stats(tmp_path)
+
+    assert result["infra-infra-1"]["CPUPerc"] == "1.50%"
+    assert set(result) == {"infra-infra-1", "other-1"}
+
+
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.cgroup_stats")
+@mock.patch("deepfellow.common.docker.get_container_processes", return_value={"infra-infra-1": PROCESS})
+@mock.patch("deepfellow.common.docker.is_cgroup_v2", return_value=True)
+def test_docker_stats_uses_cgroup(
+    mock_is_cgroup_v2: Mock, mock_get_container_processes: Mock, mock_cgroup_stats: Mock, mock_run: Mock, tmp_path: Path
+) -> None:
+    mock_cgroup_stats.return_value = {"infra-infra-1": {"Name": "infra-infra-1", "CPUPerc": "1.00%"}}
+
+    assert docker_stats(tmp_path) == mock_cgroup_stats.return_value
+    mock_cgroup_stats.assert_called_once_with({"infra-infra-1": PROCESS})
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run", return_value='{"Name": "infra-infra-1", "CPUPerc": "1.50%"}')
+@mock.patch("deepfellow.common.docker.cgroup_stats", side_effect=CgroupError("no access"))
+@mock.patch("deepfellow.common.docker.get_container_processes", return_value={"infra-infra-1": PROCESS})
+@mock.patch("deepfellow.common.docker.is_cgroup_v2", return_value=True)
+def test_docker_stats_cgroup_falls_back_to_docker(
+    mock_is_cgroup_v2: Mock, mock_get_container_processes: Mock, mock_cgroup_stats: Mock, mock_run: Mock, tmp_path: Path
+) -> None:
+    assert docker_stats(tmp_path)["infra-infra-1"]["CPUPerc"] == "1.50%"
+
+
+@mock.patch("deepfellow.common.docker.run")
+def test_get_container_processes_cli(mock_run: Mock, tmp_path: Path) -> None:
+    mock_run.side_effect = ["abc\ndef\n", "/infra-infra-1 abc 42\n/infra-mongo-1 def 0\n"]
+
+    assert get_container_processes(tmp_path) == {"infra-infra-1": PROCESS}
+    mock_run.assert_called_with(
+        ["docker", "inspect", "--format", "{{.Name}} {{.Id}} {{.State.Pid}}", "abc", "def"], capture_output=True
+    )
+
+
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_get_container_processes_uses_api(mock_get_docker_api: Mock, tmp_path: Path) -> None:
+    api = mock_get_docker_api.return_value
+    api.list_containers.return_value = [{"Id": "abc"}]
+    api.inspect_container.return_value = {"Id": "abc", "Name": "/infra-infra-1", "State": {"Pid": 42}}
+
+    assert get_container_processes(tmp_path) == {"infra-infra-1": PROCESS}
+
+
+@mock.patch("deepfellow.common.docker.run", return_value=None)
+def test_docker_stats_cli_error(mock_run: Mock, tmp_path: Path) -> None:
+    assert docker_stats(tmp_path) == {}
+
+
 @mock.patch("deepfellow.common.docker.echo")
 def test_save_compose_file_writes_yaml_content(mock_echo: mock.Mock, temp_compose_file: Path) -> None:
     expected = {"web": {"image": "nginx", "ports": ["80:80"]}}
@@ -138,84 +309,105 @@ def test_save_compose_file_with_volumes(temp_compose_file: Path):
     )
 
 
-def test_parse_docker_compose_ps():
-    # Test with sample docker compose ps output
-    sample_output = (
-        "NAME            IMAGE                                                 COMMAND                  "
-        "SERVICE   CREATED       STATUS          PORTS\n"
-        'infra-infra-1   hub.simplito.com/deepfellow/deepfellow-infra:0.15.0   "./.venv/bin/uvicorn…"   infra     '
-        "2 weeks ago   Up 14 minutes   0.0.0.0:8086->8086/tcp, [::]:8086->8086/tcp"
-    )
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_get_image_repo_digests_uses_api(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.inspect_image.return_value = {"RepoDigests": ["org/image@sha256:abc"]}
 
-    result = parse_docker_compose_ps(sample_output)
+    assert get_image_repo_digests("org/image:1.0.0") == ["org/image@sha256:abc"]
+    mock_run.assert_not_called()
 
-    assert result["NAME"] == "infra-infra-1"
-    assert result["IMAGE"] == "hub.simplito.com/deepfellow/deepfellow-infra:0.15.0"
-    assert result["CREATED"] == "2 weeks ago"
-    assert result["STATUS"] == "Up 14 minutes"
-    assert result["PORTS"] == "0.0.0.0:8086->8086/tcp, [::]:8086->8086/tcp"
 
+@mock.patch("deepfellow.common.docker.run", return_value='["org/image@sha256:abc"]\n')
+@mock.patch("deepfellow.common.docker.get_docker_api", return_value=None)
+def test_get_image_repo_digests_cli(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    assert get_image_repo_digests("org/image:1.0.0") == ["org/image@sha256:abc"]
+    assert mock_run.call_args.args[0] == [
+        "docker",
+        "image",
+        "inspect",
+        "--format",
+        "{{json .RepoDigests}}",
+        "org/image:1.0.0",
+    ]
 
-def test_parse_docker_compose_ps_empty():
-    # Test with empty output
-    result = parse_docker_compose_ps("")
-    assert result == {}
 
+@mock.patch("deepfellow.common.docker.run", side_effect=DockerError("No such image"))
+@mock.patch("deepfellow.common.docker.get_docker_api", return_value=None)
+def test_get_image_repo_digests_missing_image(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    assert get_image_repo_digests("org/image:1.0.0") == []
 
-def test_parse_docker_compose_ps_single_line():
-    # Test with only header
-    result = parse_docker_compose_ps("NAME            IMAGE")
-    assert result == {}
 
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_is_image_present_uses_api(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.inspect_image.return_value = {"Id": "sha256:abc"}
 
-def test_parse_docker_compose_usage():
-    # Test with sample docker stats output
-    sample_output = (
-        "CONTAINER ID   NAME            CPU %     MEM USAGE / LIMIT     MEM %     NET I/O           BLOCK I/O    PIDS\n"
-        "9c06fdf7cb59   infra-infra-1   0.21%     53.67MiB / 11.72GiB   0.45%     20.1kB / 5.48kB   353MB / 0B   2"
-    )
+    assert is_image_present("org/image:1.0.0") is True
+    mock_run.assert_not_called()
 
-    result = parse_docker_compose_usage(sample_output)
 
-    assert result["CONTAINER ID"] == "9c06fdf7cb59"
-    assert result["NAME"] == "infra-infra-1"
-    assert result["CPU %"] == "0.21%"
-    assert result["MEM USAGE"] == "53.67MiB"
-    assert result["MEM LIMIT"] == "11.72GiB"
-    assert result["MEM %"] == "0.45%"
-    assert result["NET I/O"] == "20.1kB / 5.48kB"
-    assert result["BLOCK I/O"] == "353MB / 0B"
-    assert result["PIDS"] == "2"
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_is_image_present_missing_image_skips_cli(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.inspect_image.side_effect = DockerApiNotFoundError("No such image")
 
+    assert is_image_present("org/image:1.0.0") is False
+    mock_run.assert_not_called()
 
-def test_parse_docker_compose_usage_empty():
-    # Test with empty output
-    result = parse_docker_compose_usage("")
-    assert result == {}
 
+@mock.patch("deepfellow.common.docker.run", return_value="sha256:abc\n")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_is_image_present_falls_back_to_cli_on_transport_error(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.inspect_image.side_effect = DockerApiError("permission denied")
 
-def test_parse_docker_compose_usage_single_line():
-    # Test with only header
-    sample_output = "CONTAINER ID   NAME            CPU %     MEM USAGE / LIMIT"
-    result = parse_docker_compose_usage(sample_output)
-    assert result == {}
+    assert is_image_present("org/image:1.0.0") is True
+    assert mock_run.call_count == 1
 
 
-def test_parse_docker_compose_usage_different_values():
-    # Test with different container data
-    sample_output = (
-        "CONTAINER ID   NAME          CPU %     MEM USAGE / LIMIT    MEM %     NET I/O         BLOCK I/O      PIDS\n"
-        "abc123def456   my-app-1      1.50%     128.5MiB / 2GiB      6.27%     1.2MB / 856kB   1.5GB / 10MB   5"
-    )
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_get_image_repo_digests_missing_image_skips_cli(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.inspect_image.side_effect = DockerApiNotFoundError("No such image")
+
+    assert get_image_repo_digests("org/image:1.0.0") == []
+    mock_run.assert_not_called()
+
 
-    result = parse_docker_compose_usage(sample_output)
-
-    assert result["CONTAINER ID"] == "abc123def456"
-    assert result["NAME"] == "my-app-1"
-    assert result["CPU %"] == "1.50%"
-    assert result["MEM USAGE"] == "128.5MiB"
-    assert result["MEM LIMIT"] == "2GiB"
-    assert result["MEM %"] == "6.27%"
-    assert result["NET I/O"] == "1.2MB / 856kB"
-    assert result["BLOCK I/O"] == "1.5GB / 10MB"
-    assert result["PIDS"] == "5"
+@mock.patch("deepfellow.common.docker.run", side_effect=DockerError("No such image"))
+def test_is_image_present_missing_image(mock_run: Mock) -> None:
+    assert is_image_present("org/image:1.0.0") is False
+    assert mock_run.call_args.args[0] == ["docker", "image", "inspect", "--format", "{{.Id}}", "org/image:1.0.0"]
+
+
+@mock.patch("deepfellow.common.docker.run")
+@mock.patch("deepfellow.common.docker.get_docker_api")
+def test_list_image_tags_uses_api(mock_get_docker_api: Mock, mock_run: Mock) -> None:
+    mock_get_docker_api.return_value.list_images.return_value = [
+        {"RepoTags": ["localhost:5000/org/image:1.0.0", "localhost:5000/org/image-dev:2.0.0"]},
+        {"RepoTags": ["localhost:5000/org/image:1.1.0"]},
+        {"RepoTags": None},
+    ]
+
+    assert list_image_tags("localhost:5000/org/image") == ["1.0.0", "1.1.0"]
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.docker.run", return_value="1.0.0\n<none>\nlatest\n")
+def test_list_image_tags_cli(mock_run: Mock) -> None:
+    assert list_image_tags("org/image") == ["1.0.0", "latest"]
+    assert mock_run.call_args.args[0] == ["docker", "image", "ls", "--format", "{{.Tag}}", "org/image"]
+
+
+@pytest.mark.parametrize(
+    ("service", "local_image", "expected", "changed"),
+    [
+        ({"image": "server"}, True, {"image": "server", "pull_policy": "never"}, True),
+        ({"image": "server", "pull_policy": "never"}, True, {"image": "server", "pull_policy": "never"}, False),
+        ({"image": "server", "pull_policy": "never"}, False, {"image": "server"}, True),
+        ({"image": "server"}, False, {"image": "server"}, False),
+    ],
+)
+def test_set_pull_policy(service: dict, local_image: bool, expected: dict, changed: bool) -> None:
+    assert set_pull_policy(service, local_image) is changed
+    assert service == expected
@@ -0,0 +1,269 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the docker_api module."""
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+
+from deepfellow.common.docker_api import (
+    DockerApi,
+    DockerApiError,
+    DockerApiNotFoundError,
+    compose_project_name,
+    container_to_compose_ps,
+    find_socket,
+    format_binary_size,
+    format_created,
+    format_decimal_size,
+    format_ports,
+    get_docker_api,
+    stats_to_usage,
+)
+
+
+def make_api(handler) -> DockerApi:
+    return DockerApi(httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def stats() -> dict:
+    return {
+        "id": "0123456789abcdef",
+        "name": "/infra-infra-1",
+        "cpu_stats": {"cpu_usage": {"total_usage": 300}, "system_cpu_usage": 2000, "online_cpus": 4},
+        "precpu_stats": {"cpu_usage": {"total_usage": 100}, "system_cpu_usage": 1000},
+        "memory_stats": {"usage": 300 * 1024 * 1024, "limit": 1024 * 1024 * 1024, "stats": {"inactive_file": 0}},
+        "networks": {"eth0": {"rx_bytes": 1500, "tx_bytes": 500}, "eth1": {"rx_bytes": 500, "tx_bytes": 0}},
+        "blkio_stats": {
+            "io_service_bytes_recursive": [{"op": "read", "value": 2_000_000}, {"op": "write", "value": 0}]
+        },
+        "pids_stats": {"current": 12},
+    }
+
+
+def test_ping():
+    api = make_api(lambda request: httpx.Response(200, text="OK"))
+
+    assert api.ping()
+
+
+def test_ping_unreachable():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused")
+
+    assert not make_api(handler).ping()
+
+
+def test_request_raises_on_error_status():
+    api = make_api(lambda request: httpx.Response(500, json={"message": "boom"}))
+
+    with pytest.raises(DockerApiError) as exc_info:
+        api.request("GET", "/networks")
+
+    assert not isinstance(exc_info.value, DockerApiNotFoundError)
+
+
+def test_request_raises_not_found_on_404():
+    api = make_api(lambda request: httpx.Response(404, json={"message": "No such image: org/image:1.0.0"}))
+
+    with pytest.raises(DockerApiNotFoundError):
+        api.request("GET", "/images/org/image:1.0.0/json")
+
+
+def test_list_networks():
+    api = make_api(lambda request: httpx.Response(200, json=[{"Name": "bridge"}, {"Name": "deepfellow-infra-net"}]))
+
+    assert api.list_networks() == ["bridge", "deepfellow-infra-net"]
+
+
+def test_create_network():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(201, json={"Id": "abc"})
+
+    make_api(handler).create_network("deepfellow-infra-net")
+
+    assert requests[0].url.path == "/networks/create"
+    assert json.loads(requests[0].content) == {"Name": "deepfellow-infra-net", "Driver": "bridge"}
+
+
+def test_list_containers_filters():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=[{"Id": "abc"}])
+
+    containers = make_api(handler).list_containers({"com.docker.compose.service": "infra"}, status="running")
+
+    assert containers == [{"Id": "abc"}]
+    assert requests[0].url.params["all"] == "false"
+    assert json.loads(requests[0].url.params["filters"]) == {
+        "label": ["com.docker.compose.service=infra"],
+        "status": ["running"],
+    }
+
+
+def test_find_socket_docker_host(monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "unix:///tmp/docker.sock")
+
+    assert find_socket() == "/tmp/docker.sock"
+
+
+def test_find_socket_tcp_docker_host(monkeypatch):
+    monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+
+    assert find_socket() is None
+
+
+@mock.patch("deepfellow.common.docker_api.find_socket", return_value=None)
+def test_get_docker_api_without_socket(mock_find_socket):
+    get_docker_api.cache_clear()
+    try:
+        assert get_docker_api() is None
+    finally:
+        get_docker_api.cache_clear()
+
+
+@mock.patch("deepfellow.common.docker_api.DockerApi.ping", return_value=False)
+@mock.patch("deepfellow.common.docker_api.find_socket", return_value="/tmp/docker.sock")
+def test_get_docker_api_unreachable_socket(mock_find_socket, mock_ping):
+    get_docker_api.cache_clear()
+    try:
+        assert get_docker_api() is None
+    finally:
+        get_docker_api.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [("infra", "infra"), ("My Server", "myserver"), ("otel.collector", "otelcollector")],
+)
+def test_compose_project_name(tmp_path: Path, monkeypatch, name: str, expected: str):
+    monkeypatch.delenv("COMPOSE_PROJECT_NAME", raising=False)
+
+    assert compose_project_name(tmp_path / name) == expected
+
+
+def test_compose_project_name_from_env(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("COMPOSE_PROJECT_NAME", "custom")
+
+    assert compose_project_name(tmp_path) == "custom"
+
+
+def test_format_ports():
+    ports = [
+        {"IP": "0.0.0.0", "PrivatePort": 8086, "PublicPort": 8086, "Type": "tcp"},
+        {"IP": "::", "PrivatePort": 8086, "PublicPort": 8086, "Type": "tcp"},
+        {"PrivatePort": 9000, "Type": "tcp"},
+    ]
+
+    assert format_ports(ports) == "0.0.0.0:8086->8086/tcp, [::]:8086->8086/tcp, 9000/tcp"
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"), [(0, "0B"), (1536, "1.5KiB"), (300 * 1024 * 1024, "300MiB"), (2 * 1024**3, "2GiB")]
+)
+def test_format_binary_size(size: int, expected: str):
+    assert format_binary_size(size) == expected
+
+
+@pytest.mark.parametrize(("size", "expected"), [(0, "0B"), (1500, "1.5kB"), (2_000_000, "2MB")])
+def test_format_decimal_size(size: int, expected: str):
+    assert format_decimal_size(size) == expected
+
+
+@pytest.mark.parametrize(
+    ("age", "expected"),
+    [(5, "5 seconds ago"), (60, "1 minute ago"), (2 * 3600 + 5, "2 hours ago"), (3 * 86400, "3 days ago")],
+)
+def test_format_created(age: int, expected: str):
+    assert format_created(1_000_000, now=1_000_000 + age) == expected
+
+
+def test_container_to_compose_ps():
+    container = {
+        "Id": "abc",
+        "Names": ["/infra-infra-1"],
+        "Image": "hub.simplito.com/deepfellow/deepfellow-infra:dev",
+        "Command": "python main.py",
+        "Labels": {"com.docker.compose.service": "infra"},
+        "State": "running",
+        "Status": "Up 2 hours",
+        "Ports": [{"IP": "0.0.0.0", "PrivatePort": 8086, "PublicPort": 8086, "Type": "tcp"}],
+    }
+
+    assert container_to_compose_ps(container) == {
+        "ID": "abc",
+        "Name": "infra-infra-1",
+        "Image": "hub.simplito.com/deepfellow/deepfellow-infra:dev",
+        "Command": "python main.py",
+        "Service": "infra",
+        "State": "running",
+        "Status": "Up 2 hours",
+        "RunningFor": "",
+        "Ports": "0.0.0.0:8086->8086/tcp",
+    }
+
+
+def test_stats_to_usage(stats: dict):
+    assert stats_to_usage(stats) == {
+        "ID": "0123456789ab",
+        "Name": "infra-infra-1",
+        "CPUPerc": "80.00%",
+        "MemUsage": "300MiB / 1GiB",
+        "MemPerc": "29.30%",
+        "NetIO": "2kB / 500B",
+        "BlockIO": "2MB / 0B",
+        "PIDs": "12",
+    }
+
+
+def test_inspect_image():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/images/hub.example.com/org/image:1.0.0/json"
+        return httpx.Response(200, json={"RepoDigests": ["hub.example.com/org/image@sha256:abc"]})
+
+    assert make_api(handler).inspect_image("hub.example.com/org/image:1.0.0") == {
+        "RepoDigests": ["hub.example.com/org/image@sha256:abc"]
+    }
+
+
+def test_list_images_filters_by_reference():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/images/json"
+        assert json.loads(request.url.params["filters"]) == {"reference": ["org/image"]}
+        return httpx.Response(200, json=[{"RepoTags": ["org/image:1.0.0"]}])
+
+    assert make_api(handler).list_images("org/image") == [{"RepoTags": ["org/image:1.0.0"]}]
+
+
+def test_pull_image_streams_events():
+    events = [{"status": "Pulling fs layer", "id": "a"}, {"status": "Pull complete", "id": "a"}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["fromImage"] == "org/image:1.0.0"
+        return httpx.Response(200, text="\n".join(json.dumps(event) for event in events) + "\n")
+
+    assert list(make_api(handler).pull_image("org/image:1.0.0")) == events
+
+
+def test_pull_image_raises_on_error_event():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=json.dumps({"error": "manifest unknown"}))
+
+    with pytest.raises(DockerApiError, match="manifest unknown"):
+        list(make_api(handler).pull_image("org/image:1.0.0"))
@@ -323,16 +323,16 @@ def test_prompt_kwargs_passed_to_prompt_ask(mock_interactive, mock_ask, prompter
 
 
 @mock.patch(_IS_INTERACTIVE)
-@mock.patch("deepfellow.common.echo.questionary")
-def test_choice_interactive(mock_questionary: Mock, mock_is_interactive: Mock) -> None:
+@mock.patch("questionary.select")
+def test_choice_interactive(mock_select: Mock, mock_is_interactive: Mock) -> None:
     """Test choice method in interactive mode."""
     mock_is_interactive.return_value = True
-    mock_questionary.select.return_value.ask.return_value = "option1"
+    mock_select.return_value.ask.return_value = "option1"
 
     result = echo.choice("Select option", choices=["option1", "option2"])
 
     assert result == "option1"
-    mock_questionary.select.assert_called_once()
+    mock_select.assert_called_once()
 
 
 @mock.patch(_IS_INTERACTIVE)
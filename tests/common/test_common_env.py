@@ -9,10 +9,13 @@
 
 """Tests for the env module."""
 
+from pathlib import Path
 from unittest import mock
 from unittest.mock import Mock
 
-from deepfellow.common.env import EnvMetadata, print_env_info
+import pytest
+
+from deepfellow.common.env import EnvMetadata, parse_env_assignments, print_env_info
 
 
 def test_render_empty_value_shows_undefined():
@@ -164,3 +167,30 @@ def test_print_env_info_echo_called_once_regardless_of_mode(mock_echo: Mock):
     print_env_info("Header", metadata, {}, doc=False)
 
     assert mock_echo.info.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("assignments", "df_prefix", "expected"),
+    [
+        (["A=1", "df_b=x=y"], True, {"DF_A": "1", "DF_B": "x=y"}),
+        (["A=1", "B="], False, {"A": "1", "B": ""}),
+        (["NAME", "value"], True, {"DF_NAME": "value"}),
+        (["NAME"], True, {"DF_NAME": ""}),
+        ([], True, {}),
+    ],
+)
+def test_parse_env_assignments(assignments: list[str], df_prefix: bool, expected: dict[str, str]):
+    assert parse_env_assignments(assignments, df_prefix=df_prefix) == expected
+
+
+def test_parse_env_assignments_arguments_override_file(tmp_path: Path):
+    overrides = tmp_path / "overrides.env"
+    overrides.write_text('# comment\nDF_A=file\nB="quoted value"\n')
+
+    assert parse_env_assignments(["A=args"], overrides) == {"DF_A": "args", "DF_B": "quoted value"}
+
+
+@pytest.mark.parametrize("assignments", [["A=1", "B"], ["1A=1"], ["A-B", "1", "2"], ["=1"]])
+def test_parse_env_assignments_invalid(assignments: list[str]):
+    with pytest.raises(ValueError, match="Invalid"):
+        parse_env_assignments(assignments)
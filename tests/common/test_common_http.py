@@ -0,0 +1,90 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the http module."""
+
+from unittest import mock
+
+import httpx
+import pytest
+
+from deepfellow.common.http import (
+    DF_HTTP_CONNECT_TIMEOUT,
+    DF_HTTP_READ_TIMEOUT,
+    close_client,
+    get_client,
+    get_timeout,
+    is_http2_enabled,
+)
+from deepfellow.common.state import state
+
+
+@pytest.fixture(autouse=True)
+def fresh_client():
+    close_client()
+    yield
+    close_client()
+
+
+def test_get_client_returns_shared_client():
+    client = get_client()
+
+    assert isinstance(client, httpx.Client)
+    assert get_client() is client
+
+
+def test_close_client_closes_connections():
+    client = get_client()
+
+    close_client()
+
+    assert client.is_closed
+    assert get_client() is not client
+
+
+def test_get_timeout_defaults():
+    timeout = get_timeout()
+
+    assert timeout.connect == DF_HTTP_CONNECT_TIMEOUT
+    assert timeout.read == DF_HTTP_READ_TIMEOUT
+
+
+def test_get_timeout_from_config():
+    state.cli_config = {"df_http_connect_timeout": "2.5", "df_http_read_timeout": "30"}
+
+    timeout = get_timeout()
+
+    assert timeout.connect == 2.5
+    assert timeout.read == 30.0
+    assert get_client().timeout.connect == 2.5
+
+
+@mock.patch("deepfellow.common.config.echo")
+def test_get_timeout_invalid_config_falls_back_to_defaults(mock_echo: mock.Mock):
+    state.cli_config = {"df_http_connect_timeout": "fast", "df_http_read_timeout": "1m"}
+
+    timeout = get_timeout()
+
+    assert timeout.connect == DF_HTTP_CONNECT_TIMEOUT
+    assert timeout.read == DF_HTTP_READ_TIMEOUT
+    assert mock_echo.warning.call_count == 2
+
+
+def test_http2_disabled_by_default():
+    assert not is_http2_enabled()
+
+
+@pytest.mark.parametrize(("spec", "expected"), [(object(), True), (None, False)])
+@mock.patch("deepfellow.common.http.find_spec")
+def test_http2_requires_h2(mock_find_spec: mock.Mock, spec: object, expected: bool):
+    mock_find_spec.return_value = spec
+    state.cli_config = {"df_http2": "true"}
+
+    assert is_http2_enabled() is expected
+    mock_find_spec.assert_called_once_with("h2")
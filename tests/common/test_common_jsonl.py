@@ -0,0 +1,67 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the jsonl module."""
+
+from pathlib import Path
+
+import pytest
+
+from deepfellow.common.jsonl import append_jsonl, read_jsonl, write_jsonl
+
+
+def test_read_jsonl_skips_blank_and_truncated_lines(tmp_path: Path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": 1}\n\n{"id": 2}\n{"id": 3')
+
+    assert list(read_jsonl(path)) == [{"id": 1}, {"id": 2}]
+
+
+def test_append_jsonl_creates_owner_only_file(tmp_path: Path):
+    path = tmp_path / "nested" / "records.jsonl"
+
+    append_jsonl(path, {"id": 1})
+    append_jsonl(path, {"id": 2})
+
+    assert list(read_jsonl(path)) == [{"id": 1}, {"id": 2}]
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_write_jsonl_replaces_the_file(tmp_path: Path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": "old"}\n')
+
+    assert write_jsonl(path, iter([{"id": 1}, {"id": 2}])) == 2
+    assert list(read_jsonl(path)) == [{"id": 1}, {"id": 2}]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_write_jsonl_is_readable_by_the_owner_only(tmp_path: Path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": "old"}\n')
+    path.chmod(0o644)
+
+    write_jsonl(path, [{"id": 1}])
+
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_write_jsonl_keeps_the_old_file_on_error(tmp_path: Path):
+    path = tmp_path / "records.jsonl"
+    path.write_text('{"id": "old"}\n')
+
+    def records():
+        yield {"id": 1}
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        write_jsonl(path, records())
+
+    assert list(read_jsonl(path)) == [{"id": "old"}]
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,103 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lazy module."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from deepfellow.common.lazy import LazyCommand, LazyGroup, PlaceholderCommand, lazy_group, load_command
+
+LAZY_PACKAGES = [
+    "deepfellow.main",
+    "deepfellow.cli",
+    "deepfellow.infra",
+    "deepfellow.infra.env_command",
+    "deepfellow.infra.model",
+    "deepfellow.infra.service",
+    "deepfellow.otel",
+    "deepfellow.server",
+    "deepfellow.server.env_command",
+    "deepfellow.server.organization",
+    "deepfellow.server.organization.admin_api_key",
+    "deepfellow.server.project",
+    "deepfellow.server.project.api_key",
+]
+
+HEAVY_MODULES = ["questionary", "prompt_toolkit", "httpx", "email_validator", "yaml", "tzlocal"]
+
+# Cumulative import time of ``deepfellow.main`` in microseconds, generous enough for slow CI runners
+IMPORT_TIME_BUDGET_US = 300_000
+
+
+def _lazy_commands() -> list[LazyCommand]:
+    return [command for package in LAZY_PACKAGES for command in importlib.import_module(package).COMMANDS]
+
+
+@pytest.mark.parametrize("lazy_command", _lazy_commands(), ids=lambda command: command.import_path)
+def test_lazy_command_loads_matching_command(lazy_command):
+    command = load_command(lazy_command)
+
+    assert command.name == lazy_command.name
+    assert command.get_short_help_str(limit=200) == lazy_command.help
+
+
+def test_lazy_group_registers_placeholders():
+    group_cls = lazy_group([LazyCommand("version", "deepfellow.cli.version:app", "Show version.")])
+
+    group = group_cls(name="test")
+
+    assert issubclass(group_cls, LazyGroup)
+    assert isinstance(group.commands["version"], PlaceholderCommand)
+    assert group.commands["version"].help == "Show version."
+
+
+def test_lazy_group_replaces_placeholder_on_resolve():
+    group = lazy_group([LazyCommand("update", "deepfellow.cli.update:app", "Update DeepFellow CLI.")])(name="test")
+    ctx = group.make_context("test", ["update"], resilient_parsing=True)
+
+    cmd_name, cmd, _ = group.resolve_command(ctx, ["update"])
+
+    assert cmd_name == "update"
+    assert not isinstance(cmd, PlaceholderCommand)
+    assert group.commands["update"] is cmd
+
+
+def test_lazy_group_help_does_not_load_commands():
+    app = typer.Typer(cls=lazy_group([LazyCommand("missing", "deepfellow.does_not_exist:app", "Missing command.")]))
+    app.callback()(lambda: None)
+
+    result = CliRunner().invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    assert "Missing command." in result.output
+
+
+def test_main_import_skips_heavy_modules():
+    code = f"import sys, deepfellow.main; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "[]"
+
+
+def test_main_import_time_within_budget():
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import deepfellow.main"], capture_output=True, text=True, check=True
+    ).stderr
+
+    cumulative = next(
+        int(line.split("|")[1]) for line in stderr.splitlines() if line.split("|")[-1].strip() == "deepfellow.main"
+    )
+    assert cumulative < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,40 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the lock module."""
+
+import threading
+import time
+from pathlib import Path
+
+from deepfellow.common.lock import file_lock, get_lock_path
+
+
+def test_get_lock_path():
+    assert get_lock_path(Path("/home/user/.deepfellow/secrets")) == Path("/home/user/.deepfellow/.secrets.lock")
+
+
+def test_file_lock_serializes_holders(tmp_path: Path):
+    lock_path = tmp_path / "nested" / ".secrets.lock"
+    events = []
+
+    def hold(name: str) -> None:
+        with file_lock(lock_path):
+            events.append(f"{name} acquired")
+            time.sleep(0.05)
+            events.append(f"{name} released")
+
+    threads = [threading.Thread(target=hold, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [event.split()[1] for event in events] == ["acquired", "released", "acquired", "released"]
+    assert lock_path.stat().st_mode & 0o777 == 0o600
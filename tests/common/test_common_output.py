@@ -0,0 +1,109 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the output module."""
+
+import json
+from dataclasses import asdict, dataclass
+from unittest import mock
+
+import pytest
+
+from deepfellow.common.defaults import OutputFormatChoice
+from deepfellow.common.echo import echo
+from deepfellow.common.output import print_record, print_records
+from deepfellow.common.state import state
+
+
+@dataclass
+class Item:
+    id: str
+    name: str
+
+    def as_dict(self) -> dict[str, str]:
+        return asdict(self)
+
+    def __str__(self) -> str:
+        return f"id: {self.id}\nname: {self.name}"
+
+
+ITEMS = [Item("1", "first"), Item("2", "second")]
+
+
+@mock.patch("deepfellow.common.output.echo")
+def test_print_records_table(mock_echo):
+    print_records(ITEMS)
+
+    assert mock_echo.info.call_args_list == [mock.call("id: 1\nname: first"), mock.call("\nid: 2\nname: second")]
+
+
+@mock.patch("deepfellow.common.output.echo")
+def test_print_records_table_empty_message(mock_echo):
+    print_records([], empty_message="Nothing here.")
+
+    assert mock_echo.info.call_args == mock.call("Nothing here.")
+
+
+@pytest.mark.parametrize("items", [ITEMS, []])
+@mock.patch("deepfellow.common.output.echo")
+def test_print_records_json_is_a_single_array(mock_echo, capsys, items):
+    state.output = OutputFormatChoice.json
+
+    print_records(iter(items))
+
+    assert json.loads(capsys.readouterr().out) == [item.as_dict() for item in items]
+    assert mock_echo.info.call_count == 0
+
+
+def test_print_records_jsonl_writes_each_record_before_the_next_is_fetched(capsys):
+    state.output = OutputFormatChoice.jsonl
+    written = []
+
+    def records():
+        for item in ITEMS:
+            yield item
+            written.append(capsys.readouterr().out)
+
+    print_records(records())
+
+    assert [json.loads(line) for line in written] == [item.as_dict() for item in ITEMS]
+
+
+def test_print_record_output_argument_overrides_global(capsys):
+    state.output = OutputFormatChoice.table
+
+    print_record(ITEMS[0], output=OutputFormatChoice.jsonl)
+
+    assert capsys.readouterr().out == '{"id": "1", "name": "first"}\n'
+
+
+@pytest.mark.parametrize("output", [OutputFormatChoice.json, OutputFormatChoice.jsonl])
+def test_messages_go_to_stderr_with_json_output(capsys, output):
+    state.output = output
+
+    echo.info("Listing items.")
+    print_records(ITEMS)
+    echo.success("Done.")
+
+    captured = capsys.readouterr()
+    assert "Listing items." in captured.err
+    assert "Done." in captured.err
+    if output == OutputFormatChoice.json:
+        records = json.loads(captured.out)
+    else:
+        records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records == [item.as_dict() for item in ITEMS]
+
+
+def test_messages_go_to_stdout_with_table_output(capsys):
+    echo.info("Listing items.")
+
+    captured = capsys.readouterr()
+    assert "Listing items." in captured.out
+    assert captured.err == ""
@@ -0,0 +1,255 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the concurrent image pulls."""
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+
+from deepfellow.common.bundle import save_bundle_images
+from deepfellow.common.docker import DockerError
+from deepfellow.common.docker_api import DockerApiError
+from deepfellow.common.pull import LayerProgress, get_pull_images, is_pinned, pull_images, with_tag
+from deepfellow.common.state import state
+
+
+def downloading(layer: str, current: int, total: int) -> dict[str, Any]:
+    return {"status": "Downloading", "id": layer, "progressDetail": {"current": current, "total": total}}
+
+
+def test_layer_progress_sums_downloading_layers() -> None:
+    layers = LayerProgress()
+    for event in [
+        {"status": "Pulling from org/image", "id": "1.0.0"},
+        {"status": "Already exists", "id": "a"},
+        downloading("b", 10, 100),
+        downloading("c", 5, 50),
+        {"status": "Download complete", "id": "b"},
+        {"status": "Status: Downloaded newer image for org/image:1.0.0"},
+    ]:
+        layers.update(event)
+
+    assert layers.completed == 105
+    assert layers.total == 150
+
+
+@pytest.mark.parametrize(
+    ("image", "expected"),
+    [
+        ("mongo:8.2.7", True),
+        ("quay.io/coreos/etcd:v3.5.25", True),
+        (f"milvusdb/milvus:v2.6.7@sha256:{'0' * 64}", True),
+        ("qdrant/qdrant:v1.15", False),
+        ("mongo:8", False),
+        ("mongo:latest", False),
+        ("localhost:5000/mongo", False),
+    ],
+)
+def test_is_pinned(image: str, expected: bool) -> None:
+    assert is_pinned(image) is expected
+
+
+@pytest.mark.parametrize(
+    ("image", "expected"),
+    [
+        ("org/image", "org/image:latest"),
+        ("localhost:5000/image", "localhost:5000/image:latest"),
+        ("org/image:1.0.0", "org/image:1.0.0"),
+        ("org/image@sha256:abc", "org/image@sha256:abc"),
+    ],
+)
+def test_with_tag(image: str, expected: str) -> None:
+    assert with_tag(image) == expected
+
+
+@mock.patch("deepfellow.common.pull.get_compose_config")
+def test_get_pull_images_skips_local_images(mock_config: Mock, tmp_path: Path) -> None:
+    mock_config.return_value = {
+        "services": {
+            "server": {"image": "server:dev", "pull_policy": "never"},
+            "mongo": {"image": "mongo:8"},
+            "qdrant": {"image": "qdrant:1"},
+            "mongo-copy": {"image": "mongo:8"},
+        }
+    }
+
+    assert get_pull_images(tmp_path) == ["mongo:8", "qdrant:1"]
+
+
+@pytest.fixture
+def mock_images() -> Any:
+    with mock.patch("deepfellow.common.pull.get_pull_images", return_value=["mongo:8.2.7", "qdrant:1"]) as images:
+        yield images
+
+
+@pytest.fixture(autouse=True)
+def non_interactive() -> None:
+    # Plain messages without the progress display
+    state.non_interactive = True
+
+
+@pytest.fixture(autouse=True)
+def mock_present() -> Any:
+    with mock.patch("deepfellow.common.pull.is_image_present", return_value=False) as present:
+        yield present
+
+
+@pytest.fixture
+def mock_sleep() -> Any:
+    with mock.patch("deepfellow.common.pull.time.sleep") as sleep:
+        yield sleep
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_uses_api_and_reports_total(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    mock_api.return_value.pull_image.side_effect = lambda image: iter(
+        [downloading("a", 1000, 2000), {"status": "Pull complete", "id": "a"}] if image == "mongo:8.2.7" else []
+    )
+
+    assert pull_images(tmp_path) is True
+
+    assert sorted(call.args[0] for call in mock_api.return_value.pull_image.call_args_list) == [
+        "mongo:8.2.7",
+        "qdrant:1",
+    ]
+    mock_run.assert_not_called()
+    assert "Pulled 2 of 2 images, 2kB in " in capsys.readouterr().out
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_skips_present_images(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, mock_present: Mock, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    mock_present.side_effect = lambda image: image == "mongo:8.2.7"
+    mock_api.return_value.pull_image.return_value = iter([])
+
+    assert pull_images(tmp_path) is True
+
+    assert mock_api.return_value.pull_image.call_args == mock.call("qdrant:1")
+    output = capsys.readouterr().out
+    assert "1 docker image(s) already present." in output
+    assert "Pulled 1 of 1 images" in output
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_without_missing_images_does_not_pull(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, mock_present: Mock, tmp_path: Path
+) -> None:
+    mock_images.return_value = ["mongo:8.2.7", f"qdrant/qdrant:v1.15@sha256:{'0' * 64}"]
+    mock_present.return_value = True
+
+    assert pull_images(tmp_path) is True
+
+    mock_api.return_value.pull_image.assert_not_called()
+    mock_run.assert_not_called()
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_refreshes_present_moving_tags(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, mock_present: Mock, tmp_path: Path
+) -> None:
+    mock_images.return_value = ["mongo:8.2.7", "qdrant/qdrant:v1.15", "otel/collector:latest"]
+    mock_present.return_value = True
+    mock_api.return_value.pull_image.side_effect = lambda image: iter([])
+
+    assert pull_images(tmp_path) is True
+
+    assert sorted(call.args[0] for call in mock_api.return_value.pull_image.call_args_list) == [
+        "otel/collector:latest",
+        "qdrant/qdrant:v1.15",
+    ]
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_skips_present_bundle_images(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, mock_present: Mock, tmp_path: Path
+) -> None:
+    save_bundle_images(["qdrant/qdrant:v1.15", "otel/collector:latest"])
+    mock_images.return_value = ["qdrant/qdrant:v1.15", "otel/collector", "nginx:1.27-alpine"]
+    mock_present.return_value = True
+    mock_api.return_value.pull_image.side_effect = lambda image: iter([])
+
+    assert pull_images(tmp_path) is True
+
+    assert mock_api.return_value.pull_image.call_args_list == [mock.call("nginx:1.27-alpine")]
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_docker_api")
+def test_pull_images_retries_failed_pull(
+    mock_api: Mock, mock_run: Mock, mock_images: Mock, mock_sleep: Mock, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    mock_images.return_value = ["mongo:8"]
+    mock_api.return_value.pull_image.side_effect = DockerApiError("connection reset")
+    mock_run.side_effect = [DockerError("timeout"), "sha256:abc"]
+
+    assert pull_images(tmp_path) is True
+
+    assert mock_api.return_value.pull_image.call_count == 2
+    assert mock_run.call_args == (
+        (["docker", "pull", "--quiet", "mongo:8"],),
+        {"capture_output": True, "raises": DockerError},
+    )
+    assert mock_sleep.call_count == 1
+    output = capsys.readouterr().out
+    assert "Unable to pull" not in output
+    # The size of an image pulled with `docker pull` is unknown, it is not reported as downloading nothing
+    assert "Pulled 1 of 1 images, 0B (+ 1 image(s) of unknown size) in " in output
+
+
+@mock.patch("deepfellow.common.pull.run", side_effect=DockerError("denied"))
+def test_pull_images_reports_failed_images(
+    mock_run: Mock, mock_images: Mock, mock_sleep: Mock, tmp_path: Path, capsys: pytest.CaptureFixture
+) -> None:
+    state.cli_config = {"df_pull_retries": "1"}
+
+    assert pull_images(tmp_path) is False
+
+    assert mock_run.call_count == 4
+    output = capsys.readouterr().out
+    assert "Unable to pull mongo:8.2.7: denied" in output
+    assert "Unable to pull qdrant:1: denied" in output
+    assert "Pulled 0 of 2 images, 0B in " in output
+
+
+@mock.patch("deepfellow.common.pull.run")
+@mock.patch("deepfellow.common.pull.get_pull_images", return_value=None)
+def test_pull_images_falls_back_to_compose_pull(mock_images: Mock, mock_run: Mock, tmp_path: Path) -> None:
+    assert pull_images(tmp_path) is True
+
+    assert mock_run.call_args == ((["docker", "compose", "pull"],), {"cwd": tmp_path, "raises": DockerError})
+
+
+@pytest.mark.parametrize("value", ["many", "1.5", ""])
+@mock.patch("deepfellow.common.config.echo")
+@mock.patch("deepfellow.common.pull.run", side_effect=DockerError("denied"))
+def test_pull_images_invalid_config_falls_back_to_defaults(
+    mock_run: Mock, mock_echo: Mock, mock_images: Mock, mock_sleep: Mock, tmp_path: Path, value: str
+) -> None:
+    state.cli_config = {"df_pull_concurrency": value, "df_pull_retries": value}
+
+    assert pull_images(tmp_path) is False
+
+    # Both images tried 1 + DF_PULL_RETRIES times
+    assert mock_run.call_count == 6
+    assert mock_echo.warning.call_args_list == [
+        mock.call(f"Invalid DF_PULL_CONCURRENCY value {value!r} in the CLI config, using the default 4."),
+        mock.call(f"Invalid DF_PULL_RETRIES value {value!r} in the CLI config, using the default 2."),
+    ]
@@ -11,8 +11,20 @@ from unittest import mock
 from unittest.mock import Mock
 
 import httpx
-
-from deepfellow.common.registry import _parse_tag, get_newest_image_tag
+import pytest
+
+from deepfellow.common.bundle import save_bundle_images
+from deepfellow.common.registry import (
+    _get_registry_token,
+    _parse_tag,
+    get_bundle_image,
+    get_install_image,
+    get_newest_image_tag,
+    get_remote_digest,
+    is_image_up_to_date,
+    split_image,
+)
+from deepfellow.common.state import state
 
 HUB = "hub.example.com/org/image"
 IMAGE_PATH = "org/image"
@@ -51,23 +63,24 @@ def _make_probe_response(realm: str, service: str = "Docker registry") -> Mock:
     return resp
 
 
-def _make_token_response(token: str) -> Mock:
+def _make_token_response(token: str, expires_in: int | None = None) -> Mock:
     resp = Mock(spec=httpx.Response)
     resp.status_code = 200
-    resp.json.return_value = {"token": token}
+    resp.json.return_value = {"token": token, "expires_in": expires_in}
     resp.raise_for_status = Mock()
     return resp
 
 
-def _make_tags_response(tags: list[str]) -> Mock:
+def _make_tags_response(tags: list[str], next_url: str | None = None) -> Mock:
     resp = Mock(spec=httpx.Response)
     resp.status_code = 200
     resp.json.return_value = {"name": IMAGE_PATH, "tags": tags}
     resp.raise_for_status = Mock()
+    resp.links = {"next": {"url": next_url, "rel": "next"}} if next_url else {}
     return resp
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_returns_highest_semver(mock_get: Mock) -> None:
     mock_get.side_effect = [
         _make_probe_response("https://auth.example.com/token"),
@@ -80,7 +93,7 @@ def test_get_newest_image_tag_returns_highest_semver(mock_get: Mock) -> None:
     assert result == f"{HUB}:v0.27.0"
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_plain_semver_beats_lower_v_tag(mock_get: Mock) -> None:
     mock_get.side_effect = [
         _make_probe_response("https://auth.example.com/token"),
@@ -93,7 +106,7 @@ def test_get_newest_image_tag_plain_semver_beats_lower_v_tag(mock_get: Mock) ->
     assert result == f"{HUB}:0.27.1"
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_falls_back_to_latest_on_http_error(mock_get: Mock) -> None:
     mock_get.side_effect = httpx.ConnectError("unreachable")
 
@@ -102,7 +115,7 @@ def test_get_newest_image_tag_falls_back_to_latest_on_http_error(mock_get: Mock)
     assert result == f"{HUB}:latest"
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_falls_back_when_no_semver_tags(mock_get: Mock) -> None:
     mock_get.side_effect = [
         _make_probe_response("https://auth.example.com/token"),
@@ -115,7 +128,7 @@ def test_get_newest_image_tag_falls_back_when_no_semver_tags(mock_get: Mock) ->
     assert result == f"{HUB}:latest"
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_falls_back_when_token_missing(mock_get: Mock) -> None:
     probe = Mock(spec=httpx.Response)
     probe.status_code = 401
@@ -127,7 +140,7 @@ def test_get_newest_image_tag_falls_back_when_token_missing(mock_get: Mock) -> N
     assert result == f"{HUB}:latest"
 
 
-@mock.patch("deepfellow.common.registry.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_newest_image_tag_falls_back_when_tags_request_raises(mock_get: Mock) -> None:
     tags_resp = Mock(spec=httpx.Response)
     tags_resp.raise_for_status.side_effect = httpx.HTTPStatusError("403", request=Mock(), response=Mock())
@@ -140,3 +153,295 @@ def test_get_newest_image_tag_falls_back_when_tags_request_raises(mock_get: Mock
     result = get_newest_image_tag(HUB)
 
     assert result == f"{HUB}:latest"
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_follows_link_pagination(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"], next_url=f"/v2/{IMAGE_PATH}/tags/list?n=2&last=0.25.0"),
+        _make_tags_response(["0.26.0", "latest"]),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.26.0"
+
+    assert mock_get.call_args_list[2].args == (f"https://hub.example.com/v2/{IMAGE_PATH}/tags/list",)
+    assert mock_get.call_args_list[2].kwargs["params"] == {"n": 1000}
+    assert mock_get.call_args_list[3].args == (f"https://hub.example.com/v2/{IMAGE_PATH}/tags/list?n=2&last=0.25.0",)
+    assert mock_get.call_args_list[3].kwargs["params"] is None
+
+
+@mock.patch("deepfellow.common.registry.TAGS_PAGE_SIZE", 2)
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_asks_for_next_page_without_link(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"]),
+        _make_tags_response(["0.30.0"]),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.30.0"
+    assert mock_get.call_args_list[3].kwargs["params"] == {"n": 2, "last": "0.25.0"}
+
+
+@mock.patch("deepfellow.common.registry.TAGS_PAGE_SIZE", 2)
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_stops_when_registry_repeats_page(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"]),
+        _make_tags_response(["0.24.0", "0.25.0"]),
+        AssertionError("the repeated page must end the listing"),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+    assert mock_get.call_count == 4
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_stops_when_link_does_not_advance(mock_get: Mock) -> None:
+    next_url = f"/v2/{IMAGE_PATH}/tags/list?n=2&last=0.25.0"
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"], next_url=next_url),
+        _make_tags_response(["0.23.0", "0.24.0"], next_url=next_url),
+        AssertionError("the already listed page must end the listing"),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+    assert mock_get.call_count == 4
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_stops_on_empty_page_linking_to_itself(mock_get: Mock) -> None:
+    next_url = f"/v2/{IMAGE_PATH}/tags/list?n=2&last=0.25.0"
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"], next_url=next_url),
+        _make_tags_response([], next_url=next_url),
+        AssertionError("the empty page must end the listing"),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+    assert mock_get.call_count == 4
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_follows_links_regardless_of_tag_order(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.25.0", "0.24.0"], next_url=f"/v2/{IMAGE_PATH}/tags/list?page=2"),
+        _make_tags_response(["0.27.0", "0.23.0"], next_url=f"/v2/{IMAGE_PATH}/tags/list?page=3"),
+        _make_tags_response(["0.26.0"]),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.27.0"
+    assert mock_get.call_count == 5
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_is_cached_per_hub(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0", "0.25.0"]),
+    ]
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+
+    assert mock_get.call_count == 3
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_cache_expires(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok", expires_in=300),
+        _make_tags_response(["0.24.0"]),
+        _make_tags_response(["0.24.0", "0.25.0"]),
+    ]
+
+    with mock.patch("deepfellow.common.cache.time.time", return_value=1000.0):
+        assert get_newest_image_tag(HUB) == f"{HUB}:0.24.0"
+
+    with mock.patch("deepfellow.common.cache.time.time", return_value=1601.0):
+        assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+
+    # The token is still valid, so the second lookup only fetches the tags
+    assert mock_get.call_count == 4
+
+
+@mock.patch("httpx.Client.get")
+def test_get_newest_image_tag_bypasses_cache_with_no_cache(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.24.0"]),
+        _make_tags_response(["0.25.0"]),
+    ]
+    get_newest_image_tag(HUB)
+    state.no_cache = True
+
+    assert get_newest_image_tag(HUB) == f"{HUB}:0.25.0"
+
+
+@mock.patch("httpx.Client.get")
+def test_registry_token_is_fetched_again_after_expiry(mock_get: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("first", expires_in=60),
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("second", expires_in=60),
+    ]
+
+    with mock.patch("deepfellow.common.registry.time.monotonic", return_value=0.0):
+        assert _get_registry_token("hub.example.com", IMAGE_PATH) == "first"
+        assert _get_registry_token("hub.example.com", IMAGE_PATH) == "first"
+
+    with mock.patch("deepfellow.common.registry.time.monotonic", return_value=51.0):
+        assert _get_registry_token("hub.example.com", IMAGE_PATH) == "second"
+
+
+# --- split_image ---
+
+
+@pytest.mark.parametrize(
+    ("image", "expected"),
+    [
+        (f"{HUB}:0.15.0", ("hub.example.com", IMAGE_PATH, "0.15.0")),
+        (HUB, ("hub.example.com", IMAGE_PATH, "latest")),
+        ("localhost:5000/image:dev", ("localhost:5000", "image", "dev")),
+        (f"{HUB}@sha256:abc", ("hub.example.com", IMAGE_PATH, "sha256:abc")),
+        ("nginx:1.27-alpine", ("registry-1.docker.io", "library/nginx", "1.27-alpine")),
+        ("qdrant/qdrant:v1.15", ("registry-1.docker.io", "qdrant/qdrant", "v1.15")),
+    ],
+)
+def test_split_image(image: str, expected: tuple[str, str, str]) -> None:
+    assert split_image(image) == expected
+
+
+# --- get_remote_digest ---
+
+
+def _make_manifest_response(digest: str) -> Mock:
+    resp = Mock(spec=httpx.Response)
+    resp.status_code = 200
+    resp.headers = {"docker-content-digest": digest}
+    resp.raise_for_status = Mock()
+    return resp
+
+
+@mock.patch("httpx.Client.head")
+@mock.patch("httpx.Client.get")
+def test_get_remote_digest_heads_manifest_with_token(mock_get: Mock, mock_head: Mock) -> None:
+    mock_get.side_effect = [_make_probe_response("https://auth.example.com/token"), _make_token_response("tok")]
+    mock_head.return_value = _make_manifest_response("sha256:remote")
+
+    assert get_remote_digest(f"{HUB}:0.15.0") == "sha256:remote"
+
+    assert mock_head.call_args.args == (f"https://hub.example.com/v2/{IMAGE_PATH}/manifests/0.15.0",)
+    headers = mock_head.call_args.kwargs["headers"]
+    assert headers["Authorization"] == "Bearer tok"
+    assert "application/vnd.oci.image.index.v1+json" in headers["Accept"]
+
+
+@mock.patch("httpx.Client.head")
+@mock.patch("httpx.Client.get")
+def test_get_remote_digest_returns_none_on_http_error(mock_get: Mock, mock_head: Mock) -> None:
+    mock_get.side_effect = [_make_probe_response("https://auth.example.com/token"), _make_token_response("tok")]
+    mock_head.side_effect = httpx.ConnectError("unreachable")
+
+    assert get_remote_digest(f"{HUB}:0.15.0") is None
+
+
+@mock.patch("httpx.Client.head")
+def test_get_remote_digest_of_pinned_image_skips_registry(mock_head: Mock) -> None:
+    assert get_remote_digest(f"{HUB}@sha256:pinned") == "sha256:pinned"
+    mock_head.assert_not_called()
+
+
+# --- get_install_image ---
+
+
+@mock.patch("deepfellow.common.registry.list_image_tags", return_value=["latest", "0.9.0", "0.15.0", "0.10.1"])
+def test_get_bundle_image_returns_newest_bundled_image_present(mock_tags: Mock) -> None:
+    save_bundle_images([f"{HUB}:0.9.0", f"{HUB}:0.15.0", f"{HUB}:0.16.0", "mongo:8.2.7"])
+
+    # 0.16.0 was removed after the import, 0.10.1 was not imported
+    assert get_bundle_image(HUB) == f"{HUB}:0.15.0"
+    assert mock_tags.call_args == mock.call(HUB)
+
+
+@mock.patch("deepfellow.common.registry.list_image_tags")
+def test_get_bundle_image_without_bundle_does_not_list_images(mock_tags: Mock) -> None:
+    assert get_bundle_image(HUB) is None
+    mock_tags.assert_not_called()
+
+
+@mock.patch("deepfellow.common.registry.get_registry_image", return_value=None)
+@mock.patch("deepfellow.common.registry.list_image_tags", return_value=["0.15.0"])
+def test_get_install_image_offline_uses_bundle_image(mock_tags: Mock, mock_registry: Mock) -> None:
+    save_bundle_images([f"{HUB}:0.15.0"])
+
+    assert get_install_image(HUB) == f"{HUB}:0.15.0"
+
+
+@mock.patch("deepfellow.common.registry.get_registry_image", return_value=None)
+def test_get_install_image_offline_without_bundle_falls_back_to_latest(mock_registry: Mock) -> None:
+    assert get_install_image(HUB) == f"{HUB}:latest"
+
+
+@mock.patch("deepfellow.common.registry.list_image_tags")
+@mock.patch("httpx.Client.get")
+def test_get_install_image_prefers_reachable_registry_over_old_bundle(mock_get: Mock, mock_tags: Mock) -> None:
+    save_bundle_images([f"{HUB}:0.15.0"])
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.15.0", "0.16.0"]),
+    ]
+
+    assert get_install_image(HUB) == f"{HUB}:0.16.0"
+    mock_tags.assert_not_called()
+
+
+@mock.patch("deepfellow.common.registry.list_image_tags", return_value=["0.15.0"])
+@mock.patch("httpx.Client.get")
+def test_get_install_image_online_picks_registry_newest_over_older_local_tag(mock_get: Mock, mock_tags: Mock) -> None:
+    mock_get.side_effect = [
+        _make_probe_response("https://auth.example.com/token"),
+        _make_token_response("tok"),
+        _make_tags_response(["0.15.0", "0.16.0", "latest"]),
+    ]
+
+    assert get_install_image(HUB) == f"{HUB}:0.16.0"
+
+
+# --- is_image_up_to_date ---
+
+
+@pytest.mark.parametrize(
+    ("remote_digest", "repo_digests", "expected"),
+    [
+        ("sha256:same", [f"{HUB}@sha256:other", f"{HUB}@sha256:same"], True),
+        ("sha256:new", [f"{HUB}@sha256:old"], False),
+        ("sha256:new", [], False),
+        (None, [f"{HUB}@sha256:old"], False),
+    ],
+)
+@mock.patch("deepfellow.common.registry.get_image_repo_digests")
+@mock.patch("deepfellow.common.registry.get_remote_digest")
+def test_is_image_up_to_date(
+    mock_remote: Mock, mock_local: Mock, remote_digest: str | None, repo_digests: list[str], expected: bool
+) -> None:
+    mock_remote.return_value = remote_digest
+    mock_local.return_value = repo_digests
+
+    assert is_image_up_to_date(f"{HUB}:0.15.0") is expected
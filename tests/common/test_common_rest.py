@@ -9,10 +9,32 @@
 
 """Tests for the rest module."""
 
+import asyncio
+import json
 from pathlib import Path
 from unittest import mock
 
-from deepfellow.common.rest import get_server_url
+import httpx
+import pytest
+
+from deepfellow.common.rest import (
+    CIRCUIT_BREAKER_THRESHOLD,
+    HEALTH_CHECK_TIMEOUT,
+    BulkReport,
+    BulkRequest,
+    BulkResult,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    bulk_request,
+    check_health,
+    get,
+    get_server_url,
+    paginate,
+    parse_retry_after,
+    send_request,
+    token_refresher,
+)
 from deepfellow.common.state import state
 
 
@@ -28,3 +50,414 @@ def test_get_server_url_calls_env_set_when_config_file_set_and_no_existing_serve
     assert mock_env_set.call_args == mock.call(
         Path("/fake/.env"), "SERVER_URL", "http://example.com", should_raise=False, docker_note=False
     )
+
+
+@mock.patch("deepfellow.common.rest.check_health")
+def test_get_server_url_checks_health_once_within_ttl(mock_check_health):
+    state.cli_config = {"df_server_url": "http://example.com"}
+
+    assert get_server_url(None) == "http://example.com"
+    assert get_server_url(None) == "http://example.com"
+
+    assert mock_check_health.call_count == 1
+
+
+@mock.patch("deepfellow.common.rest.check_health")
+@mock.patch("httpx.Client.request", side_effect=httpx.ConnectError("Connection refused"))
+def test_connection_error_drops_cached_health(mock_request, mock_check_health):
+    state.cli_config = {"df_server_url": "http://example.com", "df_http_retries": "0"}
+    get_server_url(None)
+
+    with pytest.raises(httpx.ConnectError):
+        send_request("POST", "http://example.com/auth/login")
+
+    get_server_url(None)
+    assert mock_check_health.call_count == 2
+
+
+@mock.patch("httpx.Client.request")
+def test_get_with_cache_serves_cached_body_on_304(mock_request):
+    request = httpx.Request("GET", "http://example.com/items")
+    mock_request.side_effect = [
+        httpx.Response(200, json={"data": [1]}, headers={"ETag": '"v1"'}, request=request),
+        httpx.Response(304, request=request),
+    ]
+
+    assert get("http://example.com/items", "token", cache=True) == {"data": [1]}
+    assert get("http://example.com/items", "token", cache=True) == {"data": [1]}
+
+    assert "If-None-Match" not in mock_request.call_args_list[0].kwargs["headers"]
+    assert mock_request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+
+@mock.patch("httpx.Client.request")
+def test_get_with_cache_keeps_organizations_apart(mock_request):
+    request = httpx.Request("GET", "http://example.com/projects")
+    mock_request.side_effect = [
+        httpx.Response(200, json={"data": ["a"]}, headers={"ETag": '"a"'}, request=request),
+        httpx.Response(200, json={"data": ["b"]}, headers={"ETag": '"b"'}, request=request),
+        httpx.Response(304, request=request),
+    ]
+
+    org_a = get("http://example.com/projects", "token", {"OpenAI-Organization": "org-a"}, cache=True)
+    org_b = get("http://example.com/projects", "token", {"OpenAI-Organization": "org-b"}, cache=True)
+    org_a_again = get("http://example.com/projects", "token", {"OpenAI-Organization": "org-a"}, cache=True)
+
+    assert org_a == {"data": ["a"]}
+    assert org_b == {"data": ["b"]}
+    assert org_a_again == {"data": ["a"]}
+    assert "If-None-Match" not in mock_request.call_args_list[1].kwargs["headers"]
+    assert mock_request.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"a"'
+
+
+@mock.patch("httpx.Client.request")
+def test_get_with_no_cache_skips_revalidation(mock_request):
+    request = httpx.Request("GET", "http://example.com/items")
+    mock_request.return_value = httpx.Response(200, json={"data": [1]}, headers={"ETag": '"v1"'}, request=request)
+    get("http://example.com/items", "token", cache=True)
+    state.no_cache = True
+
+    get("http://example.com/items", "token", cache=True)
+
+    assert "If-None-Match" not in mock_request.call_args_list[1].kwargs["headers"]
+
+
+@mock.patch("deepfellow.common.rest.get")
+def test_paginate_follows_after_cursor_until_has_more_is_false(mock_get):
+    mock_get.side_effect = [
+        {"data": [{"id": "a"}, {"id": "b"}], "has_more": True},
+        {"data": [{"id": "c"}], "has_more": False},
+    ]
+
+    items = paginate("http://example.com/items", "token", page_size=2)
+    assert mock_get.call_count == 0  # nothing is fetched before iterating
+    assert [item["id"] for item in items] == ["a", "b", "c"]
+
+    assert mock_get.call_args_list[0].args[0] == "http://example.com/items?limit=2"
+    assert mock_get.call_args_list[1].args[0] == "http://example.com/items?limit=2&after=b"
+
+
+@mock.patch("deepfellow.common.rest.echo")
+@mock.patch("deepfellow.common.rest.get", return_value={"data": [{"id": "a"}, {"id": "b"}], "has_more": True})
+def test_paginate_stops_when_cursor_repeats(mock_get, mock_echo):
+    items = list(paginate("http://example.com/items", "token", page_size=2))
+
+    assert [item["id"] for item in items] == ["a", "b"]
+    assert mock_get.call_count == 2
+    assert mock_echo.warning.call_count == 1
+
+
+@mock.patch("deepfellow.common.rest.get", return_value={"data": [{"id": "a"}], "has_more": False})
+def test_paginate_passes_cache_flag(mock_get):
+    list(paginate("http://example.com/items", "token"))
+    list(paginate("http://example.com/items", "token", cache=False))
+
+    assert mock_get.call_args_list[0].kwargs["cache"] is True
+    assert mock_get.call_args_list[1].kwargs["cache"] is False
+
+
+@mock.patch("deepfellow.common.rest.get")
+def test_paginate_stops_fetching_at_limit(mock_get):
+    mock_get.side_effect = [
+        {"data": [{"id": "a"}, {"id": "b"}], "has_more": True},
+        {"data": [{"id": "c"}], "has_more": True},
+    ]
+
+    assert [item["id"] for item in paginate("http://example.com/items", "token", limit=3, page_size=2)] == [
+        "a",
+        "b",
+        "c",
+    ]
+
+    assert mock_get.call_args_list[1].args[0] == "http://example.com/items?limit=1&after=b"
+    assert mock_get.call_count == 2
+
+
+@mock.patch("deepfellow.common.rest.get", return_value={"data": [{"id": "a"}, {"id": "b"}]})
+def test_paginate_single_page_without_has_more(mock_get):
+    assert len(list(paginate("http://example.com/items", "token"))) == 2
+    assert mock_get.call_count == 1
+
+
+def bulk_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_bulk_request_collects_errors(mock_create_async_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/items/2":
+            return httpx.Response(403, json={"detail": "Forbidden"})
+        if request.url.path == "/items/3":
+            raise httpx.ConnectError("Connection refused")
+        return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+    mock_create_async_client.side_effect = lambda: bulk_client(handler)
+    requests = [BulkRequest("GET", f"http://server/items/{i}", label=f"item {i}") for i in range(1, 5)]
+
+    report = bulk_request(requests, "token")
+
+    assert [result.ok for result in report.results] == [True, False, False, True]
+    assert report.results[0].data == {"id": "1"}
+    assert report.results[1].status_code == 403
+    assert report.results[1].error == "Forbidden"
+    assert report.results[2].error == "Connection refused"
+    assert len(report.succeeded) == 2
+    assert len(report.failed) == 2
+
+
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_bulk_request_sends_token_and_data(mock_create_async_client):
+    received: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        received.append(request)
+        return httpx.Response(204)
+
+    mock_create_async_client.side_effect = lambda: bulk_client(handler)
+
+    report = bulk_request([BulkRequest("POST", "http://server/items", data={"name": "a"})], "token")
+
+    assert report.results[0].ok
+    assert report.results[0].data is None
+    assert received[0].headers["Authorization"] == "Bearer token"
+    assert json.loads(received[0].content) == {"name": "a"}
+
+
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_bulk_request_bounds_concurrency(mock_create_async_client):
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    mock_create_async_client.side_effect = lambda: bulk_client(handler)
+
+    report = bulk_request([BulkRequest("GET", f"http://server/items/{i}") for i in range(10)], "token", concurrency=3)
+
+    assert len(report.succeeded) == 10
+    assert max_in_flight == 3
+
+
+@mock.patch("deepfellow.common.rest.echo")
+def test_bulk_report_print(mock_echo):
+    request = BulkRequest("DELETE", "http://server/items/1")
+    report = BulkReport(results=[BulkResult(request, error="Not found"), BulkResult(request, data={})], elapsed=1.0)
+
+    report.print()
+
+    mock_echo.error.assert_called_once_with("DELETE http://server/items/1: Not found")
+    mock_echo.warning.assert_called_once_with("1 of 2 requests succeeded in 1.0s.")
+
+
+@pytest.mark.parametrize(
+    ("method", "status_code", "exc", "expected"),
+    [
+        ("GET", 503, None, True),
+        ("GET", 429, None, True),
+        ("GET", 404, None, False),
+        ("GET", 200, None, False),
+        ("POST", 503, None, False),
+        ("POST", 429, None, True),
+        ("POST", None, httpx.ConnectError("refused"), True),
+        ("POST", None, httpx.ReadTimeout("timeout"), False),
+        ("DELETE", None, httpx.ReadTimeout("timeout"), True),
+    ],
+)
+def test_retry_policy_should_retry(method, status_code, exc, expected):
+    response = httpx.Response(status_code) if status_code else None
+
+    assert RetryPolicy().should_retry(method, 0, response=response, exc=exc) is expected
+
+
+def test_retry_policy_stops_after_retries():
+    assert not RetryPolicy(retries=2).should_retry("GET", 2, response=httpx.Response(503))
+
+
+def test_retry_policy_from_config():
+    state.cli_config = {"df_http_retries": "5", "df_http_backoff": "0.1"}
+
+    assert RetryPolicy.from_config() == RetryPolicy(retries=5, backoff=0.1)
+
+
+@mock.patch("deepfellow.common.rest.random.uniform", side_effect=lambda low, high: high)
+def test_retry_policy_delay_exponential_backoff(mock_uniform):
+    policy = RetryPolicy(backoff=0.5, max_backoff=3.0)
+
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_retry_policy_delay_honours_retry_after():
+    response = httpx.Response(429, headers={"Retry-After": "7"})
+
+    assert RetryPolicy().delay(0, response) == 7.0
+
+
+@pytest.mark.parametrize(("value", "expected"), [(None, None), ("", None), ("3", 3.0), ("-1", 0.0), ("soon", None)])
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+@mock.patch("deepfellow.common.rest.get_client")
+def test_check_health_uses_short_timeout(mock_get_client):
+    mock_get_client.return_value.request.return_value = httpx.Response(200)
+
+    check_health("http://server")
+
+    assert mock_get_client.return_value.request.call_args == mock.call(
+        "GET", "http://server/health", timeout=HEALTH_CHECK_TIMEOUT
+    )
+
+
+@mock.patch("deepfellow.common.rest.time.sleep")
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_retries_transient_errors(mock_get_client, mock_sleep):
+    mock_get_client.return_value.request.side_effect = [
+        httpx.ConnectError("refused"),
+        httpx.Response(503),
+        httpx.Response(200, json={"ok": True}),
+    ]
+
+    response = send_request("GET", "http://server/items")
+
+    assert response.status_code == 200
+    assert mock_get_client.return_value.request.call_count == 3
+    assert mock_sleep.call_count == 2
+
+
+@mock.patch("deepfellow.common.rest.time.sleep")
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_does_not_repeat_non_idempotent_request(mock_get_client, mock_sleep):
+    mock_get_client.return_value.request.return_value = httpx.Response(503)
+
+    response = send_request("POST", "http://server/items", json={})
+
+    assert response.status_code == 503
+    mock_sleep.assert_not_called()
+
+
+@mock.patch("deepfellow.common.rest.time.sleep")
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_raises_after_last_attempt(mock_get_client, mock_sleep):
+    state.cli_config = {"df_http_retries": "2"}
+    mock_get_client.return_value.request.side_effect = httpx.ConnectError("refused")
+
+    with pytest.raises(httpx.ConnectError):
+        send_request("GET", "http://server/items")
+
+    assert mock_get_client.return_value.request.call_count == 3
+
+
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_fails_fast_when_circuit_is_open(mock_get_client):
+    state.cli_config = {"df_http_retries": "0"}
+    mock_get_client.return_value.request.side_effect = httpx.ConnectError("refused")
+    for _ in range(CIRCUIT_BREAKER_THRESHOLD):
+        with pytest.raises(httpx.ConnectError):
+            send_request("GET", "http://server/items")
+
+    with pytest.raises(CircuitOpenError):
+        send_request("GET", "http://server/items")
+
+    assert mock_get_client.return_value.request.call_count == CIRCUIT_BREAKER_THRESHOLD
+
+
+@mock.patch("deepfellow.common.rest.time.monotonic")
+def test_circuit_breaker_closes_after_cooldown_and_success(mock_monotonic):
+    breaker = CircuitBreaker(threshold=2, cooldown=10.0)
+    mock_monotonic.return_value = 100.0
+    breaker.record("server", success=False)
+    breaker.record("server", success=False)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.check("server")
+
+    breaker.check("other")
+    mock_monotonic.return_value = 111.0
+    breaker.check("server")
+    breaker.record("server", success=True)
+    assert breaker.failures == {}
+    assert breaker.opened_at == {}
+
+
+@mock.patch("deepfellow.common.rest.asyncio.sleep")
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_bulk_request_retries_transient_errors(mock_create_async_client, mock_sleep):
+    responses = iter([httpx.Response(502), httpx.Response(200, json={"id": "1"})])
+    mock_create_async_client.side_effect = lambda: bulk_client(lambda request: next(responses))
+
+    report = bulk_request([BulkRequest("GET", "http://server/items/1")], "token")
+
+    assert report.results[0].data == {"id": "1"}
+    mock_sleep.assert_awaited_once()
+
+
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_refreshes_rejected_token_once(mock_get_client):
+    refresh = mock.Mock(return_value="new-token")
+    token_refresher.register("old-token", refresh)
+    mock_get_client.return_value.request.side_effect = [httpx.Response(401), httpx.Response(200), httpx.Response(200)]
+
+    first = send_request("GET", "http://server/items", headers={"Authorization": "Bearer old-token"})
+    second = send_request("GET", "http://server/items", headers={"Authorization": "Bearer old-token"})
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    refresh.assert_called_once_with()
+    sent_headers = [call.kwargs["headers"] for call in mock_get_client.return_value.request.call_args_list]
+    assert sent_headers == [
+        {"Authorization": "Bearer old-token"},
+        {"Authorization": "Bearer new-token"},
+        {"Authorization": "Bearer new-token"},
+    ]
+
+
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_does_not_refresh_refreshed_token_again(mock_get_client):
+    refresh = mock.Mock(return_value="new-token")
+    token_refresher.register("old-token", refresh)
+    mock_get_client.return_value.request.return_value = httpx.Response(401)
+
+    first = send_request("GET", "http://server/items", headers={"Authorization": "Bearer old-token"})
+    second = send_request("GET", "http://server/items", headers={"Authorization": "Bearer old-token"})
+
+    assert first.status_code == 401
+    assert second.status_code == 401
+    refresh.assert_called_once_with()
+    assert mock_get_client.return_value.request.call_count == 3
+
+
+@mock.patch("deepfellow.common.rest.get_client")
+def test_send_request_returns_401_for_unregistered_token(mock_get_client):
+    mock_get_client.return_value.request.return_value = httpx.Response(401)
+
+    response = send_request("GET", "http://server/items", headers={"Authorization": "Bearer token"})
+
+    assert response.status_code == 401
+    assert mock_get_client.return_value.request.call_count == 1
+
+
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_bulk_request_refreshes_rejected_token_once(mock_create_async_client):
+    refresh = mock.Mock(return_value="new-token")
+    token_refresher.register("old-token", refresh)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200 if request.headers["Authorization"] == "Bearer new-token" else 401)
+
+    mock_create_async_client.side_effect = lambda: bulk_client(handler)
+
+    report = bulk_request([BulkRequest("GET", f"http://server/items/{i}") for i in range(5)], "old-token")
+
+    assert len(report.succeeded) == 5
+    refresh.assert_called_once_with()
@@ -0,0 +1,153 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the restart of the compose services affected by a change."""
+
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+
+from deepfellow.common.restart import (
+    find_variables,
+    get_affected_services,
+    get_compose_config,
+    plan_restart,
+    recreate_services,
+    restart_changed_services,
+)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("${DF_A}", {"DF_A"}),
+        ("${DF_A:-default} ${DF_B-x} ${DF_C:?required}", {"DF_A", "DF_B", "DF_C"}),
+        ("$DF_A:$DF_B", {"DF_A", "DF_B"}),
+        ("$$NOT_A_VARIABLE ${DF_A}", {"DF_A"}),
+        (["${DF_A}:8000", {"key": "${DF_B}", "${DF_C}": 1}], {"DF_A", "DF_B", "DF_C"}),
+        (8000, set()),
+        ("plain", set()),
+    ],
+)
+def test_find_variables(value: Any, expected: set[str]) -> None:
+    assert find_variables(value) == expected
+
+
+def test_get_affected_services_keeps_compose_order() -> None:
+    compose = {
+        "services": {
+            "server": {"image": "${DF_SERVER_IMAGE}", "environment": ["DF_MONGO_URL=${DF_MONGO_URL}"]},
+            "mongo": {"image": "mongo", "ports": ["${DF_MONGO_PORT}:27017"]},
+            "qdrant": {"image": "qdrant/qdrant"},
+        }
+    }
+
+    assert get_affected_services(compose, ["DF_MONGO_PORT", "DF_MONGO_URL"]) == ["server", "mongo"]
+    assert get_affected_services(compose, ["DF_OTHER"]) == []
+    assert get_affected_services({}, ["DF_MONGO_URL"]) == []
+
+
+@mock.patch("deepfellow.common.restart.run")
+@mock.patch("deepfellow.common.restart.ensure_network")
+@mock.patch("deepfellow.common.restart.get_docker_network", return_value="deepfellow-net")
+def test_recreate_services_leaves_other_services(
+    mock_get_network: Mock, mock_ensure_network: Mock, mock_run: Mock, directory: Path
+) -> None:
+    downtime = recreate_services(directory, ["server"])
+
+    assert downtime >= 0
+
+    assert mock_ensure_network.call_args == mock.call("deepfellow-net")
+    assert mock_run.call_args == mock.call(
+        ["docker", "compose", "up", "-d", "--wait", "--no-deps", "--force-recreate", "server"], cwd=directory
+    )
+
+
+@pytest.mark.parametrize(
+    ("output", "expected"),
+    [
+        (
+            '{"name": "server", "services": {"server": {"image": "server:1"}}}',
+            {"name": "server", "services": {"server": {"image": "server:1"}}},
+        ),
+        (None, None),
+        ("not json", None),
+    ],
+)
+@mock.patch("deepfellow.common.restart.run")
+def test_get_compose_config(mock_run: Mock, output: str | None, expected: dict | None, directory: Path) -> None:
+    mock_run.return_value = output
+
+    assert get_compose_config(directory) == expected
+    assert mock_run.call_args == mock.call(
+        ["docker", "compose", "config", "--format", "json"], cwd=directory, capture_output=True
+    )
+
+
+def test_plan_restart_returns_changed_and_added_services() -> None:
+    before = {
+        "services": {
+            "server": {"environment": {"DF_OTEL_TRACING_ENABLED": "false"}},
+            "mongo": {"image": "mongo"},
+        }
+    }
+    after = {
+        "services": {
+            "server": {"environment": {"DF_OTEL_TRACING_ENABLED": "true"}},
+            "mongo": {"image": "mongo"},
+            "otel-collector": {"image": "otel"},
+        }
+    }
+
+    assert plan_restart(before, after) == ["server", "otel-collector"]
+    assert plan_restart(after, after) == []
+
+
+@mock.patch("deepfellow.common.restart.echo")
+@mock.patch("deepfellow.common.restart.recreate_services", return_value=2.5)
+@mock.patch("deepfellow.common.restart.get_compose_config")
+def test_restart_changed_services_recreates_planned_services(
+    mock_get_config: Mock, mock_recreate: Mock, mock_echo: Mock, directory: Path
+) -> None:
+    mock_get_config.return_value = {"services": {"server": {"image": "server:2"}, "mongo": {"image": "mongo"}}}
+
+    restart_changed_services(directory, {"services": {"server": {"image": "server:1"}, "mongo": {"image": "mongo"}}})
+
+    assert mock_recreate.call_args == mock.call(directory, ["server"])
+    assert mock_echo.info.call_args == mock.call("Recreated server, downtime 2.5s.")
+
+
+@mock.patch("deepfellow.common.restart.echo")
+@mock.patch("deepfellow.common.restart.recreate_services")
+@mock.patch("deepfellow.common.restart.get_compose_config")
+def test_restart_changed_services_nothing_changed(
+    mock_get_config: Mock, mock_recreate: Mock, mock_echo: Mock, directory: Path
+) -> None:
+    mock_get_config.return_value = {"services": {"server": {"image": "server:1"}}}
+
+    restart_changed_services(directory, {"services": {"server": {"image": "server:1"}}})
+
+    assert mock_recreate.call_count == 0
+    assert mock_echo.info.call_args == mock.call("No service configuration changed, nothing to restart.")
+
+
+@mock.patch("deepfellow.common.restart.echo")
+@mock.patch("deepfellow.common.restart.recreate_services", return_value=1.0)
+@mock.patch("deepfellow.common.restart.load_compose_file", return_value={"services": {"infra": {}, "other": {}}})
+@mock.patch("deepfellow.common.restart.get_compose_config", return_value=None)
+def test_restart_changed_services_without_config_recreates_all_services(
+    mock_get_config: Mock, mock_load: Mock, mock_recreate: Mock, mock_echo: Mock, directory: Path
+) -> None:
+    restart_changed_services(directory, None)
+
+    assert mock_load.call_args == mock.call(directory / "compose.yaml")
+    assert mock_recreate.call_args == mock.call(directory, ["infra", "other"])
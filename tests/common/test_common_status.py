@@ -0,0 +1,172 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the status module."""
+
+import json
+from collections import deque
+from pathlib import Path
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+
+from deepfellow.common.defaults import OutputFormatChoice
+from deepfellow.common.status import (
+    ContainerStatus,
+    get_status,
+    parse_percent,
+    print_status,
+    sparkline,
+    status_table,
+    watch_status,
+)
+
+
+@pytest.fixture
+def containers() -> list[dict]:
+    return [
+        {"Name": "server-server-1", "Service": "server", "Image": "server:1.0.0", "State": "running"},
+        {"Name": "server-mongo-1", "Service": "mongo", "Image": "mongo:8", "State": "exited", "Status": "Exited (0)"},
+    ]
+
+
+@pytest.fixture
+def usage() -> dict[str, dict[str, str]]:
+    return {
+        "server-server-1": {
+            "Name": "server-server-1",
+            "CPUPerc": "1.50%",
+            "MemUsage": "100MiB / 1GiB",
+            "MemPerc": "9.77%",
+            "NetIO": "1kB / 2kB",
+            "BlockIO": "0B / 0B",
+            "PIDs": "5",
+        },
+        "other-1": {"Name": "other-1", "CPUPerc": "99.00%"},
+    }
+
+
+def test_container_status_from_docker(containers: list[dict], usage: dict):
+    container_status = ContainerStatus.from_docker(containers[0], usage["server-server-1"])
+
+    assert container_status.service == "server"
+    assert container_status.cpu == "1.50%"
+    assert container_status.memory_usage == "100MiB"
+    assert container_status.memory_limit == "1GiB"
+    assert container_status.pids == "5"
+
+
+def test_container_status_from_docker_without_usage(containers: list[dict]):
+    container_status = ContainerStatus.from_docker(containers[1])
+
+    assert container_status.state == "exited"
+    assert container_status.cpu is None
+    assert container_status.memory_usage is None
+
+
+@mock.patch("deepfellow.common.status.docker_stats")
+@mock.patch("deepfellow.common.status.docker_ps")
+def test_get_status(mock_docker_ps: Mock, mock_docker_stats: Mock, containers: list[dict], usage: dict):
+    mock_docker_ps.return_value = containers
+    mock_docker_stats.return_value = usage
+
+    statuses = get_status(Path("/fake/dir"))
+
+    assert [container_status.service for container_status in statuses] == ["mongo", "server"]
+    assert statuses[0].cpu is None
+    assert statuses[1].cpu == "1.50%"
+    mock_docker_ps.assert_called_once_with(Path("/fake/dir"))
+    mock_docker_stats.assert_called_once_with(Path("/fake/dir"))
+
+
+def test_status_table(containers: list[dict], usage: dict):
+    statuses = [ContainerStatus.from_docker(container, usage.get(container["Name"])) for container in containers]
+
+    table = status_table(statuses)
+
+    assert table.row_count == 2
+    assert [column.header for column in table.columns][:3] == ["SERVICE", "IMAGE", "STATUS"]
+
+
+@mock.patch("deepfellow.common.status.echo")
+def test_print_status_json(mock_echo: Mock, containers: list[dict]):
+    statuses = [ContainerStatus.from_docker(container) for container in containers]
+
+    print_status(statuses, "server", OutputFormatChoice.json)
+
+    data = mock_echo.print_json.call_args.kwargs["data"]
+    assert json.loads(json.dumps(data))[0]["name"] == "server-server-1"
+    mock_echo.print.assert_not_called()
+
+
+@mock.patch("deepfellow.common.status.echo")
+def test_print_status_empty(mock_echo: Mock):
+    print_status([], "server", OutputFormatChoice.table)
+
+    mock_echo.info.assert_called_once_with("No server container is currently running.")
+
+
+@pytest.mark.parametrize(("value", "expected"), [("1.50%", 1.5), ("--", 0.0), (None, 0.0)])
+def test_parse_percent(value: str | None, expected: float):
+    assert parse_percent(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"), [([], ""), ([0.0, 0.0], "▁▁"), ([0.0, 50.0, 100.0], "▁▅█"), ([10.0, 10.0], "██")]
+)
+def test_sparkline(values: list[float], expected: str):
+    assert sparkline(values) == expected
+
+
+def test_status_table_with_history(containers: list[dict], usage: dict):
+    statuses = [ContainerStatus.from_docker(container, usage.get(container["Name"])) for container in containers]
+
+    table = status_table(statuses, {"server-server-1": deque([0.0, 1.0], maxlen=5)})
+
+    assert table.columns[-1].header == "CPU HISTORY"
+    assert list(table.columns[-1].cells) == ["▁█", ""]
+
+
+@mock.patch("deepfellow.common.status.Live")
+@mock.patch("deepfellow.common.status.stream")
+@mock.patch("deepfellow.common.status.docker_ps")
+def test_watch_status(mock_docker_ps: Mock, mock_stream: Mock, mock_live: Mock, containers: list[dict]):
+    mock_docker_ps.return_value = containers
+    mock_stream.return_value = iter(
+        [
+            "\x1b[2J\x1b[H",
+            '{"Name": "server-server-1", "CPUPerc": "1.00%", "MemUsage": "10MiB / 1GiB"}',
+            "WARNING: daemon is running low on disk space",
+            '{"Name": "server-server-1", "CPUPerc"',
+            '{"Name": "other-1", "CPUPerc": "9.00%"}',
+            '{"Name": "server-server-1", "CPUPerc": "3.00%", "MemUsage": "12MiB / 1GiB"}',
+        ]
+    )
+
+    watch_status(Path("/fake/dir"), "server", interval=0, history_size=2)
+
+    mock_stream.assert_called_once_with(
+        ["docker", "stats", "--format", "{{json .}}", "server-server-1"], cwd=Path("/fake/dir")
+    )
+    live = mock_live.return_value.__enter__.return_value
+    assert live.update.call_count == 2
+    table = live.update.call_args.args[0]
+    assert list(table.columns[4].cells) == ["N/A", "3.00%"]
+    assert list(table.columns[-1].cells) == ["", "▃█"]
+
+
+@mock.patch("deepfellow.common.status.echo")
+@mock.patch("deepfellow.common.status.stream")
+@mock.patch("deepfellow.common.status.docker_ps", return_value=[])
+def test_watch_status_nothing_running(mock_docker_ps: Mock, mock_stream: Mock, mock_echo: Mock):
+    watch_status(Path("/fake/dir"), "server")
+
+    mock_echo.info.assert_called_once_with("No server container is currently running.")
+    mock_stream.assert_not_called()
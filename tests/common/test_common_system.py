@@ -17,7 +17,7 @@ import pytest
 import typer
 
 from deepfellow.common.state import state
-from deepfellow.common.system import rmtree
+from deepfellow.common.system import pipe, rmtree, stream
 
 
 @mock.patch("deepfellow.common.system.shutil.rmtree")
@@ -108,3 +108,35 @@ def test_rmtree_permission_error_user_declines_sudo_raises_exit(
     assert mock_run.call_count == 0
     assert mock_echo.error.call_count == 1
     assert mock_echo.error.call_args == mock.call(f"Remove manually: sudo rm -rf {directory.as_posix()}")
+
+
+def test_stream_yields_lines() -> None:
+    lines = stream(["printf", "first\\nsecond\\n"])
+
+    assert list(lines) == ["first", "second"]
+
+
+@mock.patch("deepfellow.common.system.subprocess.Popen")
+def test_stream_terminates_process_when_closed(mock_popen: Mock) -> None:
+    mock_popen.return_value.stdout = iter(["first\n", "second\n"])
+
+    lines = stream(["docker", "stats"])
+    assert next(lines) == "first"
+    lines.close()
+
+    mock_popen.return_value.terminate.assert_called_once()
+    mock_popen.return_value.wait.assert_called_once()
+
+
+def test_pipe_streams_source_into_sink() -> None:
+    assert pipe(["printf", "first\\nsecond\\n"], ["tr", "a-z", "A-Z"]) == "FIRST\nSECOND\n"
+
+
+def test_pipe_raises_on_failed_source() -> None:
+    with pytest.raises(ValueError, match="No such file"):
+        pipe(["cat", "/nonexistent/bundle"], ["cat"], raises=ValueError)
+
+
+def test_pipe_raises_on_failed_sink() -> None:
+    with pytest.raises(ValueError, match="No such file"):
+        pipe(["printf", "data"], ["cat", "-", "/nonexistent/bundle"], raises=ValueError)
@@ -0,0 +1,56 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the bearer token helpers."""
+
+import base64
+import json
+
+import pytest
+
+from deepfellow.common.token import get_token_claims, get_token_identity
+
+
+def make_jwt(payload: dict) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.signature"
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        (make_jwt({"sub": "user", "exp": 1}), {"sub": "user", "exp": 1}),
+        ("dfuser_opaque", {}),
+        ("a.!!!.c", {}),
+        (f"a.{base64.urlsafe_b64encode(b'[1]').decode()}.c", {}),
+    ],
+)
+def test_get_token_claims(token: str, expected: dict):
+    assert get_token_claims(token) == expected
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        (make_jwt({"sub": "user", "exp": 1}), "sub:user"),
+        (make_jwt({"sub": 42}), "sub:42"),
+        (make_jwt({"sub": ""}), f"token:{make_jwt({'sub': ''})}"),
+        ("dfproject_key", "token:dfproject_key"),
+    ],
+)
+def test_get_token_identity(token: str, expected: str):
+    assert get_token_identity(token) == expected
+
+
+def test_get_token_identity_is_stable_across_refresh():
+    assert get_token_identity(make_jwt({"sub": "user", "exp": 1})) == get_token_identity(
+        make_jwt({"sub": "user", "exp": 2})
+    )
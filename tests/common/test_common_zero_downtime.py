@@ -0,0 +1,220 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the blue/green update of a service behind its proxy."""
+
+import socket
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from unittest import mock
+from unittest.mock import Mock
+
+import pytest
+import typer
+import yaml
+
+from deepfellow.common.defaults import DOCKER_COMPOSE_CONFIG_FILENAME, DOCKER_COMPOSE_PROXY_IMAGE
+from deepfellow.common.docker import DockerError
+from deepfellow.common.zero_downtime import (
+    GapProbe,
+    enable_proxy,
+    get_container_port,
+    zero_downtime_update,
+)
+
+
+@pytest.fixture
+def compose() -> dict[str, Any]:
+    return {
+        "services": {
+            "server": {
+                "container_name": "server",
+                "image": "${DF_SERVER_IMAGE}",
+                "ports": ["${DF_SERVER_PORT}:8000"],
+                "networks": ["deepfellow-infra-net"],
+            },
+            "mongo": {"image": "mongo"},
+        }
+    }
+
+
+def serve_status(status: int) -> Iterator[int]:
+    """Serve the status code on every GET in the background, yield the port."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(status)
+            self.end_headers()
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def healthy_port() -> Iterator[int]:
+    yield from serve_status(200)
+
+
+@pytest.fixture
+def proxy_without_upstream_port() -> Iterator[int]:
+    yield from serve_status(502)
+
+
+@pytest.fixture
+def closed_port() -> int:
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        return int(server.getsockname()[1])
+
+
+@pytest.mark.parametrize(
+    ("mapping", "expected"),
+    [("${DF_INFRA_PORT}:8086", 8086), ("127.0.0.1:8000:8000/tcp", 8000), ("8000", 8000)],
+)
+def test_get_container_port(mapping: str, expected: int) -> None:
+    assert get_container_port(mapping) == expected
+
+
+def test_enable_proxy_moves_port_to_proxy(tmp_path: Path, compose: dict[str, Any]) -> None:
+    assert enable_proxy(tmp_path, compose, "server") is True
+
+    assert compose["services"]["server"] == {"image": "${DF_SERVER_IMAGE}", "networks": ["deepfellow-infra-net"]}
+    assert compose["services"]["server-proxy"] == {
+        "image": DOCKER_COMPOSE_PROXY_IMAGE,
+        "ports": ["${DF_SERVER_PORT}:8000"],
+        "volumes": ["./server-proxy.conf:/etc/nginx/nginx.conf:ro"],
+        "restart": "unless-stopped",
+        "depends_on": ["server"],
+        "networks": ["deepfellow-infra-net"],
+    }
+    config = (tmp_path / "server-proxy.conf").read_text()
+    assert "server server:8000;" in config
+    assert "listen 8000;" in config
+
+
+def test_enable_proxy_is_idempotent(tmp_path: Path, compose: dict[str, Any]) -> None:
+    enable_proxy(tmp_path, compose, "server")
+
+    assert enable_proxy(tmp_path, compose, "server") is False
+
+
+def test_enable_proxy_raises_without_port(tmp_path: Path, compose: dict[str, Any]) -> None:
+    with pytest.raises(ValueError, match="does not publish a port"):
+        enable_proxy(tmp_path, compose, "mongo")
+
+
+def test_gap_probe_healthy_service_has_no_gap(healthy_port: int) -> None:
+    with GapProbe(healthy_port, interval=0.01) as probe:
+        while not probe.reached:
+            pass
+
+    assert probe.longest_gap == 0.0
+
+
+def test_gap_probe_counts_proxy_error_as_gap(proxy_without_upstream_port: int) -> None:
+    with (
+        mock.patch("deepfellow.common.zero_downtime.time.monotonic", side_effect=[10.0, 11.5]),
+        GapProbe(proxy_without_upstream_port, interval=1) as probe,
+    ):
+        while probe._failed_since is None:
+            pass
+
+    assert probe.reached is False
+    assert probe.longest_gap == 1.5
+
+
+def test_gap_probe_measures_unreachable_port(closed_port: int) -> None:
+    with (
+        mock.patch("deepfellow.common.zero_downtime.time.monotonic", side_effect=[10.0, 12.5]),
+        GapProbe(closed_port, interval=1) as probe,
+    ):
+        while probe._failed_since is None:
+            pass
+
+    assert probe.reached is False
+    assert probe.longest_gap == 2.5
+
+
+@pytest.mark.parametrize(
+    ("tls", "url"), [(False, "http://127.0.0.1:8000/health"), (True, "https://127.0.0.1:8000/health")]
+)
+def test_gap_probe_requests_health_endpoint(tls: bool, url: str) -> None:
+    assert GapProbe(8000, tls=tls).url == url
+
+
+@pytest.fixture
+def mocks(tmp_path: Path, compose: dict[str, Any]) -> Iterator[Mock]:
+    (tmp_path / DOCKER_COMPOSE_CONFIG_FILENAME).write_text(yaml.dump(compose, sort_keys=False))
+    manager = Mock()
+    with (
+        mock.patch("deepfellow.common.zero_downtime.run", manager.run),
+        mock.patch("deepfellow.common.zero_downtime.list_containers", manager.list_containers),
+        mock.patch("deepfellow.common.zero_downtime.is_service_running", manager.is_service_running),
+        mock.patch("deepfellow.common.zero_downtime.ensure_network"),
+        mock.patch("deepfellow.common.zero_downtime.get_docker_network"),
+        mock.patch("deepfellow.common.zero_downtime.GapProbe") as probe,
+        mock.patch("deepfellow.common.zero_downtime.echo") as echo,
+    ):
+        manager.echo = echo
+        probe.return_value.__enter__.return_value.longest_gap = 0.2
+        yield manager
+
+
+def test_zero_downtime_update_switches_through_running_proxy(tmp_path: Path, mocks: Mock) -> None:
+    mocks.list_containers.return_value = ["old"]
+    mocks.is_service_running.return_value = True
+
+    zero_downtime_update(tmp_path, "server", 8000)
+
+    assert [call.args[0] for call in mocks.run.call_args_list] == [
+        ["docker", "compose", "up", "-d", "--wait", "--no-deps", "--no-recreate", "--scale", "server=2", "server"],
+        ["docker", "compose", "exec", "server-proxy", "nginx", "-s", "reload"],
+        ["docker", "stop", "--time", "30", "old"],
+        ["docker", "rm", "old"],
+        ["docker", "compose", "exec", "server-proxy", "nginx", "-s", "reload"],
+    ]
+    assert mocks.echo.success.call_args == mock.call("Switched server to the new container, longest gap 0.2s.")
+    saved = yaml.safe_load((tmp_path / DOCKER_COMPOSE_CONFIG_FILENAME).read_text())
+    assert "server-proxy" in saved["services"]
+
+
+def test_zero_downtime_update_starts_proxy_after_old_container_stops(tmp_path: Path, mocks: Mock) -> None:
+    mocks.list_containers.return_value = ["old"]
+    mocks.is_service_running.return_value = False
+
+    zero_downtime_update(tmp_path, "server", 8000)
+
+    assert [call.args[0] for call in mocks.run.call_args_list][1:4] == [
+        ["docker", "stop", "--time", "30", "old"],
+        ["docker", "compose", "up", "-d", "--no-deps", "server-proxy"],
+        ["docker", "rm", "old"],
+    ]
+
+
+def test_zero_downtime_update_keeps_old_container_when_new_is_unhealthy(tmp_path: Path, mocks: Mock) -> None:
+    mocks.list_containers.side_effect = [["old"], ["old", "new"]]
+    mocks.run.side_effect = [DockerError(), None]
+
+    with pytest.raises(typer.Exit):
+        zero_downtime_update(tmp_path, "server", 8000)
+
+    assert mocks.run.call_args_list[-1].args[0] == ["docker", "rm", "--force", "new"]
+    assert mocks.is_service_running.call_count == 0
@@ -8,9 +8,12 @@
 # limitations under the License.
 
 from pathlib import Path
+from unittest import mock
 
 import pytest
 
+from deepfellow.common.registry import registry_tokens
+from deepfellow.common.rest import circuit_breaker, token_refresher
 from deepfellow.common.state import state
 
 
@@ -20,6 +23,22 @@ def directory() -> Path:
 
 
 @pytest.fixture(autouse=True)
-def reset_app_state():
+def reset_app_state(tmp_path: Path):
+    state.cli_cache_directory = tmp_path / "cache"
+    state.cli_bundle_file = tmp_path / "bundle.json"
     yield
     state.reset()
+    circuit_breaker.reset()
+    registry_tokens.reset()
+    token_refresher.reset()
+
+
+@pytest.fixture(autouse=True)
+def no_local_docker():
+    """Keep the tests away from the local Docker daemon and cgroups, docker helpers use the mocked CLI."""
+    with (
+        mock.patch("deepfellow.common.docker.get_docker_api", return_value=None),
+        mock.patch("deepfellow.common.pull.get_docker_api", return_value=None),
+        mock.patch("deepfellow.common.docker.is_cgroup_v2", return_value=False),
+    ):
+        yield
@@ -25,6 +25,14 @@ from deepfellow.infra.connect import (
 )
 
 
+@pytest.fixture(autouse=True)
+def mock_get_compose_config():
+    with mock.patch(
+        "deepfellow.infra.connect.get_compose_config", return_value={"services": {}}
+    ) as mock_get_compose_config:
+        yield mock_get_compose_config
+
+
 @pytest.fixture
 def default_connect_kwargs(directory: Path) -> dict:
     return {
@@ -34,9 +42,8 @@ def default_connect_kwargs(directory: Path) -> dict:
     }
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -44,14 +51,13 @@ def test_connect_calls_check_infra_directory(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
@@ -59,9 +65,8 @@ def test_connect_calls_check_infra_directory(
     assert mock_check.call_args == ((directory,), {})
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -69,9 +74,8 @@ def test_connect_raises_exit_when_service_not_running(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = False
@@ -80,33 +84,31 @@ def test_connect_raises_exit_when_service_not_running(
         connect(**default_connect_kwargs)
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
-def test_connect_calls_env_get(
+def test_connect_reads_env_file(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
-    assert mock_env_get.call_args_list[0] == ((directory / ".env", "DF_CONNECT_TO_MESH_URL"), {})
+    assert mock_open_env_file.call_args == mock.call(directory / ".env")
+    assert mock_open_env_file.return_value.get.call_args_list[0] == mock.call("DF_CONNECT_TO_MESH_URL")
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -114,13 +116,12 @@ def test_connect_prints_disconnect_message_when_previous_url_exists(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = ["http://old-infra:8086", None, None]
+    mock_open_env_file.return_value.get.side_effect = ["http://old-infra:8086", None, None]
 
     connect(**default_connect_kwargs)
 
@@ -128,9 +129,8 @@ def test_connect_prints_disconnect_message_when_previous_url_exists(
     assert any("http://old-infra:8086" in msg for msg in echo_info_messages)
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -138,13 +138,12 @@ def test_connect_no_disconnect_message_when_no_previous_url(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
@@ -152,110 +151,107 @@ def test_connect_no_disconnect_message_when_no_previous_url(
     assert not any("Disconnecting" in msg for msg in echo_info_messages)
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
-def test_connect_calls_env_set_for_mesh_url(
+def test_connect_saves_mesh_url_and_key_at_once(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
-    assert (
-        mock.call(directory / ".env", "DF_CONNECT_TO_MESH_URL", "ws://parent-infra:8086") in mock_env_set.call_args_list
+    env = mock_open_env_file.return_value
+    assert env.update.call_args == mock.call(
+        {"DF_CONNECT_TO_MESH_URL": "ws://parent-infra:8086", "DF_CONNECT_TO_MESH_KEY": "test-mesh-key"}
     )
+    assert env.save.call_count == 1
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
-def test_connect_calls_env_set_for_mesh_key(
+def test_connect_sets_mesh_key(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
-    assert mock.call(directory / ".env", "DF_CONNECT_TO_MESH_KEY", "test-mesh-key") in mock_env_set.call_args_list
+    assert mock_open_env_file.return_value.update.call_args.args[0]["DF_CONNECT_TO_MESH_KEY"] == "test-mesh-key"
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
-def test_connect_calls_docker_compose_down(
+def test_connect_reads_compose_config_before_saving(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
+    mock_get_compose_config: Mock,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
+
+    env = mock_open_env_file.return_value
+    manager = mock.Mock()
+    manager.attach_mock(mock_get_compose_config, "get_compose_config")
+    manager.attach_mock(env.save, "save")
 
     connect(**default_connect_kwargs)
 
-    assert mock.call(["docker", "compose", "down"], cwd=directory, quiet=True) in mock_run.call_args_list
+    assert [call[0] for call in manager.mock_calls] == ["get_compose_config", "save"]
+    assert mock_get_compose_config.call_args == mock.call(directory)
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
-def test_connect_calls_docker_compose_up(
+def test_connect_restarts_changed_services(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
-    assert (
-        mock.call(["docker", "compose", "up", "-d", "--remove-orphans"], cwd=directory, quiet=True)
-        in mock_run.call_args_list
-    )
+    assert mock_restart.call_args == mock.call(directory, {"services": {}})
 
 
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -263,13 +259,12 @@ def test_connect_calls_echo_success(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     connect(**default_connect_kwargs)
 
@@ -305,7 +300,7 @@ def test_logs_show_connection_returns_false_on_exception(mock_run: Mock, directo
 
 
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_returns_connected(mock_get: Mock, mock_time: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5]
     mock_response = Mock()
@@ -317,7 +312,7 @@ def test_verify_parent_connection_returns_connected(mock_get: Mock, mock_time: M
 
 
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_returns_timeout(mock_get: Mock, mock_time: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5, 5, 61]
     mock_response = Mock()
@@ -328,7 +323,7 @@ def test_verify_parent_connection_returns_timeout(mock_get: Mock, mock_time: Moc
 
 
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_returns_legacy(mock_get: Mock, mock_time: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5, 5, 61]
     mock_response = Mock()
@@ -340,7 +335,7 @@ def test_verify_parent_connection_returns_legacy(mock_get: Mock, mock_time: Mock
 
 
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_returns_outdated(mock_get: Mock, mock_time: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5, 5, 5, 5, 5]
     mock_response = Mock()
@@ -352,7 +347,7 @@ def test_verify_parent_connection_returns_outdated(mock_get: Mock, mock_time: Mo
 
 
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_handles_http_error_and_returns_timeout(mock_get: Mock, mock_time: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5, 5, 61]
     mock_get.side_effect = httpx.HTTPError("connection refused")
@@ -362,7 +357,7 @@ def test_verify_parent_connection_handles_http_error_and_returns_timeout(mock_ge
 
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.time")
-@mock.patch("deepfellow.infra.connect.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_verify_parent_connection_prints_slow_warning_once(mock_get: Mock, mock_time: Mock, mock_echo: Mock) -> None:
     mock_time.monotonic.side_effect = [0, 0, 5, 5, 11, 11, 15, 61]
     mock_response = Mock()
@@ -390,9 +385,8 @@ def test_connect_raises_exit_when_localhost_url(
 
 
 @mock.patch("deepfellow.infra.connect._verify_parent_connection")
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -400,14 +394,13 @@ def test_connect_warns_on_outdated_verification(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     mock_verify: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = [None, "8086", "admin-key"]
+    mock_open_env_file.return_value.get.side_effect = [None, "8086", "admin-key"]
     mock_verify.return_value = _VerifyResult.OUTDATED
 
     connect(**default_connect_kwargs)
@@ -417,9 +410,8 @@ def test_connect_warns_on_outdated_verification(
 
 @mock.patch("deepfellow.infra.connect._logs_show_connection")
 @mock.patch("deepfellow.infra.connect._verify_parent_connection")
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -427,15 +419,14 @@ def test_connect_warns_on_legacy_verification_with_logs(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     mock_verify: Mock,
     mock_logs: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = [None, "8086", "admin-key"]
+    mock_open_env_file.return_value.get.side_effect = [None, "8086", "admin-key"]
     mock_verify.return_value = _VerifyResult.LEGACY
     mock_logs.return_value = True
 
@@ -446,9 +437,8 @@ def test_connect_warns_on_legacy_verification_with_logs(
 
 @mock.patch("deepfellow.infra.connect._logs_show_connection")
 @mock.patch("deepfellow.infra.connect._verify_parent_connection")
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -456,15 +446,14 @@ def test_connect_raises_exit_on_legacy_verification_without_logs(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     mock_verify: Mock,
     mock_logs: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = [None, "8086", "admin-key"]
+    mock_open_env_file.return_value.get.side_effect = [None, "8086", "admin-key"]
     mock_verify.return_value = _VerifyResult.LEGACY
     mock_logs.return_value = False
 
@@ -473,9 +462,8 @@ def test_connect_raises_exit_on_legacy_verification_without_logs(
 
 
 @mock.patch("deepfellow.infra.connect._verify_parent_connection")
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -483,14 +471,13 @@ def test_connect_raises_exit_on_timeout_verification(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     mock_verify: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = [None, "8086", "admin-key"]
+    mock_open_env_file.return_value.get.side_effect = [None, "8086", "admin-key"]
     mock_verify.return_value = _VerifyResult.TIMEOUT
 
     with pytest.raises(typer.Exit):
@@ -498,9 +485,8 @@ def test_connect_raises_exit_on_timeout_verification(
 
 
 @mock.patch("deepfellow.infra.connect._verify_parent_connection")
-@mock.patch("deepfellow.infra.connect.run")
-@mock.patch("deepfellow.infra.connect.env_set")
-@mock.patch("deepfellow.infra.connect.env_get")
+@mock.patch("deepfellow.infra.connect.restart_changed_services")
+@mock.patch("deepfellow.infra.connect.open_env_file")
 @mock.patch("deepfellow.infra.connect.echo")
 @mock.patch("deepfellow.infra.connect.is_service_running")
 @mock.patch("deepfellow.infra.connect.check_infra_directory")
@@ -508,14 +494,13 @@ def test_connect_calls_echo_success_after_connected_verification(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     mock_verify: Mock,
     default_connect_kwargs: dict,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.side_effect = [None, "8086", "admin-key"]
+    mock_open_env_file.return_value.get.side_effect = [None, "8086", "admin-key"]
     mock_verify.return_value = _VerifyResult.CONNECTED
 
     connect(**default_connect_kwargs)
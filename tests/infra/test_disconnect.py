@@ -17,9 +17,16 @@ import typer
 from deepfellow.infra.disconnect import disconnect
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@pytest.fixture(autouse=True)
+def mock_get_compose_config():
+    with mock.patch(
+        "deepfellow.infra.disconnect.get_compose_config", return_value={"services": {}}
+    ) as mock_get_compose_config:
+        yield mock_get_compose_config
+
+
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
@@ -27,13 +34,12 @@ def test_disconnect_calls_check_infra_directory(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = False
 
     disconnect(directory=directory)
@@ -42,9 +48,8 @@ def test_disconnect_calls_check_infra_directory(
     assert mock_check.call_args == ((directory,), {})
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
@@ -52,9 +57,8 @@ def test_disconnect_raises_exit_when_service_not_running(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = False
@@ -63,33 +67,30 @@ def test_disconnect_raises_exit_when_service_not_running(
         disconnect(directory=directory)
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_calls_env_get(
+def test_disconnect_reads_env_file(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     disconnect(directory=directory)
 
-    assert mock_env_get.call_count == 1
-    assert mock_env_get.call_args == ((directory / ".env", "DF_CONNECT_TO_MESH_URL"), {})
+    assert mock_open_env_file.call_args == mock.call(directory / ".env")
+    assert mock_open_env_file.return_value.get.call_args == mock.call("DF_CONNECT_TO_MESH_URL")
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
@@ -97,13 +98,12 @@ def test_disconnect_calls_echo_error_when_not_connected(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     disconnect(directory=directory)
 
@@ -111,32 +111,29 @@ def test_disconnect_calls_echo_error_when_not_connected(
     assert mock_echo.error.call_args == (("Already disconnected",), {})
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_does_not_call_env_set_when_not_connected(
+def test_disconnect_does_not_save_when_not_connected(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = None
+    mock_open_env_file.return_value.get.return_value = None
 
     disconnect(directory=directory)
 
-    assert mock_env_set.call_count == 0
+    assert mock_open_env_file.return_value.save.call_count == 0
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
@@ -144,13 +141,12 @@ def test_disconnect_calls_echo_success_when_not_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = False
 
     disconnect(directory=directory)
@@ -159,132 +155,127 @@ def test_disconnect_calls_echo_success_when_not_confirmed(
     assert mock_echo.success.call_args == (("Operation ends with no changes.",), {})
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_does_not_call_run_when_not_confirmed(
+def test_disconnect_does_not_restart_when_not_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = False
 
     disconnect(directory=directory)
 
-    assert mock_run.call_count == 0
+    assert mock_restart.call_count == 0
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_calls_env_set_for_mesh_url_when_confirmed(
+def test_disconnect_clears_mesh_url_and_key_at_once_when_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = True
 
     disconnect(directory=directory)
 
-    assert mock.call(directory / ".env", "DF_CONNECT_TO_MESH_URL", "") in mock_env_set.call_args_list
+    env = mock_open_env_file.return_value
+    assert env.update.call_args == mock.call({"DF_CONNECT_TO_MESH_URL": "", "DF_CONNECT_TO_MESH_KEY": ""})
+    assert env.save.call_count == 1
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_calls_env_set_for_mesh_key_when_confirmed(
+def test_disconnect_clears_mesh_key_when_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = True
 
     disconnect(directory=directory)
 
-    assert mock.call(directory / ".env", "DF_CONNECT_TO_MESH_KEY", "") in mock_env_set.call_args_list
+    assert mock_open_env_file.return_value.update.call_args.args[0]["DF_CONNECT_TO_MESH_KEY"] == ""
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_calls_docker_compose_down_when_confirmed(
+def test_disconnect_reads_compose_config_before_saving(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
+    mock_get_compose_config: Mock,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = True
 
+    env = mock_open_env_file.return_value
+    manager = mock.Mock()
+    manager.attach_mock(mock_get_compose_config, "get_compose_config")
+    manager.attach_mock(env.save, "save")
+
     disconnect(directory=directory)
 
-    assert mock.call(["docker", "compose", "down"], cwd=directory, quiet=True) in mock_run.call_args_list
+    assert [call[0] for call in manager.mock_calls] == ["get_compose_config", "save"]
+    assert mock_get_compose_config.call_args == mock.call(directory)
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
-def test_disconnect_calls_docker_compose_up_when_confirmed(
+def test_disconnect_restarts_changed_services_when_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = True
 
     disconnect(directory=directory)
 
-    assert (
-        mock.call(["docker", "compose", "up", "-d", "--remove-orphans"], cwd=directory, quiet=True)
-        in mock_run.call_args_list
-    )
+    assert mock_restart.call_args == mock.call(directory, {"services": {}})
 
 
-@mock.patch("deepfellow.infra.disconnect.run")
-@mock.patch("deepfellow.infra.disconnect.env_set")
-@mock.patch("deepfellow.infra.disconnect.env_get")
+@mock.patch("deepfellow.infra.disconnect.restart_changed_services")
+@mock.patch("deepfellow.infra.disconnect.open_env_file")
 @mock.patch("deepfellow.infra.disconnect.echo")
 @mock.patch("deepfellow.infra.disconnect.is_service_running")
 @mock.patch("deepfellow.infra.disconnect.check_infra_directory")
@@ -292,13 +283,12 @@ def test_disconnect_calls_echo_success_when_confirmed(
     mock_check: Mock,
     mock_is_running: Mock,
     mock_echo: Mock,
-    mock_env_get: Mock,
-    mock_env_set: Mock,
-    mock_run: Mock,
+    mock_open_env_file: Mock,
+    mock_restart: Mock,
     directory: Path,
 ) -> None:
     mock_is_running.return_value = True
-    mock_env_get.return_value = "http://parent-infra:8086"
+    mock_open_env_file.return_value.get.return_value = "http://parent-infra:8086"
     mock_echo.confirm.return_value = True
 
     disconnect(directory=directory)
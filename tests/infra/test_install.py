@@ -9,14 +9,17 @@
 
 import re
 from pathlib import Path
+from typing import Any
 from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+import typer
 
 from deepfellow.common.defaults import (
     DF_INFRA_DOCKER_NETWORK,
     DF_INFRA_IMAGE,
+    DF_INFRA_IMAGE_HUB,
     DF_INFRA_NAME,
     DF_INFRA_PORT,
     DF_INFRA_STORAGE_DIR,
@@ -55,13 +58,19 @@ def default_install_kwargs(directory: Path, docker_config: Mock) -> dict:
     }
 
 
+@pytest.fixture(autouse=True)
+def mock_install_image() -> Any:
+    with mock.patch("deepfellow.infra.install.get_install_image", return_value=DF_INFRA_IMAGE) as install_image:
+        yield install_image
+
+
 def _setup_echo(mock_echo: Mock) -> None:
     mock_echo.prompt.side_effect = [DF_INFRA_NAME, DF_INFRA_DOCKER_NETWORK, "", ""]
     mock_echo.prompt_until_valid.return_value = DF_INFRA_URL
     mock_echo.confirm.return_value = False
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -87,7 +96,7 @@ def test_install_calls_assert_docker(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -99,7 +108,7 @@ def test_install_calls_assert_docker(
     assert mock_assert_docker.call_args == ((), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -125,7 +134,7 @@ def test_install_calls_get_socket_with_allow_rootful(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -137,7 +146,7 @@ def test_install_calls_get_socket_with_allow_rootful(
     assert mock_get_socket.call_args == ((), {"allow_rootful": True})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -163,7 +172,7 @@ def test_install_calls_ensure_directory(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     directory: Path,
 ) -> None:
@@ -179,7 +188,7 @@ def test_install_calls_ensure_directory(
     )
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -205,7 +214,7 @@ def test_install_calls_read_env_file_to_dict(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     directory: Path,
 ) -> None:
@@ -218,7 +227,7 @@ def test_install_calls_read_env_file_to_dict(
     assert mock_read.call_args == ((directory / ".env",), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -244,7 +253,7 @@ def test_install_docker_config_write_text_when_not_a_file(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     docker_config: Mock,
 ) -> None:
@@ -258,7 +267,7 @@ def test_install_docker_config_write_text_when_not_a_file(
     assert docker_config.write_text.call_args == (("{}",), {"encoding": "utf-8"})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -284,7 +293,7 @@ def test_install_docker_config_no_write_text_when_file_exists(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     docker_config: Mock,
 ) -> None:
@@ -297,7 +306,7 @@ def test_install_docker_config_no_write_text_when_file_exists(
     assert docker_config.write_text.call_count == 0
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -323,7 +332,7 @@ def test_install_docker_config_defaults_to_directory_path(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     tmp_path: Path,
 ) -> None:
@@ -337,7 +346,7 @@ def test_install_docker_config_defaults_to_directory_path(
     assert infra_values["DF_INFRA_DOCKER_CONFIG"] == str(dir / "docker-config.json")
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -363,7 +372,7 @@ def test_install_flag_print_keys_true_prints_keys(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     mock_echo.prompt.side_effect = [DF_INFRA_NAME, DF_INFRA_DOCKER_NETWORK, "", ""]
@@ -380,7 +389,7 @@ def test_install_flag_print_keys_true_prints_keys(
     assert any("DF_MESH_KEY" in msg for msg in echo_info_messages)
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -406,7 +415,7 @@ def test_install_flag_print_keys_false_does_not_print_keys(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -420,7 +429,7 @@ def test_install_flag_print_keys_false_does_not_print_keys(
     assert not any("DF_MESH_KEY:" in msg for msg in echo_info_messages)
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -446,7 +455,7 @@ def test_install_calls_ensure_network(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -458,7 +467,7 @@ def test_install_calls_ensure_network(
     assert mock_ensure_network.call_args == ((DF_INFRA_DOCKER_NETWORK,), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -484,7 +493,7 @@ def test_install_compose_prefix_kept_when_confirmed(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     original_prefix = "dfabcdef_"
@@ -499,7 +508,7 @@ def test_install_compose_prefix_kept_when_confirmed(
     assert infra_values["DF_INFRA_COMPOSE_PREFIX"] == original_prefix
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -525,7 +534,7 @@ def test_install_compose_prefix_regenerated_when_not_confirmed(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     original_prefix = "dfabcdef_"
@@ -542,7 +551,7 @@ def test_install_compose_prefix_regenerated_when_not_confirmed(
     assert re.match(r"^df[a-z0-9]{6}_$", new_prefix)
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -568,7 +577,7 @@ def test_install_compose_prefix_generated_when_no_original(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -580,7 +589,7 @@ def test_install_compose_prefix_generated_when_no_original(
     assert re.match(r"^df[a-z0-9]{6}_$", infra_values["DF_INFRA_COMPOSE_PREFIX"])
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -606,7 +615,7 @@ def test_install_storage_kept_when_confirmed(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     original_storage = Path("/custom/storage")
@@ -621,7 +630,7 @@ def test_install_storage_kept_when_confirmed(
     assert infra_values["DF_INFRA_STORAGE_DIR"] == original_storage.expanduser().resolve().as_posix()
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -647,7 +656,7 @@ def test_install_storage_uses_default_when_no_original(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -659,7 +668,7 @@ def test_install_storage_uses_default_when_no_original(
     assert infra_values["DF_INFRA_STORAGE_DIR"] == DF_INFRA_STORAGE_DIR.expanduser().resolve().as_posix()
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -685,7 +694,7 @@ def test_install_metrics_kept_when_confirmed(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     mock_echo.prompt.side_effect = [DF_INFRA_NAME, DF_INFRA_DOCKER_NETWORK, "", ""]
@@ -701,7 +710,7 @@ def test_install_metrics_kept_when_confirmed(
     assert infra_values["DF_METRICS_PASSWORD"] == "orig_pass"
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -727,7 +736,7 @@ def test_install_metrics_generated_when_not_present(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -742,7 +751,7 @@ def test_install_metrics_generated_when_not_present(
     assert infra_values["DF_METRICS_PASSWORD"] == "gen_pass"
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -768,7 +777,7 @@ def test_install_calls_save_env_file(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     directory: Path,
 ) -> None:
@@ -781,7 +790,88 @@ def test_install_calls_save_env_file(
     assert mock_save_env.call_args == ((directory / ".env", mock.ANY), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
+@mock.patch("deepfellow.infra.install.save_compose_file")
+@mock.patch("deepfellow.infra.install.add_network_to_service")
+@mock.patch("deepfellow.infra.install.ensure_network")
+@mock.patch("deepfellow.infra.install.save_env_file")
+@mock.patch("deepfellow.infra.install.env_set")
+@mock.patch("deepfellow.infra.install.generate_password")
+@mock.patch("deepfellow.infra.install.configure_uuid_key")
+@mock.patch("deepfellow.infra.install.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.install.ensure_directory")
+@mock.patch("deepfellow.infra.install.get_socket")
+@mock.patch("deepfellow.infra.install.assert_docker")
+@mock.patch("deepfellow.infra.install.echo")
+def test_install_uses_install_image(
+    mock_echo: Mock,
+    mock_assert_docker: Mock,
+    mock_get_socket: Mock,
+    mock_ensure_dir: Mock,
+    mock_read: Mock,
+    mock_configure_uuid: Mock,
+    mock_gen_password: Mock,
+    mock_env_set: Mock,
+    mock_save_env: Mock,
+    mock_ensure_network: Mock,
+    mock_add_network: Mock,
+    mock_save_compose: Mock,
+    mock_pull: Mock,
+    default_install_kwargs: dict,
+    mock_install_image: Mock,
+) -> None:
+    _setup_echo(mock_echo)
+    mock_read.return_value = {}
+    mock_install_image.return_value = f"{DF_INFRA_IMAGE_HUB}:1.2.3"
+
+    install(**default_install_kwargs)
+
+    assert mock_install_image.call_args == mock.call(DF_INFRA_IMAGE_HUB)
+    assert mock_save_env.call_args[0][1]["DF_INFRA_IMAGE"] == f"{DF_INFRA_IMAGE_HUB}:1.2.3"
+
+
+@mock.patch("deepfellow.infra.install.pull_images")
+@mock.patch("deepfellow.infra.install.save_compose_file")
+@mock.patch("deepfellow.infra.install.add_network_to_service")
+@mock.patch("deepfellow.infra.install.ensure_network")
+@mock.patch("deepfellow.infra.install.save_env_file")
+@mock.patch("deepfellow.infra.install.env_set")
+@mock.patch("deepfellow.infra.install.generate_password")
+@mock.patch("deepfellow.infra.install.configure_uuid_key")
+@mock.patch("deepfellow.infra.install.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.install.ensure_directory")
+@mock.patch("deepfellow.infra.install.get_socket")
+@mock.patch("deepfellow.infra.install.assert_docker")
+@mock.patch("deepfellow.infra.install.echo")
+def test_install_exits_when_pull_fails(
+    mock_echo: Mock,
+    mock_assert_docker: Mock,
+    mock_get_socket: Mock,
+    mock_ensure_dir: Mock,
+    mock_read: Mock,
+    mock_configure_uuid: Mock,
+    mock_gen_password: Mock,
+    mock_env_set: Mock,
+    mock_save_env: Mock,
+    mock_ensure_network: Mock,
+    mock_add_network: Mock,
+    mock_save_compose: Mock,
+    mock_pull: Mock,
+    default_install_kwargs: dict,
+) -> None:
+    _setup_echo(mock_echo)
+    mock_read.return_value = {}
+    mock_pull.return_value = False
+
+    with pytest.raises(typer.Exit) as exc_info:
+        install(**default_install_kwargs)
+
+    assert exc_info.value.exit_code == 1
+    assert mock_echo.error.call_args == mock.call("Unable to pull the docker images of DeepFellow Infra.")
+    assert mock_echo.success.call_count == 0
+
+
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -807,7 +897,7 @@ def test_install_calls_env_set_for_config_file(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -827,7 +917,7 @@ def test_install_calls_env_set_for_config_file(
     )
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -853,7 +943,7 @@ def test_install_calls_env_set_for_secrets_file(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -874,7 +964,7 @@ def test_install_calls_env_set_for_secrets_file(
     )
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -900,7 +990,7 @@ def test_install_calls_add_network_to_service(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -912,7 +1002,7 @@ def test_install_calls_add_network_to_service(
     assert mock_add_network.call_args == ((mock.ANY, DF_INFRA_DOCKER_NETWORK), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -938,7 +1028,7 @@ def test_install_appends_docker_socket_volumes(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -954,7 +1044,7 @@ def test_install_appends_docker_socket_volumes(
     assert "${DF_INFRA_STORAGE_DIR}:${DF_INFRA_STORAGE_DIR}" in volumes
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -980,7 +1070,7 @@ def test_install_local_image_sets_pull_policy_never(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -992,7 +1082,7 @@ def test_install_local_image_sets_pull_policy_never(
     assert compose_arg["services"]["infra"]["pull_policy"] == "never"
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1018,7 +1108,7 @@ def test_install_no_local_image_does_not_set_pull_policy(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -1030,7 +1120,7 @@ def test_install_no_local_image_does_not_set_pull_policy(
     assert "pull_policy" not in compose_arg["services"]["infra"]
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1056,7 +1146,7 @@ def test_install_calls_save_compose_file(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     directory: Path,
 ) -> None:
@@ -1069,7 +1159,7 @@ def test_install_calls_save_compose_file(
     assert mock_save_compose.call_args == ((mock.ANY, directory / DOCKER_COMPOSE_CONFIG_FILENAME), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1082,7 +1172,7 @@ def test_install_calls_save_compose_file(
 @mock.patch("deepfellow.infra.install.get_socket")
 @mock.patch("deepfellow.infra.install.assert_docker")
 @mock.patch("deepfellow.infra.install.echo")
-def test_install_calls_docker_compose_pull(
+def test_install_pulls_images(
     mock_echo: Mock,
     mock_assert_docker: Mock,
     mock_get_socket: Mock,
@@ -1095,7 +1185,7 @@ def test_install_calls_docker_compose_pull(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
     directory: Path,
 ) -> None:
@@ -1104,11 +1194,11 @@ def test_install_calls_docker_compose_pull(
 
     install(**default_install_kwargs)
 
-    assert mock_run.call_count == 1
-    assert mock_run.call_args == ((["docker", "compose", "pull"], directory), {"quiet": True})
+    assert mock_pull.call_count == 1
+    assert mock_pull.call_args == ((directory,), {})
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1134,7 +1224,7 @@ def test_install_calls_echo_success(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -1145,7 +1235,7 @@ def test_install_calls_echo_success(
     assert mock_echo.success.call_count == 1
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1171,7 +1261,7 @@ def test_install_hugging_face_token_added_to_env_when_provided(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     mock_echo.prompt.side_effect = [DF_INFRA_NAME, DF_INFRA_DOCKER_NETWORK, ""]
@@ -1185,7 +1275,7 @@ def test_install_hugging_face_token_added_to_env_when_provided(
     assert infra_values["DF_HUGGING_FACE_TOKEN"] == "hf-test-token"
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1211,7 +1301,7 @@ def test_install_hugging_face_token_not_added_when_empty(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -1223,7 +1313,7 @@ def test_install_hugging_face_token_not_added_when_empty(
     assert "DF_HUGGING_FACE_TOKEN" not in infra_values
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1249,7 +1339,7 @@ def test_install_civitai_token_added_to_env_when_provided(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     mock_echo.prompt.side_effect = [DF_INFRA_NAME, DF_INFRA_DOCKER_NETWORK, ""]
@@ -1263,7 +1353,7 @@ def test_install_civitai_token_added_to_env_when_provided(
     assert infra_values["DF_CIVITAI_TOKEN"] == "civitai-test-token"
 
 
-@mock.patch("deepfellow.infra.install.run")
+@mock.patch("deepfellow.infra.install.pull_images")
 @mock.patch("deepfellow.infra.install.save_compose_file")
 @mock.patch("deepfellow.infra.install.add_network_to_service")
 @mock.patch("deepfellow.infra.install.ensure_network")
@@ -1289,7 +1379,7 @@ def test_install_civitai_token_not_added_when_empty(
     mock_ensure_network: Mock,
     mock_add_network: Mock,
     mock_save_compose: Mock,
-    mock_run: Mock,
+    mock_pull: Mock,
     default_install_kwargs: dict,
 ) -> None:
     _setup_echo(mock_echo)
@@ -243,6 +243,7 @@ def test_uninstall_connection_error(
     )
 
 
+@mock.patch("deepfellow.common.output.echo")
 @mock.patch("deepfellow.infra.service.list.echo")
 @mock.patch("deepfellow.infra.service.list.make_request")
 @mock.patch("deepfellow.infra.service.list.cast")
@@ -254,6 +255,7 @@ def test_list_displays_services(
     mock_cast: Mock,
     mock_make_request: Mock,
     mock_echo: Mock,
+    mock_output_echo: Mock,
 ) -> None:
     mock_make_request.return_value = {
         "list": [
@@ -279,12 +281,13 @@ def test_list_displays_services(
     list_services(server="http://infra:8086")
 
     assert mock_make_request.call_count == 1
-    assert mock_echo.info.call_count == 1
-    assert mock_echo.info.call_args == mock.call(
+    assert mock_output_echo.info.call_count == 1
+    assert mock_output_echo.info.call_args == mock.call(
         "id: ollama\ntype: ollama\ninstance: default\ndescription: Local models.\ndownloaded: True"
     )
 
 
+@mock.patch("deepfellow.common.output.echo")
 @mock.patch("deepfellow.infra.service.list.echo")
 @mock.patch("deepfellow.infra.service.list.make_request")
 @mock.patch("deepfellow.infra.service.list.cast")
@@ -296,13 +299,14 @@ def test_list_with_no_installed_services(
     mock_cast: Mock,
     mock_make_request: Mock,
     mock_echo: Mock,
+    mock_output_echo: Mock,
 ) -> None:
     mock_make_request.return_value = {"list": [{"id": "claude", "installed": False}]}
 
     list_services(server="http://infra:8086")
 
-    assert mock_echo.info.call_count == 1
-    assert mock_echo.info.call_args == mock.call("No services installed.")
+    assert mock_output_echo.info.call_count == 1
+    assert mock_output_echo.info.call_args == mock.call("No services installed.")
 
 
 @mock.patch("deepfellow.infra.service.list.echo")
@@ -38,24 +38,27 @@ def mocks():
     with (
         mock.patch("deepfellow.infra.ssl_on.shutil") as m_shutil,
         mock.patch("deepfellow.infra.ssl_on.run") as m_run,
-        mock.patch("deepfellow.infra.ssl_on.env_set") as m_env_set,
-        mock.patch("deepfellow.infra.ssl_on.env_get") as m_env_get,
+        mock.patch("deepfellow.infra.ssl_on.open_env_file") as m_open_env_file,
         mock.patch("deepfellow.infra.ssl_on.save_compose_file") as m_save,
         mock.patch("deepfellow.infra.ssl_on.load_compose_file") as m_load,
         mock.patch("deepfellow.infra.ssl_on.is_service_running") as m_is_running,
         mock.patch("deepfellow.infra.ssl_on.echo") as m_echo,
         mock.patch("deepfellow.infra.ssl_on.check_infra_directory") as m_check,
+        mock.patch("deepfellow.infra.ssl_on.get_compose_config", return_value={"services": {}}) as m_get_config,
+        mock.patch("deepfellow.infra.ssl_on.restart_changed_services") as m_restart,
     ):
         yield SimpleNamespace(
             shutil=m_shutil,
             run=m_run,
-            env_set=m_env_set,
-            env_get=m_env_get,
+            open_env_file=m_open_env_file,
+            env=m_open_env_file.return_value,
             save=m_save,
             load=m_load,
             is_running=m_is_running,
             echo=m_echo,
             check=m_check,
+            get_config=m_get_config,
+            restart=m_restart,
         )
 
 
@@ -64,7 +67,7 @@ def test_ssl_on_calls_check_infra_directory(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -99,7 +102,7 @@ def test_ssl_on_adds_ssl_volume_when_not_present(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -115,7 +118,7 @@ def test_ssl_on_does_not_add_volume_when_already_present(
     compose = {"services": {"infra": {"volumes": [f"{ssl_dir_str}:/ssl"]}}}
     mocks.is_running.return_value = True
     mocks.load.return_value = compose
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -127,7 +130,7 @@ def test_ssl_on_saves_compose_twice(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -139,7 +142,7 @@ def test_ssl_on_runs_mkdir_in_container(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -154,7 +157,7 @@ def test_ssl_on_copies_cert_files_when_paths_provided(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**{**default_ssl_kwargs, "ssl_key_path": "/key.pem", "ssl_cert_path": "/cert.pem"})
 
@@ -165,7 +168,7 @@ def test_ssl_on_errors_when_cert_file_not_found(mocks: SimpleNamespace, compose_
     mocks.shutil.copy2.side_effect = FileNotFoundError("/key.pem")
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     with pytest.raises(typer.Exit):
         ssl_on(**{**default_ssl_kwargs, "ssl_key_path": "/key.pem", "ssl_cert_path": "/cert.pem"})
@@ -178,7 +181,7 @@ def test_ssl_on_runs_openssl_when_no_paths_provided(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -188,31 +191,32 @@ def test_ssl_on_runs_openssl_when_no_paths_provided(
 def test_ssl_on_updates_port_when_different(mocks: SimpleNamespace, compose_data: dict, default_ssl_kwargs: dict):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.side_effect = [9000, None]
+    mocks.env.get.side_effect = [9000, None]
 
     ssl_on(**{**default_ssl_kwargs, "port": 8080})
 
-    assert any("infra_port" in str(c) and "8080" in str(c) for c in mocks.env_set.call_args_list)
+    assert mock.call("DF_INFRA_PORT", "8080") in mocks.env.set.call_args_list
+    assert mocks.env.save.call_args == mock.call(quiet=True)
 
 
 def test_ssl_on_converts_http_to_https(mocks: SimpleNamespace, compose_data: dict, default_ssl_kwargs: dict):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.side_effect = [None, "http://localhost:8080"]
+    mocks.env.get.side_effect = [None, "http://localhost:8080"]
 
     ssl_on(**default_ssl_kwargs)
 
-    assert mock.call(mock.ANY, "infra_url", "https://localhost:8080", quiet=True) in mocks.env_set.call_args_list
+    assert mock.call("DF_INFRA_URL", "https://localhost:8080") in mocks.env.set.call_args_list
 
 
 def test_ssl_on_uses_provided_server_directly(mocks: SimpleNamespace, compose_data: dict, default_ssl_kwargs: dict):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.side_effect = [None, "http://localhost:8080"]
+    mocks.env.get.side_effect = [None, "http://localhost:8080"]
 
     ssl_on(**{**default_ssl_kwargs, "server": "https://myserver.com"})
 
-    assert mock.call(mock.ANY, "infra_url", "https://myserver.com", quiet=True) in mocks.env_set.call_args_list
+    assert mock.call("DF_INFRA_URL", "https://myserver.com") in mocks.env.set.call_args_list
 
 
 def test_ssl_on_sets_entrypoint_and_command_in_compose(
@@ -220,7 +224,7 @@ def test_ssl_on_sets_entrypoint_and_command_in_compose(
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
 
     ssl_on(**default_ssl_kwargs)
 
@@ -228,13 +232,39 @@ def test_ssl_on_sets_entrypoint_and_command_in_compose(
     assert "--ssl-keyfile /ssl/key.pem" in compose_data["services"]["infra"]["command"]
 
 
-def test_ssl_on_runs_docker_compose_up(
+def test_ssl_on_restarts_services_changed_since_before_the_changes(
     mocks: SimpleNamespace, tmp_path: Path, compose_data: dict, default_ssl_kwargs: dict
 ):
     mocks.is_running.return_value = True
     mocks.load.return_value = compose_data
-    mocks.env_get.return_value = None
+    mocks.env.get.return_value = None
+    manager = mock.Mock()
+    manager.attach_mock(mocks.get_config, "get_compose_config")
+    manager.attach_mock(mocks.save, "save_compose_file")
+    manager.attach_mock(mocks.restart, "restart_changed_services")
 
     ssl_on(**default_ssl_kwargs)
 
-    assert any("up" in str(arg) and "--build" in str(arg) for arg in mocks.run.call_args_list)
+    assert [call[0] for call in manager.mock_calls] == [
+        "get_compose_config",
+        "save_compose_file",
+        "save_compose_file",
+        "restart_changed_services",
+    ]
+    assert mocks.restart.call_args == mock.call(tmp_path, {"services": {}})
+    assert not any("down" in str(arg) for arg in mocks.run.call_args_list)
+
+
+def test_ssl_on_saves_port_and_url_at_once(mocks: SimpleNamespace, compose_data: dict, default_ssl_kwargs: dict):
+    mocks.is_running.return_value = True
+    mocks.load.return_value = compose_data
+    mocks.env.get.side_effect = ["9000", "http://localhost:9000"]
+
+    ssl_on(**{**default_ssl_kwargs, "port": 8080})
+
+    assert mocks.open_env_file.call_count == 1
+    assert mocks.env.set.call_args_list == [
+        mock.call("DF_INFRA_PORT", "8080"),
+        mock.call("DF_INFRA_URL", "https://localhost:9000"),
+    ]
+    assert mocks.env.save.call_count == 1
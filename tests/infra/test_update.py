@@ -8,6 +8,7 @@
 # limitations under the License.
 
 
+from collections.abc import Iterator
 from pathlib import Path
 from unittest import mock
 from unittest.mock import Mock
@@ -19,6 +20,12 @@ from deepfellow.common.defaults import DF_INFRA_IMAGE, DF_INFRA_IMAGE_HUB, DOCKE
 from deepfellow.infra.update import update
 
 
+@pytest.fixture(autouse=True)
+def mock_up_to_date() -> Iterator[Mock]:
+    with mock.patch("deepfellow.infra.update.is_image_up_to_date", return_value=False) as mock_up_to_date:
+        yield mock_up_to_date
+
+
 @pytest.fixture
 def infra_values() -> dict:
     return {"df_infra_image": "some-image"}
@@ -41,6 +48,7 @@ def default_update_kwargs(directory) -> dict:
         "image": DF_INFRA_IMAGE,
         "local_image": False,
         "tag": None,
+        "zero_downtime": False,
     }
 
 
@@ -399,3 +407,177 @@ def test_update_does_not_restart_when_not_confirmed(
 
     assert mock_stop.call_count == 0
     assert mock_start.call_count == 0
+
+
+@mock.patch("deepfellow.infra.update.zero_downtime_update")
+@mock.patch("deepfellow.infra.update.start_infra")
+@mock.patch("deepfellow.infra.update.stop_infra")
+@mock.patch("deepfellow.infra.update.run")
+@mock.patch("deepfellow.infra.update.env_set")
+@mock.patch("deepfellow.infra.update.save_compose_file")
+@mock.patch("deepfellow.infra.update.load_compose_file")
+@mock.patch("deepfellow.infra.update.echo")
+@mock.patch("deepfellow.infra.update.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.update.check_infra_directory")
+def test_update_zero_downtime_switches_without_stopping(
+    mock_check: Mock,
+    mock_read: Mock,
+    mock_echo: Mock,
+    mock_load: Mock,
+    mock_save: Mock,
+    mock_env_set: Mock,
+    mock_run: Mock,
+    mock_stop: Mock,
+    mock_start: Mock,
+    mock_zero_downtime: Mock,
+    compose_data: dict,
+    default_update_kwargs: dict,
+) -> None:
+    mock_read.return_value = {"df_infra_image": "some-image", "df_infra_port": "9086"}
+    mock_load.return_value = compose_data
+
+    update(**{**default_update_kwargs, "zero_downtime": True})
+
+    assert mock_zero_downtime.call_args == ((default_update_kwargs["directory"], "infra", 9086), {"tls": False})
+    assert mock_echo.confirm.call_count == 0
+    assert mock_stop.call_count == 0
+    assert mock_start.call_count == 0
+
+
+@mock.patch("deepfellow.infra.update.zero_downtime_update")
+@mock.patch("deepfellow.infra.update.run")
+@mock.patch("deepfellow.infra.update.env_set")
+@mock.patch("deepfellow.infra.update.save_compose_file")
+@mock.patch("deepfellow.infra.update.load_compose_file")
+@mock.patch("deepfellow.infra.update.echo")
+@mock.patch("deepfellow.infra.update.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.update.check_infra_directory")
+def test_update_zero_downtime_probes_over_https_after_ssl_on(
+    mock_check: Mock,
+    mock_read: Mock,
+    mock_echo: Mock,
+    mock_load: Mock,
+    mock_save: Mock,
+    mock_env_set: Mock,
+    mock_run: Mock,
+    mock_zero_downtime: Mock,
+    compose_data: dict,
+    default_update_kwargs: dict,
+) -> None:
+    mock_read.return_value = {
+        "df_infra_image": "some-image",
+        "df_infra_port": "9086",
+        "df_infra_url": "https://infra.example.com",
+    }
+    mock_load.return_value = compose_data
+
+    update(**{**default_update_kwargs, "zero_downtime": True})
+
+    assert mock_zero_downtime.call_args == ((default_update_kwargs["directory"], "infra", 9086), {"tls": True})
+
+
+@mock.patch("deepfellow.infra.update.start_infra")
+@mock.patch("deepfellow.infra.update.stop_infra")
+@mock.patch("deepfellow.infra.update.run")
+@mock.patch("deepfellow.infra.update.env_set")
+@mock.patch("deepfellow.infra.update.save_compose_file")
+@mock.patch("deepfellow.infra.update.load_compose_file")
+@mock.patch("deepfellow.infra.update.echo")
+@mock.patch("deepfellow.infra.update.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.update.check_infra_directory")
+def test_update_skips_pull_and_restart_when_digest_unchanged(
+    mock_check: Mock,
+    mock_read: Mock,
+    mock_echo: Mock,
+    mock_load: Mock,
+    mock_save: Mock,
+    mock_env_set: Mock,
+    mock_run: Mock,
+    mock_stop: Mock,
+    mock_start: Mock,
+    mock_up_to_date: Mock,
+    compose_data: dict,
+    default_update_kwargs: dict,
+) -> None:
+    image = f"{DF_INFRA_IMAGE_HUB}:0.15.0"
+    mock_read.return_value = {"df_infra_image": image}
+    mock_load.return_value = compose_data
+    mock_up_to_date.return_value = True
+
+    update(**{**default_update_kwargs, "tag": "0.15.0"})
+
+    assert mock_up_to_date.call_args == ((image,), {})
+    assert mock_run.call_count == 0
+    assert mock_env_set.call_count == 0
+    assert mock_echo.confirm.call_count == 0
+    assert mock_echo.success.call_args == ((f"Deepfellow Infra is up to date ({image}).",), {})
+
+
+@mock.patch("deepfellow.infra.update.start_infra")
+@mock.patch("deepfellow.infra.update.stop_infra")
+@mock.patch("deepfellow.infra.update.run")
+@mock.patch("deepfellow.infra.update.env_set")
+@mock.patch("deepfellow.infra.update.save_compose_file")
+@mock.patch("deepfellow.infra.update.load_compose_file")
+@mock.patch("deepfellow.infra.update.echo")
+@mock.patch("deepfellow.infra.update.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.update.check_infra_directory")
+def test_update_skips_pull_but_offers_restart_when_pulled_image_is_new(
+    mock_check: Mock,
+    mock_read: Mock,
+    mock_echo: Mock,
+    mock_load: Mock,
+    mock_save: Mock,
+    mock_env_set: Mock,
+    mock_run: Mock,
+    mock_stop: Mock,
+    mock_start: Mock,
+    mock_up_to_date: Mock,
+    infra_values: dict,
+    compose_data: dict,
+    default_update_kwargs: dict,
+) -> None:
+    mock_read.return_value = infra_values
+    mock_load.return_value = compose_data
+    mock_up_to_date.return_value = True
+    mock_echo.confirm.return_value = True
+
+    update(**{**default_update_kwargs, "tag": "0.15.0"})
+
+    assert mock_run.call_count == 0
+    assert mock_env_set.call_count == 1
+    assert mock_stop.call_count == 1
+    assert mock_start.call_count == 1
+
+
+@mock.patch("deepfellow.infra.update.start_infra")
+@mock.patch("deepfellow.infra.update.stop_infra")
+@mock.patch("deepfellow.infra.update.run")
+@mock.patch("deepfellow.infra.update.env_set")
+@mock.patch("deepfellow.infra.update.save_compose_file")
+@mock.patch("deepfellow.infra.update.load_compose_file")
+@mock.patch("deepfellow.infra.update.echo")
+@mock.patch("deepfellow.infra.update.read_env_file_to_dict")
+@mock.patch("deepfellow.infra.update.check_infra_directory")
+def test_update_local_image_does_not_check_registry(
+    mock_check: Mock,
+    mock_read: Mock,
+    mock_echo: Mock,
+    mock_load: Mock,
+    mock_save: Mock,
+    mock_env_set: Mock,
+    mock_run: Mock,
+    mock_stop: Mock,
+    mock_start: Mock,
+    mock_up_to_date: Mock,
+    compose_data: dict,
+    default_update_kwargs: dict,
+) -> None:
+    mock_read.return_value = {"df_infra_image": "local-image"}
+    mock_load.return_value = compose_data
+    mock_echo.confirm.return_value = False
+
+    update(**{**default_update_kwargs, "image": "local-image", "local_image": True})
+
+    assert mock_up_to_date.call_count == 0
+    assert mock_run.call_count == 1
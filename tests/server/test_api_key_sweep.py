@@ -0,0 +1,134 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+import typer
+
+from deepfellow.common.rest import BulkReport, BulkResult
+from deepfellow.server.api_key.sweep import sweep, sweep_api_keys
+from deepfellow.server.organization.admin_api_key.utils import ApiKey as AdminApiKey
+from deepfellow.server.organization.admin_api_key.utils import Owner
+from deepfellow.server.organization.utils import Organization
+from deepfellow.server.project.api_key.utils import ApiKey as ProjectApiKey
+from deepfellow.server.project.utils import Project
+
+SERVER = "http://server.example"
+NOW = 1_000 * 86400.0
+DAY = 86400.0
+
+
+def project_key(key_id: str, last_used_at: float | None, created_at: float = 0.0) -> ProjectApiKey:
+    return ProjectApiKey(key_id, "organization.project.api_key", key_id, "sk-...", created_at, last_used_at, None)
+
+
+def admin_key(key_id: str, last_used_at: float | None) -> AdminApiKey:
+    owner = Owner(0.0, "user-1", "admin", "organization.user", "owner", "user")
+    return AdminApiKey(key_id, "organization.admin_api_key", key_id, "sk-...", owner, 0.0, last_used_at, None)
+
+
+def project(project_id: str, status: str = "active") -> Project:
+    return Project(project_id, project_id, status, [], [], [], 0.0)
+
+
+@pytest.fixture
+def tenant():
+    with (
+        mock.patch("deepfellow.server.api_key.sweep.time.time", return_value=NOW),
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_organizations",
+            return_value=iter(
+                [Organization("org-1", 0.0, "first", "user-1"), Organization("org-2", 0.0, "second", "user-1")]
+            ),
+        ),
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_admin_api_keys",
+            side_effect=lambda server, token, org_id, cache: iter(
+                [admin_key(f"{org_id}-admin", NOW - (100 if org_id == "org-1" else 10) * DAY)]
+            ),
+        ),
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_projects",
+            side_effect=lambda server, token, org_id, cache: iter(
+                [project(f"{org_id}-proj"), project(f"{org_id}-archived", "archived")]
+            ),
+        ) as mock_list_projects,
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_api_keys",
+            side_effect=lambda server, token, org_id, project_id, cache: iter(
+                [
+                    project_key(f"{project_id}-fresh", NOW - DAY),
+                    project_key(f"{project_id}-never-used", None, created_at=NOW - 200 * DAY),
+                ]
+            ),
+        ) as mock_list_api_keys,
+    ):
+        yield mock_list_projects, mock_list_api_keys
+
+
+def test_sweep_api_keys_finds_keys_unused_for_the_period(tenant):
+    _, mock_list_api_keys = tenant
+
+    swept = sweep_api_keys(SERVER, "token", 90 * DAY, concurrency=4)
+
+    assert [(key.kind, key.api_key.id) for key in swept] == [
+        ("organization", "org-1-admin"),
+        ("project", "org-1-proj-never-used"),
+        ("project", "org-2-proj-never-used"),
+    ]
+    assert swept[0].unused_days == 100
+    # Archived projects are skipped
+    assert sorted(call.args[3] for call in mock_list_api_keys.call_args_list) == ["org-1-proj", "org-2-proj"]
+
+
+@mock.patch("deepfellow.server.api_key.sweep.bulk_request")
+@mock.patch("deepfellow.server.api_key.sweep.print_records")
+@mock.patch("deepfellow.server.api_key.sweep.get_token", return_value="token")
+@mock.patch("deepfellow.server.api_key.sweep.get_server_url", return_value=SERVER)
+def test_sweep_revoke_sends_deletes_to_revoke_endpoints(
+    mock_get_server_url, mock_get_token, mock_print_records, mock_bulk_request, tenant
+):
+    mock_bulk_request.return_value = BulkReport(results=[BulkResult(mock.Mock(), status_code=200)])
+    with mock.patch("deepfellow.server.api_key.sweep.state") as mock_state:
+        mock_state.yes = True
+        sweep(server=None, unused_for="90d", revoke=True, concurrency=4)
+
+    requests = mock_bulk_request.call_args.args[0]
+    assert [(request.method, request.url, request.headers) for request in requests] == [
+        ("DELETE", f"{SERVER}/v1/organization/admin_api_keys/org-1-admin", {"OpenAI-Organization": "org-1"}),
+        (
+            "DELETE",
+            f"{SERVER}/v1/organization/projects/org-1-proj/api_keys/org-1-proj-never-used",
+            {"OpenAI-Organization": "org-1"},
+        ),
+        (
+            "DELETE",
+            f"{SERVER}/v1/organization/projects/org-2-proj/api_keys/org-2-proj-never-used",
+            {"OpenAI-Organization": "org-2"},
+        ),
+    ]
+
+
+@mock.patch("deepfellow.server.api_key.sweep.bulk_request")
+@mock.patch("deepfellow.server.api_key.sweep.print_records")
+@mock.patch("deepfellow.server.api_key.sweep.get_token", return_value="token")
+@mock.patch("deepfellow.server.api_key.sweep.get_server_url", return_value=SERVER)
+def test_sweep_without_revoke_only_reports(
+    mock_get_server_url, mock_get_token, mock_print_records, mock_bulk_request, tenant
+):
+    sweep(server=None, unused_for="90d", revoke=False, concurrency=4)
+
+    assert len(mock_print_records.call_args.args[0]) == 3
+    assert mock_bulk_request.call_count == 0
+
+
+def test_sweep_invalid_duration():
+    with pytest.raises(typer.BadParameter):
+        sweep(server=None, unused_for="soon", revoke=False, concurrency=4)
@@ -14,78 +14,123 @@ from unittest import mock
 from unittest.mock import Mock
 
 import pytest
+import typer
+import yaml
 
+from deepfellow.common.config import read_env_file
 from deepfellow.server.env_command.set import set
 
+COMPOSE = {
+    "services": {
+        "server": {"image": "${DF_IMAGE}", "environment": ["DF_SOME_VAR=${DF_SOME_VAR}", "DF_LOG=${DF_LOG:-INFO}"]},
+        "mongo": {"image": "mongo", "environment": ["PASSWORD=$DF_MONGO_PASSWORD"]},
+    }
+}
+
 
 @pytest.fixture
 def directory(tmp_path: Path) -> Path:
+    (tmp_path / ".env").write_text("# server\nDF_SOME_VAR=old\nDF_LOG=INFO\nDF_MONGO_PASSWORD=secret\n")
+    (tmp_path / "compose.yaml").write_text(yaml.dump(COMPOSE, sort_keys=False))
     return tmp_path
 
 
-@mock.patch("deepfellow.server.env_command.set.start_server")
-@mock.patch("deepfellow.server.env_command.set.stop_server")
-@mock.patch("deepfellow.server.env_command.set.echo")
-@mock.patch("deepfellow.server.env_command.set.env_set")
+@pytest.fixture
+def mock_recreate():
+    with mock.patch("deepfellow.common.env.recreate_services") as mock_recreate:
+        yield mock_recreate
+
+
+@mock.patch("deepfellow.common.env.echo")
 @mock.patch("deepfellow.server.env_command.set.check_server_directory")
-def test_set_restarts_server_when_confirmed(
-    mock_check: Mock,
-    mock_env_set: Mock,
-    mock_echo: Mock,
-    mock_stop: Mock,
-    mock_start: Mock,
-    directory: Path,
+def test_set_applies_all_assignments_with_one_restart(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path
 ) -> None:
     mock_echo.confirm.return_value = True
 
-    set(directory=directory, env_name="DF_SOME_VAR", env_value="value", df_prefix=True)
+    set(directory=directory, assignments=["SOME_VAR=value", "DF_LOG=DEBUG"], from_file=None, df_prefix=True)
 
-    assert mock_env_set.call_count == 1
-    assert mock_echo.confirm.call_count == 1
-    assert mock_stop.call_count == 1
-    assert mock_stop.call_args == mock.call(directory)
-    assert mock_start.call_count == 1
-    assert mock_start.call_args == mock.call(directory)
+    assert mock_check.call_args == mock.call(directory)
+    assert (directory / ".env").read_text() == "# server\nDF_SOME_VAR=value\nDF_LOG=DEBUG\nDF_MONGO_PASSWORD=secret\n"
+    assert mock_echo.confirm.call_args == mock.call("Restart server now to apply the changes?", default=True)
+    assert mock_recreate.call_args_list == [mock.call(directory, ["server"])]
 
 
-@mock.patch("deepfellow.server.env_command.set.start_server")
-@mock.patch("deepfellow.server.env_command.set.stop_server")
-@mock.patch("deepfellow.server.env_command.set.echo")
-@mock.patch("deepfellow.server.env_command.set.env_set")
+@mock.patch("deepfellow.common.env.echo")
+@mock.patch("deepfellow.server.env_command.set.check_server_directory")
+def test_set_restarts_only_services_using_changed_variables(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path
+) -> None:
+    mock_echo.confirm.return_value = True
+
+    set(directory=directory, assignments=["DF_MONGO_PASSWORD=changed"], from_file=None, df_prefix=True)
+
+    assert mock_recreate.call_args == mock.call(directory, ["mongo"])
+
+
+@mock.patch("deepfellow.common.env.echo")
 @mock.patch("deepfellow.server.env_command.set.check_server_directory")
 def test_set_skips_restart_when_declined(
-    mock_check: Mock,
-    mock_env_set: Mock,
-    mock_echo: Mock,
-    mock_stop: Mock,
-    mock_start: Mock,
-    directory: Path,
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path
 ) -> None:
     mock_echo.confirm.return_value = False
 
-    set(directory=directory, env_name="DF_SOME_VAR", env_value="value", df_prefix=True)
+    set(directory=directory, assignments=["DF_SOME_VAR", "value"], from_file=None, df_prefix=True)
 
-    assert mock_env_set.call_count == 1
+    assert read_env_file(directory / ".env")["DF_SOME_VAR"] == "value"
     assert mock_echo.confirm.call_count == 1
-    assert mock_stop.call_count == 0
-    assert mock_start.call_count == 0
+    assert mock_recreate.call_count == 0
 
 
-@mock.patch("deepfellow.server.env_command.set.start_server")
-@mock.patch("deepfellow.server.env_command.set.stop_server")
-@mock.patch("deepfellow.server.env_command.set.echo")
-@mock.patch("deepfellow.server.env_command.set.env_set")
+@mock.patch("deepfellow.common.env.echo")
 @mock.patch("deepfellow.server.env_command.set.check_server_directory")
-def test_set_confirm_has_default_true(
-    mock_check: Mock,
-    mock_env_set: Mock,
-    mock_echo: Mock,
-    mock_stop: Mock,
-    mock_start: Mock,
-    directory: Path,
+def test_set_without_changes_does_not_restart(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path
 ) -> None:
+    set(directory=directory, assignments=["DF_SOME_VAR=old"], from_file=None, df_prefix=True)
+
+    assert mock_echo.confirm.call_count == 0
+    assert mock_recreate.call_count == 0
+
+
+@mock.patch("deepfellow.common.env.echo")
+@mock.patch("deepfellow.server.env_command.set.check_server_directory")
+def test_set_unused_variable_does_not_restart(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path
+) -> None:
+    set(directory=directory, assignments=["DF_UNUSED=1"], from_file=None, df_prefix=True)
+
+    assert read_env_file(directory / ".env")["DF_UNUSED"] == "1"
+    assert mock_echo.confirm.call_count == 0
+    assert mock_recreate.call_count == 0
+
+
+@mock.patch("deepfellow.common.env.echo")
+@mock.patch("deepfellow.server.env_command.set.check_server_directory")
+def test_set_from_file_overridden_by_arguments(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    overrides = tmp_path_factory.mktemp("overrides") / "overrides.env"
+    overrides.write_text("# tuning\nDF_SOME_VAR=from_file\nDF_MONGO_PASSWORD=from_file\n")
     mock_echo.confirm.return_value = True
 
-    set(directory=directory, env_name="DF_SOME_VAR", env_value="value", df_prefix=True)
+    set(directory=directory, assignments=["DF_SOME_VAR=from_args"], from_file=overrides, df_prefix=True)
+
+    env = read_env_file(directory / ".env")
+    assert env["DF_SOME_VAR"] == "from_args"
+    assert env["DF_MONGO_PASSWORD"] == "from_file"
+    assert mock_recreate.call_args_list == [mock.call(directory, ["server", "mongo"])]
+
+
+@pytest.mark.parametrize("assignments", [[], ["A=1", "B"], ["1A=1"]])
+@mock.patch("deepfellow.server.env_command.set.echo")
+@mock.patch("deepfellow.server.env_command.set.check_server_directory")
+def test_set_invalid_assignments_exit(
+    mock_check: Mock, mock_echo: Mock, mock_recreate: Mock, directory: Path, assignments: list[str]
+) -> None:
+    with pytest.raises(typer.Exit):
+        set(directory=directory, assignments=assignments, from_file=None, df_prefix=True)
 
-    assert mock_echo.confirm.call_args == mock.call("Restart the server now to apply the change?", default=True)
+    assert mock_echo.error.call_count == 1
+    assert read_env_file(directory / ".env")["DF_SOME_VAR"] == "old"
+    assert mock_recreate.call_count == 0
@@ -29,7 +29,7 @@ MOCK_CONFIGURE_MONGO = mock.patch("deepfellow.server.install.configure_mongo")
 MOCK_CONFIGURE_INFRA = mock.patch("deepfellow.server.install.configure_infra")
 MOCK_CONFIGURE_VECTOR_DB = mock.patch("deepfellow.server.install.configure_vector_db")
 MOCK_CONFIGURE_OTEL = mock.patch("deepfellow.server.install.configure_otel")
-MOCK_RUN = mock.patch("deepfellow.server.install.run")
+MOCK_PULL = mock.patch("deepfellow.server.install.pull_images")
 MOCK_SAVE_COMPOSE_FILE = mock.patch("deepfellow.server.install.save_compose_file")
 MOCK_SET_DEFAULT_SERVER_DIRECTORY = mock.patch("deepfellow.server.install.set_default_server_directory")
 
@@ -95,7 +95,7 @@ def test_install_otel_local_and_otel_url_are_mutually_exclusive(
 
 @MOCK_SET_DEFAULT_SERVER_DIRECTORY
 @MOCK_SAVE_COMPOSE_FILE
-@MOCK_RUN
+@MOCK_PULL
 @MOCK_CONFIGURE_OTEL
 @MOCK_CONFIGURE_VECTOR_DB
 @MOCK_CONFIGURE_INFRA
@@ -111,7 +111,7 @@ def test_install_writes_log_level_and_plugins_setup_defaults(
     mock_configure_infra,
     mock_configure_vector_db,
     mock_configure_otel,
-    mock_run,
+    mock_pull,
     mock_save_compose_file,
     mock_set_default_server_directory,
     tmp_path,
@@ -129,7 +129,44 @@ def test_install_writes_log_level_and_plugins_setup_defaults(
 
 @MOCK_SET_DEFAULT_SERVER_DIRECTORY
 @MOCK_SAVE_COMPOSE_FILE
-@MOCK_RUN
+@MOCK_PULL
+@MOCK_CONFIGURE_OTEL
+@MOCK_CONFIGURE_VECTOR_DB
+@MOCK_CONFIGURE_INFRA
+@MOCK_CONFIGURE_MONGO
+@MOCK_ENSURE_NETWORK
+@MOCK_ASSERT_DOCKER
+@MOCK_ECHO
+def test_install_exits_when_pull_fails(
+    mock_echo,
+    mock_assert_docker,
+    mock_ensure_network,
+    mock_configure_mongo,
+    mock_configure_infra,
+    mock_configure_vector_db,
+    mock_configure_otel,
+    mock_pull,
+    mock_save_compose_file,
+    mock_set_default_server_directory,
+    tmp_path,
+):
+    configure_install_mocks(
+        mock_echo, mock_configure_mongo, mock_configure_infra, mock_configure_vector_db, mock_configure_otel
+    )
+
+    mock_pull.return_value = False
+
+    with pytest.raises(typer.Exit) as exc_info:
+        install(**install_kwargs(tmp_path))
+
+    assert exc_info.value.exit_code == 1
+    assert mock_echo.error.call_args == mock.call("Unable to pull the docker images of DeepFellow Server.")
+    assert mock_echo.success.call_count == 0
+
+
+@MOCK_SET_DEFAULT_SERVER_DIRECTORY
+@MOCK_SAVE_COMPOSE_FILE
+@MOCK_PULL
 @MOCK_CONFIGURE_OTEL
 @MOCK_CONFIGURE_VECTOR_DB
 @MOCK_CONFIGURE_INFRA
@@ -145,7 +182,7 @@ def test_install_preserves_existing_log_level_and_plugins_setup(
     mock_configure_infra,
     mock_configure_vector_db,
     mock_configure_otel,
-    mock_run,
+    mock_pull,
     mock_save_compose_file,
     mock_set_default_server_directory,
     tmp_path,
@@ -164,7 +201,7 @@ def test_install_preserves_existing_log_level_and_plugins_setup(
 
 @MOCK_SET_DEFAULT_SERVER_DIRECTORY
 @MOCK_SAVE_COMPOSE_FILE
-@MOCK_RUN
+@MOCK_PULL
 @MOCK_CONFIGURE_OTEL
 @MOCK_CONFIGURE_VECTOR_DB
 @MOCK_CONFIGURE_INFRA
@@ -180,7 +217,7 @@ def test_install_compose_environment_forwards_log_level_and_plugins_setup(
     mock_configure_infra,
     mock_configure_vector_db,
     mock_configure_otel,
-    mock_run,
+    mock_pull,
     mock_save_compose_file,
     mock_set_default_server_directory,
     tmp_path,
@@ -200,7 +237,7 @@ def test_install_compose_environment_forwards_log_level_and_plugins_setup(
 
 @MOCK_SET_DEFAULT_SERVER_DIRECTORY
 @MOCK_SAVE_COMPOSE_FILE
-@MOCK_RUN
+@MOCK_PULL
 @MOCK_CONFIGURE_OTEL
 @MOCK_CONFIGURE_VECTOR_DB
 @MOCK_CONFIGURE_INFRA
@@ -216,7 +253,7 @@ def test_install_rejects_invalid_plugins_setup(
     mock_configure_infra,
     mock_configure_vector_db,
     mock_configure_otel,
-    mock_run,
+    mock_pull,
     mock_save_compose_file,
     mock_set_default_server_directory,
     tmp_path,
@@ -236,7 +273,7 @@ def test_install_rejects_invalid_plugins_setup(
 
 @MOCK_SET_DEFAULT_SERVER_DIRECTORY
 @MOCK_SAVE_COMPOSE_FILE
-@MOCK_RUN
+@MOCK_PULL
 @MOCK_CONFIGURE_OTEL
 @MOCK_CONFIGURE_VECTOR_DB
 @MOCK_CONFIGURE_INFRA
@@ -252,7 +289,7 @@ def test_install_rejects_invalid_log_level(
     mock_configure_infra,
     mock_configure_vector_db,
     mock_configure_otel,
-    mock_run,
+    mock_pull,
     mock_save_compose_file,
     mock_set_default_server_directory,
     tmp_path,
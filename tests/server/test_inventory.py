@@ -0,0 +1,87 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+import typer
+
+from deepfellow.common.jsonl import read_jsonl
+from deepfellow.server.inventory.diff import diff
+from deepfellow.server.inventory.dump import dump
+from deepfellow.server.organization.utils import Organization
+from deepfellow.server.utils.inventory import InventoryItem
+
+
+@mock.patch("deepfellow.server.inventory.dump.echo")
+@mock.patch("deepfellow.server.inventory.dump.crawl_inventory")
+@mock.patch("deepfellow.server.inventory.dump.get_token", return_value="token")
+@mock.patch("deepfellow.server.inventory.dump.get_server_url", return_value="http://server.example")
+def test_dump_writes_snapshot(
+    mock_get_server_url: mock.Mock,
+    mock_get_token: mock.Mock,
+    mock_crawl_inventory: mock.Mock,
+    mock_echo: mock.Mock,
+    tmp_path: Path,
+) -> None:
+    organization = Organization("org-1", 0.0, "first", "user-1")
+    mock_crawl_inventory.return_value = iter([InventoryItem("organization", "org-1", None, organization)])
+    snapshot = tmp_path / "inventory.jsonl"
+
+    dump(server=None, snapshot=snapshot, concurrency=4)
+
+    assert list(read_jsonl(snapshot)) == [
+        {
+            "type": "organization",
+            "organization_id": "org-1",
+            "id": "org-1",
+            "created_at": 0.0,
+            "name": "first",
+            "owner_id": "user-1",
+        }
+    ]
+    assert mock_crawl_inventory.call_args == mock.call("http://server.example", "token", 4)
+
+
+def write_snapshot(path: Path, records: list[dict]) -> Path:
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+@mock.patch("deepfellow.common.output.echo")
+def test_diff_prints_changes(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    old = write_snapshot(
+        tmp_path / "a.jsonl", [{"type": "organization", "organization_id": "o", "id": "o", "name": "A"}]
+    )
+    new = write_snapshot(
+        tmp_path / "b.jsonl",
+        [
+            {"type": "organization", "organization_id": "o", "id": "o", "name": "B"},
+            {"type": "project", "organization_id": "o", "id": "p"},
+        ],
+    )
+
+    diff(old=old, new=new, ignore=["last_used_at"])
+
+    assert mock_echo.info.call_args_list == [
+        mock.call("~ organization o\n  name: A -> B"),
+        mock.call("\n+ project o/project/p"),
+    ]
+
+
+@mock.patch("deepfellow.server.inventory.diff.echo")
+def test_diff_invalid_snapshot(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    old = write_snapshot(tmp_path / "a.jsonl", [{"type": "unknown"}])
+
+    with pytest.raises(typer.Exit):
+        diff(old=old, new=old, ignore=[])
+
+    assert mock_echo.error.call_count == 1
@@ -0,0 +1,114 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import httpx
+import pytest
+import typer
+
+from deepfellow.common.jsonl import read_jsonl
+from deepfellow.server.project.api_key.create_bulk import ManifestRow, create_bulk, read_manifest
+
+SERVER = "http://server.example"
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Path:
+    path = tmp_path / "keys.csv"
+    path.write_text("organization_id,project_id,name\norg-1,proj-1,first\norg-1,proj-2,second\norg-1,proj-1,first\n")
+    return path
+
+
+def test_read_manifest_csv_drops_duplicates(manifest: Path) -> None:
+    assert read_manifest(manifest) == [
+        ManifestRow("org-1", "proj-1", "first"),
+        ManifestRow("org-1", "proj-2", "second"),
+    ]
+
+
+def test_read_manifest_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "keys.jsonl"
+    path.write_text('{"organization_id": "org-1", "project_id": "proj-1", "name": "first"}\n\n')
+
+    assert read_manifest(path) == [ManifestRow("org-1", "proj-1", "first")]
+
+
+@mock.patch("deepfellow.server.project.api_key.create_bulk.echo")
+def test_read_manifest_invalid_row_exits(mock_echo: mock.Mock, tmp_path: Path) -> None:
+    path = tmp_path / "keys.csv"
+    path.write_text("organization_id,project_id,name\norg-1,,first\n")
+
+    with pytest.raises(typer.Exit):
+        read_manifest(path)
+
+    assert mock_echo.error.call_args == mock.call(f"Invalid row 1 in the manifest {path}: missing project_id.")
+
+
+def api_key_handler(failing_projects: set[str]):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        project_id = request.url.path.split("/")[-2]
+        requests.append((request.headers["OpenAI-Organization"], project_id))
+        if project_id in failing_projects:
+            return httpx.Response(403, json={"detail": "Forbidden"})
+
+        return httpx.Response(200, json={"id": f"key-{project_id}", "value": "secret"})
+
+    return handler, requests
+
+
+@mock.patch("deepfellow.server.project.api_key.create_bulk.echo")
+@mock.patch("deepfellow.server.project.api_key.create_bulk.get_token", return_value="token")
+@mock.patch("deepfellow.server.project.api_key.create_bulk.get_server_url", return_value=SERVER)
+@mock.patch("deepfellow.common.rest.create_async_client")
+def test_create_bulk_resumes_skipping_created_rows(
+    mock_create_async_client: mock.Mock,
+    mock_get_server_url: mock.Mock,
+    mock_get_token: mock.Mock,
+    mock_echo: mock.Mock,
+    manifest: Path,
+) -> None:
+    results_file = manifest.with_name("keys.results.jsonl")
+    handler, requests = api_key_handler({"proj-2"})
+    mock_create_async_client.side_effect = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with pytest.raises(typer.Exit):
+        create_bulk(server=None, manifest=manifest, results_file=None, concurrency=4)
+
+    assert sorted(requests) == [("org-1", "proj-1"), ("org-1", "proj-2")]
+    assert [record["status"] for record in read_jsonl(results_file)] == ["created", "failed"]
+    assert results_file.stat().st_mode & 0o777 == 0o600
+
+    handler, requests = api_key_handler(set())
+    create_bulk(server=None, manifest=manifest, results_file=None, concurrency=4)
+
+    assert requests == [("org-1", "proj-2")]
+    records = list(read_jsonl(results_file))
+    assert [record["status"] for record in records] == ["created", "created"]
+    assert records[1]["api_key"] == {"id": "key-proj-2", "value": "secret"}
+
+
+@mock.patch("deepfellow.server.project.api_key.create_bulk.echo")
+@mock.patch("deepfellow.server.project.api_key.create_bulk.get_server_url")
+def test_create_bulk_with_everything_created_sends_nothing(
+    mock_get_server_url: mock.Mock, mock_echo: mock.Mock, manifest: Path, tmp_path: Path
+) -> None:
+    results_file = tmp_path / "results.jsonl"
+    results_file.write_text(
+        "\n".join(json.dumps(row.as_dict() | {"status": "created"}) for row in read_manifest(manifest)) + "\n"
+    )
+
+    create_bulk(server=None, manifest=manifest, results_file=results_file, concurrency=4)
+
+    assert mock_get_server_url.call_count == 0
+    assert mock_echo.info.call_args == mock.call("2 of 2 API Keys already created, creating 0.")
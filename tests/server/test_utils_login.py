@@ -7,13 +7,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
 import httpx
+import pytest
 
+from deepfellow.common.config import read_env_file
+from deepfellow.common.rest import token_refresher
 from deepfellow.common.state import state
-from deepfellow.server.utils.login import get_token, get_token_from_login, try_refresh_token
+from deepfellow.server.utils.login import (
+    get_saved_token_expiry,
+    get_token,
+    get_token_expiry,
+    get_token_from_login,
+    try_refresh_token,
+)
 
 SERVER = "http://localhost:8000"
 
@@ -34,15 +47,11 @@ REFRESH_RESPONSE = {
 # ── get_token_from_login ──────────────────────────────────────────────────────
 
 
-@mock.patch("deepfellow.server.utils.login.save_env_file")
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={})
-@mock.patch("deepfellow.server.utils.login.httpx.post")
+@mock.patch("httpx.Client.post")
 @mock.patch("deepfellow.server.utils.login.echo.prompt_until_valid", side_effect=["user@example.com", "password123"])
 def test_get_token_from_login_writes_token_key(
     mock_prompt: mock.Mock,
     mock_post: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     secrets_file = tmp_path / "secrets"
@@ -55,20 +64,16 @@ def test_get_token_from_login_writes_token_key(
     token = get_token_from_login(secrets_file, SERVER)
 
     assert token == "dfuser_abc"
-    saved_secrets = mock_save.call_args[0][1]
+    saved_secrets = read_env_file(secrets_file)
     assert saved_secrets["DF_USER_TOKEN"] == "dfuser_abc"
     assert saved_secrets["DF_USER_REFRESH_TOKEN"] == "dfuserrefresh_xyz"
 
 
-@mock.patch("deepfellow.server.utils.login.save_env_file")
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={})
-@mock.patch("deepfellow.server.utils.login.httpx.post")
+@mock.patch("httpx.Client.post")
 @mock.patch("deepfellow.server.utils.login.echo.prompt_until_valid", side_effect=["user@example.com", "password123"])
 def test_get_token_from_login_no_refresh_token_in_response(
     mock_prompt: mock.Mock,
     mock_post: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     secrets_file = tmp_path / "secrets"
@@ -81,7 +86,7 @@ def test_get_token_from_login_no_refresh_token_in_response(
     token = get_token_from_login(secrets_file, SERVER)
 
     assert token == "dfuser_abc"
-    saved_secrets = mock_save.call_args[0][1]
+    saved_secrets = read_env_file(secrets_file)
     assert saved_secrets["DF_USER_TOKEN"] == "dfuser_abc"
     assert "DF_USER_REFRESH_TOKEN" not in saved_secrets
 
@@ -89,17 +94,13 @@ def test_get_token_from_login_no_refresh_token_in_response(
 # ── try_refresh_token ─────────────────────────────────────────────────────────
 
 
-@mock.patch("deepfellow.server.utils.login.save_env_file")
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_REFRESH_TOKEN": "dfuserrefresh_xyz"})
-@mock.patch("deepfellow.server.utils.login.httpx.post")
+@mock.patch("httpx.Client.post")
 def test_try_refresh_token_success_returns_new_token_and_saves(
     mock_post: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\n")
     mock_response = mock.Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = REFRESH_RESPONSE
@@ -108,23 +109,18 @@ def test_try_refresh_token_success_returns_new_token_and_saves(
     result = try_refresh_token(secrets_file, SERVER)
 
     assert result == "dfuser_new"
-    assert mock_save.call_count == 1
-    saved_secrets = mock_save.call_args[0][1]
+    saved_secrets = read_env_file(secrets_file)
     assert saved_secrets["DF_USER_TOKEN"] == "dfuser_new"
     assert saved_secrets["DF_USER_REFRESH_TOKEN"] == "dfuserrefresh_new"
 
 
-@mock.patch("deepfellow.server.utils.login.save_env_file")
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_REFRESH_TOKEN": "dfuserrefresh_xyz"})
-@mock.patch("deepfellow.server.utils.login.httpx.post")
+@mock.patch("httpx.Client.post")
 def test_try_refresh_token_uses_refresh_token_as_bearer(
     mock_post: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\n")
     mock_response = mock.Mock()
     mock_response.status_code = 200
     mock_response.json.return_value = REFRESH_RESPONSE
@@ -137,15 +133,13 @@ def test_try_refresh_token_uses_refresh_token_as_bearer(
     assert "json" not in call_kwargs
 
 
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_REFRESH_TOKEN": "dfuserrefresh_xyz"})
-@mock.patch("deepfellow.server.utils.login.httpx.post")
+@mock.patch("httpx.Client.post")
 def test_try_refresh_token_401_returns_none(
     mock_post: mock.Mock,
-    mock_read: mock.Mock,
     tmp_path: Path,
 ):
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\n")
     mock_response = mock.Mock()
     mock_response.status_code = 401
     mock_post.return_value = mock_response
@@ -155,11 +149,7 @@ def test_try_refresh_token_401_returns_none(
     assert result is None
 
 
-@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={})
-def test_try_refresh_token_no_stored_refresh_token_returns_none(
-    mock_read: mock.Mock,
-    tmp_path: Path,
-):
+def test_try_refresh_token_no_stored_refresh_token_returns_none(tmp_path: Path):
     secrets_file = tmp_path / "secrets"
     secrets_file.touch()
 
@@ -171,8 +161,27 @@ def test_try_refresh_token_no_stored_refresh_token_returns_none(
 # ── get_token ─────────────────────────────────────────────────────────────────
 
 
+@mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value="dfuser_new")
+@mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_TOKEN": "dfuser_valid"})
+@mock.patch("httpx.Client.get")
+def test_get_token_registers_refresh_under_lock(
+    mock_get: mock.Mock,
+    mock_read: mock.Mock,
+    mock_refresh: mock.Mock,
+    tmp_path: Path,
+):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.touch()
+    mock_get.return_value = mock.Mock(status_code=200)
+
+    token = get_token(secrets_file, SERVER)
+
+    assert token_refresher.refresh(token) == "dfuser_new"
+    mock_refresh.assert_called_once_with(secrets_file, SERVER, stale_token="dfuser_valid")
+
+
 @mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_TOKEN": "dfuser_valid"})
-@mock.patch("deepfellow.server.utils.login.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_token_valid_token_returns_without_refresh(
     mock_get: mock.Mock,
     mock_read: mock.Mock,
@@ -191,7 +200,7 @@ def test_get_token_valid_token_returns_without_refresh(
 
 @mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value="dfuser_new")
 @mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_TOKEN": "dfuser_expired"})
-@mock.patch("deepfellow.server.utils.login.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_token_401_refresh_succeeds(
     mock_get: mock.Mock,
     mock_read: mock.Mock,
@@ -213,7 +222,7 @@ def test_get_token_401_refresh_succeeds(
 @mock.patch("deepfellow.server.utils.login.get_token_from_login", return_value="dfuser_fresh")
 @mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value=None)
 @mock.patch("deepfellow.server.utils.login.read_env_file", return_value={"DF_USER_TOKEN": "dfuser_expired"})
-@mock.patch("deepfellow.server.utils.login.httpx.get")
+@mock.patch("httpx.Client.get")
 def test_get_token_401_refresh_401_falls_back_to_login(
     mock_get: mock.Mock,
     mock_read: mock.Mock,
@@ -237,60 +246,46 @@ def test_get_token_401_refresh_401_falls_back_to_login(
 # ── logout ────────────────────────────────────────────────────────────────────
 
 
-@mock.patch("deepfellow.server.logout.save_env_file")
-@mock.patch("deepfellow.server.logout.read_env_file")
 @mock.patch("deepfellow.server.logout.get_token", return_value="dfuser_abc")
-@mock.patch("deepfellow.server.logout.httpx.post")
+@mock.patch("httpx.Client.post")
 @mock.patch("deepfellow.server.logout.get_server_url", return_value=SERVER)
 def test_logout_successful_clears_token_key(
     mock_server_url: mock.Mock,
     mock_post: mock.Mock,
     mock_get_token: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     from deepfellow.server.logout import logout
 
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_TOKEN=dfuser_abc\nDF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\nOTHER_KEY=kept\n")
     state.cli_secrets_file = secrets_file
-    mock_read.return_value = {
-        "DF_USER_TOKEN": "dfuser_abc",
-        "DF_USER_REFRESH_TOKEN": "dfuserrefresh_xyz",
-        "OTHER_KEY": "kept",
-    }
     mock_response = mock.Mock()
     mock_response.status_code = 200
     mock_post.return_value = mock_response
 
     logout()
 
-    saved_secrets = mock_save.call_args[0][1]
+    saved_secrets = read_env_file(secrets_file)
     assert "DF_USER_TOKEN" not in saved_secrets
     assert "DF_USER_REFRESH_TOKEN" not in saved_secrets
     assert saved_secrets.get("OTHER_KEY") == "kept"
 
 
-@mock.patch("deepfellow.server.logout.save_env_file")
-@mock.patch("deepfellow.server.logout.read_env_file")
 @mock.patch("deepfellow.server.logout.get_token", return_value="dfuser_abc")
-@mock.patch("deepfellow.server.logout.httpx.post")
+@mock.patch("httpx.Client.post")
 @mock.patch("deepfellow.server.logout.get_server_url", return_value=SERVER)
 def test_logout_uses_bearer_auth_no_body(
     mock_server_url: mock.Mock,
     mock_post: mock.Mock,
     mock_get_token: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     from deepfellow.server.logout import logout
 
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_TOKEN=dfuser_abc\n")
     state.cli_secrets_file = secrets_file
-    mock_read.return_value = {"DF_USER_TOKEN": "dfuser_abc"}
     mock_response = mock.Mock()
     mock_response.status_code = 200
     mock_post.return_value = mock_response
@@ -302,29 +297,162 @@ def test_logout_uses_bearer_auth_no_body(
     assert "json" not in call_kwargs
 
 
-@mock.patch("deepfellow.server.logout.save_env_file")
-@mock.patch("deepfellow.server.logout.read_env_file")
 @mock.patch("deepfellow.server.logout.get_token", return_value="dfuser_abc")
-@mock.patch("deepfellow.server.logout.httpx.post")
+@mock.patch("httpx.Client.post")
 @mock.patch("deepfellow.server.logout.get_server_url", return_value=SERVER)
 def test_logout_clears_locally_even_when_server_call_fails(
     mock_server_url: mock.Mock,
     mock_post: mock.Mock,
     mock_get_token: mock.Mock,
-    mock_read: mock.Mock,
-    mock_save: mock.Mock,
     tmp_path: Path,
 ):
     from deepfellow.server.logout import logout
 
     secrets_file = tmp_path / "secrets"
-    secrets_file.touch()
+    secrets_file.write_text("DF_USER_TOKEN=dfuser_abc\n")
     state.cli_secrets_file = secrets_file
-    mock_read.return_value = {"DF_USER_TOKEN": "dfuser_abc"}
     mock_post.side_effect = httpx.ConnectError("connection refused")
 
     logout()
 
-    assert mock_save.call_count == 1
-    saved_secrets = mock_save.call_args[0][1]
+    saved_secrets = read_env_file(secrets_file)
     assert "DF_USER_TOKEN" not in saved_secrets
+
+
+# ── JWT expiry ────────────────────────────────────────────────────────────────
+
+
+def make_jwt(payload: dict) -> str:
+    def encode(data: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    return f"{encode({'alg': 'HS256', 'typ': 'JWT'})}.{encode(payload)}.signature"
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        (make_jwt({"sub": "user", "exp": 1_900_000_000}), 1_900_000_000.0),
+        (make_jwt({"sub": "user"}), None),
+        (make_jwt({"exp": "soon"}), None),
+        ("dfuser_opaque", None),
+        ("a.!!!.c", None),
+    ],
+)
+def test_get_token_expiry(token: str, expected: float | None):
+    assert get_token_expiry(token) == expected
+
+
+@mock.patch("deepfellow.server.utils.login.try_refresh_token")
+@mock.patch("httpx.Client.get")
+def test_get_token_valid_jwt_skips_auth_me(mock_get: mock.Mock, mock_refresh: mock.Mock, tmp_path: Path):
+    token = make_jwt({"exp": time.time() + 3600})
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text(f"DF_USER_TOKEN={token}\n")
+
+    assert get_token(secrets_file, SERVER) == token
+    mock_get.assert_not_called()
+    mock_refresh.assert_not_called()
+
+
+@mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value="dfuser_new")
+@mock.patch("httpx.Client.get")
+def test_get_token_expiring_jwt_is_refreshed(mock_get: mock.Mock, mock_refresh: mock.Mock, tmp_path: Path):
+    secrets_file = tmp_path / "secrets"
+    token = make_jwt({"exp": time.time() + 10})
+    secrets_file.write_text(f"DF_USER_TOKEN={token}\n")
+
+    assert get_token(secrets_file, SERVER) == "dfuser_new"
+    mock_get.assert_not_called()
+    mock_refresh.assert_called_once_with(secrets_file, SERVER, stale_token=token)
+
+
+@mock.patch("deepfellow.server.utils.login.get_token_from_login")
+@mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value=None)
+def test_get_token_expiring_jwt_refresh_failed_uses_current(
+    mock_refresh: mock.Mock, mock_login: mock.Mock, tmp_path: Path
+):
+    token = make_jwt({"exp": time.time() + 10})
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text(f"DF_USER_TOKEN={token}\n")
+
+    assert get_token(secrets_file, SERVER) == token
+    mock_login.assert_not_called()
+
+
+@mock.patch("deepfellow.server.utils.login.get_token_from_login", return_value="dfuser_fresh")
+@mock.patch("deepfellow.server.utils.login.try_refresh_token", return_value=None)
+def test_get_token_expired_jwt_refresh_failed_falls_back_to_login(
+    mock_refresh: mock.Mock, mock_login: mock.Mock, tmp_path: Path
+):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text(f"DF_USER_TOKEN={make_jwt({'exp': time.time() - 10})}\n")
+
+    assert get_token(secrets_file, SERVER) == "dfuser_fresh"
+    mock_login.assert_called_once_with(secrets_file, SERVER)
+
+
+@mock.patch("httpx.Client.get")
+def test_get_token_uses_saved_expiry_for_opaque_token(mock_get: mock.Mock, tmp_path: Path):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text(f"DF_USER_TOKEN=dfuser_abc\nDF_USER_TOKEN_EXPIRES_AT={int(time.time()) + 3600}\n")
+
+    assert get_token(secrets_file, SERVER) == "dfuser_abc"
+    mock_get.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("secrets", "expected"),
+    [
+        ({"DF_USER_TOKEN_EXPIRES_AT": "1900000000"}, 1_900_000_000.0),
+        ({}, None),
+        ({"DF_USER_TOKEN_EXPIRES_AT": "x"}, None),
+    ],
+)
+def test_get_saved_token_expiry(secrets: dict, expected: float | None):
+    assert get_saved_token_expiry(secrets) == expected
+
+
+@mock.patch("httpx.Client.post")
+def test_try_refresh_token_saves_expiry(mock_post: mock.Mock, tmp_path: Path):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text("DF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\n")
+    mock_post.return_value = httpx.Response(200, json=REFRESH_RESPONSE, request=httpx.Request("POST", SERVER))
+
+    try_refresh_token(secrets_file, SERVER)
+
+    assert read_env_file(secrets_file)["DF_USER_TOKEN_EXPIRES_AT"] == "9999999999"
+
+
+# ── single-flight refresh ─────────────────────────────────────────────────────
+
+
+@mock.patch("httpx.Client.post")
+def test_try_refresh_token_reuses_token_refreshed_by_another_process(mock_post: mock.Mock, tmp_path: Path):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text(
+        "DF_USER_TOKEN=dfuser_new\nDF_USER_REFRESH_TOKEN=dfuserrefresh_new\n"
+        f"DF_USER_TOKEN_EXPIRES_AT={time.time() + 3600}\n"
+    )
+
+    assert try_refresh_token(secrets_file, SERVER, stale_token="dfuser_old") == "dfuser_new"
+    mock_post.assert_not_called()
+
+
+@mock.patch("httpx.Client.post")
+def test_try_refresh_token_concurrent_calls_refresh_once(mock_post: mock.Mock, tmp_path: Path):
+    secrets_file = tmp_path / "secrets"
+    secrets_file.write_text("DF_USER_TOKEN=dfuser_old\nDF_USER_REFRESH_TOKEN=dfuserrefresh_xyz\n")
+
+    def refresh(*args, **kwargs):
+        time.sleep(0.1)
+        return httpx.Response(200, json=REFRESH_RESPONSE, request=httpx.Request("POST", f"{SERVER}/auth/refresh"))
+
+    mock_post.side_effect = refresh
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        tokens = list(
+            executor.map(lambda _: try_refresh_token(secrets_file, SERVER, stale_token="dfuser_old"), range(4))
+        )
+
+    assert tokens == ["dfuser_new"] * 4
+    assert mock_post.call_count == 1
@@ -0,0 +1,142 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from deepfellow.server.organization.admin_api_key.utils import ApiKey as AdminApiKey
+from deepfellow.server.organization.admin_api_key.utils import Owner
+from deepfellow.server.organization.utils import Organization
+from deepfellow.server.project.api_key.utils import ApiKey as ProjectApiKey
+from deepfellow.server.project.utils import Project
+from deepfellow.server.utils.inventory import crawl_inventory, diff_snapshots, record_key
+
+SERVER = "http://server.example"
+
+
+@pytest.fixture
+def tenant():
+    owner = Owner(0.0, "user-1", "admin", "organization.user", "owner", "user")
+    with (
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_organizations",
+            return_value=iter([Organization("org-b", 0.0, "b", "user-1"), Organization("org-a", 0.0, "a", "user-1")]),
+        ) as mock_list_organizations,
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_admin_api_keys",
+            side_effect=lambda server, token, org_id, cache: iter(
+                [AdminApiKey(f"{org_id}-key", "organization.admin_api_key", "k", "sk-...", owner, 0.0, None, "secret")]
+            ),
+        ) as mock_list_admin_api_keys,
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_projects",
+            side_effect=lambda server, token, org_id, cache: iter(
+                [
+                    Project(f"{org_id}-p2", f"{org_id}-p2", "archived", [], [], [], 0.0),
+                    Project(f"{org_id}-p1", f"{org_id}-p1", "active", [], [], [], 0.0),
+                ]
+            ),
+        ) as mock_list_projects,
+        mock.patch(
+            "deepfellow.server.utils.inventory.list_api_keys",
+            side_effect=lambda server, token, org_id, project_id, cache: iter(
+                [ProjectApiKey(f"{project_id}-key", "organization.project.api_key", "k", "sk-...", 0.0, None, None)]
+            ),
+        ) as mock_list_api_keys,
+    ):
+        yield mock_list_organizations, mock_list_admin_api_keys, mock_list_projects, mock_list_api_keys
+
+
+def test_crawl_inventory_yields_items_sorted_by_record_key(tenant):
+    records = [item.to_record() for item in crawl_inventory(SERVER, "token", concurrency=4)]
+
+    keys = [record_key(record) for record in records]
+    assert keys == sorted(keys)
+    assert keys[:6] == [
+        ("org-a",),
+        ("org-a", "api_key", "org-a-key"),
+        ("org-a", "project", "org-a-p1"),
+        ("org-a", "project", "org-a-p1", "api_key", "org-a-p1-key"),
+        ("org-a", "project", "org-a-p2"),
+        ("org-a", "project", "org-a-p2", "api_key", "org-a-p2-key"),
+    ]
+    assert len(records) == 12
+
+
+def test_crawl_inventory_records_have_no_secrets(tenant):
+    records = [item.to_record() for item in crawl_inventory(SERVER, "token")]
+
+    assert records[1] == {
+        "type": "organization_api_key",
+        "organization_id": "org-a",
+        "id": "org-a-key",
+        "name": "k",
+        "redacted_value": "sk-...",
+        "created_at": 0.0,
+        "last_used_at": None,
+        "owner_id": "user-1",
+    }
+
+
+def test_crawl_inventory_skips_archived_projects(tenant):
+    items = list(crawl_inventory(SERVER, "token", include_archived=False))
+
+    assert {item.project_id for item in items if item.project_id} == {"org-a-p1", "org-b-p1"}
+
+
+def test_crawl_inventory_skips_http_cache(tenant):
+    list(crawl_inventory(SERVER, "token"))
+
+    for mock_list in tenant:
+        assert {call.kwargs["cache"] for call in mock_list.call_args_list} == {False}
+
+
+def test_crawl_inventory_yields_items_while_crawling(tenant):
+    *_, mock_list_api_keys = tenant
+    items = crawl_inventory(SERVER, "token", concurrency=1)
+
+    assert [next(items).organization_id for _ in range(3)] == ["org-a", "org-a", "org-a"]
+    assert mock_list_api_keys.call_count < 4
+    assert len(list(items)) == 9
+    assert mock_list_api_keys.call_count == 4
+
+
+def org(org_id: str, **fields) -> dict:
+    return {"type": "organization", "organization_id": org_id, "id": org_id} | fields
+
+
+def project(org_id: str, project_id: str, **fields) -> dict:
+    return {"type": "project", "organization_id": org_id, "id": project_id} | fields
+
+
+def test_diff_snapshots():
+    old = [org("a", name="A"), project("a", "p1", name="one"), project("a", "p2"), org("b")]
+    new = [org("a", name="A2"), project("a", "p1", name="one", last_used_at=1), org("b"), project("b", "p3")]
+
+    assert list(diff_snapshots(old, new, ignore=["last_used_at"])) == [
+        {"change": "changed", "type": "organization", "key": ["a"], "fields": {"name": ["A", "A2"]}},
+        {"change": "removed", "type": "project", "key": ["a", "project", "p2"], "record": project("a", "p2")},
+        {"change": "added", "type": "project", "key": ["b", "project", "p3"], "record": project("b", "p3")},
+    ]
+
+
+def test_diff_snapshots_reads_lazily():
+    def snapshot():
+        yield org("a")
+        raise AssertionError("read too far")
+
+    changes = diff_snapshots(snapshot(), iter([org("0")]))
+
+    assert next(changes)["change"] == "added"
+
+
+def test_diff_snapshots_rejects_unsorted_snapshot():
+    with pytest.raises(ValueError, match="not sorted"):
+        list(diff_snapshots([org("b"), org("a")], []))
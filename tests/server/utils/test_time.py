@@ -0,0 +1,26 @@
+# DeepFellow Software Framework.
+# Copyright © 2026 Simplito sp. z o.o.
+#
+# This file is part of the DeepFellow Software Framework (https://deepfellow.ai).
+# This software is Licensed under the DeepFellow Free License.
+#
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from deepfellow.server.utils.time import parse_duration
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("90d", 90 * 86400), ("12h", 12 * 3600), ("2w", 14 * 86400), ("30m", 1800), ("1.5D", 1.5 * 86400)],
+)
+def test_parse_duration(value: str, expected: float) -> None:
+    assert parse_duration(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "90", "d", "90 days", "-1d"])
+def test_parse_duration_invalid(value: str) -> None:
+    with pytest.raises(ValueError, match="Invalid duration"):
+        parse_duration(value)